@@ -14,9 +14,13 @@ from communication.messages import Error
 from communication.messages import Event
 from communication.messages import MultipleError
 from fbsrankings.cli.error import print_err
+from fbsrankings.cli.game_result import GameResultRecorder
 from fbsrankings.cli.progress import ProgressBar
 from fbsrankings.cli.progress import Spinner
-from fbsrankings.messages.command import CalculateRankingsForSeasonCommand
+from fbsrankings.cli.simulation import print_simulation
+from fbsrankings.cli.table import print_table
+from fbsrankings.cli.table import print_table_title
+from fbsrankings.messages.command import CalculateRankingsForSeasonsCommand
 from fbsrankings.messages.command import DropStorageCommand
 from fbsrankings.messages.command import ImportSeasonByYearCommand
 from fbsrankings.messages.enums import GameStatus
@@ -34,8 +38,12 @@ from fbsrankings.messages.event import GameCreatedEvent
 from fbsrankings.messages.event import GameNotesUpdatedEvent
 from fbsrankings.messages.event import GameRankingCalculatedEvent
 from fbsrankings.messages.event import GameRescheduledEvent
+from fbsrankings.messages.event import SeasonRankingsCalculatedEvent
 from fbsrankings.messages.event import TeamRankingCalculatedEvent
 from fbsrankings.messages.event import TeamRecordCalculatedEvent
+from fbsrankings.messages.packed import game_ranking_values
+from fbsrankings.messages.packed import team_ranking_values
+from fbsrankings.messages.packed import team_record_values
 from fbsrankings.messages.query import AffiliationCountBySeasonQuery
 from fbsrankings.messages.query import AffiliationCountBySeasonResult
 from fbsrankings.messages.query import CanceledGamesQuery
@@ -78,11 +86,22 @@ class GameUpdateTracker(ContextManager["GameUpdateTracker"]):
     def __init__(self, event_bus: EventBus) -> None:
         self._event_bus = event_bus
         self.updates: dict[str, list[int]] = {}
+        self._schedule_changes: set[str] = set()
 
         self._event_bus.register_handler(GameCreatedEvent, self)
         self._event_bus.register_handler(GameCompletedEvent, self)
         self._event_bus.register_handler(GameCanceledEvent, self)
 
+    @property
+    def start_weeks(self) -> dict[str, int]:
+        # Strength of schedule and game strength depend on the whole schedule,
+        # so a season with created or canceled games is calculated in full.
+        return {
+            season_id: min(weeks)
+            for season_id, weeks in self.updates.items()
+            if season_id not in self._schedule_changes
+        }
+
     def close(self) -> None:
         self._event_bus.unregister_handler(GameCreatedEvent, self)
         self._event_bus.unregister_handler(GameCompletedEvent, self)
@@ -92,6 +111,9 @@ class GameUpdateTracker(ContextManager["GameUpdateTracker"]):
         self,
         event: Union[GameCreatedEvent, GameCompletedEvent, GameCanceledEvent],
     ) -> None:
+        if not isinstance(event, GameCompletedEvent):
+            self._schedule_changes.add(event.season_id)
+
         season = self.updates.get(event.season_id)
         if season is None:
             self.updates[event.season_id] = [event.week]
@@ -144,6 +166,10 @@ class Application:
             GameRankingCalculatedEvent,
             self._save_season_event,
         )
+        self._event_bus.register_handler(
+            SeasonRankingsCalculatedEvent,
+            self._save_season_rankings_event,
+        )
 
         self._note_events: list[GameNotesUpdatedEvent] = []
         self._event_bus.register_handler(GameNotesUpdatedEvent, self._save_notes_event)
@@ -174,19 +200,24 @@ class Application:
 
         with GameUpdateTracker(self._event_bus) as tracker:
             print_err("Importing season data:")
-            for year in ProgressBar(years):
+            for index, year in enumerate(ProgressBar(years)):
                 self._command_bus.send(
-                    ImportSeasonByYearCommand(command_id=str(uuid4()), year=year),
+                    ImportSeasonByYearCommand(
+                        command_id=str(uuid4()),
+                        year=year,
+                        prefetch_years=years[index + 1 :],
+                    ),
                 )
 
             if tracker.updates:
                 print_err()
                 print_err("Calculating rankings:")
-                for season_id in ProgressBar(tracker.updates.keys()):
+                with Spinner():
                     self._command_bus.send(
-                        CalculateRankingsForSeasonCommand(
+                        CalculateRankingsForSeasonsCommand(
                             command_id=str(uuid4()),
-                            season_id=season_id,
+                            season_ids=tracker.updates.keys(),
+                            start_weeks=tracker.start_weeks,
                         ),
                     )
 
@@ -203,6 +234,28 @@ class Application:
         else:
             self._print_errors()
 
+    def record_game_result(
+        self,
+        season: str,
+        team1: str,
+        score1: int,
+        team2: str,
+        score2: int,
+    ) -> None:
+        year, week = self._parse_season_week(season)
+        recorder = GameResultRecorder(self._command_bus, self._query_bus)
+        recorder.record(
+            self._get_season(year).season_id,
+            season,
+            week,
+            team1,
+            score1,
+            team2,
+            score2,
+        )
+
+        self._print_events()
+
     def print_latest(self, rating: str, top: str) -> None:
         rating_name = self._parse_rating(rating)
         limit = self._parse_top(top)
@@ -234,13 +287,13 @@ class Application:
             week,
         )
 
-        self._print_table_title(year, week, "Teams", team_ranking.name)
+        print_table_title(year, week, "Teams", team_ranking.name)
         self._print_teams_table(team_record, team_ranking, team_sos, limit)
 
         completed_games = []
         scheduled_games = []
         next_week_games = []
-        for game in game_ranking.values:
+        for game in game_ranking_values(game_ranking):
             if game.status == GameStatus.GAME_STATUS_COMPLETED:
                 completed_games.append(game)
             elif game.status == GameStatus.GAME_STATUS_SCHEDULED:
@@ -249,15 +302,15 @@ class Application:
                     next_week_games.append(game)
 
         if len(next_week_games) > 0:
-            self._print_table_title(year, week, "Next Week Games", team_ranking.name)
+            print_table_title(year, week, "Next Week Games", team_ranking.name)
             self._print_games_table(next_week_games, team_ranking, limit)
 
         if len(scheduled_games) > 0:
-            self._print_table_title(year, week, "Remaining Games", team_ranking.name)
+            print_table_title(year, week, "Remaining Games", team_ranking.name)
             self._print_games_table(scheduled_games, team_ranking, limit)
 
         if len(completed_games) > 0:
-            self._print_table_title(year, week, "Completed Games", team_ranking.name)
+            print_table_title(year, week, "Completed Games", team_ranking.name)
             self._print_games_table(completed_games, team_ranking, limit)
 
     def print_seasons(self, top: str) -> None:
@@ -287,7 +340,7 @@ class Application:
             week,
         )
 
-        self._print_table_title(year, week, "Teams", ranking.name)
+        print_table_title(year, week, "Teams", ranking.name)
         self._print_teams_table(record, ranking, sos, limit)
 
     def print_games(self, season: str, rating: str, top: str) -> None:
@@ -305,8 +358,36 @@ class Application:
             week,
         )
 
-        self._print_table_title(year, week, "Season Games", team_ranking.name)
-        self._print_games_table(list(game_ranking.values), team_ranking, limit)
+        print_table_title(year, week, "Season Games", team_ranking.name)
+        self._print_games_table(
+            game_ranking_values(game_ranking),
+            team_ranking,
+            limit,
+        )
+
+    def print_simulation(
+        self,
+        season: str,
+        count: int,
+        top: str,
+        seed: Optional[int],
+    ) -> None:
+        limit = self._parse_top(top)
+
+        year, week = self._parse_season_week(season)
+        if week is not None and season.casefold() != "latest".casefold():
+            raise ValueError(
+                f"'{season}' must be a single season (e.g. 2018) or 'latest'",
+            )
+
+        print_simulation(
+            self._query_bus,
+            year,
+            self._get_season(year).season_id,
+            count,
+            seed,
+            limit,
+        )
 
     def _save_season_event(
         self,
@@ -330,6 +411,19 @@ class Application:
         season_event_counts.setdefault(event_type, 0)
         season_event_counts[event_type] += 1
 
+    def _save_season_rankings_event(self, event: SeasonRankingsCalculatedEvent) -> None:
+        season_event_counts = self._event_counts_by_season.setdefault(
+            event.season_id,
+            {},
+        )
+        for event_type, count in (
+            (TeamRecordCalculatedEvent, len(event.team_records)),
+            (TeamRankingCalculatedEvent, len(event.team_rankings)),
+            (GameRankingCalculatedEvent, len(event.game_rankings)),
+        ):
+            season_event_counts.setdefault(event_type, 0)
+            season_event_counts[event_type] += count
+
     def _save_notes_event(self, event: GameNotesUpdatedEvent) -> None:
         self._note_events.append(event)
 
@@ -375,7 +469,7 @@ class Application:
                 week,
             )
 
-            self._print_table_title(year, week, "Teams", team_ranking.name)
+            print_table_title(year, week, "Teams", team_ranking.name)
             self._print_teams_table(
                 team_record,
                 team_ranking,
@@ -383,9 +477,9 @@ class Application:
                 limit,
             )
 
-            self._print_table_title(year, week, "Season Games", team_ranking.name)
+            print_table_title(year, week, "Season Games", team_ranking.name)
             self._print_games_table(
-                list(game_ranking.values),
+                game_ranking_values(game_ranking),
                 team_ranking,
                 limit,
             )
@@ -447,6 +541,8 @@ class Application:
             return "Colley Matrix"
         if rating.casefold() == "simultaneous-wins".casefold():
             return "Simultaneous Wins"
+        if rating.casefold() == "elo".casefold():
+            return "Elo"
 
         raise ValueError(f"Unknown rating type: {rating}")
 
@@ -536,46 +632,6 @@ class Application:
             raise ValueError(f"Game rankings not found for {rating_name}, {year}")
         return result.ranking
 
-    @staticmethod
-    def _print_table(
-        header: list[str],
-        alignments: list[str],
-        rows: list[list[str]],
-    ) -> None:
-        num_columns = len(header)
-        column_widths = [
-            max(len(header[column]), max(len(row[column]) for row in rows))
-            for column in range(num_columns)
-        ]
-        separator = "+" + "+".join("-" * (width + 2) for width in column_widths) + "+"
-
-        print(separator)
-
-        line = "| "
-        for column in range(num_columns):
-            if alignments[column] == "r":
-                line += header[column].rjust(column_widths[column]) + " | "
-            elif alignments[column] == "l":
-                line += header[column].ljust(column_widths[column]) + " | "
-            else:
-                line += header[column].center(column_widths[column]) + " | "
-        print(line.rstrip())
-
-        print(separator)
-
-        for row in rows:
-            line = "| "
-            for column in range(num_columns):
-                if alignments[column] == "r":
-                    line += row[column].rjust(column_widths[column]) + " | "
-                elif alignments[column] == "l":
-                    line += row[column].ljust(column_widths[column]) + " | "
-                else:
-                    line += row[column].center(column_widths[column]) + " | "
-            print(line.rstrip())
-
-        print(separator)
-
     def _print_seasons_table(self, seasons: Iterable[SeasonResult]) -> None:
         headers = ["Season", "Weeks", "Teams", "FBS", "FCS", "Games", "Post"]
         alignments = ["c", "c", "c", "c", "c", "c", "c"]
@@ -631,20 +687,7 @@ class Application:
             )
 
         print()
-        self._print_table(headers, alignments, rows)
-
-    @staticmethod
-    def _print_table_title(
-        year: int,
-        week: Optional[int],
-        header: str,
-        rating_name: str,
-    ) -> None:
-        print()
-        if week is not None:
-            print(f"{year}, Week {week} {header}, {rating_name}:")
-        else:
-            print(f"{year} {header}, {rating_name}:")
+        print_table(headers, alignments, rows)
 
     def _print_teams_table(
         self,
@@ -653,14 +696,14 @@ class Application:
         sos: TeamRankingBySeasonWeekValue,
         limit: Optional[int],
     ) -> None:
-        record_map = {v.team_id: v for v in record.values}
-        sos_map = {v.team_id: v for v in sos.values}
+        record_map = {v.team_id: v for v in team_record_values(record)}
+        sos_map = {v.team_id: v for v in team_ranking_values(sos)}
 
         headers = ["#", "Team", "W-L", "Val", "SOS_#", "SOS_Val"]
         alignments = ["r", "l", "r", "c", "r", "c"]
         rows = []
 
-        values = list(ranking.values)
+        values = team_ranking_values(ranking)
         if limit is not None:
             values = values[:limit]
 
@@ -679,7 +722,7 @@ class Application:
                 ],
             )
 
-        self._print_table(headers, alignments, rows)
+        print_table(headers, alignments, rows)
 
     def _print_games_table(
         self,
@@ -687,7 +730,7 @@ class Application:
         team_ranking: TeamRankingBySeasonWeekValue,
         limit: Optional[int],
     ) -> None:
-        team_map = {v.team_id: v for v in team_ranking.values}
+        team_map = {v.team_id: v for v in team_ranking_values(team_ranking)}
 
         headers = ["Date", "H#", "Home", "A#", "Away", "Score", "Val"]
         alignments = ["c", "r", "l", "r", "l", "r", "c"]
@@ -719,7 +762,7 @@ class Application:
                 ],
             )
 
-        self._print_table(headers, alignments, rows)
+        print_table(headers, alignments, rows)
 
     def _print_events(self) -> None:
         print()
@@ -765,7 +808,7 @@ class Application:
                     ],
                 )
 
-            self._print_table(headers, alignments, rows)
+            print_table(headers, alignments, rows)
 
         else:
             print("None")
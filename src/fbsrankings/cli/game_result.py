@@ -0,0 +1,85 @@
+from typing import Optional
+from uuid import uuid4
+
+from communication.bus import CommandBus
+from communication.bus import QueryBus
+from fbsrankings.messages.command import CalculateRankingsForSeasonCommand
+from fbsrankings.messages.command import RecordGameResultCommand
+from fbsrankings.messages.enums import GameStatus
+from fbsrankings.messages.query import GameBySeasonResult
+from fbsrankings.messages.query import GamesBySeasonQuery
+from fbsrankings.messages.query import GamesBySeasonResult
+
+
+class GameResultRecorder:
+    # Records the result of the scheduled game between two teams, which can
+    # be given in either order, and recalculates the rankings of the season
+    # from the week of the game.
+    def __init__(self, command_bus: CommandBus, query_bus: QueryBus) -> None:
+        self._command_bus = command_bus
+        self._query_bus = query_bus
+
+    def record(
+        self,
+        season_id: str,
+        season: str,
+        week: Optional[int],
+        team1: str,
+        score1: int,
+        team2: str,
+        score2: int,
+    ) -> None:
+        game = self._find_game(season_id, season, week, team1, team2)
+
+        if game.home_team_name.casefold() == team1.casefold():
+            home_team_score, away_team_score = score1, score2
+        else:
+            home_team_score, away_team_score = score2, score1
+
+        self._command_bus.send(
+            RecordGameResultCommand(
+                command_id=str(uuid4()),
+                game_id=game.game_id,
+                home_team_score=home_team_score,
+                away_team_score=away_team_score,
+            ),
+        )
+        self._command_bus.send(
+            CalculateRankingsForSeasonCommand(
+                command_id=str(uuid4()),
+                season_id=season_id,
+                start_week=game.week,
+            ),
+        )
+
+    def _find_game(
+        self,
+        season_id: str,
+        season: str,
+        week: Optional[int],
+        team1: str,
+        team2: str,
+    ) -> GameBySeasonResult:
+        result = self._query_bus.query(
+            GamesBySeasonQuery(query_id=str(uuid4()), season_id=season_id),
+            GamesBySeasonResult,
+        )
+        teams = {team1.casefold(), team2.casefold()}
+        games = [
+            game
+            for game in result.games
+            if game.status == GameStatus.GAME_STATUS_SCHEDULED
+            and (week is None or game.week == week)
+            and {game.home_team_name.casefold(), game.away_team_name.casefold()}
+            == teams
+        ]
+        if not games:
+            raise ValueError(
+                f"Scheduled game not found for {team1} vs. {team2} in {season}",
+            )
+        if len(games) > 1:
+            raise ValueError(
+                f"Multiple scheduled games found for {team1} vs. {team2} in"
+                f" {season}, a specific week must be provided (e.g. 2014w10)",
+            )
+        return games[0]
@@ -84,6 +84,66 @@ def import_seasons(args: argparse.Namespace) -> None:
 
 import_parser.set_defaults(func=import_seasons)
 
+# RECORD-------------------------------------
+
+record_parser = subparsers.add_parser(
+    "record",
+    description="Record the final score of a scheduled game and update the rankings"
+    " from the week of the game.",
+    parents=[common_parser],
+)
+record_parser.add_argument(
+    "season",
+    metavar="SEASON",
+    type=SeasonWeekType(),
+    action="store",
+    help="Single season (e.g. 2018) or a specific week within a season (e.g."
+    " 2014w10) in which the game is scheduled.",
+)
+record_parser.add_argument(
+    "team1",
+    metavar="TEAM1",
+    type=str,
+    action="store",
+    help="name of one of the teams",
+)
+record_parser.add_argument(
+    "score1",
+    metavar="SCORE1",
+    type=int,
+    action="store",
+    help="final score of TEAM1",
+)
+record_parser.add_argument(
+    "team2",
+    metavar="TEAM2",
+    type=str,
+    action="store",
+    help="name of the other team",
+)
+record_parser.add_argument(
+    "score2",
+    metavar="SCORE2",
+    type=int,
+    action="store",
+    help="final score of TEAM2",
+)
+
+
+def record_game_result(args: argparse.Namespace) -> None:
+    with Environment(args.config) as env:
+        application = Application(env.command_bus, env.query_bus, env.event_bus)
+        application.record_game_result(
+            args.season,
+            args.team1,
+            args.score1,
+            args.team2,
+            args.score2,
+        )
+
+
+record_parser.set_defaults(func=record_game_result)
+
 # LATEST-------------------------------------
 
 latest_parser = subparsers.add_parser(
@@ -95,7 +155,7 @@ latest_parser.add_argument(
     "-r",
     "--rating",
     type=str.casefold,
-    choices=["srs", "colley-matrix", "simultaneous-wins"],
+    choices=["srs", "colley-matrix", "simultaneous-wins", "elo"],
     default="srs",
     action="store",
     help="rating calculation to use for rankings",
@@ -167,7 +227,7 @@ teams_parser.add_argument(
     "-r",
     "--rating",
     type=str.casefold,
-    choices=["SRS", "colley-matrix", "simultaneous-wins"],
+    choices=["SRS", "colley-matrix", "simultaneous-wins", "elo"],
     default="SRS",
     action="store",
     help="rating calculation to use for rankings",
@@ -212,7 +272,7 @@ games_parser.add_argument(
     "-r",
     "--rating",
     type=str.casefold,
-    choices=["SRS", "colley-matrix", "simultaneous-wins"],
+    choices=["SRS", "colley-matrix", "simultaneous-wins", "elo"],
     default="SRS",
     action="store",
     help="rating calculation to use for rankings",
@@ -236,6 +296,59 @@ def print_games(args: argparse.Namespace) -> None:
 
 games_parser.set_defaults(func=print_games)
 
+# SIMULATE---------------------------------
+
+simulate_parser = subparsers.add_parser(
+    "simulate",
+    description="Simulate the remaining games of SEASON from the SRS ratings and"
+    " print the projected wins and rankings of each team.",
+    parents=[common_parser],
+)
+simulate_parser.add_argument(
+    "season",
+    metavar="SEASON",
+    type=SeasonWeekType(),
+    nargs="?",
+    default="latest",
+    action="store",
+    help="Single season (e.g. 2018) or 'latest' to simulate the most recent season.",
+)
+simulate_parser.add_argument(
+    "-n",
+    "--count",
+    metavar="COUNT",
+    type=int,
+    default=10000,
+    action="store",
+    help="number of simulations to run",
+)
+simulate_parser.add_argument(
+    "-s",
+    "--seed",
+    metavar="SEED",
+    type=int,
+    action="store",
+    help="seed for the random number generator, to repeat a simulation",
+)
+simulate_parser.add_argument(
+    "-t",
+    "--top",
+    metavar="COUNT",
+    type=NumberOrAllType(),
+    default="10",
+    action="store",
+    help="number of teams to display, or 'all' to display all teams",
+)
+
+
+def print_simulation(args: argparse.Namespace) -> None:
+    with Environment(args.config) as env:
+        application = Application(env.command_bus, env.query_bus, env.event_bus)
+        application.print_simulation(args.season, args.count, args.top, args.seed)
+
+
+simulate_parser.set_defaults(func=print_simulation)
+
 # ENTRY POINT--------------------------------
 
 
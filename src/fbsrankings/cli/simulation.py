@@ -0,0 +1,71 @@
+from typing import Optional
+from uuid import uuid4
+
+from communication.bus import QueryBus
+from fbsrankings.cli.table import print_table
+from fbsrankings.cli.table import print_table_title
+from fbsrankings.messages.query import SeasonSimulationQuery
+from fbsrankings.messages.query import SeasonSimulationResult
+
+
+def print_simulation(
+    query_bus: QueryBus,
+    year: int,
+    season_id: str,
+    count: int,
+    seed: Optional[int],
+    limit: Optional[int],
+) -> None:
+    result = query_bus.query(
+        SeasonSimulationQuery(
+            query_id=str(uuid4()),
+            season_id=season_id,
+            count=count,
+            seed=seed,
+        ),
+        SeasonSimulationResult,
+    )
+
+    print_table_title(year, result.week, "Season Simulation", "SRS")
+    _print_simulation_table(result, limit)
+
+
+def _print_simulation_table(
+    simulation: SeasonSimulationResult,
+    limit: Optional[int],
+) -> None:
+    headers = ["#", "Team", "W-L", "Val", "Exp_W", "Exp_#", "Top_1", "Top_4"]
+    alignments = ["r", "l", "r", "c", "c", "r", "r", "r"]
+    rows = []
+
+    teams = sorted(
+        (
+            (
+                sum(
+                    rank * probability
+                    for rank, probability in enumerate(team.rank_probabilities, 1)
+                ),
+                team,
+            )
+            for team in simulation.teams
+        ),
+        key=lambda item: item[0],
+    )
+    if limit is not None:
+        teams = teams[:limit]
+
+    for index, (expected_rank, team) in enumerate(teams, 1):
+        rows.append(
+            [
+                str(index),
+                str(team.name),
+                f"{team.wins}-{team.losses}",
+                f"{team.rating:.3f}",
+                f"{team.expected_wins:.1f}",
+                f"{expected_rank:.1f}",
+                f"{sum(team.rank_probabilities[:1]):.1%}",
+                f"{sum(team.rank_probabilities[:4]):.1%}",
+            ],
+        )
+
+    print_table(headers, alignments, rows)
@@ -0,0 +1,54 @@
+from typing import Optional
+
+
+def print_table(
+    header: list[str],
+    alignments: list[str],
+    rows: list[list[str]],
+) -> None:
+    num_columns = len(header)
+    column_widths = [
+        max(len(header[column]), max(len(row[column]) for row in rows))
+        for column in range(num_columns)
+    ]
+    separator = "+" + "+".join("-" * (width + 2) for width in column_widths) + "+"
+
+    print(separator)
+
+    line = "| "
+    for column in range(num_columns):
+        if alignments[column] == "r":
+            line += header[column].rjust(column_widths[column]) + " | "
+        elif alignments[column] == "l":
+            line += header[column].ljust(column_widths[column]) + " | "
+        else:
+            line += header[column].center(column_widths[column]) + " | "
+    print(line.rstrip())
+
+    print(separator)
+
+    for row in rows:
+        line = "| "
+        for column in range(num_columns):
+            if alignments[column] == "r":
+                line += row[column].rjust(column_widths[column]) + " | "
+            elif alignments[column] == "l":
+                line += row[column].ljust(column_widths[column]) + " | "
+            else:
+                line += row[column].center(column_widths[column]) + " | "
+        print(line.rstrip())
+
+    print(separator)
+
+
+def print_table_title(
+    year: int,
+    week: Optional[int],
+    header: str,
+    rating_name: str,
+) -> None:
+    print()
+    if week is not None:
+        print(f"{year}, Week {week} {header}, {rating_name}:")
+    else:
+        print(f"{year} {header}, {rating_name}:")
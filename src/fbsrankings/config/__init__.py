@@ -2,6 +2,11 @@
 
 from .config import ChannelType
 from .config import Config
+from .config import FetchConfig
+from .config import RankingConfig
+from .config import RankingDivisionType
+from .config import RankingEngineType
+from .config import RankingSolverType
 from .config import SerializationType
 from .config import SqliteFile
 from .config import StorageType
@@ -11,6 +16,11 @@ from .config import TinyDbFile
 __all__ = [
     "ChannelType",
     "Config",
+    "FetchConfig",
+    "RankingConfig",
+    "RankingDivisionType",
+    "RankingEngineType",
+    "RankingSolverType",
     "SerializationType",
     "SqliteFile",
     "StorageType",
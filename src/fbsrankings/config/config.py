@@ -5,6 +5,7 @@ from enum import Enum
 from pathlib import Path
 from typing import Any
 from typing import Literal
+from typing import Optional
 from typing import TypeVar
 from typing import Union
 
@@ -30,6 +31,27 @@ class StorageType(str, Enum):
     SQLITE_TINYDB = "sqlite-tinydb"
 
 
+class RankingEngineType(str, Enum):
+    AUTO = "auto"
+    DIRECT = "direct"
+    INCREMENTAL = "incremental"
+    BATCHED = "batched"
+    SPARSE = "sparse"
+
+
+class RankingSolverType(str, Enum):
+    AUTO = "auto"
+    LU = "lu"
+    CHOLESKY = "cholesky"
+    CG = "cg"
+    GMRES = "gmres"
+
+
+class RankingDivisionType(str, Enum):
+    FBS = "fbs"
+    ALL = "all"
+
+
 SqliteFile = Union[Path, Literal[":memory:"]]
 
 
@@ -70,6 +92,193 @@ class TinyDbConfig:
         return cls(file=Path(file))
 
 
+@dataclass(frozen=True)
+class RankingConfig:
+    engine: RankingEngineType = RankingEngineType.AUTO
+    srs_engine: Optional[RankingEngineType] = None
+    colley_matrix_engine: Optional[RankingEngineType] = None
+    simultaneous_wins_engine: Optional[RankingEngineType] = None
+    solver: RankingSolverType = RankingSolverType.AUTO
+    division: RankingDivisionType = RankingDivisionType.FBS
+    workers: int = 1
+    threads: int = 1
+    bootstrap_samples: int = 0
+
+    def __post_init__(self) -> None:
+        if not isinstance(self.workers, int) or self.workers < 1:
+            raise ValueError(f"Invalid ranking workers value: {self.workers}")
+
+        if not isinstance(self.threads, int) or self.threads < 1:
+            raise ValueError(f"Invalid ranking threads value: {self.threads}")
+
+        if not isinstance(self.bootstrap_samples, int) or self.bootstrap_samples < 0:
+            raise ValueError(
+                f"Invalid ranking bootstrap_samples value: {self.bootstrap_samples}",
+            )
+
+        if not isinstance(self.solver, RankingSolverType):
+            raise ValueError(f"Invalid ranking solver type: {self.solver}")
+
+        if not isinstance(self.division, RankingDivisionType):
+            raise ValueError(f"Invalid ranking division type: {self.division}")
+
+        for engine in (
+            self.engine,
+            self.srs_engine,
+            self.colley_matrix_engine,
+            self.simultaneous_wins_engine,
+        ):
+            if engine is not None and not isinstance(engine, RankingEngineType):
+                raise ValueError(f"Invalid ranking engine type: {engine}")
+
+    @classmethod
+    def from_dict(cls, data: dict[str, Any]) -> "RankingConfig":
+        def parse_engine(key: str) -> Optional[RankingEngineType]:
+            value = data.get(key)
+            if value is None:
+                return None
+            try:
+                return RankingEngineType(value)
+            except ValueError as ex:
+                raise ValueError(f"Invalid ranking engine value: {value}") from ex
+
+        solver = data.get("solver", RankingSolverType.AUTO.value)
+        try:
+            solver_type = RankingSolverType(solver)
+        except ValueError as ex:
+            raise ValueError(f"Invalid ranking solver value: {solver}") from ex
+
+        division = data.get("division", RankingDivisionType.FBS.value)
+        try:
+            division_type = RankingDivisionType(division)
+        except ValueError as ex:
+            raise ValueError(f"Invalid ranking division value: {division}") from ex
+
+        workers = data.get("workers", 1)
+        try:
+            worker_count = int(workers)
+        except ValueError as ex:
+            raise ValueError(f"Invalid ranking workers value: {workers}") from ex
+
+        threads = data.get("threads", 1)
+        try:
+            thread_count = int(threads)
+        except ValueError as ex:
+            raise ValueError(f"Invalid ranking threads value: {threads}") from ex
+
+        bootstrap_samples = data.get("bootstrap_samples", 0)
+        try:
+            bootstrap_sample_count = int(bootstrap_samples)
+        except ValueError as ex:
+            raise ValueError(
+                f"Invalid ranking bootstrap_samples value: {bootstrap_samples}",
+            ) from ex
+
+        return cls(
+            engine=parse_engine("engine") or RankingEngineType.AUTO,
+            srs_engine=parse_engine("srs_engine"),
+            colley_matrix_engine=parse_engine("colley_matrix_engine"),
+            simultaneous_wins_engine=parse_engine("simultaneous_wins_engine"),
+            solver=solver_type,
+            division=division_type,
+            workers=worker_count,
+            threads=thread_count,
+            bootstrap_samples=bootstrap_sample_count,
+        )
+
+
+@dataclass(frozen=True)
+class FetchConfig:
+    url: str = "https://www.sports-reference.com/cfb/years"
+    workers: int = 4
+    prefetch: int = 2
+    delay: float = 3.0
+    retries: int = 3
+    backoff: float = 2.0
+    cache: Optional[Path] = None
+    archive: Optional[Path] = None
+
+    def __post_init__(self) -> None:
+        if not isinstance(self.url, str) or not self.url.lower().startswith("http"):
+            raise ValueError(f"Invalid fetch url: {self.url}")
+
+        if not isinstance(self.workers, int) or self.workers < 1:
+            raise ValueError(f"Invalid fetch workers value: {self.workers}")
+
+        if not isinstance(self.prefetch, int) or self.prefetch < 0:
+            raise ValueError(f"Invalid fetch prefetch value: {self.prefetch}")
+
+        if not isinstance(self.delay, (int, float)) or self.delay < 0.0:
+            raise ValueError(f"Invalid fetch delay value: {self.delay}")
+
+        if not isinstance(self.retries, int) or self.retries < 0:
+            raise ValueError(f"Invalid fetch retries value: {self.retries}")
+
+        if not isinstance(self.backoff, (int, float)) or self.backoff < 0.0:
+            raise ValueError(f"Invalid fetch backoff value: {self.backoff}")
+
+        if self.cache is not None and not isinstance(self.cache, Path):
+            raise ValueError(f"Invalid fetch cache directory: {self.cache}")
+
+        if self.archive is not None and not isinstance(self.archive, Path):
+            raise ValueError(f"Invalid fetch archive path: {self.archive}")
+
+    @classmethod
+    def from_dict(cls, data: dict[str, Any]) -> "FetchConfig":
+        url = data.get("url", "https://www.sports-reference.com/cfb/years")
+        if not isinstance(url, str):
+            raise ValueError(f"Invalid fetch url value: {url}")
+
+        workers = data.get("workers", 4)
+        try:
+            worker_count = int(workers)
+        except ValueError as ex:
+            raise ValueError(f"Invalid fetch workers value: {workers}") from ex
+
+        prefetch = data.get("prefetch", 2)
+        try:
+            prefetch_count = int(prefetch)
+        except ValueError as ex:
+            raise ValueError(f"Invalid fetch prefetch value: {prefetch}") from ex
+
+        delay = data.get("delay", 3.0)
+        try:
+            delay_seconds = float(delay)
+        except ValueError as ex:
+            raise ValueError(f"Invalid fetch delay value: {delay}") from ex
+
+        retries = data.get("retries", 3)
+        try:
+            retry_count = int(retries)
+        except ValueError as ex:
+            raise ValueError(f"Invalid fetch retries value: {retries}") from ex
+
+        backoff = data.get("backoff", 2.0)
+        try:
+            backoff_seconds = float(backoff)
+        except ValueError as ex:
+            raise ValueError(f"Invalid fetch backoff value: {backoff}") from ex
+
+        cache = data.get("cache")
+        if cache is not None and not isinstance(cache, (str, Path)):
+            raise ValueError(f"Invalid fetch cache value: {cache}")
+
+        archive = data.get("archive")
+        if archive is not None and not isinstance(archive, (str, Path)):
+            raise ValueError(f"Invalid fetch archive value: {archive}")
+
+        return cls(
+            url=url.rstrip("/"),
+            workers=worker_count,
+            prefetch=prefetch_count,
+            delay=delay_seconds,
+            retries=retry_count,
+            backoff=backoff_seconds,
+            cache=Path(cache) if cache else None,
+            archive=Path(archive) if archive else None,
+        )
+
+
 @dataclass(frozen=True)
 class Config:
     channel: ChannelType
@@ -80,6 +289,8 @@ class Config:
 
     sqlite: SqliteConfig = field(default_factory=SqliteConfig)
     tinydb: TinyDbConfig = field(default_factory=TinyDbConfig)
+    ranking: RankingConfig = field(default_factory=RankingConfig)
+    fetch: FetchConfig = field(default_factory=FetchConfig)
 
     def __post_init__(self) -> None:
         if not isinstance(self.channel, ChannelType):
@@ -125,6 +336,8 @@ class Config:
             alternate_names=data.get("alternate_names", {}),
             sqlite=SqliteConfig.from_dict(data.get("sqlite", {})),
             tinydb=TinyDbConfig.from_dict(data.get("tinydb", {})),
+            ranking=RankingConfig.from_dict(data.get("ranking", {})),
+            fetch=FetchConfig.from_dict(data.get("fetch", {})),
         )
 
     @classmethod
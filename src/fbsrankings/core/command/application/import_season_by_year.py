@@ -3,6 +3,7 @@ from fbsrankings.config import Config
 from fbsrankings.core.command.domain.service.importer import Importer
 from fbsrankings.core.command.domain.service.validator import Validator
 from fbsrankings.core.command.infrastructure.data_source import DataSource
+from fbsrankings.core.command.infrastructure.page_source import PageSource
 from fbsrankings.core.command.infrastructure.sports_reference import SportsReference
 from fbsrankings.core.command.infrastructure.transaction.transaction import Transaction
 from fbsrankings.messages.command import ImportSeasonByYearCommand
@@ -13,10 +14,12 @@ class ImportSeasonByYearCommandHandler:
         self,
         config: Config,
         data_source: DataSource,
+        fetcher: PageSource,
         event_bus: EventBus,
     ) -> None:
         self._config = config
         self._data_source = data_source
+        self._fetcher = fetcher
         self._event_bus = event_bus
 
     def __call__(self, command: ImportSeasonByYearCommand) -> None:
@@ -29,9 +32,14 @@ class ImportSeasonByYearCommandHandler:
         with Transaction(self._data_source, self._event_bus) as transaction:
             importer = Importer(transaction.factory, transaction.repository)
             sports_reference = SportsReference(
+                self._config.fetch.url,
                 alternate_names,
                 importer,
                 validator,
+                self._fetcher,
+            )
+            sports_reference.prefetch_seasons(
+                [command.year, *command.prefetch_years[: self._config.fetch.prefetch]],
             )
             sports_reference.import_season(command.year)
             try:
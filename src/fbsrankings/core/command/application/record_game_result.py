@@ -0,0 +1,27 @@
+from uuid import UUID
+
+from communication.bus import EventBus
+from fbsrankings.core.command.domain.model.game import GameID
+from fbsrankings.core.command.infrastructure.data_source import DataSource
+from fbsrankings.core.command.infrastructure.transaction.transaction import Transaction
+from fbsrankings.messages.command import RecordGameResultCommand
+
+
+class RecordGameResultCommandHandler:
+    def __init__(self, data_source: DataSource, event_bus: EventBus) -> None:
+        self._data_source = data_source
+        self._event_bus = event_bus
+
+    def __call__(self, command: RecordGameResultCommand) -> None:
+        with Transaction(self._data_source, self._event_bus) as transaction:
+            game = transaction.repository.game.get(GameID(UUID(command.game_id)))
+            if game is None:
+                raise ValueError(f"Game not found for {command.game_id}")
+
+            game.complete(command.home_team_score, command.away_team_score)
+
+            try:
+                transaction.commit()
+            except Exception:
+                transaction.rollback()
+                raise
@@ -9,8 +9,17 @@ from fbsrankings.context import Context
 from fbsrankings.core.command.application.import_season_by_year import (
     ImportSeasonByYearCommandHandler,
 )
+from fbsrankings.core.command.application.record_game_result import (
+    RecordGameResultCommandHandler,
+)
 from fbsrankings.core.command.infrastructure.data_source import DataSource
+from fbsrankings.core.command.infrastructure.http_client import HttpClient
+from fbsrankings.core.command.infrastructure.page_archive import PageArchive
+from fbsrankings.core.command.infrastructure.page_cache import PageCache
+from fbsrankings.core.command.infrastructure.page_fetcher import PageFetcher
+from fbsrankings.core.command.infrastructure.page_source import PageSource
 from fbsrankings.messages.command import ImportSeasonByYearCommand
+from fbsrankings.messages.command import RecordGameResultCommand
 
 
 class Service(ContextManager["Service"]):
@@ -22,6 +31,20 @@ class Service(ContextManager["Service"]):
     ) -> None:
         config = context.config
         data_source = DataSource(context)
+        self._fetcher: PageSource
+        if config.fetch.archive is not None:
+            self._fetcher = PageArchive(config.fetch.archive)
+        else:
+            self._fetcher = PageFetcher(
+                config.fetch.workers,
+                config.fetch.delay,
+                HttpClient(config.fetch.retries, config.fetch.backoff),
+                (
+                    PageCache(config.fetch.cache)
+                    if config.fetch.cache is not None
+                    else None
+                ),
+            )
 
         self._command_bus = command_bus
         self._command_bus.register_handler(
@@ -29,12 +52,19 @@ class Service(ContextManager["Service"]):
             ImportSeasonByYearCommandHandler(
                 config,
                 data_source,
+                self._fetcher,
                 event_bus,
             ),
         )
+        self._command_bus.register_handler(
+            RecordGameResultCommand,
+            RecordGameResultCommandHandler(data_source, event_bus),
+        )
 
     def close(self) -> None:
         self._command_bus.unregister_handler(ImportSeasonByYearCommand)
+        self._command_bus.unregister_handler(RecordGameResultCommand)
+        self._fetcher.close()
 
     def __enter__(self) -> "Service":
         return self
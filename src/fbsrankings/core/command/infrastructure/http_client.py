@@ -0,0 +1,194 @@
+import socket
+import threading
+import zlib
+from collections.abc import Iterator
+from email.message import Message
+from http.client import HTTPConnection
+from http.client import HTTPException
+from http.client import HTTPResponse
+from http.client import HTTPSConnection
+from types import TracebackType
+from typing import ContextManager
+from typing import Literal
+from typing import Optional
+from urllib.parse import urljoin
+from urllib.parse import urlsplit
+
+
+class HttpResponse(ContextManager["HttpResponse"]):
+    # The body is read in chunks and decompressed as it is read. Once all of
+    # it has been read, the connection is handed back to the client to be
+    # used for the next request to the same host.
+    def __init__(
+        self,
+        client: "HttpClient",
+        host: tuple[str, str],
+        connection: HTTPConnection,
+        response: HTTPResponse,
+    ) -> None:
+        self._client = client
+        self._host = host
+        self._connection: Optional[HTTPConnection] = connection
+        self._response = response
+        self.status = response.status
+        self.reason = response.reason
+        self.headers: Message = response.headers
+
+    def chunks(self, size: int) -> Iterator[bytes]:
+        decompressor = (
+            zlib.decompressobj(zlib.MAX_WBITS | 16)
+            if self.headers.get("Content-Encoding", "").lower() == "gzip"
+            else None
+        )
+        while data := self._response.read(size):
+            if decompressor is not None:
+                data = decompressor.decompress(data)
+            if data:
+                yield data
+        if decompressor is not None:
+            data = decompressor.flush()
+            if data:
+                yield data
+
+    def close(self) -> None:
+        if self._connection is None:
+            return
+
+        # A response without a body is finished as soon as it is read, so the
+        # connection can still be reused. A response that was only partly
+        # read would leave the rest of its body in the way of the next one.
+        if not self._response.isclosed() and self._response.length == 0:
+            self._response.read()
+        if self._response.isclosed() and not self._response.will_close:
+            self._client.release(self._host, self._connection)
+        else:
+            self._response.close()
+            self._connection.close()
+        self._connection = None
+
+    def __enter__(self) -> "HttpResponse":
+        return self
+
+    def __exit__(
+        self,
+        type_: Optional[type[BaseException]],
+        value: Optional[BaseException],
+        traceback: Optional[TracebackType],
+    ) -> Literal[False]:
+        self.close()
+        return False
+
+
+class HttpClient:
+    redirects: int = 5
+    timeout: float = 60.0
+
+    # Keeps the connections to each host open between requests, so that the
+    # pages of a multi-season import do not each pay for a new connection and
+    # TLS handshake, and asks for pages to be sent compressed. A request that
+    # fails to connect, is cut off before its response, or is answered with
+    # a status that the server is busy or unavailable is retried, waiting
+    # twice as long before each retry. Once the body of a response has begun
+    # to be read, a failure is no longer retried.
+    def __init__(self, retries: int, backoff: float) -> None:
+        self._retries = retries
+        self._backoff = backoff
+        self._idle: dict[tuple[str, str], list[HTTPConnection]] = {}
+        self._lock = threading.Lock()
+        self._closed = threading.Event()
+
+    def get(self, url: str, headers: dict[str, str]) -> HttpResponse:
+        for _ in range(self.redirects + 1):
+            response = self._request(url, headers)
+            location = response.headers.get("Location")
+            if response.status not in (301, 302, 303, 307, 308) or not location:
+                return response
+            response.close()
+            url = urljoin(url, location)
+        raise ValueError(f"Too many redirects for {url}")
+
+    def release(self, host: tuple[str, str], connection: HTTPConnection) -> None:
+        with self._lock:
+            if not self._closed.is_set():
+                self._idle.setdefault(host, []).append(connection)
+                return
+        connection.close()
+
+    def close(self) -> None:
+        with self._lock:
+            self._closed.set()
+            idle = [
+                connection
+                for connections in self._idle.values()
+                for connection in connections
+            ]
+            self._idle.clear()
+        for connection in idle:
+            connection.close()
+
+    def _request(self, url: str, headers: dict[str, str]) -> HttpResponse:
+        parts = urlsplit(url)
+        host = (parts.scheme.lower(), parts.netloc)
+        path = parts.path or "/"
+        if parts.query:
+            path = f"{path}?{parts.query}"
+
+        attempt = 0
+        while True:
+            if self._closed.is_set():
+                raise RuntimeError(f"HTTP client was closed before requesting {url}")
+
+            connection, reused = self._connection(host)
+            try:
+                connection.request(
+                    "GET",
+                    path,
+                    headers={"Accept-Encoding": "gzip", **headers},
+                )
+                response = HttpResponse(
+                    self,
+                    host,
+                    connection,
+                    connection.getresponse(),
+                )
+            except (OSError, HTTPException) as error:
+                connection.close()
+                # The server may have closed an idle connection at any time,
+                # which is not a failure of the request itself. A host name
+                # that cannot be resolved is not worth retrying.
+                if reused:
+                    continue
+                if attempt >= self._retries or isinstance(error, socket.gaierror):
+                    raise
+                self._sleep(attempt, None)
+                attempt += 1
+                continue
+
+            if (
+                response.status not in (429, 500, 502, 503, 504)
+                or attempt >= self._retries
+            ):
+                return response
+            retry_after = response.headers.get("Retry-After")
+            response.close()
+            self._sleep(attempt, retry_after)
+            attempt += 1
+
+    def _connection(self, host: tuple[str, str]) -> tuple[HTTPConnection, bool]:
+        with self._lock:
+            connections = self._idle.get(host)
+            if connections:
+                return connections.pop(), True
+
+        scheme, netloc = host
+        if scheme == "https":
+            return HTTPSConnection(netloc, timeout=self.timeout), False
+        if scheme == "http":
+            return HTTPConnection(netloc, timeout=self.timeout), False
+        raise ValueError(f"Only HTTP is allowed for URL {scheme}://{netloc}")
+
+    def _sleep(self, attempt: int, retry_after: Optional[str]) -> None:
+        delay = self._backoff * 2**attempt
+        if retry_after is not None and retry_after.isdigit():
+            delay = max(delay, float(retry_after))
+        self._closed.wait(delay)
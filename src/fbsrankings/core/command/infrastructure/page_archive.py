@@ -0,0 +1,71 @@
+import codecs
+import mmap
+import tarfile
+from collections.abc import Iterable
+from collections.abc import Iterator
+from pathlib import Path
+from typing import BinaryIO
+from typing import Optional
+
+from fbsrankings.core.command.infrastructure.page_source import CHUNK_SIZE
+from fbsrankings.core.command.infrastructure.page_source import PageSource
+
+
+class PageArchive(PageSource):
+    # Reads pages from a local snapshot instead of downloading them, looking
+    # each one up by the last part of its url (e.g. 2018-schedule.html). The
+    # snapshot is either a directory of pages or an uncompressed tar archive
+    # of them. An archive is memory-mapped and each page is decoded straight
+    # from the mapped buffer, a chunk at a time.
+    def __init__(self, path: Path) -> None:
+        self._path = path
+        self._file: Optional[BinaryIO] = None
+        self._buffer: Optional[mmap.mmap] = None
+        self._members: Optional[dict[str, tuple[int, int]]] = None
+
+    def prefetch(self, urls: Iterable[str], final: bool = False) -> None:
+        pass
+
+    def stream(self, url: str, final: bool = False) -> Iterator[str]:
+        name = url.rsplit("/", 1)[-1]
+        if self._path.is_dir():
+            page_path = self._path / name
+            if not page_path.is_file():
+                raise ValueError(f"Page not found in {self._path}: {name}")
+            with page_path.open(mode="r", encoding="utf-8") as page_file:
+                while chunk := page_file.read(CHUNK_SIZE):
+                    yield chunk
+            return
+
+        buffer, members = self._open()
+        member = members.get(name)
+        if member is None:
+            raise ValueError(f"Page not found in {self._path}: {name}")
+        offset, size = member
+        decoder = codecs.getincrementaldecoder("utf-8")()
+        for start in range(offset, offset + size, CHUNK_SIZE):
+            end = min(start + CHUNK_SIZE, offset + size)
+            yield decoder.decode(buffer[start:end], final=end == offset + size)
+
+    def close(self) -> None:
+        if self._buffer is not None:
+            self._buffer.close()
+            self._buffer = None
+        if self._file is not None:
+            self._file.close()
+            self._file = None
+        self._members = None
+
+    def _open(self) -> tuple[mmap.mmap, dict[str, tuple[int, int]]]:
+        if self._buffer is None or self._members is None:
+            with tarfile.open(self._path, mode="r:") as archive:
+                members = {
+                    Path(member.name).name: (member.offset_data, member.size)
+                    for member in archive.getmembers()
+                    if member.isfile()
+                }
+
+            self._file = self._path.open(mode="rb")
+            self._buffer = mmap.mmap(self._file.fileno(), 0, access=mmap.ACCESS_READ)
+            self._members = members
+        return self._buffer, self._members
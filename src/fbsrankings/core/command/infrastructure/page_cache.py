@@ -0,0 +1,73 @@
+import gzip
+import hashlib
+import json
+import os
+import threading
+from pathlib import Path
+from typing import Optional
+
+
+class CachedPage:
+    def __init__(
+        self,
+        body: str,
+        etag: Optional[str],
+        last_modified: Optional[str],
+    ) -> None:
+        self.body = body
+        self.etag = etag
+        self.last_modified = last_modified
+
+
+class PageCache:
+    # Keeps a compressed copy of each downloaded page in a directory, along
+    # with the validators the server sent for it, so that a page can be
+    # revalidated with a conditional request or used without a request at
+    # all. Files are named after a hash of the url and are replaced
+    # atomically, so a cache shared by several imports stays consistent.
+    def __init__(self, directory: Path) -> None:
+        self._directory = directory
+        self._directory.mkdir(parents=True, exist_ok=True)
+
+    def get(self, url: str) -> Optional[CachedPage]:
+        body_path, metadata_path = self._paths(url)
+        try:
+            with metadata_path.open(mode="r", encoding="utf-8") as metadata_file:
+                metadata = json.load(metadata_file)
+            with gzip.open(body_path, mode="rt", encoding="utf-8") as body_file:
+                body = body_file.read()
+        except (OSError, ValueError):
+            return None
+
+        if metadata.get("url") != url:
+            return None
+        return CachedPage(body, metadata.get("etag"), metadata.get("last_modified"))
+
+    def put(self, url: str, page: CachedPage) -> None:
+        body_path, metadata_path = self._paths(url)
+        _replace(body_path, gzip.compress(page.body.encode("utf-8")))
+        _replace(
+            metadata_path,
+            json.dumps(
+                {
+                    "url": url,
+                    "etag": page.etag,
+                    "last_modified": page.last_modified,
+                },
+            ).encode("utf-8"),
+        )
+
+    def _paths(self, url: str) -> tuple[Path, Path]:
+        name = hashlib.sha256(url.encode("utf-8")).hexdigest()
+        return (
+            self._directory / f"{name}.html.gz",
+            self._directory / f"{name}.json",
+        )
+
+
+def _replace(path: Path, data: bytes) -> None:
+    temp_path = path.with_name(
+        f"{path.name}.{os.getpid()}.{threading.get_ident()}.tmp",
+    )
+    temp_path.write_bytes(data)
+    os.replace(temp_path, path)
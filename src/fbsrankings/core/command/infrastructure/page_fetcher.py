@@ -0,0 +1,141 @@
+import codecs
+import itertools
+import queue
+import threading
+import time
+from collections.abc import Iterable
+from collections.abc import Iterator
+from concurrent.futures import Future
+from concurrent.futures import ThreadPoolExecutor
+from typing import Optional
+from urllib.error import HTTPError
+
+from fbsrankings.core.command.infrastructure.http_client import HttpClient
+from fbsrankings.core.command.infrastructure.page_cache import CachedPage
+from fbsrankings.core.command.infrastructure.page_cache import PageCache
+from fbsrankings.core.command.infrastructure.page_source import CHUNK_SIZE
+from fbsrankings.core.command.infrastructure.page_source import PageSource
+
+
+class _PageStream:
+    # The chunks of a page are handed from the thread downloading it to the
+    # reader as they arrive, followed by None once the download is done.
+    def __init__(
+        self,
+        chunks: queue.SimpleQueue[Optional[str]],
+        download: Future[None],
+    ) -> None:
+        self.chunks = chunks
+        self.download = download
+
+
+class PageFetcher(PageSource):
+    # Downloads pages on a pool of threads, so that the pages of the seasons
+    # that will be imported next can be requested while the current one is
+    # being imported. However many threads are waiting, requests are started
+    # at least the delay apart to stay within the rate limit of the site.
+    #
+    # With a cache, a final page that was already downloaded is used without
+    # a request, and any other cached page is revalidated with a conditional
+    # request. Requests are made through a client that keeps the connection
+    # to the site open between them.
+    #
+    # A page is read from the response in chunks and handed to the reader as
+    # each one arrives, so it can be parsed while the rest is downloading.
+    def __init__(
+        self,
+        workers: int,
+        delay: float,
+        client: HttpClient,
+        cache: Optional[PageCache] = None,
+    ) -> None:
+        self._delay = delay
+        self._client = client
+        self._cache = cache
+        self._executor = ThreadPoolExecutor(max_workers=workers)
+        self._pages: dict[str, _PageStream] = {}
+        self._lock = threading.Lock()
+        self._next_request = 0.0
+        self._closed = threading.Event()
+
+    def prefetch(self, urls: Iterable[str], final: bool = False) -> None:
+        for url in urls:
+            if url not in self._pages:
+                self._pages[url] = self._start(url, final)
+
+    def stream(self, url: str, final: bool = False) -> Iterator[str]:
+        page = self._pages.pop(url, None)
+        if page is None:
+            page = self._start(url, final)
+
+        while (chunk := page.chunks.get()) is not None:
+            yield chunk
+        page.download.result()
+
+    def close(self) -> None:
+        self._closed.set()
+        self._client.close()
+        self._pages.clear()
+        self._executor.shutdown(wait=True, cancel_futures=True)
+
+    def _start(self, url: str, final: bool) -> _PageStream:
+        chunks: queue.SimpleQueue[Optional[str]] = queue.SimpleQueue()
+        download = self._executor.submit(self._download, url, final, chunks)
+        download.add_done_callback(lambda _: chunks.put(None))
+        return _PageStream(chunks, download)
+
+    def _download(
+        self,
+        url: str,
+        final: bool,
+        chunks: queue.SimpleQueue[Optional[str]],
+    ) -> None:
+        cached = self._cache.get(url) if self._cache is not None else None
+        if cached is not None and final:
+            chunks.put(cached.body)
+            return
+
+        headers: dict[str, str] = {}
+        if cached is not None and cached.etag is not None:
+            headers["If-None-Match"] = cached.etag
+        if cached is not None and cached.last_modified is not None:
+            headers["If-Modified-Since"] = cached.last_modified
+
+        self._wait()
+        if self._closed.is_set():
+            raise RuntimeError(f"Page fetcher was closed before requesting {url}")
+        with self._client.get(url, headers) as response:
+            if response.status == 304 and cached is not None:
+                chunks.put(cached.body)
+                return
+            if response.status != 200:
+                raise HTTPError(
+                    url,
+                    response.status,
+                    response.reason,
+                    response.headers,
+                    None,
+                )
+
+            # The whole body is only kept when it is going to be cached.
+            body: Optional[list[str]] = [] if self._cache is not None else None
+            decoder = codecs.getincrementaldecoder("utf-8")()
+            for data in itertools.chain(response.chunks(CHUNK_SIZE), [b""]):
+                chunk = decoder.decode(data, final=not data)
+                if chunk:
+                    chunks.put(chunk)
+                    if body is not None:
+                        body.append(chunk)
+            etag = response.headers.get("ETag")
+            last_modified = response.headers.get("Last-Modified")
+
+        if body is not None and self._cache is not None:
+            self._cache.put(url, CachedPage("".join(body), etag, last_modified))
+
+    def _wait(self) -> None:
+        with self._lock:
+            now = time.monotonic()
+            start = max(now, self._next_request)
+            self._next_request = start + self._delay
+        if start > now:
+            self._closed.wait(start - now)
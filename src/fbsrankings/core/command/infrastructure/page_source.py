@@ -0,0 +1,21 @@
+from abc import ABCMeta
+from abc import abstractmethod
+from collections.abc import Iterable
+from collections.abc import Iterator
+
+
+CHUNK_SIZE = 64 * 1024
+
+
+class PageSource(metaclass=ABCMeta):
+    @abstractmethod
+    def prefetch(self, urls: Iterable[str], final: bool = False) -> None:
+        raise NotImplementedError
+
+    @abstractmethod
+    def stream(self, url: str, final: bool = False) -> Iterator[str]:
+        raise NotImplementedError
+
+    @abstractmethod
+    def close(self) -> None:
+        raise NotImplementedError
@@ -1,9 +1,10 @@
 import datetime
+import re
+from collections.abc import Iterable
 from collections.abc import Iterator
 from html.parser import HTMLParser
 from typing import Any
 from typing import Optional
-from urllib.request import urlopen
 
 from fbsrankings.core.command.domain.model.affiliation import Affiliation
 from fbsrankings.core.command.domain.model.game import Game
@@ -11,6 +12,7 @@ from fbsrankings.core.command.domain.model.season import Season
 from fbsrankings.core.command.domain.model.team import Team
 from fbsrankings.core.command.domain.service.importer import Importer
 from fbsrankings.core.command.domain.service.validator import Validator
+from fbsrankings.core.command.infrastructure.page_source import PageSource
 from fbsrankings.messages.enums import GameStatus
 from fbsrankings.messages.enums import SeasonSection
 from fbsrankings.messages.enums import Subdivision
@@ -19,10 +21,16 @@ from fbsrankings.messages.enums import Subdivision
 class SportsReference:
     def __init__(
         self,
+        url: str,
         alternate_names: dict[str, str],
         importer: Importer,
         validator: Validator,
+        fetcher: PageSource,
     ) -> None:
+        if not url.lower().startswith("http"):
+            raise ValueError(f"Only HTTP is allowed for URL {url}")
+        self._url = url
+
         if alternate_names is not None:
             self._alternate_names = {
                 key.lower(): value for key, value in alternate_names.items()
@@ -32,23 +40,19 @@ class SportsReference:
 
         self._importer = importer
         self._validator = validator
+        self._fetcher = fetcher
 
-    def import_season(self, year: int) -> None:
-        team_url = f"https://www.sports-reference.com/cfb/years/{year}-standings.html"
-        if not team_url.lower().startswith("http"):
-            raise ValueError(f"Only HTTP is allowed for teams URL {team_url}")
-
-        with urlopen(team_url) as team_html:  # nosec
-            team_soup = team_html.read().decode("utf-8")
-        team_rows = _html_iter(team_soup)
+    def prefetch_seasons(self, years: Iterable[int]) -> None:
+        for year in years:
+            self._fetcher.prefetch(self._urls(year), self._is_final(year))
 
-        game_url = f"https://www.sports-reference.com/cfb/years/{year}-schedule.html"
-        if not game_url.lower().startswith("http"):
-            raise ValueError(f"Only HTTP is allowed for games URL {game_url}")
+    def import_season(self, year: int) -> None:
+        team_url, game_url = self._urls(year)
+        final = self._is_final(year)
+        self._fetcher.prefetch([team_url, game_url], final)
 
-        with urlopen(game_url) as game_html:  # nosec
-            game_soup = game_html.read().decode("utf-8")
-        game_rows = _html_iter(game_soup)
+        team_rows = _html_iter(self._fetcher.stream(team_url, final), "standings")
+        game_rows = _html_iter(self._fetcher.stream(game_url, final), "schedule")
 
         season = self._importer.import_season(year)
 
@@ -79,6 +83,18 @@ class SportsReference:
                 games,
             )
 
+    @staticmethod
+    def _is_final(year: int) -> bool:
+        # The last bowl games of a season are played in January, so its pages
+        # do not change after that.
+        return datetime.date.today() >= datetime.date(year + 1, 2, 1)
+
+    def _urls(self, year: int) -> tuple[str, str]:
+        return (
+            f"{self._url}/{year}-standings.html",
+            f"{self._url}/{year}-schedule.html",
+        )
+
     def _import_team_rows(
         self,
         season: Season,
@@ -308,43 +324,115 @@ class SportsReference:
 
 
 class TableRowParser(HTMLParser):
-    def __init__(self) -> None:
+    # Collects the rows of the table with the given id as they are completed,
+    # ignoring the rows of any other table, so that a page can be fed in
+    # chunks and its rows taken while the rest of it is still downloading.
+    # The text of a cell is its last run of text between tags, which may be
+    # split across several chunks.
+    def __init__(self, table_id: str) -> None:
         super().__init__()
+        self.table_id = table_id
+        self.table_depth = 0
+        self.found = False
+        self.done = False
         self.in_tr = False
         self.in_td_or_th = False
+        self.in_data = False
         self.data = ""
         self.current_row: list[str] = []
         self.rows: list[list[str]] = []
 
+    def take_rows(self) -> list[list[str]]:
+        rows = self.rows
+        self.rows = []
+        return rows
+
     def handle_starttag(
         self,
         tag: str,
-        _: list[tuple[str, Optional[str]]],
+        attrs: list[tuple[str, Optional[str]]],
     ) -> None:
-        if tag == "tr":
-            self.in_tr = True
-            self.current_row = []
-        elif tag in ("td", "th") and self.in_tr:
-            self.in_td_or_th = True
-            self.data = ""
+        self.in_data = False
+        if tag == "table":
+            if self.table_depth > 0:
+                self.table_depth += 1
+            elif not self.done and ("id", self.table_id) in attrs:
+                self.table_depth = 1
+                self.found = True
+        elif self.table_depth == 1:
+            if tag == "tr":
+                self.in_tr = True
+                self.current_row = []
+            elif tag in ("td", "th") and self.in_tr:
+                self.in_td_or_th = True
+                self.data = ""
 
     def handle_endtag(self, tag: str) -> None:
-        if tag == "tr" and self.in_tr:
-            self.in_tr = False
-            self.rows.append(self.current_row)
-        elif tag in ("td", "th") and self.in_td_or_th:
-            self.in_td_or_th = False
-            self.current_row.append(self.data.strip())
+        self.in_data = False
+        if tag == "table":
+            if self.table_depth > 0:
+                self.table_depth -= 1
+                self.done = self.table_depth == 0
+        elif self.table_depth == 1:
+            if tag == "tr" and self.in_tr:
+                self.in_tr = False
+                self.rows.append(self.current_row)
+            elif tag in ("td", "th") and self.in_td_or_th:
+                self.in_td_or_th = False
+                self.current_row.append(self.data.strip())
 
     def handle_data(self, data: str) -> None:
         if self.in_td_or_th:
-            self.data = data
+            self.data = self.data + data if self.in_data else data
+            self.in_data = True
+
+    def handle_comment(self, data: str) -> None:
+        self.in_data = False
 
     def error(self, message: str) -> Any:
         raise ValueError(message)
 
 
-def _html_iter(html_content: str) -> Iterator[list[str]]:
-    parser = TableRowParser()
-    parser.feed(html_content)
-    yield from parser.rows
+def _html_iter(chunks: Iterable[str], table_id: str) -> Iterator[list[str]]:
+    # Markup before the table is skipped with a plain search instead of being
+    # parsed, keeping enough of it between chunks to find a start tag or the
+    # end of a comment that is split across them, and the rest of the page is
+    # not read at all once the table has ended. A table inside a comment is
+    # skipped, as the parser would.
+    table_start = re.compile(
+        rf"""<!--|<table\b[^>]*?\bid=["']?{re.escape(table_id)}["'\s/>]""",
+        re.IGNORECASE,
+    )
+    parser = TableRowParser(table_id)
+    skipped: Optional[str] = ""
+    for chunk in chunks:
+        if skipped is not None:
+            skipped += chunk
+            match = table_start.search(skipped)
+            while match is not None and match.group() == "<!--":
+                comment_end = skipped.find("-->", match.end())
+                if comment_end < 0:
+                    break
+                skipped = skipped[comment_end + 3 :]
+                match = table_start.search(skipped)
+            if match is None:
+                tag_start = skipped.rfind("<")
+                skipped = skipped[tag_start:] if tag_start >= 0 else ""
+                continue
+            if match.group() == "<!--":
+                skipped = skipped[match.start() :]
+                continue
+            # The start tag may not be complete yet, so the parser may not
+            # have found the table until it is fed the next chunk.
+            chunk = skipped[match.start() :]
+            skipped = None
+
+        parser.feed(chunk)
+        yield from parser.take_rows()
+        if parser.done:
+            break
+
+    if not parser.found:
+        raise ValueError(f"Table was not found: {table_id}")
+    parser.close()
+    yield from parser.take_rows()
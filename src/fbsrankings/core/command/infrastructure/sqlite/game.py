@@ -90,12 +90,12 @@ class GameRepository(BaseRepository):
             str,
             int,
             str,
-            str,
+            SeasonSection,
             str,
             str,
             Optional[int],
             Optional[int],
-            str,
+            GameStatus,
             str,
         ],
     ) -> Game:
@@ -105,12 +105,12 @@ class GameRepository(BaseRepository):
             SeasonID(UUID(row[1])),
             row[2],
             datetime.strptime(row[3], "%Y-%m-%d").date(),
-            SeasonSection(row[4]),
+            row[4],
             TeamID(UUID(row[5])),
             TeamID(UUID(row[6])),
             row[7],
             row[8],
-            GameStatus(row[9]),
+            row[9],
             row[10],
         )
 
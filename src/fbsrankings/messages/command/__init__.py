@@ -1,12 +1,16 @@
 """Command message classes for the fbsrankings package"""
 
 from .calculate_rankings_for_season_pb2 import CalculateRankingsForSeasonCommand
+from .calculate_rankings_for_seasons_pb2 import CalculateRankingsForSeasonsCommand
 from .drop_storage_pb2 import DropStorageCommand
 from .import_season_by_year_pb2 import ImportSeasonByYearCommand
+from .record_game_result_pb2 import RecordGameResultCommand
 
 
 __all__ = [
     "CalculateRankingsForSeasonCommand",
+    "CalculateRankingsForSeasonsCommand",
     "DropStorageCommand",
     "ImportSeasonByYearCommand",
+    "RecordGameResultCommand",
 ]
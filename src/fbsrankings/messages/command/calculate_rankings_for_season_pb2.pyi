@@ -6,11 +6,13 @@ from typing import ClassVar as _ClassVar, Optional as _Optional
 DESCRIPTOR: _descriptor.FileDescriptor
 
 class CalculateRankingsForSeasonCommand(_message.Message):
-    __slots__ = ("command_id", "season_id", "year")
+    __slots__ = ("command_id", "season_id", "year", "start_week")
     COMMAND_ID_FIELD_NUMBER: _ClassVar[int]
     SEASON_ID_FIELD_NUMBER: _ClassVar[int]
     YEAR_FIELD_NUMBER: _ClassVar[int]
+    START_WEEK_FIELD_NUMBER: _ClassVar[int]
     command_id: str
     season_id: str
     year: int
-    def __init__(self, command_id: _Optional[str] = ..., season_id: _Optional[str] = ..., year: _Optional[int] = ...) -> None: ...
+    start_week: int
+    def __init__(self, command_id: _Optional[str] = ..., season_id: _Optional[str] = ..., year: _Optional[int] = ..., start_week: _Optional[int] = ...) -> None: ...
@@ -0,0 +1,43 @@
+# -*- coding: utf-8 -*-
+# Generated by the protocol buffer compiler.  DO NOT EDIT!
+# NO CHECKED-IN PROTOBUF GENCODE
+# source: fbsrankings/messages/command/calculate_rankings_for_seasons.proto
+# Protobuf Python Version: 6.30.1
+"""Generated protocol buffer code."""
+from google.protobuf import descriptor as _descriptor
+from google.protobuf import descriptor_pool as _descriptor_pool
+from google.protobuf import runtime_version as _runtime_version
+from google.protobuf import symbol_database as _symbol_database
+from google.protobuf.internal import builder as _builder
+_runtime_version.ValidateProtobufRuntimeVersion(
+    _runtime_version.Domain.PUBLIC,
+    6,
+    30,
+    1,
+    '',
+    'fbsrankings/messages/command/calculate_rankings_for_seasons.proto'
+)
+# @@protoc_insertion_point(imports)
+
+_sym_db = _symbol_database.Default()
+
+
+from fbsrankings.messages.options import options_pb2 as fbsrankings_dot_messages_dot_options_dot_options__pb2
+
+
+DESCRIPTOR = _descriptor_pool.Default().AddSerializedFile(b'\nAfbsrankings/messages/command/calculate_rankings_for_seasons.proto\x12\x1c\x66\x62srankings.messages.command\x1a*fbsrankings/messages/options/options.proto\"\x9e\x02\n\"CalculateRankingsForSeasonsCommand\x12\x12\n\ncommand_id\x18\x01 \x01(\t\x12\x12\n\nseason_ids\x18\x02 \x03(\t\x12\x65\n\x0bstart_weeks\x18\x03 \x03(\x0b\x32P.fbsrankings.messages.command.CalculateRankingsForSeasonsCommand.StartWeeksEntry\x1a\x31\n\x0fStartWeeksEntry\x12\x0b\n\x03key\x18\x01 \x01(\t\x12\r\n\x05value\x18\x02 \x01(\x05:\x02\x38\x01:6\x82\xb5\x18\x32\x66\x62srankings.command.calculate_rankings_for_seasonsb\x06proto3')
+
+_globals = globals()
+_builder.BuildMessageAndEnumDescriptors(DESCRIPTOR, _globals)
+_builder.BuildTopDescriptorsAndMessages(DESCRIPTOR, 'fbsrankings.messages.command.calculate_rankings_for_seasons_pb2', _globals)
+if not _descriptor._USE_C_DESCRIPTORS:
+  DESCRIPTOR._loaded_options = None
+  _globals['_CALCULATERANKINGSFORSEASONSCOMMAND_STARTWEEKSENTRY']._loaded_options = None
+  _globals['_CALCULATERANKINGSFORSEASONSCOMMAND_STARTWEEKSENTRY']._serialized_options = b'8\001'
+  _globals['_CALCULATERANKINGSFORSEASONSCOMMAND']._loaded_options = None
+  _globals['_CALCULATERANKINGSFORSEASONSCOMMAND']._serialized_options = b'\202\265\0302fbsrankings.command.calculate_rankings_for_seasons'
+  _globals['_CALCULATERANKINGSFORSEASONSCOMMAND']._serialized_start=144
+  _globals['_CALCULATERANKINGSFORSEASONSCOMMAND']._serialized_end=430
+  _globals['_CALCULATERANKINGSFORSEASONSCOMMAND_STARTWEEKSENTRY']._serialized_start=325
+  _globals['_CALCULATERANKINGSFORSEASONSCOMMAND_STARTWEEKSENTRY']._serialized_end=374
+# @@protoc_insertion_point(module_scope)
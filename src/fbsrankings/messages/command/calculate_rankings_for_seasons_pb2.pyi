@@ -0,0 +1,25 @@
+from fbsrankings.messages.options import options_pb2 as _options_pb2
+from google.protobuf.internal import containers as _containers
+from google.protobuf import descriptor as _descriptor
+from google.protobuf import message as _message
+from collections.abc import Iterable as _Iterable, Mapping as _Mapping
+from typing import ClassVar as _ClassVar, Optional as _Optional
+
+DESCRIPTOR: _descriptor.FileDescriptor
+
+class CalculateRankingsForSeasonsCommand(_message.Message):
+    __slots__ = ("command_id", "season_ids", "start_weeks")
+    class StartWeeksEntry(_message.Message):
+        __slots__ = ("key", "value")
+        KEY_FIELD_NUMBER: _ClassVar[int]
+        VALUE_FIELD_NUMBER: _ClassVar[int]
+        key: str
+        value: int
+        def __init__(self, key: _Optional[str] = ..., value: _Optional[int] = ...) -> None: ...
+    COMMAND_ID_FIELD_NUMBER: _ClassVar[int]
+    SEASON_IDS_FIELD_NUMBER: _ClassVar[int]
+    START_WEEKS_FIELD_NUMBER: _ClassVar[int]
+    command_id: str
+    season_ids: _containers.RepeatedScalarFieldContainer[str]
+    start_weeks: _containers.ScalarMap[str, int]
+    def __init__(self, command_id: _Optional[str] = ..., season_ids: _Optional[_Iterable[str]] = ..., start_weeks: _Optional[_Mapping[str, int]] = ...) -> None: ...
@@ -1,14 +1,18 @@
 from fbsrankings.messages.options import options_pb2 as _options_pb2
+from google.protobuf.internal import containers as _containers
 from google.protobuf import descriptor as _descriptor
 from google.protobuf import message as _message
+from collections.abc import Iterable as _Iterable
 from typing import ClassVar as _ClassVar, Optional as _Optional
 
 DESCRIPTOR: _descriptor.FileDescriptor
 
 class ImportSeasonByYearCommand(_message.Message):
-    __slots__ = ("command_id", "year")
+    __slots__ = ("command_id", "year", "prefetch_years")
     COMMAND_ID_FIELD_NUMBER: _ClassVar[int]
     YEAR_FIELD_NUMBER: _ClassVar[int]
+    PREFETCH_YEARS_FIELD_NUMBER: _ClassVar[int]
     command_id: str
     year: int
-    def __init__(self, command_id: _Optional[str] = ..., year: _Optional[int] = ...) -> None: ...
+    prefetch_years: _containers.RepeatedScalarFieldContainer[int]
+    def __init__(self, command_id: _Optional[str] = ..., year: _Optional[int] = ..., prefetch_years: _Optional[_Iterable[int]] = ...) -> None: ...
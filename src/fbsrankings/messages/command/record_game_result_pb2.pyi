@@ -0,0 +1,18 @@
+from fbsrankings.messages.options import options_pb2 as _options_pb2
+from google.protobuf import descriptor as _descriptor
+from google.protobuf import message as _message
+from typing import ClassVar as _ClassVar, Optional as _Optional
+
+DESCRIPTOR: _descriptor.FileDescriptor
+
+class RecordGameResultCommand(_message.Message):
+    __slots__ = ("command_id", "game_id", "home_team_score", "away_team_score")
+    COMMAND_ID_FIELD_NUMBER: _ClassVar[int]
+    GAME_ID_FIELD_NUMBER: _ClassVar[int]
+    HOME_TEAM_SCORE_FIELD_NUMBER: _ClassVar[int]
+    AWAY_TEAM_SCORE_FIELD_NUMBER: _ClassVar[int]
+    command_id: str
+    game_id: str
+    home_team_score: int
+    away_team_score: int
+    def __init__(self, command_id: _Optional[str] = ..., game_id: _Optional[str] = ..., home_team_score: _Optional[int] = ..., away_team_score: _Optional[int] = ...) -> None: ...
@@ -1,3 +1,4 @@
+from collections.abc import Iterable
 from datetime import date
 from datetime import datetime
 
@@ -12,3 +13,18 @@ def datetime_to_timestamp(value: datetime) -> Timestamp:
 
 def date_to_timestamp(value: date) -> Timestamp:
     return datetime_to_timestamp(datetime.combine(value, datetime.min.time()))
+
+
+def ids_to_bytes(values: Iterable[str]) -> bytes:
+    return bytes.fromhex("".join(values).replace("-", ""))
+
+
+def bytes_to_ids(value: bytes) -> list[str]:
+    # Formatting the hex digits directly is several times faster than going
+    # through UUID for each id.
+    digits = value.hex()
+    return [
+        f"{digits[i : i + 8]}-{digits[i + 8 : i + 12]}-{digits[i + 12 : i + 16]}-"
+        f"{digits[i + 16 : i + 20]}-{digits[i + 20 : i + 32]}"
+        for i in range(0, len(digits), 32)
+    ]
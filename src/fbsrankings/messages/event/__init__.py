@@ -1,6 +1,7 @@
 """Event message classes for the fbsrankings package"""
 
 from .affiliation_pb2 import AffiliationCreatedEvent
+from .fingerprint_pb2 import RankingFingerprintCalculatedEvent
 from .game_pb2 import GameCanceledEvent
 from .game_pb2 import GameCompletedEvent
 from .game_pb2 import GameCreatedEvent
@@ -12,6 +13,9 @@ from .ranking_pb2 import TeamRankingCalculatedEvent
 from .record_pb2 import TeamRecordCalculatedEvent
 from .record_pb2 import TeamRecordValue
 from .season_pb2 import SeasonCreatedEvent
+from .season_ranking_pb2 import PackedRanking
+from .season_ranking_pb2 import PackedTeamRecord
+from .season_ranking_pb2 import SeasonRankingsCalculatedEvent
 from .team_pb2 import TeamCreatedEvent
 
 
@@ -23,8 +27,12 @@ __all__ = [
     "GameNotesUpdatedEvent",
     "GameRankingCalculatedEvent",
     "GameRescheduledEvent",
+    "PackedRanking",
+    "PackedTeamRecord",
+    "RankingFingerprintCalculatedEvent",
     "RankingValue",
     "SeasonCreatedEvent",
+    "SeasonRankingsCalculatedEvent",
     "TeamCreatedEvent",
     "TeamRankingCalculatedEvent",
     "TeamRecordCalculatedEvent",
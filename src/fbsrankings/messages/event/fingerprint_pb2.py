@@ -0,0 +1,39 @@
+# -*- coding: utf-8 -*-
+# Generated by the protocol buffer compiler.  DO NOT EDIT!
+# NO CHECKED-IN PROTOBUF GENCODE
+# source: fbsrankings/messages/event/fingerprint.proto
+# Protobuf Python Version: 6.30.1
+"""Generated protocol buffer code."""
+from google.protobuf import descriptor as _descriptor
+from google.protobuf import descriptor_pool as _descriptor_pool
+from google.protobuf import runtime_version as _runtime_version
+from google.protobuf import symbol_database as _symbol_database
+from google.protobuf.internal import builder as _builder
+_runtime_version.ValidateProtobufRuntimeVersion(
+    _runtime_version.Domain.PUBLIC,
+    6,
+    30,
+    1,
+    '',
+    'fbsrankings/messages/event/fingerprint.proto'
+)
+# @@protoc_insertion_point(imports)
+
+_sym_db = _symbol_database.Default()
+
+
+from fbsrankings.messages.options import options_pb2 as fbsrankings_dot_messages_dot_options_dot_options__pb2
+
+
+DESCRIPTOR = _descriptor_pool.Default().AddSerializedFile(b'\n,fbsrankings/messages/event/fingerprint.proto\x12\x1a\x66\x62srankings.messages.event\x1a*fbsrankings/messages/options/options.proto\"\x93\x01\n!RankingFingerprintCalculatedEvent\x12\x10\n\x08\x65vent_id\x18\x01 \x01(\t\x12\x11\n\tseason_id\x18\x02 \x01(\t\x12\x13\n\x0b\x66ingerprint\x18\x03 \x01(\t:4\x82\xb5\x18\x30\x66\x62srankings.event.ranking_fingerprint_calculatedb\x06proto3')
+
+_globals = globals()
+_builder.BuildMessageAndEnumDescriptors(DESCRIPTOR, _globals)
+_builder.BuildTopDescriptorsAndMessages(DESCRIPTOR, 'fbsrankings.messages.event.fingerprint_pb2', _globals)
+if not _descriptor._USE_C_DESCRIPTORS:
+  DESCRIPTOR._loaded_options = None
+  _globals['_RANKINGFINGERPRINTCALCULATEDEVENT']._loaded_options = None
+  _globals['_RANKINGFINGERPRINTCALCULATEDEVENT']._serialized_options = b'\202\265\0300fbsrankings.event.ranking_fingerprint_calculated'
+  _globals['_RANKINGFINGERPRINTCALCULATEDEVENT']._serialized_start=121
+  _globals['_RANKINGFINGERPRINTCALCULATEDEVENT']._serialized_end=268
+# @@protoc_insertion_point(module_scope)
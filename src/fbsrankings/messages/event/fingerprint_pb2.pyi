@@ -0,0 +1,16 @@
+from fbsrankings.messages.options import options_pb2 as _options_pb2
+from google.protobuf import descriptor as _descriptor
+from google.protobuf import message as _message
+from typing import ClassVar as _ClassVar, Optional as _Optional
+
+DESCRIPTOR: _descriptor.FileDescriptor
+
+class RankingFingerprintCalculatedEvent(_message.Message):
+    __slots__ = ("event_id", "season_id", "fingerprint")
+    EVENT_ID_FIELD_NUMBER: _ClassVar[int]
+    SEASON_ID_FIELD_NUMBER: _ClassVar[int]
+    FINGERPRINT_FIELD_NUMBER: _ClassVar[int]
+    event_id: str
+    season_id: str
+    fingerprint: str
+    def __init__(self, event_id: _Optional[str] = ..., season_id: _Optional[str] = ..., fingerprint: _Optional[str] = ...) -> None: ...
@@ -0,0 +1,43 @@
+# -*- coding: utf-8 -*-
+# Generated by the protocol buffer compiler.  DO NOT EDIT!
+# NO CHECKED-IN PROTOBUF GENCODE
+# source: fbsrankings/messages/event/season_ranking.proto
+# Protobuf Python Version: 6.30.1
+"""Generated protocol buffer code."""
+from google.protobuf import descriptor as _descriptor
+from google.protobuf import descriptor_pool as _descriptor_pool
+from google.protobuf import runtime_version as _runtime_version
+from google.protobuf import symbol_database as _symbol_database
+from google.protobuf.internal import builder as _builder
+_runtime_version.ValidateProtobufRuntimeVersion(
+    _runtime_version.Domain.PUBLIC,
+    6,
+    30,
+    1,
+    '',
+    'fbsrankings/messages/event/season_ranking.proto'
+)
+# @@protoc_insertion_point(imports)
+
+_sym_db = _symbol_database.Default()
+
+
+from fbsrankings.messages.options import options_pb2 as fbsrankings_dot_messages_dot_options_dot_options__pb2
+
+
+DESCRIPTOR = _descriptor_pool.Default().AddSerializedFile(b'\n/fbsrankings/messages/event/season_ranking.proto\x12\x1a\x66\x62srankings.messages.event\x1a*fbsrankings/messages/options/options.proto\"n\n\x10PackedTeamRecord\x12\x11\n\trecord_id\x18\x01 \x01(\t\x12\x11\n\x04week\x18\x02 \x01(\x05H\x00\x88\x01\x01\x12\r\n\x05teams\x18\x03 \x03(\x05\x12\x0c\n\x04wins\x18\x04 \x03(\x05\x12\x0e\n\x06losses\x18\x05 \x03(\x05\x42\x07\n\x05_week\"\x89\x01\n\rPackedRanking\x12\x12\n\nranking_id\x18\x01 \x01(\t\x12\x0c\n\x04name\x18\x02 \x01(\t\x12\x11\n\x04week\x18\x03 \x01(\x05H\x00\x88\x01\x01\x12\x0b\n\x03ids\x18\x04 \x03(\x05\x12\x0e\n\x06orders\x18\x05 \x03(\x05\x12\r\n\x05ranks\x18\x06 \x03(\x05\x12\x0e\n\x06values\x18\x07 \x03(\x02\x42\x07\n\x05_week\"\xe2\x02\n\x1dSeasonRankingsCalculatedEvent\x12\x10\n\x08\x65vent_id\x18\x01 \x01(\t\x12\x11\n\tseason_id\x18\x02 \x01(\t\x12\x10\n\x08team_ids\x18\x03 \x01(\x0c\x12\x10\n\x08game_ids\x18\x04 \x01(\x0c\x12\x42\n\x0cteam_records\x18\x05 \x03(\x0b\x32,.fbsrankings.messages.event.PackedTeamRecord\x12@\n\rteam_rankings\x18\x06 \x03(\x0b\x32).fbsrankings.messages.event.PackedRanking\x12@\n\rgame_rankings\x18\x07 \x03(\x0b\x32).fbsrankings.messages.event.PackedRanking:0\x82\xb5\x18,fbsrankings.event.season_rankings_calculatedb\x06proto3')
+
+_globals = globals()
+_builder.BuildMessageAndEnumDescriptors(DESCRIPTOR, _globals)
+_builder.BuildTopDescriptorsAndMessages(DESCRIPTOR, 'fbsrankings.messages.event.season_ranking_pb2', _globals)
+if not _descriptor._USE_C_DESCRIPTORS:
+  DESCRIPTOR._loaded_options = None
+  _globals['_SEASONRANKINGSCALCULATEDEVENT']._loaded_options = None
+  _globals['_SEASONRANKINGSCALCULATEDEVENT']._serialized_options = b'\202\265\030,fbsrankings.event.season_rankings_calculated'
+  _globals['_PACKEDTEAMRECORD']._serialized_start=123
+  _globals['_PACKEDTEAMRECORD']._serialized_end=233
+  _globals['_PACKEDRANKING']._serialized_start=236
+  _globals['_PACKEDRANKING']._serialized_end=373
+  _globals['_SEASONRANKINGSCALCULATEDEVENT']._serialized_start=376
+  _globals['_SEASONRANKINGSCALCULATEDEVENT']._serialized_end=730
+# @@protoc_insertion_point(module_scope)
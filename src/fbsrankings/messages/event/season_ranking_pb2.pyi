@@ -0,0 +1,58 @@
+from fbsrankings.messages.options import options_pb2 as _options_pb2
+from google.protobuf.internal import containers as _containers
+from google.protobuf import descriptor as _descriptor
+from google.protobuf import message as _message
+from collections.abc import Iterable as _Iterable, Mapping as _Mapping
+from typing import ClassVar as _ClassVar, Optional as _Optional, Union as _Union
+
+DESCRIPTOR: _descriptor.FileDescriptor
+
+class PackedTeamRecord(_message.Message):
+    __slots__ = ("record_id", "week", "teams", "wins", "losses")
+    RECORD_ID_FIELD_NUMBER: _ClassVar[int]
+    WEEK_FIELD_NUMBER: _ClassVar[int]
+    TEAMS_FIELD_NUMBER: _ClassVar[int]
+    WINS_FIELD_NUMBER: _ClassVar[int]
+    LOSSES_FIELD_NUMBER: _ClassVar[int]
+    record_id: str
+    week: int
+    teams: _containers.RepeatedScalarFieldContainer[int]
+    wins: _containers.RepeatedScalarFieldContainer[int]
+    losses: _containers.RepeatedScalarFieldContainer[int]
+    def __init__(self, record_id: _Optional[str] = ..., week: _Optional[int] = ..., teams: _Optional[_Iterable[int]] = ..., wins: _Optional[_Iterable[int]] = ..., losses: _Optional[_Iterable[int]] = ...) -> None: ...
+
+class PackedRanking(_message.Message):
+    __slots__ = ("ranking_id", "name", "week", "ids", "orders", "ranks", "values")
+    RANKING_ID_FIELD_NUMBER: _ClassVar[int]
+    NAME_FIELD_NUMBER: _ClassVar[int]
+    WEEK_FIELD_NUMBER: _ClassVar[int]
+    IDS_FIELD_NUMBER: _ClassVar[int]
+    ORDERS_FIELD_NUMBER: _ClassVar[int]
+    RANKS_FIELD_NUMBER: _ClassVar[int]
+    VALUES_FIELD_NUMBER: _ClassVar[int]
+    ranking_id: str
+    name: str
+    week: int
+    ids: _containers.RepeatedScalarFieldContainer[int]
+    orders: _containers.RepeatedScalarFieldContainer[int]
+    ranks: _containers.RepeatedScalarFieldContainer[int]
+    values: _containers.RepeatedScalarFieldContainer[float]
+    def __init__(self, ranking_id: _Optional[str] = ..., name: _Optional[str] = ..., week: _Optional[int] = ..., ids: _Optional[_Iterable[int]] = ..., orders: _Optional[_Iterable[int]] = ..., ranks: _Optional[_Iterable[int]] = ..., values: _Optional[_Iterable[float]] = ...) -> None: ...
+
+class SeasonRankingsCalculatedEvent(_message.Message):
+    __slots__ = ("event_id", "season_id", "team_ids", "game_ids", "team_records", "team_rankings", "game_rankings")
+    EVENT_ID_FIELD_NUMBER: _ClassVar[int]
+    SEASON_ID_FIELD_NUMBER: _ClassVar[int]
+    TEAM_IDS_FIELD_NUMBER: _ClassVar[int]
+    GAME_IDS_FIELD_NUMBER: _ClassVar[int]
+    TEAM_RECORDS_FIELD_NUMBER: _ClassVar[int]
+    TEAM_RANKINGS_FIELD_NUMBER: _ClassVar[int]
+    GAME_RANKINGS_FIELD_NUMBER: _ClassVar[int]
+    event_id: str
+    season_id: str
+    team_ids: bytes
+    game_ids: bytes
+    team_records: _containers.RepeatedCompositeFieldContainer[PackedTeamRecord]
+    team_rankings: _containers.RepeatedCompositeFieldContainer[PackedRanking]
+    game_rankings: _containers.RepeatedCompositeFieldContainer[PackedRanking]
+    def __init__(self, event_id: _Optional[str] = ..., season_id: _Optional[str] = ..., team_ids: _Optional[bytes] = ..., game_ids: _Optional[bytes] = ..., team_records: _Optional[_Iterable[_Union[PackedTeamRecord, _Mapping]]] = ..., team_rankings: _Optional[_Iterable[_Union[PackedRanking, _Mapping]]] = ..., game_rankings: _Optional[_Iterable[_Union[PackedRanking, _Mapping]]] = ...) -> None: ...
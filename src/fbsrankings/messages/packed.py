@@ -0,0 +1,232 @@
+from collections.abc import Iterable
+from datetime import date
+from typing import Any
+from typing import Optional
+
+from google.protobuf.timestamp_pb2 import Timestamp
+
+from fbsrankings.messages.convert import bytes_to_ids
+from fbsrankings.messages.convert import date_to_timestamp
+from fbsrankings.messages.convert import ids_to_bytes
+from fbsrankings.messages.enums import GameStatus
+from fbsrankings.messages.enums import SeasonSection
+from fbsrankings.messages.query import GameRankingBySeasonWeekValue
+from fbsrankings.messages.query import GameRankingValueBySeasonWeekResult
+from fbsrankings.messages.query import PackedGameRankingValuesBySeasonWeekResult
+from fbsrankings.messages.query import PackedTeamRankingValuesBySeasonWeekResult
+from fbsrankings.messages.query import PackedTeamRecordValuesBySeasonWeekResult
+from fbsrankings.messages.query import TeamRankingBySeasonWeekValue
+from fbsrankings.messages.query import TeamRankingValueBySeasonWeekResult
+from fbsrankings.messages.query import TeamRecordBySeasonWeekValue
+from fbsrankings.messages.query import TeamRecordValueBySeasonWeekResult
+
+
+# The query results carry their values either as repeated value messages or
+# as packed columns. Handlers build the packed columns from rows of plain
+# values, and readers get the value messages back from either form.
+
+TeamRankingRow = tuple[str, str, int, int, float]
+TeamRecordRow = tuple[str, str, int, int]
+GameRankingRow = tuple[
+    str,
+    int,
+    date,
+    SeasonSection.ValueType,
+    str,
+    str,
+    str,
+    str,
+    Optional[int],
+    Optional[int],
+    GameStatus.ValueType,
+    str,
+    int,
+    int,
+    float,
+]
+
+
+def pack_team_ranking_values(
+    rows: Iterable[TeamRankingRow],
+) -> PackedTeamRankingValuesBySeasonWeekResult:
+    team_ids, names, orders, ranks, values = _columns(rows, 5)
+    return PackedTeamRankingValuesBySeasonWeekResult(
+        team_ids=ids_to_bytes(team_ids),
+        names=names,
+        orders=orders,
+        ranks=ranks,
+        values=values,
+    )
+
+
+def pack_team_record_values(
+    rows: Iterable[TeamRecordRow],
+) -> PackedTeamRecordValuesBySeasonWeekResult:
+    team_ids, names, wins, losses = _columns(rows, 4)
+    return PackedTeamRecordValuesBySeasonWeekResult(
+        team_ids=ids_to_bytes(team_ids),
+        names=names,
+        wins=wins,
+        losses=losses,
+    )
+
+
+def pack_game_ranking_values(
+    rows: Iterable[GameRankingRow],
+) -> PackedGameRankingValuesBySeasonWeekResult:
+    (
+        game_ids,
+        weeks,
+        dates,
+        season_sections,
+        home_team_ids,
+        home_team_names,
+        away_team_ids,
+        away_team_names,
+        home_team_scores,
+        away_team_scores,
+        statuses,
+        notes,
+        orders,
+        ranks,
+        values,
+    ) = _columns(rows, 15)
+    return PackedGameRankingValuesBySeasonWeekResult(
+        game_ids=ids_to_bytes(game_ids),
+        weeks=weeks,
+        dates=[date_to_timestamp(value).seconds for value in dates],
+        season_sections=season_sections,
+        home_team_ids=ids_to_bytes(home_team_ids),
+        home_team_names=home_team_names,
+        away_team_ids=ids_to_bytes(away_team_ids),
+        away_team_names=away_team_names,
+        has_home_team_scores=[score is not None for score in home_team_scores],
+        home_team_scores=[score or 0 for score in home_team_scores],
+        has_away_team_scores=[score is not None for score in away_team_scores],
+        away_team_scores=[score or 0 for score in away_team_scores],
+        statuses=statuses,
+        notes=notes,
+        orders=orders,
+        ranks=ranks,
+        values=values,
+    )
+
+
+def team_ranking_values(
+    ranking: TeamRankingBySeasonWeekValue,
+) -> list[TeamRankingValueBySeasonWeekResult]:
+    if not ranking.HasField("packed_values"):
+        return list(ranking.values)
+
+    packed = ranking.packed_values
+    return [
+        TeamRankingValueBySeasonWeekResult(
+            team_id=team_id,
+            name=name,
+            order=order,
+            rank=rank,
+            value=value,
+        )
+        for team_id, name, order, rank, value in zip(
+            bytes_to_ids(packed.team_ids),
+            packed.names,
+            packed.orders,
+            packed.ranks,
+            packed.values,
+        )
+    ]
+
+
+def team_record_values(
+    record: TeamRecordBySeasonWeekValue,
+) -> list[TeamRecordValueBySeasonWeekResult]:
+    if not record.HasField("packed_values"):
+        return list(record.values)
+
+    packed = record.packed_values
+    return [
+        TeamRecordValueBySeasonWeekResult(
+            team_id=team_id,
+            name=name,
+            wins=wins,
+            losses=losses,
+        )
+        for team_id, name, wins, losses in zip(
+            bytes_to_ids(packed.team_ids),
+            packed.names,
+            packed.wins,
+            packed.losses,
+        )
+    ]
+
+
+def game_ranking_values(
+    ranking: GameRankingBySeasonWeekValue,
+) -> list[GameRankingValueBySeasonWeekResult]:
+    if not ranking.HasField("packed_values"):
+        return list(ranking.values)
+
+    packed = ranking.packed_values
+    return [
+        GameRankingValueBySeasonWeekResult(
+            game_id=game_id,
+            season_id=ranking.season_id,
+            year=ranking.year,
+            week=week,
+            date=Timestamp(seconds=seconds),
+            season_section=season_section,
+            home_team_id=home_team_id,
+            home_team_name=home_team_name,
+            away_team_id=away_team_id,
+            away_team_name=away_team_name,
+            home_team_score=home_team_score if has_home_team_score else None,
+            away_team_score=away_team_score if has_away_team_score else None,
+            status=status,
+            notes=notes,
+            order=order,
+            rank=rank,
+            value=value,
+        )
+        for (
+            game_id,
+            week,
+            seconds,
+            season_section,
+            home_team_id,
+            home_team_name,
+            away_team_id,
+            away_team_name,
+            has_home_team_score,
+            home_team_score,
+            has_away_team_score,
+            away_team_score,
+            status,
+            notes,
+            order,
+            rank,
+            value,
+        ) in zip(
+            bytes_to_ids(packed.game_ids),
+            packed.weeks,
+            packed.dates,
+            packed.season_sections,
+            bytes_to_ids(packed.home_team_ids),
+            packed.home_team_names,
+            bytes_to_ids(packed.away_team_ids),
+            packed.away_team_names,
+            packed.has_home_team_scores,
+            packed.home_team_scores,
+            packed.has_away_team_scores,
+            packed.away_team_scores,
+            packed.statuses,
+            packed.notes,
+            packed.orders,
+            packed.ranks,
+            packed.values,
+        )
+    ]
+
+
+def _columns(rows: Iterable[tuple[Any, ...]], count: int) -> list[tuple[Any, ...]]:
+    columns = list(zip(*rows))
+    return columns if columns else [()] * count
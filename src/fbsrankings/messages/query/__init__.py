@@ -17,6 +17,7 @@ from .game_ranking_by_season_week_pb2 import GameRankingBySeasonWeekQuery
 from .game_ranking_by_season_week_pb2 import GameRankingBySeasonWeekResult
 from .game_ranking_by_season_week_pb2 import GameRankingBySeasonWeekValue
 from .game_ranking_by_season_week_pb2 import GameRankingValueBySeasonWeekResult
+from .game_ranking_by_season_week_pb2 import PackedGameRankingValuesBySeasonWeekResult
 from .games_by_season_pb2 import GameBySeasonResult
 from .games_by_season_pb2 import GamesBySeasonQuery
 from .games_by_season_pb2 import GamesBySeasonResult
@@ -25,12 +26,21 @@ from .latest_season_week_pb2 import LatestSeasonWeekResult
 from .latest_season_week_pb2 import LatestSeasonWeekValue
 from .postseason_game_count_by_season_pb2 import PostseasonGameCountBySeasonQuery
 from .postseason_game_count_by_season_pb2 import PostseasonGameCountBySeasonResult
+from .ranking_scenarios_pb2 import GameResultByScenario
+from .ranking_scenarios_pb2 import RankingScenario
+from .ranking_scenarios_pb2 import RankingScenariosQuery
+from .ranking_scenarios_pb2 import RankingScenariosResult
+from .ranking_scenarios_pb2 import RankingScenarioValue
+from .ranking_scenarios_pb2 import TeamRankingDeltasByScenarioResult
 from .season_by_id_pb2 import SeasonByIDQuery
 from .season_by_id_pb2 import SeasonByIDResult
 from .season_by_id_pb2 import SeasonByIDValue
 from .season_by_year_pb2 import SeasonByYearQuery
 from .season_by_year_pb2 import SeasonByYearResult
 from .season_by_year_pb2 import SeasonByYearValue
+from .season_simulation_pb2 import SeasonSimulationQuery
+from .season_simulation_pb2 import SeasonSimulationResult
+from .season_simulation_pb2 import TeamSimulationBySeasonResult
 from .seasons_pb2 import SeasonResult
 from .seasons_pb2 import SeasonsQuery
 from .seasons_pb2 import SeasonsResult
@@ -39,10 +49,12 @@ from .team_by_id_pb2 import TeamByIDResult
 from .team_by_id_pb2 import TeamByIDValue
 from .team_count_by_season_pb2 import TeamCountBySeasonQuery
 from .team_count_by_season_pb2 import TeamCountBySeasonResult
+from .team_ranking_by_season_week_pb2 import PackedTeamRankingValuesBySeasonWeekResult
 from .team_ranking_by_season_week_pb2 import TeamRankingBySeasonWeekQuery
 from .team_ranking_by_season_week_pb2 import TeamRankingBySeasonWeekResult
 from .team_ranking_by_season_week_pb2 import TeamRankingBySeasonWeekValue
 from .team_ranking_by_season_week_pb2 import TeamRankingValueBySeasonWeekResult
+from .team_record_by_season_week_pb2 import PackedTeamRecordValuesBySeasonWeekResult
 from .team_record_by_season_week_pb2 import TeamRecordBySeasonWeekQuery
 from .team_record_by_season_week_pb2 import TeamRecordBySeasonWeekResult
 from .team_record_by_season_week_pb2 import TeamRecordBySeasonWeekValue
@@ -73,13 +85,21 @@ __all__ = [
     "GameRankingBySeasonWeekResult",
     "GameRankingBySeasonWeekValue",
     "GameRankingValueBySeasonWeekResult",
+    "GameResultByScenario",
     "GamesBySeasonQuery",
     "GamesBySeasonResult",
     "LatestSeasonWeekQuery",
     "LatestSeasonWeekResult",
     "LatestSeasonWeekValue",
+    "PackedGameRankingValuesBySeasonWeekResult",
+    "PackedTeamRankingValuesBySeasonWeekResult",
+    "PackedTeamRecordValuesBySeasonWeekResult",
     "PostseasonGameCountBySeasonQuery",
     "PostseasonGameCountBySeasonResult",
+    "RankingScenario",
+    "RankingScenarioValue",
+    "RankingScenariosQuery",
+    "RankingScenariosResult",
     "SeasonByIDQuery",
     "SeasonByIDResult",
     "SeasonByIDValue",
@@ -87,6 +107,8 @@ __all__ = [
     "SeasonByYearResult",
     "SeasonByYearValue",
     "SeasonResult",
+    "SeasonSimulationQuery",
+    "SeasonSimulationResult",
     "SeasonsQuery",
     "SeasonsResult",
     "TeamByIDQuery",
@@ -97,12 +119,14 @@ __all__ = [
     "TeamRankingBySeasonWeekQuery",
     "TeamRankingBySeasonWeekResult",
     "TeamRankingBySeasonWeekValue",
+    "TeamRankingDeltasByScenarioResult",
     "TeamRankingValueBySeasonWeekResult",
     "TeamRecordBySeasonWeekQuery",
     "TeamRecordBySeasonWeekResult",
     "TeamRecordBySeasonWeekValue",
     "TeamRecordValueBySeasonWeekResult",
     "TeamResult",
+    "TeamSimulationBySeasonResult",
     "TeamsQuery",
     "TeamsResult",
     "WeekCountBySeasonQuery",
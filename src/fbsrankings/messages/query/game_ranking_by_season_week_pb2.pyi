@@ -47,21 +47,61 @@ class GameRankingValueBySeasonWeekResult(_message.Message):
     value: float
     def __init__(self, game_id: _Optional[str] = ..., season_id: _Optional[str] = ..., year: _Optional[int] = ..., week: _Optional[int] = ..., date: _Optional[_Union[_timestamp_pb2.Timestamp, _Mapping]] = ..., season_section: _Optional[_Union[_enums_pb2.SeasonSection, str]] = ..., home_team_id: _Optional[str] = ..., home_team_name: _Optional[str] = ..., away_team_id: _Optional[str] = ..., away_team_name: _Optional[str] = ..., home_team_score: _Optional[int] = ..., away_team_score: _Optional[int] = ..., status: _Optional[_Union[_enums_pb2.GameStatus, str]] = ..., notes: _Optional[str] = ..., order: _Optional[int] = ..., rank: _Optional[int] = ..., value: _Optional[float] = ...) -> None: ...
 
+class PackedGameRankingValuesBySeasonWeekResult(_message.Message):
+    __slots__ = ("game_ids", "weeks", "dates", "season_sections", "home_team_ids", "home_team_names", "away_team_ids", "away_team_names", "has_home_team_scores", "home_team_scores", "has_away_team_scores", "away_team_scores", "statuses", "notes", "orders", "ranks", "values")
+    GAME_IDS_FIELD_NUMBER: _ClassVar[int]
+    WEEKS_FIELD_NUMBER: _ClassVar[int]
+    DATES_FIELD_NUMBER: _ClassVar[int]
+    SEASON_SECTIONS_FIELD_NUMBER: _ClassVar[int]
+    HOME_TEAM_IDS_FIELD_NUMBER: _ClassVar[int]
+    HOME_TEAM_NAMES_FIELD_NUMBER: _ClassVar[int]
+    AWAY_TEAM_IDS_FIELD_NUMBER: _ClassVar[int]
+    AWAY_TEAM_NAMES_FIELD_NUMBER: _ClassVar[int]
+    HAS_HOME_TEAM_SCORES_FIELD_NUMBER: _ClassVar[int]
+    HOME_TEAM_SCORES_FIELD_NUMBER: _ClassVar[int]
+    HAS_AWAY_TEAM_SCORES_FIELD_NUMBER: _ClassVar[int]
+    AWAY_TEAM_SCORES_FIELD_NUMBER: _ClassVar[int]
+    STATUSES_FIELD_NUMBER: _ClassVar[int]
+    NOTES_FIELD_NUMBER: _ClassVar[int]
+    ORDERS_FIELD_NUMBER: _ClassVar[int]
+    RANKS_FIELD_NUMBER: _ClassVar[int]
+    VALUES_FIELD_NUMBER: _ClassVar[int]
+    game_ids: bytes
+    weeks: _containers.RepeatedScalarFieldContainer[int]
+    dates: _containers.RepeatedScalarFieldContainer[int]
+    season_sections: _containers.RepeatedScalarFieldContainer[_enums_pb2.SeasonSection]
+    home_team_ids: bytes
+    home_team_names: _containers.RepeatedScalarFieldContainer[str]
+    away_team_ids: bytes
+    away_team_names: _containers.RepeatedScalarFieldContainer[str]
+    has_home_team_scores: _containers.RepeatedScalarFieldContainer[bool]
+    home_team_scores: _containers.RepeatedScalarFieldContainer[int]
+    has_away_team_scores: _containers.RepeatedScalarFieldContainer[bool]
+    away_team_scores: _containers.RepeatedScalarFieldContainer[int]
+    statuses: _containers.RepeatedScalarFieldContainer[_enums_pb2.GameStatus]
+    notes: _containers.RepeatedScalarFieldContainer[str]
+    orders: _containers.RepeatedScalarFieldContainer[int]
+    ranks: _containers.RepeatedScalarFieldContainer[int]
+    values: _containers.RepeatedScalarFieldContainer[float]
+    def __init__(self, game_ids: _Optional[bytes] = ..., weeks: _Optional[_Iterable[int]] = ..., dates: _Optional[_Iterable[int]] = ..., season_sections: _Optional[_Iterable[_Union[_enums_pb2.SeasonSection, str]]] = ..., home_team_ids: _Optional[bytes] = ..., home_team_names: _Optional[_Iterable[str]] = ..., away_team_ids: _Optional[bytes] = ..., away_team_names: _Optional[_Iterable[str]] = ..., has_home_team_scores: _Optional[_Iterable[bool]] = ..., home_team_scores: _Optional[_Iterable[int]] = ..., has_away_team_scores: _Optional[_Iterable[bool]] = ..., away_team_scores: _Optional[_Iterable[int]] = ..., statuses: _Optional[_Iterable[_Union[_enums_pb2.GameStatus, str]]] = ..., notes: _Optional[_Iterable[str]] = ..., orders: _Optional[_Iterable[int]] = ..., ranks: _Optional[_Iterable[int]] = ..., values: _Optional[_Iterable[float]] = ...) -> None: ...
+
 class GameRankingBySeasonWeekValue(_message.Message):
-    __slots__ = ("ranking_id", "name", "season_id", "year", "week", "values")
+    __slots__ = ("ranking_id", "name", "season_id", "year", "week", "values", "packed_values")
     RANKING_ID_FIELD_NUMBER: _ClassVar[int]
     NAME_FIELD_NUMBER: _ClassVar[int]
     SEASON_ID_FIELD_NUMBER: _ClassVar[int]
     YEAR_FIELD_NUMBER: _ClassVar[int]
     WEEK_FIELD_NUMBER: _ClassVar[int]
     VALUES_FIELD_NUMBER: _ClassVar[int]
+    PACKED_VALUES_FIELD_NUMBER: _ClassVar[int]
     ranking_id: str
     name: str
     season_id: str
     year: int
     week: int
     values: _containers.RepeatedCompositeFieldContainer[GameRankingValueBySeasonWeekResult]
-    def __init__(self, ranking_id: _Optional[str] = ..., name: _Optional[str] = ..., season_id: _Optional[str] = ..., year: _Optional[int] = ..., week: _Optional[int] = ..., values: _Optional[_Iterable[_Union[GameRankingValueBySeasonWeekResult, _Mapping]]] = ...) -> None: ...
+    packed_values: PackedGameRankingValuesBySeasonWeekResult
+    def __init__(self, ranking_id: _Optional[str] = ..., name: _Optional[str] = ..., season_id: _Optional[str] = ..., year: _Optional[int] = ..., week: _Optional[int] = ..., values: _Optional[_Iterable[_Union[GameRankingValueBySeasonWeekResult, _Mapping]]] = ..., packed_values: _Optional[_Union[PackedGameRankingValuesBySeasonWeekResult, _Mapping]] = ...) -> None: ...
 
 class GameRankingBySeasonWeekResult(_message.Message):
     __slots__ = ("query_id", "ranking")
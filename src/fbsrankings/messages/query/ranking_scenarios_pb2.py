@@ -0,0 +1,49 @@
+# -*- coding: utf-8 -*-
+# Generated by the protocol buffer compiler.  DO NOT EDIT!
+# NO CHECKED-IN PROTOBUF GENCODE
+# source: fbsrankings/messages/query/ranking_scenarios.proto
+# Protobuf Python Version: 6.30.1
+"""Generated protocol buffer code."""
+from google.protobuf import descriptor as _descriptor
+from google.protobuf import descriptor_pool as _descriptor_pool
+from google.protobuf import runtime_version as _runtime_version
+from google.protobuf import symbol_database as _symbol_database
+from google.protobuf.internal import builder as _builder
+_runtime_version.ValidateProtobufRuntimeVersion(
+    _runtime_version.Domain.PUBLIC,
+    6,
+    30,
+    1,
+    '',
+    'fbsrankings/messages/query/ranking_scenarios.proto'
+)
+# @@protoc_insertion_point(imports)
+
+_sym_db = _symbol_database.Default()
+
+
+from fbsrankings.messages.options import options_pb2 as fbsrankings_dot_messages_dot_options_dot_options__pb2
+
+
+DESCRIPTOR = _descriptor_pool.Default().AddSerializedFile(b'\n2fbsrankings/messages/query/ranking_scenarios.proto\x12\x1a\x66\x62srankings.messages.query\x1a*fbsrankings/messages/options/options.proto\"Y\n\x14GameResultByScenario\x12\x0f\n\x07game_id\x18\x01 \x01(\t\x12\x17\n\x0fhome_team_score\x18\x02 \x01(\x05\x12\x17\n\x0f\x61way_team_score\x18\x03 \x01(\x05\"T\n\x0fRankingScenario\x12\x41\n\x07results\x18\x01 \x03(\x0b\x32\x30.fbsrankings.messages.query.GameResultByScenario\"{\n!TeamRankingDeltasByScenarioResult\x12\x0c\n\x04name\x18\x01 \x01(\t\x12\x0e\n\x06values\x18\x02 \x03(\x01\x12\r\n\x05ranks\x18\x03 \x03(\x05\x12\x14\n\x0cvalue_deltas\x18\x04 \x03(\x01\x12\x13\n\x0brank_deltas\x18\x05 \x03(\x05\"g\n\x14RankingScenarioValue\x12O\n\x08rankings\x18\x01 \x03(\x0b\x32=.fbsrankings.messages.query.TeamRankingDeltasByScenarioResult\"\xb1\x01\n\x16RankingScenariosResult\x12\x10\n\x08query_id\x18\x01 \x01(\t\x12\x11\n\tseason_id\x18\x02 \x01(\t\x12\x0c\n\x04week\x18\x03 \x01(\x05\x12\x10\n\x08team_ids\x18\x04 \x01(\x0c\x12\r\n\x05names\x18\x05 \x03(\t\x12\x43\n\tscenarios\x18\x06 \x03(\x0b\x32\x30.fbsrankings.messages.query.RankingScenarioValue\"\xa5\x01\n\x15RankingScenariosQuery\x12\x10\n\x08query_id\x18\x01 \x01(\t\x12\x11\n\tseason_id\x18\x02 \x01(\t\x12>\n\tscenarios\x18\x03 \x03(\x0b\x32+.fbsrankings.messages.query.RankingScenario:\'\x82\xb5\x18#fbsrankings.query.ranking_scenariosb\x06proto3')
+
+_globals = globals()
+_builder.BuildMessageAndEnumDescriptors(DESCRIPTOR, _globals)
+_builder.BuildTopDescriptorsAndMessages(DESCRIPTOR, 'fbsrankings.messages.query.ranking_scenarios_pb2', _globals)
+if not _descriptor._USE_C_DESCRIPTORS:
+  DESCRIPTOR._loaded_options = None
+  _globals['_RANKINGSCENARIOSQUERY']._loaded_options = None
+  _globals['_RANKINGSCENARIOSQUERY']._serialized_options = b'\202\265\030#fbsrankings.query.ranking_scenarios'
+  _globals['_GAMERESULTBYSCENARIO']._serialized_start=126
+  _globals['_GAMERESULTBYSCENARIO']._serialized_end=215
+  _globals['_RANKINGSCENARIO']._serialized_start=217
+  _globals['_RANKINGSCENARIO']._serialized_end=301
+  _globals['_TEAMRANKINGDELTASBYSCENARIORESULT']._serialized_start=303
+  _globals['_TEAMRANKINGDELTASBYSCENARIORESULT']._serialized_end=426
+  _globals['_RANKINGSCENARIOVALUE']._serialized_start=428
+  _globals['_RANKINGSCENARIOVALUE']._serialized_end=531
+  _globals['_RANKINGSCENARIOSRESULT']._serialized_start=534
+  _globals['_RANKINGSCENARIOSRESULT']._serialized_end=711
+  _globals['_RANKINGSCENARIOSQUERY']._serialized_start=714
+  _globals['_RANKINGSCENARIOSQUERY']._serialized_end=879
+# @@protoc_insertion_point(module_scope)
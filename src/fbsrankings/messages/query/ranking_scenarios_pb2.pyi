@@ -0,0 +1,70 @@
+from fbsrankings.messages.options import options_pb2 as _options_pb2
+from google.protobuf.internal import containers as _containers
+from google.protobuf import descriptor as _descriptor
+from google.protobuf import message as _message
+from collections.abc import Iterable as _Iterable, Mapping as _Mapping
+from typing import ClassVar as _ClassVar, Optional as _Optional, Union as _Union
+
+DESCRIPTOR: _descriptor.FileDescriptor
+
+class GameResultByScenario(_message.Message):
+    __slots__ = ("game_id", "home_team_score", "away_team_score")
+    GAME_ID_FIELD_NUMBER: _ClassVar[int]
+    HOME_TEAM_SCORE_FIELD_NUMBER: _ClassVar[int]
+    AWAY_TEAM_SCORE_FIELD_NUMBER: _ClassVar[int]
+    game_id: str
+    home_team_score: int
+    away_team_score: int
+    def __init__(self, game_id: _Optional[str] = ..., home_team_score: _Optional[int] = ..., away_team_score: _Optional[int] = ...) -> None: ...
+
+class RankingScenario(_message.Message):
+    __slots__ = ("results",)
+    RESULTS_FIELD_NUMBER: _ClassVar[int]
+    results: _containers.RepeatedCompositeFieldContainer[GameResultByScenario]
+    def __init__(self, results: _Optional[_Iterable[_Union[GameResultByScenario, _Mapping]]] = ...) -> None: ...
+
+class TeamRankingDeltasByScenarioResult(_message.Message):
+    __slots__ = ("name", "values", "ranks", "value_deltas", "rank_deltas")
+    NAME_FIELD_NUMBER: _ClassVar[int]
+    VALUES_FIELD_NUMBER: _ClassVar[int]
+    RANKS_FIELD_NUMBER: _ClassVar[int]
+    VALUE_DELTAS_FIELD_NUMBER: _ClassVar[int]
+    RANK_DELTAS_FIELD_NUMBER: _ClassVar[int]
+    name: str
+    values: _containers.RepeatedScalarFieldContainer[float]
+    ranks: _containers.RepeatedScalarFieldContainer[int]
+    value_deltas: _containers.RepeatedScalarFieldContainer[float]
+    rank_deltas: _containers.RepeatedScalarFieldContainer[int]
+    def __init__(self, name: _Optional[str] = ..., values: _Optional[_Iterable[float]] = ..., ranks: _Optional[_Iterable[int]] = ..., value_deltas: _Optional[_Iterable[float]] = ..., rank_deltas: _Optional[_Iterable[int]] = ...) -> None: ...
+
+class RankingScenarioValue(_message.Message):
+    __slots__ = ("rankings",)
+    RANKINGS_FIELD_NUMBER: _ClassVar[int]
+    rankings: _containers.RepeatedCompositeFieldContainer[TeamRankingDeltasByScenarioResult]
+    def __init__(self, rankings: _Optional[_Iterable[_Union[TeamRankingDeltasByScenarioResult, _Mapping]]] = ...) -> None: ...
+
+class RankingScenariosResult(_message.Message):
+    __slots__ = ("query_id", "season_id", "week", "team_ids", "names", "scenarios")
+    QUERY_ID_FIELD_NUMBER: _ClassVar[int]
+    SEASON_ID_FIELD_NUMBER: _ClassVar[int]
+    WEEK_FIELD_NUMBER: _ClassVar[int]
+    TEAM_IDS_FIELD_NUMBER: _ClassVar[int]
+    NAMES_FIELD_NUMBER: _ClassVar[int]
+    SCENARIOS_FIELD_NUMBER: _ClassVar[int]
+    query_id: str
+    season_id: str
+    week: int
+    team_ids: bytes
+    names: _containers.RepeatedScalarFieldContainer[str]
+    scenarios: _containers.RepeatedCompositeFieldContainer[RankingScenarioValue]
+    def __init__(self, query_id: _Optional[str] = ..., season_id: _Optional[str] = ..., week: _Optional[int] = ..., team_ids: _Optional[bytes] = ..., names: _Optional[_Iterable[str]] = ..., scenarios: _Optional[_Iterable[_Union[RankingScenarioValue, _Mapping]]] = ...) -> None: ...
+
+class RankingScenariosQuery(_message.Message):
+    __slots__ = ("query_id", "season_id", "scenarios")
+    QUERY_ID_FIELD_NUMBER: _ClassVar[int]
+    SEASON_ID_FIELD_NUMBER: _ClassVar[int]
+    SCENARIOS_FIELD_NUMBER: _ClassVar[int]
+    query_id: str
+    season_id: str
+    scenarios: _containers.RepeatedCompositeFieldContainer[RankingScenario]
+    def __init__(self, query_id: _Optional[str] = ..., season_id: _Optional[str] = ..., scenarios: _Optional[_Iterable[_Union[RankingScenario, _Mapping]]] = ...) -> None: ...
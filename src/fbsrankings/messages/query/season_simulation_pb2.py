@@ -0,0 +1,43 @@
+# -*- coding: utf-8 -*-
+# Generated by the protocol buffer compiler.  DO NOT EDIT!
+# NO CHECKED-IN PROTOBUF GENCODE
+# source: fbsrankings/messages/query/season_simulation.proto
+# Protobuf Python Version: 6.30.1
+"""Generated protocol buffer code."""
+from google.protobuf import descriptor as _descriptor
+from google.protobuf import descriptor_pool as _descriptor_pool
+from google.protobuf import runtime_version as _runtime_version
+from google.protobuf import symbol_database as _symbol_database
+from google.protobuf.internal import builder as _builder
+_runtime_version.ValidateProtobufRuntimeVersion(
+    _runtime_version.Domain.PUBLIC,
+    6,
+    30,
+    1,
+    '',
+    'fbsrankings/messages/query/season_simulation.proto'
+)
+# @@protoc_insertion_point(imports)
+
+_sym_db = _symbol_database.Default()
+
+
+from fbsrankings.messages.options import options_pb2 as fbsrankings_dot_messages_dot_options_dot_options__pb2
+
+
+DESCRIPTOR = _descriptor_pool.Default().AddSerializedFile(b'\n2fbsrankings/messages/query/season_simulation.proto\x12\x1a\x66\x62srankings.messages.query\x1a*fbsrankings/messages/options/options.proto\"\xec\x01\n\x1cTeamSimulationBySeasonResult\x12\x0f\n\x07team_id\x18\x01 \x01(\t\x12\x0c\n\x04name\x18\x02 \x01(\t\x12\x0c\n\x04wins\x18\x03 \x01(\x05\x12\x0e\n\x06losses\x18\x04 \x01(\x05\x12\x17\n\x0fremaining_games\x18\x05 \x01(\x05\x12\x0e\n\x06rating\x18\x06 \x01(\x01\x12\x18\n\x10projected_rating\x18\x07 \x01(\x01\x12\x15\n\rexpected_wins\x18\x08 \x01(\x01\x12\x19\n\x11win_probabilities\x18\t \x03(\x01\x12\x1a\n\x12rank_probabilities\x18\n \x03(\x01\"\xbd\x01\n\x16SeasonSimulationResult\x12\x10\n\x08query_id\x18\x01 \x01(\t\x12\x11\n\tseason_id\x18\x02 \x01(\t\x12\x0c\n\x04week\x18\x03 \x01(\x05\x12\r\n\x05\x63ount\x18\x04 \x01(\x05\x12\x18\n\x10margin_deviation\x18\x05 \x01(\x01\x12G\n\x05teams\x18\x06 \x03(\x0b\x32\x38.fbsrankings.messages.query.TeamSimulationBySeasonResult\"\x90\x01\n\x15SeasonSimulationQuery\x12\x10\n\x08query_id\x18\x01 \x01(\t\x12\x11\n\tseason_id\x18\x02 \x01(\t\x12\r\n\x05\x63ount\x18\x03 \x01(\x05\x12\x11\n\x04seed\x18\x04 \x01(\x04H\x00\x88\x01\x01:\'\x82\xb5\x18#fbsrankings.query.season_simulationB\x07\n\x05_seedb\x06proto3')
+
+_globals = globals()
+_builder.BuildMessageAndEnumDescriptors(DESCRIPTOR, _globals)
+_builder.BuildTopDescriptorsAndMessages(DESCRIPTOR, 'fbsrankings.messages.query.season_simulation_pb2', _globals)
+if not _descriptor._USE_C_DESCRIPTORS:
+  DESCRIPTOR._loaded_options = None
+  _globals['_SEASONSIMULATIONQUERY']._loaded_options = None
+  _globals['_SEASONSIMULATIONQUERY']._serialized_options = b'\202\265\030#fbsrankings.query.season_simulation'
+  _globals['_TEAMSIMULATIONBYSEASONRESULT']._serialized_start=127
+  _globals['_TEAMSIMULATIONBYSEASONRESULT']._serialized_end=363
+  _globals['_SEASONSIMULATIONRESULT']._serialized_start=366
+  _globals['_SEASONSIMULATIONRESULT']._serialized_end=555
+  _globals['_SEASONSIMULATIONQUERY']._serialized_start=558
+  _globals['_SEASONSIMULATIONQUERY']._serialized_end=702
+# @@protoc_insertion_point(module_scope)
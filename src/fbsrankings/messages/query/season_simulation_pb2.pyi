@@ -0,0 +1,60 @@
+from fbsrankings.messages.options import options_pb2 as _options_pb2
+from google.protobuf.internal import containers as _containers
+from google.protobuf import descriptor as _descriptor
+from google.protobuf import message as _message
+from collections.abc import Iterable as _Iterable, Mapping as _Mapping
+from typing import ClassVar as _ClassVar, Optional as _Optional, Union as _Union
+
+DESCRIPTOR: _descriptor.FileDescriptor
+
+class TeamSimulationBySeasonResult(_message.Message):
+    __slots__ = ("team_id", "name", "wins", "losses", "remaining_games", "rating", "projected_rating", "expected_wins", "win_probabilities", "rank_probabilities")
+    TEAM_ID_FIELD_NUMBER: _ClassVar[int]
+    NAME_FIELD_NUMBER: _ClassVar[int]
+    WINS_FIELD_NUMBER: _ClassVar[int]
+    LOSSES_FIELD_NUMBER: _ClassVar[int]
+    REMAINING_GAMES_FIELD_NUMBER: _ClassVar[int]
+    RATING_FIELD_NUMBER: _ClassVar[int]
+    PROJECTED_RATING_FIELD_NUMBER: _ClassVar[int]
+    EXPECTED_WINS_FIELD_NUMBER: _ClassVar[int]
+    WIN_PROBABILITIES_FIELD_NUMBER: _ClassVar[int]
+    RANK_PROBABILITIES_FIELD_NUMBER: _ClassVar[int]
+    team_id: str
+    name: str
+    wins: int
+    losses: int
+    remaining_games: int
+    rating: float
+    projected_rating: float
+    expected_wins: float
+    win_probabilities: _containers.RepeatedScalarFieldContainer[float]
+    rank_probabilities: _containers.RepeatedScalarFieldContainer[float]
+    def __init__(self, team_id: _Optional[str] = ..., name: _Optional[str] = ..., wins: _Optional[int] = ..., losses: _Optional[int] = ..., remaining_games: _Optional[int] = ..., rating: _Optional[float] = ..., projected_rating: _Optional[float] = ..., expected_wins: _Optional[float] = ..., win_probabilities: _Optional[_Iterable[float]] = ..., rank_probabilities: _Optional[_Iterable[float]] = ...) -> None: ...
+
+class SeasonSimulationResult(_message.Message):
+    __slots__ = ("query_id", "season_id", "week", "count", "margin_deviation", "teams")
+    QUERY_ID_FIELD_NUMBER: _ClassVar[int]
+    SEASON_ID_FIELD_NUMBER: _ClassVar[int]
+    WEEK_FIELD_NUMBER: _ClassVar[int]
+    COUNT_FIELD_NUMBER: _ClassVar[int]
+    MARGIN_DEVIATION_FIELD_NUMBER: _ClassVar[int]
+    TEAMS_FIELD_NUMBER: _ClassVar[int]
+    query_id: str
+    season_id: str
+    week: int
+    count: int
+    margin_deviation: float
+    teams: _containers.RepeatedCompositeFieldContainer[TeamSimulationBySeasonResult]
+    def __init__(self, query_id: _Optional[str] = ..., season_id: _Optional[str] = ..., week: _Optional[int] = ..., count: _Optional[int] = ..., margin_deviation: _Optional[float] = ..., teams: _Optional[_Iterable[_Union[TeamSimulationBySeasonResult, _Mapping]]] = ...) -> None: ...
+
+class SeasonSimulationQuery(_message.Message):
+    __slots__ = ("query_id", "season_id", "count", "seed")
+    QUERY_ID_FIELD_NUMBER: _ClassVar[int]
+    SEASON_ID_FIELD_NUMBER: _ClassVar[int]
+    COUNT_FIELD_NUMBER: _ClassVar[int]
+    SEED_FIELD_NUMBER: _ClassVar[int]
+    query_id: str
+    season_id: str
+    count: int
+    seed: int
+    def __init__(self, query_id: _Optional[str] = ..., season_id: _Optional[str] = ..., count: _Optional[int] = ..., seed: _Optional[int] = ...) -> None: ...
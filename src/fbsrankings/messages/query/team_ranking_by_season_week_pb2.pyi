@@ -21,21 +21,37 @@ class TeamRankingValueBySeasonWeekResult(_message.Message):
     value: float
     def __init__(self, team_id: _Optional[str] = ..., name: _Optional[str] = ..., order: _Optional[int] = ..., rank: _Optional[int] = ..., value: _Optional[float] = ...) -> None: ...
 
+class PackedTeamRankingValuesBySeasonWeekResult(_message.Message):
+    __slots__ = ("team_ids", "names", "orders", "ranks", "values")
+    TEAM_IDS_FIELD_NUMBER: _ClassVar[int]
+    NAMES_FIELD_NUMBER: _ClassVar[int]
+    ORDERS_FIELD_NUMBER: _ClassVar[int]
+    RANKS_FIELD_NUMBER: _ClassVar[int]
+    VALUES_FIELD_NUMBER: _ClassVar[int]
+    team_ids: bytes
+    names: _containers.RepeatedScalarFieldContainer[str]
+    orders: _containers.RepeatedScalarFieldContainer[int]
+    ranks: _containers.RepeatedScalarFieldContainer[int]
+    values: _containers.RepeatedScalarFieldContainer[float]
+    def __init__(self, team_ids: _Optional[bytes] = ..., names: _Optional[_Iterable[str]] = ..., orders: _Optional[_Iterable[int]] = ..., ranks: _Optional[_Iterable[int]] = ..., values: _Optional[_Iterable[float]] = ...) -> None: ...
+
 class TeamRankingBySeasonWeekValue(_message.Message):
-    __slots__ = ("ranking_id", "name", "season_id", "year", "week", "values")
+    __slots__ = ("ranking_id", "name", "season_id", "year", "week", "values", "packed_values")
     RANKING_ID_FIELD_NUMBER: _ClassVar[int]
     NAME_FIELD_NUMBER: _ClassVar[int]
     SEASON_ID_FIELD_NUMBER: _ClassVar[int]
     YEAR_FIELD_NUMBER: _ClassVar[int]
     WEEK_FIELD_NUMBER: _ClassVar[int]
     VALUES_FIELD_NUMBER: _ClassVar[int]
+    PACKED_VALUES_FIELD_NUMBER: _ClassVar[int]
     ranking_id: str
     name: str
     season_id: str
     year: int
     week: int
     values: _containers.RepeatedCompositeFieldContainer[TeamRankingValueBySeasonWeekResult]
-    def __init__(self, ranking_id: _Optional[str] = ..., name: _Optional[str] = ..., season_id: _Optional[str] = ..., year: _Optional[int] = ..., week: _Optional[int] = ..., values: _Optional[_Iterable[_Union[TeamRankingValueBySeasonWeekResult, _Mapping]]] = ...) -> None: ...
+    packed_values: PackedTeamRankingValuesBySeasonWeekResult
+    def __init__(self, ranking_id: _Optional[str] = ..., name: _Optional[str] = ..., season_id: _Optional[str] = ..., year: _Optional[int] = ..., week: _Optional[int] = ..., values: _Optional[_Iterable[_Union[TeamRankingValueBySeasonWeekResult, _Mapping]]] = ..., packed_values: _Optional[_Union[PackedTeamRankingValuesBySeasonWeekResult, _Mapping]] = ...) -> None: ...
 
 class TeamRankingBySeasonWeekResult(_message.Message):
     __slots__ = ("query_id", "ranking")
@@ -19,19 +19,33 @@ class TeamRecordValueBySeasonWeekResult(_message.Message):
     losses: int
     def __init__(self, team_id: _Optional[str] = ..., name: _Optional[str] = ..., wins: _Optional[int] = ..., losses: _Optional[int] = ...) -> None: ...
 
+class PackedTeamRecordValuesBySeasonWeekResult(_message.Message):
+    __slots__ = ("team_ids", "names", "wins", "losses")
+    TEAM_IDS_FIELD_NUMBER: _ClassVar[int]
+    NAMES_FIELD_NUMBER: _ClassVar[int]
+    WINS_FIELD_NUMBER: _ClassVar[int]
+    LOSSES_FIELD_NUMBER: _ClassVar[int]
+    team_ids: bytes
+    names: _containers.RepeatedScalarFieldContainer[str]
+    wins: _containers.RepeatedScalarFieldContainer[int]
+    losses: _containers.RepeatedScalarFieldContainer[int]
+    def __init__(self, team_ids: _Optional[bytes] = ..., names: _Optional[_Iterable[str]] = ..., wins: _Optional[_Iterable[int]] = ..., losses: _Optional[_Iterable[int]] = ...) -> None: ...
+
 class TeamRecordBySeasonWeekValue(_message.Message):
-    __slots__ = ("record_id", "season_id", "year", "week", "values")
+    __slots__ = ("record_id", "season_id", "year", "week", "values", "packed_values")
     RECORD_ID_FIELD_NUMBER: _ClassVar[int]
     SEASON_ID_FIELD_NUMBER: _ClassVar[int]
     YEAR_FIELD_NUMBER: _ClassVar[int]
     WEEK_FIELD_NUMBER: _ClassVar[int]
     VALUES_FIELD_NUMBER: _ClassVar[int]
+    PACKED_VALUES_FIELD_NUMBER: _ClassVar[int]
     record_id: str
     season_id: str
     year: int
     week: int
     values: _containers.RepeatedCompositeFieldContainer[TeamRecordValueBySeasonWeekResult]
-    def __init__(self, record_id: _Optional[str] = ..., season_id: _Optional[str] = ..., year: _Optional[int] = ..., week: _Optional[int] = ..., values: _Optional[_Iterable[_Union[TeamRecordValueBySeasonWeekResult, _Mapping]]] = ...) -> None: ...
+    packed_values: PackedTeamRecordValuesBySeasonWeekResult
+    def __init__(self, record_id: _Optional[str] = ..., season_id: _Optional[str] = ..., year: _Optional[int] = ..., week: _Optional[int] = ..., values: _Optional[_Iterable[_Union[TeamRecordValueBySeasonWeekResult, _Mapping]]] = ..., packed_values: _Optional[_Union[PackedTeamRecordValuesBySeasonWeekResult, _Mapping]] = ...) -> None: ...
 
 class TeamRecordBySeasonWeekResult(_message.Message):
     __slots__ = ("query_id", "record")
@@ -3,34 +3,20 @@ from uuid import uuid4
 
 from communication.bus import EventBus
 from communication.bus import QueryBus
+from fbsrankings.config import RankingConfig
 from fbsrankings.messages.command import CalculateRankingsForSeasonCommand
-from fbsrankings.messages.query import AffiliationsBySeasonQuery
-from fbsrankings.messages.query import AffiliationsBySeasonResult
-from fbsrankings.messages.query import GamesBySeasonQuery
-from fbsrankings.messages.query import GamesBySeasonResult
 from fbsrankings.messages.query import SeasonByIDQuery
 from fbsrankings.messages.query import SeasonByIDResult
 from fbsrankings.messages.query import SeasonByYearQuery
 from fbsrankings.messages.query import SeasonByYearResult
-from fbsrankings.ranking.command.domain.model.ranking import SeasonData
-from fbsrankings.ranking.command.domain.service.colley_matrix_ranking_calculator import (
-    ColleyMatrixRankingCalculator,
+from fbsrankings.ranking.command.application.elo_checkpoint_cache import (
+    EloCheckpointCache,
 )
-from fbsrankings.ranking.command.domain.service.game_strength_ranking_calculator import (
-    GameStrengthRankingCalculator,
-)
-from fbsrankings.ranking.command.domain.service.record_calculator import (
-    TeamRecordCalculator,
-)
-from fbsrankings.ranking.command.domain.service.simultaneous_wins_ranking_calculator import (
-    SimultaneousWinsRankingCalculator,
-)
-from fbsrankings.ranking.command.domain.service.srs_ranking_calculator import (
-    SRSRankingCalculator,
-)
-from fbsrankings.ranking.command.domain.service.strength_of_schedule_ranking_calculator import (
-    StrengthOfScheduleRankingCalculator,
+from fbsrankings.ranking.command.application.season_cache import SeasonCache
+from fbsrankings.ranking.command.application.season_ranking_calculator import (
+    SeasonRankingCalculator,
 )
+from fbsrankings.ranking.command.domain.model.core import SeasonID
 from fbsrankings.ranking.command.infrastructure.data_source import DataSource
 from fbsrankings.ranking.command.infrastructure.transaction.transaction import (
     Transaction,
@@ -40,13 +26,19 @@ from fbsrankings.ranking.command.infrastructure.transaction.transaction import (
 class CalculateRankingsForSeasonCommandHandler:
     def __init__(
         self,
+        config: RankingConfig,
         data_source: DataSource,
+        cache: SeasonCache,
+        elo_checkpoints: EloCheckpointCache,
         query_bus: QueryBus,
         event_bus: EventBus,
     ) -> None:
         self._data_source = data_source
+        self._cache = cache
+        self._elo_checkpoints = elo_checkpoints
         self._query_bus = query_bus
         self._event_bus = event_bus
+        self._calculator = SeasonRankingCalculator(config)
 
     def __call__(self, command: CalculateRankingsForSeasonCommand) -> None:
         with Transaction(self._data_source, self._event_bus) as transaction:
@@ -76,59 +68,41 @@ class CalculateRankingsForSeasonCommandHandler:
             else:
                 raise TypeError("season_id_or_year must be of type str or int")
 
-            affiliations = self._query_bus.query(
-                AffiliationsBySeasonQuery(
-                    query_id=str(uuid4()),
-                    season_id=season_id,
-                ),
-                AffiliationsBySeasonResult,
-            ).affiliations
-            games = self._query_bus.query(
-                GamesBySeasonQuery(query_id=str(uuid4()), season_id=season_id),
-                GamesBySeasonResult,
-            ).games
-
-            season_data = SeasonData(UUID(season_id), affiliations, games)
+            season = self._cache.get(season_id)
+            affiliations = season.affiliations
+            games = list(season.games.values())
 
-            TeamRecordCalculator(transaction.factory.team_record).calculate_for_season(
-                season_data,
+            fingerprint = self._calculator.fingerprint(affiliations, games)
+            stored_fingerprint = transaction.repository.ranking_fingerprint.find(
+                SeasonID(UUID(season_id)),
             )
+            stored_value = (
+                stored_fingerprint.value if stored_fingerprint is not None else None
+            )
+            if stored_value == fingerprint:
+                return
 
-            srs_rankings = SRSRankingCalculator(
-                transaction.factory.team_ranking,
-            ).calculate_for_season(season_data)
-            for ranking in srs_rankings:
-                StrengthOfScheduleRankingCalculator(
-                    transaction.factory.team_ranking,
-                ).calculate_for_ranking(season_data, ranking)
-                GameStrengthRankingCalculator(
-                    transaction.factory.game_ranking,
-                ).calculate_for_ranking(season_data, ranking)
-
-            cm_rankings = ColleyMatrixRankingCalculator(
-                transaction.factory.team_ranking,
-            ).calculate_for_season(season_data)
-            for ranking in cm_rankings:
-                StrengthOfScheduleRankingCalculator(
-                    transaction.factory.team_ranking,
-                ).calculate_for_ranking(season_data, ranking)
-                GameStrengthRankingCalculator(
-                    transaction.factory.game_ranking,
-                ).calculate_for_ranking(season_data, ranking)
-
-            sw_rankings = SimultaneousWinsRankingCalculator(
-                transaction.factory.team_ranking,
-            ).calculate_for_season(season_data)
-            for ranking in sw_rankings:
-                StrengthOfScheduleRankingCalculator(
-                    transaction.factory.team_ranking,
-                ).calculate_for_ranking(season_data, ranking)
-                GameStrengthRankingCalculator(
-                    transaction.factory.game_ranking,
-                ).calculate_for_ranking(season_data, ranking)
+            events, elo_checkpoints = self._calculator.calculate_for_season(
+                season_id,
+                affiliations,
+                games,
+                self._calculator.start_week(
+                    stored_value,
+                    command.start_week if command.HasField("start_week") else None,
+                ),
+                self._elo_checkpoints.get(season_id, stored_value),
+            )
+            for event in events:
+                transaction.publish(event)
+            transaction.factory.ranking_fingerprint.create(
+                SeasonID(UUID(season_id)),
+                fingerprint,
+            )
 
             try:
                 transaction.commit()
             except Exception:
                 transaction.rollback()
                 raise
+
+        self._elo_checkpoints.put(season_id, fingerprint, elo_checkpoints)
@@ -0,0 +1,176 @@
+import multiprocessing
+from collections.abc import Iterable
+from collections.abc import Iterator
+from collections.abc import Mapping
+from concurrent.futures import ProcessPoolExecutor
+from dataclasses import dataclass
+from itertools import repeat
+from typing import Optional
+from uuid import UUID
+from uuid import uuid4
+
+from communication.bus import EventBus
+from communication.bus import QueryBus
+from communication.messages import Event
+from fbsrankings.config import RankingConfig
+from fbsrankings.messages.command import CalculateRankingsForSeasonsCommand
+from fbsrankings.messages.query import AffiliationBySeasonResult
+from fbsrankings.messages.query import AffiliationsBySeasonQuery
+from fbsrankings.messages.query import AffiliationsBySeasonResult
+from fbsrankings.messages.query import GameBySeasonResult
+from fbsrankings.messages.query import GamesBySeasonQuery
+from fbsrankings.messages.query import GamesBySeasonResult
+from fbsrankings.messages.query import SeasonByIDQuery
+from fbsrankings.messages.query import SeasonByIDResult
+from fbsrankings.ranking.command.application.elo_checkpoint_cache import (
+    EloCheckpointCache,
+)
+from fbsrankings.ranking.command.application.season_ranking_calculator import (
+    SeasonRankingCalculator,
+)
+from fbsrankings.ranking.command.domain.model.core import SeasonID
+from fbsrankings.ranking.command.domain.service.elo_ranking_calculator import EloRatings
+from fbsrankings.ranking.command.infrastructure.data_source import DataSource
+from fbsrankings.ranking.command.infrastructure.transaction.transaction import (
+    Transaction,
+)
+
+
+@dataclass(frozen=True)
+class SeasonInput:
+    season_id: str
+    affiliations: list[AffiliationBySeasonResult]
+    games: list[GameBySeasonResult]
+    start_week: Optional[int]
+    fingerprint: str
+    elo_checkpoints: list[EloRatings]
+
+
+class CalculateRankingsForSeasonsCommandHandler:
+    def __init__(
+        self,
+        config: RankingConfig,
+        data_source: DataSource,
+        elo_checkpoints: EloCheckpointCache,
+        query_bus: QueryBus,
+        event_bus: EventBus,
+    ) -> None:
+        self._data_source = data_source
+        self._elo_checkpoints = elo_checkpoints
+        self._query_bus = query_bus
+        self._event_bus = event_bus
+        self._calculator = SeasonRankingCalculator(config)
+        self._workers = config.workers
+
+    def __call__(self, command: CalculateRankingsForSeasonsCommand) -> None:
+        seasons = list(self._seasons(command.season_ids, command.start_weeks))
+        calculators = repeat(self._calculator)
+
+        workers = min(self._workers, len(seasons))
+        if workers > 1:
+            with ProcessPoolExecutor(
+                max_workers=workers,
+                mp_context=multiprocessing.get_context("spawn"),
+            ) as executor:
+                for season, (events, elo_checkpoints) in zip(
+                    seasons,
+                    executor.map(_calculate_for_season, calculators, seasons),
+                ):
+                    self._commit(season, events, elo_checkpoints)
+        else:
+            for season, (events, elo_checkpoints) in zip(
+                seasons,
+                map(_calculate_for_season, calculators, seasons),
+            ):
+                self._commit(season, events, elo_checkpoints)
+
+    def _seasons(
+        self,
+        season_ids: Iterable[str],
+        start_weeks: Mapping[str, int],
+    ) -> Iterator[SeasonInput]:
+        # A season whose stored fingerprint matches is already current. The
+        # stored weeks before a season's start week are only kept when they
+        # were calculated with the same settings.
+        for season_id in season_ids:
+            season = self._query_bus.query(
+                SeasonByIDQuery(query_id=str(uuid4()), season_id=season_id),
+                SeasonByIDResult,
+            )
+            if not season.HasField("season"):
+                raise ValueError(f"Season not found for {season_id}")
+
+            affiliations = list(
+                self._query_bus.query(
+                    AffiliationsBySeasonQuery(
+                        query_id=str(uuid4()),
+                        season_id=season_id,
+                    ),
+                    AffiliationsBySeasonResult,
+                ).affiliations,
+            )
+            games = list(
+                self._query_bus.query(
+                    GamesBySeasonQuery(query_id=str(uuid4()), season_id=season_id),
+                    GamesBySeasonResult,
+                ).games,
+            )
+
+            fingerprint = self._calculator.fingerprint(affiliations, games)
+            stored_fingerprint = self._stored_fingerprint(season_id)
+            if stored_fingerprint == fingerprint:
+                continue
+
+            yield SeasonInput(
+                season_id,
+                affiliations,
+                games,
+                self._calculator.start_week(
+                    stored_fingerprint,
+                    start_weeks.get(season_id),
+                ),
+                fingerprint,
+                self._elo_checkpoints.get(season_id, stored_fingerprint),
+            )
+
+    def _stored_fingerprint(self, season_id: str) -> Optional[str]:
+        with Transaction(self._data_source, self._event_bus) as transaction:
+            stored_fingerprint = transaction.repository.ranking_fingerprint.find(
+                SeasonID(UUID(season_id)),
+            )
+        return stored_fingerprint.value if stored_fingerprint is not None else None
+
+    def _commit(
+        self,
+        season: SeasonInput,
+        events: Iterable[Event],
+        elo_checkpoints: list[EloRatings],
+    ) -> None:
+        with Transaction(self._data_source, self._event_bus) as transaction:
+            for event in events:
+                transaction.publish(event)
+            transaction.factory.ranking_fingerprint.create(
+                SeasonID(UUID(season.season_id)),
+                season.fingerprint,
+            )
+
+            try:
+                transaction.commit()
+            except Exception:
+                transaction.rollback()
+                raise
+
+        self._elo_checkpoints.put(season.season_id, season.fingerprint, elo_checkpoints)
+
+
+def _calculate_for_season(
+    calculator: SeasonRankingCalculator,
+    season: SeasonInput,
+) -> tuple[list[Event], list[EloRatings]]:
+    return calculator.calculate_for_season(
+        season.season_id,
+        season.affiliations,
+        season.games,
+        season.start_week,
+        season.elo_checkpoints,
+    )
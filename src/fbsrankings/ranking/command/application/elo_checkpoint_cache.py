@@ -0,0 +1,40 @@
+from collections import OrderedDict
+from collections.abc import Sequence
+from typing import Optional
+
+from fbsrankings.ranking.command.domain.service.elo_ranking_calculator import EloRatings
+
+
+class EloCheckpointCache:
+    capacity: int = 4
+
+    # Keeps the weekly Elo ratings of the seasons whose rankings were stored,
+    # along with the fingerprint they were stored with, so a recalculation
+    # from a later week only resumes from them while that fingerprint is still
+    # the stored one. Only the most recently used seasons are kept.
+    def __init__(self) -> None:
+        self._checkpoints: OrderedDict[str, tuple[str, list[EloRatings]]] = (
+            OrderedDict()
+        )
+
+    def get(
+        self,
+        season_id: str,
+        stored_fingerprint: Optional[str],
+    ) -> list[EloRatings]:
+        cached = self._checkpoints.get(season_id)
+        if cached is None or cached[0] != stored_fingerprint:
+            return []
+        self._checkpoints.move_to_end(season_id)
+        return cached[1]
+
+    def put(
+        self,
+        season_id: str,
+        fingerprint: str,
+        checkpoints: Sequence[EloRatings],
+    ) -> None:
+        self._checkpoints[season_id] = (fingerprint, list(checkpoints))
+        self._checkpoints.move_to_end(season_id)
+        while len(self._checkpoints) > self.capacity:
+            self._checkpoints.popitem(last=False)
@@ -0,0 +1,47 @@
+from fbsrankings.messages.convert import ids_to_bytes
+from fbsrankings.messages.query import RankingScenariosQuery
+from fbsrankings.messages.query import RankingScenariosResult
+from fbsrankings.messages.query import RankingScenarioValue
+from fbsrankings.messages.query import TeamRankingDeltasByScenarioResult
+from fbsrankings.ranking.command.application.scenario_cache import ScenarioCache
+
+
+class RankingScenariosQueryHandler:
+    def __init__(self, cache: ScenarioCache) -> None:
+        self._cache = cache
+
+    def __call__(self, query: RankingScenariosQuery) -> RankingScenariosResult:
+        season_data, calculator = self._cache.get(query.season_id)
+
+        scenarios = []
+        for scenario in query.scenarios:
+            rankings = calculator.calculate(
+                (result.game_id, result.home_team_score, result.away_team_score)
+                for result in scenario.results
+            )
+            scenarios.append(
+                RankingScenarioValue(
+                    rankings=[
+                        TeamRankingDeltasByScenarioResult(
+                            name=ranking.name,
+                            values=ranking.values.tolist(),
+                            ranks=ranking.ranks.tolist(),
+                            value_deltas=ranking.value_deltas.tolist(),
+                            rank_deltas=ranking.rank_deltas.tolist(),
+                        )
+                        for ranking in rankings
+                    ],
+                ),
+            )
+
+        team_ids = [
+            season_data.team_ids[team] for team in season_data.ranked_teams.tolist()
+        ]
+        return RankingScenariosResult(
+            query_id=query.query_id,
+            season_id=query.season_id,
+            week=calculator.week,
+            team_ids=ids_to_bytes(team_ids),
+            names=[season_data.affiliation_map[id_].team_name for id_ in team_ids],
+            scenarios=scenarios,
+        )
@@ -0,0 +1,52 @@
+from collections import OrderedDict
+from uuid import UUID
+
+from fbsrankings.config import RankingConfig
+from fbsrankings.config import RankingDivisionType
+from fbsrankings.ranking.command.application.season_cache import SeasonCache
+from fbsrankings.ranking.command.application.season_cache import SeasonInput
+from fbsrankings.ranking.command.domain.model.ranking import SeasonData
+from fbsrankings.ranking.command.domain.service.scenario_calculator import (
+    ScenarioCalculator,
+)
+
+
+class ScenarioCache:
+    capacity: int = 2
+
+    # Keeps the factorized systems of each season until its cached input
+    # changes, so repeated queries for the same season only apply their own
+    # games. Each season keeps the inverse of its last week's system, so only
+    # the most recently used seasons are kept.
+    def __init__(self, config: RankingConfig, cache: SeasonCache) -> None:
+        self._all_divisions = config.division == RankingDivisionType.ALL
+        self._cache = cache
+        self._calculators: OrderedDict[
+            str,
+            tuple[SeasonInput, int, SeasonData, ScenarioCalculator],
+        ] = OrderedDict()
+
+    def get(self, season_id: str) -> tuple[SeasonData, ScenarioCalculator]:
+        season = self._cache.get(season_id)
+        cached = self._calculators.get(season_id)
+        if cached is not None and cached[0] is season and cached[1] == season.revision:
+            self._calculators.move_to_end(season_id)
+            return cached[2], cached[3]
+
+        season_data = SeasonData(
+            UUID(season_id),
+            season.affiliations,
+            season.games.values(),
+            self._all_divisions,
+        )
+        calculator = ScenarioCalculator(season_data)
+        self._calculators[season_id] = (
+            season,
+            season.revision,
+            season_data,
+            calculator,
+        )
+        self._calculators.move_to_end(season_id)
+        while len(self._calculators) > self.capacity:
+            self._calculators.popitem(last=False)
+        return season_data, calculator
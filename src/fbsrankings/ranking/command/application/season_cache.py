@@ -0,0 +1,111 @@
+from collections import OrderedDict
+from collections.abc import Iterable
+from typing import Union
+from uuid import uuid4
+
+from communication.bus import EventBus
+from communication.bus import QueryBus
+from fbsrankings.messages.enums import GameStatus
+from fbsrankings.messages.event import AffiliationCreatedEvent
+from fbsrankings.messages.event import GameCanceledEvent
+from fbsrankings.messages.event import GameCompletedEvent
+from fbsrankings.messages.event import GameCreatedEvent
+from fbsrankings.messages.event import GameNotesUpdatedEvent
+from fbsrankings.messages.event import GameRescheduledEvent
+from fbsrankings.messages.query import AffiliationBySeasonResult
+from fbsrankings.messages.query import AffiliationsBySeasonQuery
+from fbsrankings.messages.query import AffiliationsBySeasonResult
+from fbsrankings.messages.query import GameBySeasonResult
+from fbsrankings.messages.query import GamesBySeasonQuery
+from fbsrankings.messages.query import GamesBySeasonResult
+
+
+class SeasonInput:
+    def __init__(
+        self,
+        affiliations: Iterable[AffiliationBySeasonResult],
+        games: Iterable[GameBySeasonResult],
+    ) -> None:
+        self.affiliations = list(affiliations)
+        self.games = {game.game_id: game for game in games}
+        self.revision = 0
+
+
+class SeasonCache:
+    capacity: int = 4
+
+    # Keeps the affiliations and games of the seasons that were queried, so
+    # that a recalculation after a single game result does not have to query
+    # them again. A completed game is applied to its cached season and bumps
+    # its revision, and any other change to a season's games or affiliations
+    # evicts it. Only the most recently used seasons are kept.
+    def __init__(self, query_bus: QueryBus, event_bus: EventBus) -> None:
+        self._query_bus = query_bus
+        self._event_bus = event_bus
+        self._seasons: OrderedDict[str, SeasonInput] = OrderedDict()
+
+        self._event_bus.register_handler(GameCompletedEvent, self._complete)
+        self._event_bus.register_handler(AffiliationCreatedEvent, self._evict)
+        self._event_bus.register_handler(GameCreatedEvent, self._evict)
+        self._event_bus.register_handler(GameRescheduledEvent, self._evict)
+        self._event_bus.register_handler(GameCanceledEvent, self._evict)
+        self._event_bus.register_handler(GameNotesUpdatedEvent, self._evict)
+
+    def get(self, season_id: str) -> SeasonInput:
+        season = self._seasons.get(season_id)
+        if season is None:
+            season = SeasonInput(
+                self._query_bus.query(
+                    AffiliationsBySeasonQuery(
+                        query_id=str(uuid4()),
+                        season_id=season_id,
+                    ),
+                    AffiliationsBySeasonResult,
+                ).affiliations,
+                self._query_bus.query(
+                    GamesBySeasonQuery(query_id=str(uuid4()), season_id=season_id),
+                    GamesBySeasonResult,
+                ).games,
+            )
+            self._seasons[season_id] = season
+            while len(self._seasons) > self.capacity:
+                self._seasons.popitem(last=False)
+        else:
+            self._seasons.move_to_end(season_id)
+        return season
+
+    def close(self) -> None:
+        self._event_bus.unregister_handler(GameCompletedEvent, self._complete)
+        self._event_bus.unregister_handler(AffiliationCreatedEvent, self._evict)
+        self._event_bus.unregister_handler(GameCreatedEvent, self._evict)
+        self._event_bus.unregister_handler(GameRescheduledEvent, self._evict)
+        self._event_bus.unregister_handler(GameCanceledEvent, self._evict)
+        self._event_bus.unregister_handler(GameNotesUpdatedEvent, self._evict)
+        self._seasons.clear()
+
+    def _complete(self, event: GameCompletedEvent) -> None:
+        season = self._seasons.get(event.season_id)
+        if season is None:
+            return
+
+        game = season.games.get(event.game_id)
+        if game is None:
+            del self._seasons[event.season_id]
+            return
+
+        game.home_team_score = event.home_team_score
+        game.away_team_score = event.away_team_score
+        game.status = GameStatus.GAME_STATUS_COMPLETED
+        season.revision += 1
+
+    def _evict(
+        self,
+        event: Union[
+            AffiliationCreatedEvent,
+            GameCreatedEvent,
+            GameRescheduledEvent,
+            GameCanceledEvent,
+            GameNotesUpdatedEvent,
+        ],
+    ) -> None:
+        self._seasons.pop(event.season_id, None)
@@ -0,0 +1,358 @@
+import hashlib
+from collections.abc import Iterable
+from collections.abc import Sequence
+from concurrent.futures import ThreadPoolExecutor
+from functools import partial
+from typing import Callable
+from typing import Optional
+from typing import Union
+from uuid import UUID
+
+import numpy
+from numpy.typing import NDArray
+
+from communication.bus import MemoryEventBus
+from communication.messages import Event
+from fbsrankings.config import RankingConfig
+from fbsrankings.config import RankingDivisionType
+from fbsrankings.config import RankingEngineType
+from fbsrankings.config import RankingSolverType
+from fbsrankings.messages.event import SeasonRankingsCalculatedEvent
+from fbsrankings.messages.query import AffiliationBySeasonResult
+from fbsrankings.messages.query import GameBySeasonResult
+from fbsrankings.ranking.command.domain.model.core import SeasonID
+from fbsrankings.ranking.command.domain.model.core import TeamID
+from fbsrankings.ranking.command.domain.model.factory import Factory
+from fbsrankings.ranking.command.domain.model.ranking import Ranking
+from fbsrankings.ranking.command.domain.model.ranking import SeasonData
+from fbsrankings.ranking.command.domain.model.season_ranking import (
+    SeasonRankingsBuilder,
+)
+from fbsrankings.ranking.command.domain.service.bootstrap_ranking_calculator import (
+    BootstrapRankingCalculator,
+)
+from fbsrankings.ranking.command.domain.service.colley_matrix_ranking_calculator import (
+    ColleyMatrixRankingCalculator,
+)
+from fbsrankings.ranking.command.domain.service.elo_ranking_calculator import (
+    EloRankingCalculator,
+)
+from fbsrankings.ranking.command.domain.service.elo_ranking_calculator import EloRatings
+from fbsrankings.ranking.command.domain.service.game_strength_ranking_calculator import (
+    GameStrengthRankingCalculator,
+)
+from fbsrankings.ranking.command.domain.service.linear_solver import CholeskySolver
+from fbsrankings.ranking.command.domain.service.linear_solver import (
+    ConjugateGradientSolver,
+)
+from fbsrankings.ranking.command.domain.service.linear_solver import GMRESSolver
+from fbsrankings.ranking.command.domain.service.linear_solver import LinearSolver
+from fbsrankings.ranking.command.domain.service.linear_solver import LUSolver
+from fbsrankings.ranking.command.domain.service.record_calculator import (
+    TeamRecordCalculator,
+)
+from fbsrankings.ranking.command.domain.service.simultaneous_wins_ranking_calculator import (
+    SimultaneousWinsRankingCalculator,
+)
+from fbsrankings.ranking.command.domain.service.srs_ranking_calculator import (
+    SRSRankingCalculator,
+)
+from fbsrankings.ranking.command.domain.service.strength_of_schedule_ranking_calculator import (
+    StrengthOfScheduleRankingCalculator,
+)
+from fbsrankings.ranking.command.domain.service.weekly_solver import AutoWeeklySolver
+from fbsrankings.ranking.command.domain.service.weekly_solver import BatchedWeeklySolver
+from fbsrankings.ranking.command.domain.service.weekly_solver import DirectWeeklySolver
+from fbsrankings.ranking.command.domain.service.weekly_solver import (
+    IncrementalWeeklySolver,
+)
+from fbsrankings.ranking.command.domain.service.weekly_solver import SparseWeeklySolver
+from fbsrankings.ranking.command.domain.service.weekly_solver import WeeklySolver
+
+
+RankingCalculatorType = Union[
+    type[SRSRankingCalculator],
+    type[ColleyMatrixRankingCalculator],
+    type[SimultaneousWinsRankingCalculator],
+]
+
+BootstrapType = Callable[[SeasonData, int], NDArray[numpy.float64]]
+
+
+class SeasonRankingCalculator:
+    # Changing this invalidates every stored fingerprint, so it should be
+    # bumped whenever the calculated values change for the same input. A
+    # fingerprint is the digest of the settings followed by the digest of the
+    # season's affiliations and games, so that stored rankings are only
+    # recalculated from a later week when they were calculated with the same
+    # settings.
+    version: int = 3
+
+    def __init__(self, config: RankingConfig) -> None:
+        self._all_divisions = config.division == RankingDivisionType.ALL
+        self._threads = config.threads
+        self._bootstrap_samples = config.bootstrap_samples
+        self._settings = (
+            self.version,
+            config.engine.value,
+            config.srs_engine.value if config.srs_engine is not None else None,
+            (
+                config.colley_matrix_engine.value
+                if config.colley_matrix_engine is not None
+                else None
+            ),
+            (
+                config.simultaneous_wins_engine.value
+                if config.simultaneous_wins_engine is not None
+                else None
+            ),
+            config.solver.value,
+            config.division.value,
+            config.bootstrap_samples,
+        )
+
+        self._settings_fingerprint = hashlib.sha256(
+            repr(self._settings).encode(),
+        ).hexdigest()
+
+        linear_solver_type = self._linear_solver_type(config.solver)
+        self._srs_solver_factory = self._solver_factory(
+            config.srs_engine or config.engine,
+            linear_solver_type,
+        )
+        self._colley_matrix_solver_factory = self._solver_factory(
+            config.colley_matrix_engine or config.engine,
+            linear_solver_type,
+        )
+        self._simultaneous_wins_solver_factory = self._solver_factory(
+            config.simultaneous_wins_engine or config.engine,
+            linear_solver_type,
+        )
+
+    def fingerprint(
+        self,
+        affiliations: Iterable[AffiliationBySeasonResult],
+        games: Iterable[GameBySeasonResult],
+    ) -> str:
+        digest = hashlib.sha256()
+        for affiliation in sorted(affiliations, key=lambda a: a.team_id):
+            digest.update(
+                repr(
+                    (
+                        affiliation.team_id,
+                        affiliation.team_name,
+                        affiliation.subdivision,
+                    ),
+                ).encode(),
+            )
+        for game in sorted(games, key=lambda g: g.game_id):
+            digest.update(
+                repr(
+                    (
+                        game.game_id,
+                        game.week,
+                        game.date.seconds,
+                        game.status,
+                        game.home_team_id,
+                        game.away_team_id,
+                        game.home_team_score,
+                        game.away_team_score,
+                    ),
+                ).encode(),
+            )
+        return f"{self._settings_fingerprint}:{digest.hexdigest()}"
+
+    def start_week(
+        self,
+        stored_fingerprint: Optional[str],
+        start_week: Optional[int],
+    ) -> Optional[int]:
+        if (
+            stored_fingerprint is None
+            or stored_fingerprint.partition(":")[0] != self._settings_fingerprint
+        ):
+            return None
+        return start_week
+
+    def calculate_for_season(
+        self,
+        season_id: str,
+        affiliations: Iterable[AffiliationBySeasonResult],
+        games: Iterable[GameBySeasonResult],
+        start_week: Optional[int] = None,
+        elo_checkpoints: Sequence[EloRatings] = (),
+    ) -> tuple[list[Event], list[EloRatings]]:
+        season_data = SeasonData(
+            UUID(season_id),
+            affiliations,
+            games,
+            self._all_divisions,
+            start_week,
+        )
+
+        # Each part collects into its own builder, so the parts can run on
+        # separate threads and their results are still combined in order.
+        elo_ratings: list[EloRatings] = []
+        parts: list[Callable[[SeasonRankingsBuilder], None]] = [
+            partial(self._calculate_records, season_data),
+            partial(
+                self._calculate_rankings,
+                season_data,
+                SRSRankingCalculator,
+                self._srs_solver_factory,
+                SRSRankingCalculator.bootstrap,
+                self._bootstrap_samples,
+            ),
+            partial(
+                self._calculate_rankings,
+                season_data,
+                ColleyMatrixRankingCalculator,
+                self._colley_matrix_solver_factory,
+                ColleyMatrixRankingCalculator.bootstrap,
+                self._bootstrap_samples,
+            ),
+            partial(
+                self._calculate_rankings,
+                season_data,
+                SimultaneousWinsRankingCalculator,
+                self._simultaneous_wins_solver_factory,
+                None,
+                self._bootstrap_samples,
+            ),
+            partial(
+                self._calculate_elo_rankings,
+                season_data,
+                elo_checkpoints,
+                elo_ratings,
+            ),
+        ]
+
+        if self._threads > 1:
+            with ThreadPoolExecutor(
+                max_workers=min(self._threads, len(parts)),
+            ) as executor:
+                builders = list(executor.map(_build, parts))
+        else:
+            builders = [_build(part) for part in parts]
+
+        events: list[Event] = []
+        bus = MemoryEventBus()
+        bus.register_handler(SeasonRankingsCalculatedEvent, events.append)
+
+        Factory(bus).season_rankings.create(
+            SeasonID(season_data.season_id),
+            season_data.team_ids,
+            season_data.game_ids,
+            [record for builder in builders for record in builder.team_records],
+            [ranking for builder in builders for ranking in builder.team_rankings],
+            [ranking for builder in builders for ranking in builder.game_rankings],
+        )
+
+        return events, elo_ratings
+
+    @staticmethod
+    def _calculate_records(
+        season_data: SeasonData,
+        factory: SeasonRankingsBuilder,
+    ) -> None:
+        TeamRecordCalculator(factory.team_record).calculate_for_season(season_data)
+
+    @staticmethod
+    def _calculate_rankings(
+        season_data: SeasonData,
+        calculator_type: RankingCalculatorType,
+        solver_factory: Callable[[], WeeklySolver],
+        bootstrap: Optional[BootstrapType],
+        bootstrap_samples: int,
+        factory: SeasonRankingsBuilder,
+    ) -> None:
+        rankings = calculator_type(
+            factory.team_ranking,
+            solver_factory,
+        ).calculate_for_season(season_data)
+        if bootstrap is not None and bootstrap_samples > 0 and rankings:
+            BootstrapRankingCalculator(factory.team_ranking).calculate_for_season(
+                season_data,
+                calculator_type.name,
+                bootstrap(season_data, bootstrap_samples),
+            )
+        SeasonRankingCalculator._calculate_strengths(season_data, rankings, factory)
+
+    @staticmethod
+    def _calculate_elo_rankings(
+        season_data: SeasonData,
+        checkpoints: Sequence[EloRatings],
+        elo_ratings: list[EloRatings],
+        factory: SeasonRankingsBuilder,
+    ) -> None:
+        # Weeks before the start week keep their stored rankings, so the Elo
+        # ratings are resumed from the last checkpoint before it instead of
+        # replaying the games of the whole season. The checkpoints of every
+        # week are collected into the given list for the next recalculation.
+        kept = 0
+        if len(season_data.calculated_weeks) > 0:
+            first_week = int(season_data.calculated_weeks[0])
+            while kept < len(checkpoints) and checkpoints[kept].week < first_week:
+                kept += 1
+        checkpoint = checkpoints[kept - 1] if kept > 0 else None
+
+        calculator = EloRankingCalculator(factory.team_ranking)
+        weekly = calculator.ratings_for_season(season_data, checkpoint)
+        elo_ratings.extend(checkpoints[:kept])
+        elo_ratings.extend(weekly)
+
+        rankings = calculator.calculate_for_ratings(season_data, weekly)
+        SeasonRankingCalculator._calculate_strengths(season_data, rankings, factory)
+
+    @staticmethod
+    def _calculate_strengths(
+        season_data: SeasonData,
+        rankings: list[Ranking[TeamID]],
+        factory: SeasonRankingsBuilder,
+    ) -> None:
+        for ranking in rankings:
+            StrengthOfScheduleRankingCalculator(
+                factory.team_ranking,
+            ).calculate_for_ranking(season_data, ranking)
+            GameStrengthRankingCalculator(
+                factory.game_ranking,
+            ).calculate_for_ranking(season_data, ranking)
+
+    @staticmethod
+    def _solver_factory(
+        engine: RankingEngineType,
+        linear_solver_type: Optional[type[LinearSolver]],
+    ) -> Callable[[], WeeklySolver]:
+        if engine == RankingEngineType.AUTO:
+            return partial(AutoWeeklySolver, linear_solver_type)
+        if engine == RankingEngineType.DIRECT:
+            return partial(DirectWeeklySolver, linear_solver_type)
+        if engine == RankingEngineType.INCREMENTAL:
+            return IncrementalWeeklySolver
+        if engine == RankingEngineType.BATCHED:
+            return BatchedWeeklySolver
+        if engine == RankingEngineType.SPARSE:
+            return partial(SparseWeeklySolver, linear_solver_type)
+        raise ValueError(f"Unknown ranking engine type: {engine}")
+
+    @staticmethod
+    def _linear_solver_type(
+        solver: RankingSolverType,
+    ) -> Optional[type[LinearSolver]]:
+        if solver == RankingSolverType.AUTO:
+            return None
+        if solver == RankingSolverType.LU:
+            return LUSolver
+        if solver == RankingSolverType.CHOLESKY:
+            return CholeskySolver
+        if solver == RankingSolverType.CG:
+            return ConjugateGradientSolver
+        if solver == RankingSolverType.GMRES:
+            return GMRESSolver
+        raise ValueError(f"Unknown ranking solver type: {solver}")
+
+
+def _build(part: Callable[[SeasonRankingsBuilder], None]) -> SeasonRankingsBuilder:
+    builder = SeasonRankingsBuilder(MemoryEventBus())
+    part(builder)
+    return builder
@@ -0,0 +1,47 @@
+from fbsrankings.messages.query import SeasonSimulationQuery
+from fbsrankings.messages.query import SeasonSimulationResult
+from fbsrankings.messages.query import TeamSimulationBySeasonResult
+from fbsrankings.ranking.command.application.scenario_cache import ScenarioCache
+from fbsrankings.ranking.command.domain.service.season_simulator import SeasonSimulator
+from fbsrankings.ranking.command.domain.service.srs_ranking_calculator import (
+    SRSRankingCalculator,
+)
+
+
+class SeasonSimulationQueryHandler:
+    def __init__(self, cache: ScenarioCache) -> None:
+        self._cache = cache
+
+    def __call__(self, query: SeasonSimulationQuery) -> SeasonSimulationResult:
+        season_data, calculator = self._cache.get(query.season_id)
+        simulation = SeasonSimulator(
+            season_data,
+            calculator.system(SRSRankingCalculator.name),
+        ).simulate(query.count, query.seed if query.HasField("seed") else None)
+
+        teams = []
+        for index, team in enumerate(season_data.ranked_teams.tolist()):
+            team_id = season_data.team_ids[team]
+            teams.append(
+                TeamSimulationBySeasonResult(
+                    team_id=team_id,
+                    name=season_data.affiliation_map[team_id].team_name,
+                    wins=int(simulation.wins[index]),
+                    losses=int(simulation.losses[index]),
+                    remaining_games=int(simulation.remaining_games[index]),
+                    rating=float(simulation.ratings[index]),
+                    projected_rating=float(simulation.projected_ratings[index]),
+                    expected_wins=float(simulation.expected_wins[index]),
+                    win_probabilities=simulation.win_probabilities[index].tolist(),
+                    rank_probabilities=simulation.rank_probabilities[index].tolist(),
+                ),
+            )
+
+        return SeasonSimulationResult(
+            query_id=query.query_id,
+            season_id=query.season_id,
+            week=calculator.week,
+            count=simulation.count,
+            margin_deviation=simulation.margin_deviation,
+            teams=teams,
+        )
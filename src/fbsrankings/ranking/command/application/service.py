@@ -8,9 +8,26 @@ from communication.bus import EventBus
 from communication.bus import QueryBus
 from fbsrankings.context import Context
 from fbsrankings.messages.command import CalculateRankingsForSeasonCommand
+from fbsrankings.messages.command import CalculateRankingsForSeasonsCommand
+from fbsrankings.messages.query import RankingScenariosQuery
+from fbsrankings.messages.query import SeasonSimulationQuery
 from fbsrankings.ranking.command.application.calculate_rankings_for_season import (
     CalculateRankingsForSeasonCommandHandler,
 )
+from fbsrankings.ranking.command.application.calculate_rankings_for_seasons import (
+    CalculateRankingsForSeasonsCommandHandler,
+)
+from fbsrankings.ranking.command.application.elo_checkpoint_cache import (
+    EloCheckpointCache,
+)
+from fbsrankings.ranking.command.application.ranking_scenarios import (
+    RankingScenariosQueryHandler,
+)
+from fbsrankings.ranking.command.application.scenario_cache import ScenarioCache
+from fbsrankings.ranking.command.application.season_cache import SeasonCache
+from fbsrankings.ranking.command.application.season_simulation import (
+    SeasonSimulationQueryHandler,
+)
 from fbsrankings.ranking.command.infrastructure.data_source import DataSource
 
 
@@ -24,19 +41,50 @@ class Service(ContextManager["Service"]):
     ) -> None:
         super().__init__()
         data_source = DataSource(context)
+        self._cache = SeasonCache(query_bus, event_bus)
+        elo_checkpoints = EloCheckpointCache()
 
         self._command_bus = command_bus
         self._command_bus.register_handler(
             CalculateRankingsForSeasonCommand,
             CalculateRankingsForSeasonCommandHandler(
+                context.config.ranking,
+                data_source,
+                self._cache,
+                elo_checkpoints,
+                query_bus,
+                event_bus,
+            ),
+        )
+        self._command_bus.register_handler(
+            CalculateRankingsForSeasonsCommand,
+            CalculateRankingsForSeasonsCommandHandler(
+                context.config.ranking,
                 data_source,
+                elo_checkpoints,
                 query_bus,
                 event_bus,
             ),
         )
 
+        scenario_cache = ScenarioCache(context.config.ranking, self._cache)
+
+        self._query_bus = query_bus
+        self._query_bus.register_handler(
+            RankingScenariosQuery,
+            RankingScenariosQueryHandler(scenario_cache),
+        )
+        self._query_bus.register_handler(
+            SeasonSimulationQuery,
+            SeasonSimulationQueryHandler(scenario_cache),
+        )
+
     def close(self) -> None:
         self._command_bus.unregister_handler(CalculateRankingsForSeasonCommand)
+        self._command_bus.unregister_handler(CalculateRankingsForSeasonsCommand)
+        self._query_bus.unregister_handler(RankingScenariosQuery)
+        self._query_bus.unregister_handler(SeasonSimulationQuery)
+        self._cache.close()
 
     def __enter__(self) -> "Service":
         return self
@@ -1,7 +1,43 @@
+from collections.abc import Iterable
+from collections.abc import Iterator
 from typing import NewType
 from uuid import UUID
 
 
 SeasonID = NewType("SeasonID", UUID)
-TeamID = NewType("TeamID", UUID)
-GameID = NewType("GameID", UUID)
+TeamID = NewType("TeamID", int)
+GameID = NewType("GameID", int)
+
+
+class IdTable:
+    # Interns the string ids of a season as dense ints, so that calculations
+    # can work with array indices and only look the strings up again when
+    # their results are published.
+    def __init__(self, ids: Iterable[str] = ()) -> None:
+        self._ids: list[str] = []
+        self._index: dict[str, int] = {}
+        for id_ in ids:
+            self.intern(id_)
+
+    def intern(self, id_: str) -> int:
+        index = self._index.get(id_)
+        if index is None:
+            index = len(self._ids)
+            self._index[id_] = index
+            self._ids.append(id_)
+        return index
+
+    def index(self, id_: str) -> int:
+        return self._index[id_]
+
+    def __contains__(self, id_: object) -> bool:
+        return id_ in self._index
+
+    def __getitem__(self, index: int) -> str:
+        return self._ids[index]
+
+    def __iter__(self) -> Iterator[str]:
+        return iter(self._ids)
+
+    def __len__(self) -> int:
+        return len(self._ids)
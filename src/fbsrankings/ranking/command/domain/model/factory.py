@@ -1,7 +1,13 @@
 from communication.bus import EventBus
+from fbsrankings.ranking.command.domain.model.fingerprint import (
+    RankingFingerprintFactory,
+)
 from fbsrankings.ranking.command.domain.model.ranking import GameRankingFactory
 from fbsrankings.ranking.command.domain.model.ranking import TeamRankingFactory
 from fbsrankings.ranking.command.domain.model.record import TeamRecordFactory
+from fbsrankings.ranking.command.domain.model.season_ranking import (
+    SeasonRankingsFactory,
+)
 
 
 class Factory:
@@ -11,6 +17,8 @@ class Factory:
         self._team_record = TeamRecordFactory(self._bus)
         self._team_ranking = TeamRankingFactory(self._bus)
         self._game_ranking = GameRankingFactory(self._bus)
+        self._season_rankings = SeasonRankingsFactory(self._bus)
+        self._ranking_fingerprint = RankingFingerprintFactory(self._bus)
 
     @property
     def team_record(self) -> TeamRecordFactory:
@@ -23,3 +31,11 @@ class Factory:
     @property
     def game_ranking(self) -> GameRankingFactory:
         return self._game_ranking
+
+    @property
+    def season_rankings(self) -> SeasonRankingsFactory:
+        return self._season_rankings
+
+    @property
+    def ranking_fingerprint(self) -> RankingFingerprintFactory:
+        return self._ranking_fingerprint
@@ -0,0 +1,46 @@
+from abc import ABCMeta
+from abc import abstractmethod
+from typing import Optional
+from uuid import uuid4
+
+from communication.bus import EventBus
+from fbsrankings.messages.event import RankingFingerprintCalculatedEvent
+from fbsrankings.ranking.command.domain.model.core import SeasonID
+
+
+class RankingFingerprint:
+    def __init__(self, bus: EventBus, season_id: SeasonID, value: str) -> None:
+        self._bus = bus
+        self._season_id = season_id
+        self._value = value
+
+    @property
+    def season_id(self) -> SeasonID:
+        return self._season_id
+
+    @property
+    def value(self) -> str:
+        return self._value
+
+
+class RankingFingerprintFactory:
+    def __init__(self, bus: EventBus) -> None:
+        self._bus = bus
+
+    def create(self, season_id: SeasonID, value: str) -> RankingFingerprint:
+        fingerprint = RankingFingerprint(self._bus, season_id, value)
+        self._bus.publish(
+            RankingFingerprintCalculatedEvent(
+                event_id=str(uuid4()),
+                season_id=str(fingerprint.season_id),
+                fingerprint=fingerprint.value,
+            ),
+        )
+
+        return fingerprint
+
+
+class RankingFingerprintRepository(metaclass=ABCMeta):
+    @abstractmethod
+    def find(self, season_id: SeasonID) -> Optional[RankingFingerprint]:
+        raise NotImplementedError
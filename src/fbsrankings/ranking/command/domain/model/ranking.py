@@ -1,29 +1,36 @@
-import datetime
 from abc import ABCMeta
 from abc import abstractmethod
 from collections.abc import Iterable
 from collections.abc import Sequence
-from typing import Callable
+from typing import cast
 from typing import Generic
 from typing import NewType
 from typing import Optional
+from typing import overload
 from typing import TypeVar
+from typing import Union
 from uuid import UUID
 from uuid import uuid4
 
+import numpy
+from numpy.typing import NDArray
+
 from communication.bus import EventBus
+from fbsrankings.messages.enums import GameStatus
+from fbsrankings.messages.enums import Subdivision
 from fbsrankings.messages.event import GameRankingCalculatedEvent
 from fbsrankings.messages.event import RankingValue as EventValue
 from fbsrankings.messages.event import TeamRankingCalculatedEvent
 from fbsrankings.messages.query import AffiliationBySeasonResult
 from fbsrankings.messages.query import GameBySeasonResult
 from fbsrankings.ranking.command.domain.model.core import GameID
+from fbsrankings.ranking.command.domain.model.core import IdTable
 from fbsrankings.ranking.command.domain.model.core import SeasonID
 from fbsrankings.ranking.command.domain.model.core import TeamID
 from fbsrankings.typing_helpers import SupportsRichComparison
 
 
-T = TypeVar("T", bound=UUID)
+T = TypeVar("T", bound=int)
 
 
 class SeasonData:
@@ -32,6 +39,8 @@ class SeasonData:
         season_id: UUID,
         affiliations: Iterable[AffiliationBySeasonResult],
         games: Iterable[GameBySeasonResult],
+        all_divisions: bool = False,
+        start_week: Optional[int] = None,
     ) -> None:
         self.season_id = season_id
         self.affiliation_map = {
@@ -39,6 +48,162 @@ class SeasonData:
         }
         self.game_map = {game.game_id: game for game in games}
 
+        self.team_ids = IdTable(self.affiliation_map.keys())
+        for game in self.game_map.values():
+            self.team_ids.intern(game.home_team_id)
+            self.team_ids.intern(game.away_team_id)
+        self.team_subdivision = numpy.array(
+            [
+                (
+                    self.affiliation_map[id_].subdivision
+                    if id_ in self.affiliation_map
+                    else Subdivision.SUBDIVISION_UNSPECIFIED
+                )
+                for id_ in self.team_ids
+            ],
+            dtype=numpy.int32,
+        )
+
+        if all_divisions:
+            ranked_team = self.team_subdivision != Subdivision.SUBDIVISION_UNSPECIFIED
+        else:
+            ranked_team = self.team_subdivision == Subdivision.SUBDIVISION_FBS
+        self.ranked_teams = numpy.flatnonzero(ranked_team)
+        self.ranked_team_index = numpy.full(len(self.team_ids), -1, dtype=numpy.intp)
+        self.ranked_team_index[self.ranked_teams] = numpy.arange(len(self.ranked_teams))
+
+        game_count = len(self.game_map)
+        self.game_ids = IdTable(self.game_map.keys())
+        self.game_week = numpy.fromiter(
+            (game.week for game in self.game_map.values()),
+            dtype=numpy.int32,
+            count=game_count,
+        )
+        self.game_section = numpy.fromiter(
+            (game.season_section for game in self.game_map.values()),
+            dtype=numpy.int32,
+            count=game_count,
+        )
+        self.game_status = numpy.fromiter(
+            (game.status for game in self.game_map.values()),
+            dtype=numpy.int32,
+            count=game_count,
+        )
+        self.game_home_team = numpy.fromiter(
+            (self.team_ids.index(game.home_team_id) for game in self.game_map.values()),
+            dtype=numpy.intp,
+            count=game_count,
+        )
+        self.game_away_team = numpy.fromiter(
+            (self.team_ids.index(game.away_team_id) for game in self.game_map.values()),
+            dtype=numpy.intp,
+            count=game_count,
+        )
+        self.game_home_score = numpy.fromiter(
+            (game.home_team_score for game in self.game_map.values()),
+            dtype=numpy.int32,
+            count=game_count,
+        )
+        self.game_away_score = numpy.fromiter(
+            (game.away_team_score for game in self.game_map.values()),
+            dtype=numpy.int32,
+            count=game_count,
+        )
+
+        home_win = self.game_home_score > self.game_away_score
+        self.game_winning_team = numpy.where(
+            home_win,
+            self.game_home_team,
+            self.game_away_team,
+        )
+        self.game_losing_team = numpy.where(
+            home_win,
+            self.game_away_team,
+            self.game_home_team,
+        )
+
+        ranked_game = (
+            (self.ranked_team_index[self.game_home_team] >= 0)
+            & (self.ranked_team_index[self.game_away_team] >= 0)
+            & (self.game_home_score != self.game_away_score)
+        )
+        self.is_complete = not numpy.any(
+            ~ranked_game & (self.game_status == GameStatus.GAME_STATUS_SCHEDULED),
+        )
+
+        team_names = [
+            (
+                self.affiliation_map[id_].team_name.upper()
+                if id_ in self.affiliation_map
+                else ""
+            )
+            for id_ in self.team_ids
+        ]
+        self.team_sort_order = self._sort_order(
+            list(zip(team_names, self.team_ids)),
+        )
+        self.game_sort_order = self._sort_order(
+            [
+                (
+                    game.date.seconds,
+                    team_names[self.team_ids.index(game.home_team_id)],
+                    team_names[self.team_ids.index(game.away_team_id)],
+                    id_,
+                )
+                for id_, game in self.game_map.items()
+            ],
+        )
+
+        ranked_games = numpy.flatnonzero(ranked_game)
+        self.ranked_games = ranked_games[
+            numpy.argsort(self.game_week[ranked_games], kind="stable")
+        ]
+
+        # The completed games between ranked teams, including ties, which
+        # the ratings that score a tie as half a win are calculated from.
+        played_games = numpy.flatnonzero(
+            (self.ranked_team_index[self.game_home_team] >= 0)
+            & (self.ranked_team_index[self.game_away_team] >= 0)
+            & (self.game_status == GameStatus.GAME_STATUS_COMPLETED),
+        )
+        self.played_games = played_games[
+            numpy.argsort(self.game_week[played_games], kind="stable")
+        ]
+        self.ranked_weeks, self.ranked_week_index = numpy.unique(
+            self.game_week[self.ranked_games],
+            return_inverse=True,
+        )
+
+        # Weeks before the start week keep their stored rankings, but the last
+        # week is always calculated so the final rankings stay up to date.
+        self.start_week_index = 0
+        if start_week is not None and len(self.ranked_weeks) > 0:
+            self.start_week_index = min(
+                int(numpy.searchsorted(self.ranked_weeks, start_week)),
+                len(self.ranked_weeks) - 1,
+            )
+        self.calculated_weeks = self.ranked_weeks[self.start_week_index :]
+
+    @staticmethod
+    def _sort_order(keys: Sequence[SupportsRichComparison]) -> NDArray[numpy.intp]:
+        order = numpy.empty(len(keys), dtype=numpy.intp)
+        order[sorted(range(len(keys)), key=keys.__getitem__)] = numpy.arange(
+            len(keys),
+        )
+        return order
+
+    def team_values(self, ranking: "Ranking[TeamID]") -> NDArray[numpy.float64]:
+        teams = ranking.values.ids
+        if ranking.ids is not self.team_ids:
+            teams = numpy.array(
+                [self.team_ids.index(ranking.ids[team]) for team in teams.tolist()],
+                dtype=numpy.intp,
+            )
+
+        values = numpy.full(len(self.team_ids), numpy.nan)
+        values[teams] = ranking.values.values
+        return values
+
 
 RankingID = NewType("RankingID", UUID)
 
@@ -66,31 +231,109 @@ class RankingValue(Generic[T]):
     def value(self) -> float:
         return self._value
 
+
+class RankingValues(Sequence[RankingValue[T]]):
+    # The values are held as parallel arrays sorted by order, and a
+    # RankingValue is only created when one is looked up.
+    def __init__(
+        self,
+        ids: NDArray[numpy.intp],
+        orders: NDArray[numpy.intp],
+        ranks: NDArray[numpy.intp],
+        values: NDArray[numpy.float64],
+    ) -> None:
+        self._ids = ids
+        self._orders = orders
+        self._ranks = ranks
+        self._values = values
+
     @staticmethod
-    def to_values(
-        season_data: SeasonData,
-        value_map: dict[T, float],
-        sort_key: Callable[[SeasonData, T, float], SupportsRichComparison],
-    ) -> list["RankingValue[T]"]:
-        sorted_values = sorted(
-            value_map.items(),
-            key=lambda t: sort_key(season_data, t[0], t[1]),
+    def from_scores(
+        ids: NDArray[numpy.intp],
+        scores: NDArray[numpy.float64],
+        sort_order: NDArray[numpy.intp],
+    ) -> "RankingValues[T]":
+        # Scores that only differ by the rounding of the solver are tied, so
+        # the tied teams share a rank and are ordered by the sort order
+        # rather than by which of them happened to round up.
+        indices = numpy.argsort(-scores, kind="stable")
+        is_tied = numpy.zeros(len(indices), dtype=bool)
+        is_tied[1:] = numpy.isclose(
+            scores[indices[1:]],
+            scores[indices[:-1]],
+            rtol=1e-9,
+            atol=1e-12,
+        )
+        groups = numpy.cumsum(~is_tied)
+        indices = indices[numpy.lexsort((sort_order[indices], groups))]
+        sorted_scores = scores[indices]
+        ranks = numpy.flatnonzero(~is_tied)[groups - 1]
+
+        return RankingValues(
+            ids[indices],
+            numpy.arange(1, len(sorted_scores) + 1),
+            ranks + 1,
+            sorted_scores,
+        )
+
+    @staticmethod
+    def from_values(values: Iterable[RankingValue[T]]) -> "RankingValues[T]":
+        value_list = list(values)
+        ranking_values = RankingValues[T](
+            numpy.array([value.id_ for value in value_list], dtype=numpy.intp),
+            numpy.array([value.order for value in value_list], dtype=numpy.intp),
+            numpy.array([value.rank for value in value_list], dtype=numpy.intp),
+            numpy.array([value.value for value in value_list], dtype=numpy.float64),
         )
+        return ranking_values[numpy.argsort(ranking_values.orders, kind="stable")]
+
+    @property
+    def ids(self) -> NDArray[numpy.intp]:
+        return self._ids
 
-        ranking_values = []
-        previous_value = 0.0
-        previous_rank = 0
-        for order, item in enumerate(sorted_values):
-            if item[1] == previous_value:
-                rank = previous_rank
-            else:
-                rank = order
+    @property
+    def orders(self) -> NDArray[numpy.intp]:
+        return self._orders
 
-            previous_value = item[1]
-            previous_rank = rank
-            ranking_values.append(RankingValue(item[0], order + 1, rank + 1, item[1]))
+    @property
+    def ranks(self) -> NDArray[numpy.intp]:
+        return self._ranks
 
-        return ranking_values
+    @property
+    def values(self) -> NDArray[numpy.float64]:
+        return self._values
+
+    @overload
+    def __getitem__(self, index: int) -> RankingValue[T]:
+        pass
+
+    @overload
+    def __getitem__(
+        self,
+        index: Union[slice, NDArray[numpy.intp]],
+    ) -> "RankingValues[T]":
+        pass
+
+    def __getitem__(
+        self,
+        index: Union[int, slice, NDArray[numpy.intp]],
+    ) -> Union[RankingValue[T], "RankingValues[T]"]:
+        if isinstance(index, (slice, numpy.ndarray)):
+            return RankingValues(
+                self._ids[index],
+                self._orders[index],
+                self._ranks[index],
+                self._values[index],
+            )
+        return RankingValue(
+            cast(T, int(self._ids[index])),
+            int(self._orders[index]),
+            int(self._ranks[index]),
+            float(self._values[index]),
+        )
+
+    def __len__(self) -> int:
+        return len(self._ids)
 
 
 class Ranking(Generic[T]):
@@ -101,14 +344,16 @@ class Ranking(Generic[T]):
         name: str,
         season_id: SeasonID,
         week: Optional[int],
-        values: Iterable[RankingValue[T]],
+        ids: IdTable,
+        values: RankingValues[T],
     ) -> None:
         self._bus = bus
         self._id = id_
         self._name = name
         self._season_id = season_id
         self._week = week
-        self._values = sorted(values, key=lambda v: v.order)
+        self._ids = ids
+        self._values = values
 
     @property
     def id_(self) -> RankingID:
@@ -127,7 +372,11 @@ class Ranking(Generic[T]):
         return self._week
 
     @property
-    def values(self) -> Sequence[RankingValue[T]]:
+    def ids(self) -> IdTable:
+        return self._ids
+
+    @property
+    def values(self) -> RankingValues[T]:
         return self._values
 
 
@@ -135,23 +384,15 @@ class TeamRankingCalculator:  # noqa: PIE798
     @staticmethod
     def to_values(
         season_data: SeasonData,
-        value_map: dict[TeamID, float],
-    ) -> list[RankingValue[TeamID]]:
-        return RankingValue.to_values(
-            season_data,
-            value_map,
-            TeamRankingCalculator.sort_key,
+        teams: NDArray[numpy.intp],
+        values: NDArray[numpy.float64],
+    ) -> RankingValues[TeamID]:
+        return RankingValues.from_scores(
+            teams,
+            values,
+            season_data.team_sort_order[teams],
         )
 
-    @staticmethod
-    def sort_key(
-        season_data: SeasonData,
-        team_id: TeamID,
-        value: float,
-    ) -> tuple[float, str, str]:
-        affiliation = season_data.affiliation_map[str(team_id)]
-        return (-value, affiliation.team_name.upper(), str(team_id))
-
 
 class TeamRankingFactory:
     def __init__(self, bus: EventBus) -> None:
@@ -162,10 +403,11 @@ class TeamRankingFactory:
         name: str,
         season_id: SeasonID,
         week: Optional[int],
-        values: Iterable[RankingValue[TeamID]],
+        ids: IdTable,
+        values: RankingValues[TeamID],
     ) -> Ranking[TeamID]:
         id_ = RankingID(uuid4())
-        ranking = Ranking(self._bus, id_, name, season_id, week, values)
+        ranking = Ranking(self._bus, id_, name, season_id, week, ids, values)
         self._bus.publish(
             TeamRankingCalculatedEvent(
                 event_id=str(uuid4()),
@@ -174,13 +416,13 @@ class TeamRankingFactory:
                 season_id=str(ranking.season_id),
                 week=ranking.week,
                 values=[
-                    EventValue(
-                        id=str(value.id_),
-                        order=value.order,
-                        rank=value.rank,
-                        value=value.value,
+                    EventValue(id=ids[id_], order=order, rank=rank, value=value)
+                    for id_, order, rank, value in zip(
+                        values.ids.tolist(),
+                        values.orders.tolist(),
+                        values.ranks.tolist(),
+                        values.values.tolist(),
                     )
-                    for value in ranking.values
                 ],
             ),
         )
@@ -207,30 +449,13 @@ class GameRankingCalculator:  # noqa: PIE798
     @staticmethod
     def to_values(
         season_data: SeasonData,
-        value_map: dict[GameID, float],
-    ) -> list[RankingValue[GameID]]:
-        return RankingValue.to_values(
-            season_data,
-            value_map,
-            GameRankingCalculator.sort_key,
-        )
-
-    @staticmethod
-    def sort_key(
-        season_data: SeasonData,
-        game_id: GameID,
-        value: float,
-    ) -> tuple[float, datetime.date, str, str, str]:
-        game = season_data.game_map[str(game_id)]
-        home_affiliation = season_data.affiliation_map[game.home_team_id]
-        away_affiliation = season_data.affiliation_map[game.away_team_id]
-
-        return (
-            -value,
-            game.date.ToDatetime().date(),
-            home_affiliation.team_name.upper(),
-            away_affiliation.team_name.upper(),
-            str(game_id),
+        games: NDArray[numpy.intp],
+        values: NDArray[numpy.float64],
+    ) -> RankingValues[GameID]:
+        return RankingValues.from_scores(
+            games,
+            values,
+            season_data.game_sort_order[games],
         )
 
 
@@ -243,10 +468,11 @@ class GameRankingFactory:
         name: str,
         season_id: SeasonID,
         week: Optional[int],
-        values: Iterable[RankingValue[GameID]],
+        ids: IdTable,
+        values: RankingValues[GameID],
     ) -> Ranking[GameID]:
         id_ = RankingID(uuid4())
-        ranking = Ranking(self._bus, id_, name, season_id, week, values)
+        ranking = Ranking(self._bus, id_, name, season_id, week, ids, values)
         self._bus.publish(
             GameRankingCalculatedEvent(
                 event_id=str(uuid4()),
@@ -255,13 +481,13 @@ class GameRankingFactory:
                 season_id=str(ranking.season_id),
                 week=ranking.week,
                 values=[
-                    EventValue(
-                        id=str(value.id_),
-                        order=value.order,
-                        rank=value.rank,
-                        value=value.value,
+                    EventValue(id=ids[id_], order=order, rank=rank, value=value)
+                    for id_, order, rank, value in zip(
+                        values.ids.tolist(),
+                        values.orders.tolist(),
+                        values.ranks.tolist(),
+                        values.values.tolist(),
                     )
-                    for value in ranking.values
                 ],
             ),
         )
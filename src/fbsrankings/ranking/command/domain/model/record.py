@@ -9,6 +9,7 @@ from uuid import uuid4
 from communication.bus import EventBus
 from fbsrankings.messages.event import TeamRecordCalculatedEvent
 from fbsrankings.messages.event import TeamRecordValue as EventValue
+from fbsrankings.ranking.command.domain.model.core import IdTable
 from fbsrankings.ranking.command.domain.model.core import SeasonID
 from fbsrankings.ranking.command.domain.model.core import TeamID
 
@@ -50,12 +51,14 @@ class TeamRecord:
         id_: TeamRecordID,
         season_id: SeasonID,
         week: Optional[int],
+        ids: IdTable,
         values: list[TeamRecordValue],
     ) -> None:
         self._bus = bus
         self._id = id_
         self._season_id = season_id
         self._week = week
+        self._ids = ids
         self._values = values
 
     @property
@@ -70,6 +73,10 @@ class TeamRecord:
     def week(self) -> Optional[int]:
         return self._week
 
+    @property
+    def ids(self) -> IdTable:
+        return self._ids
+
     @property
     def values(self) -> Sequence[TeamRecordValue]:
         return self._values
@@ -83,10 +90,11 @@ class TeamRecordFactory:
         self,
         season_id: SeasonID,
         week: Optional[int],
+        ids: IdTable,
         values: list[TeamRecordValue],
     ) -> TeamRecord:
         id_ = TeamRecordID(uuid4())
-        record = TeamRecord(self._bus, id_, season_id, week, values)
+        record = TeamRecord(self._bus, id_, season_id, week, ids, values)
         self._bus.publish(
             TeamRecordCalculatedEvent(
                 event_id=str(uuid4()),
@@ -95,7 +103,7 @@ class TeamRecordFactory:
                 week=record.week,
                 values=[
                     EventValue(
-                        team_id=str(value.team_id),
+                        team_id=ids[value.team_id],
                         wins=value.wins,
                         losses=value.losses,
                         games=value.games,
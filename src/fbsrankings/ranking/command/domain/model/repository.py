@@ -3,6 +3,9 @@ from abc import abstractmethod
 from typing import Protocol
 
 from communication.bus import EventBus
+from fbsrankings.ranking.command.domain.model.fingerprint import (
+    RankingFingerprintRepository,
+)
 from fbsrankings.ranking.command.domain.model.ranking import GameRankingRepository
 from fbsrankings.ranking.command.domain.model.ranking import TeamRankingRepository
 from fbsrankings.ranking.command.domain.model.record import TeamRecordRepository
@@ -24,6 +27,11 @@ class Repository(metaclass=ABCMeta):
     def game_ranking(self) -> GameRankingRepository:
         raise NotImplementedError
 
+    @property
+    @abstractmethod
+    def ranking_fingerprint(self) -> RankingFingerprintRepository:
+        raise NotImplementedError
+
 
 class RepositoryFactory(Protocol, metaclass=ABCMeta):
     @abstractmethod
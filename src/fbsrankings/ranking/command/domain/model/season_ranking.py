@@ -0,0 +1,215 @@
+from collections.abc import Sequence
+from typing import Optional
+from typing import TypeVar
+from uuid import uuid4
+
+from communication.bus import EventBus
+from fbsrankings.messages.convert import ids_to_bytes
+from fbsrankings.messages.event import PackedRanking
+from fbsrankings.messages.event import PackedTeamRecord
+from fbsrankings.messages.event import SeasonRankingsCalculatedEvent
+from fbsrankings.ranking.command.domain.model.core import GameID
+from fbsrankings.ranking.command.domain.model.core import IdTable
+from fbsrankings.ranking.command.domain.model.core import SeasonID
+from fbsrankings.ranking.command.domain.model.core import TeamID
+from fbsrankings.ranking.command.domain.model.ranking import GameRankingFactory
+from fbsrankings.ranking.command.domain.model.ranking import Ranking
+from fbsrankings.ranking.command.domain.model.ranking import RankingID
+from fbsrankings.ranking.command.domain.model.ranking import RankingValues
+from fbsrankings.ranking.command.domain.model.ranking import TeamRankingFactory
+from fbsrankings.ranking.command.domain.model.record import TeamRecord
+from fbsrankings.ranking.command.domain.model.record import TeamRecordFactory
+from fbsrankings.ranking.command.domain.model.record import TeamRecordID
+from fbsrankings.ranking.command.domain.model.record import TeamRecordValue
+
+
+T = TypeVar("T", bound=int)
+
+
+class SeasonRankings:
+    def __init__(
+        self,
+        bus: EventBus,
+        season_id: SeasonID,
+        team_records: Sequence[TeamRecord],
+        team_rankings: Sequence[Ranking[TeamID]],
+        game_rankings: Sequence[Ranking[GameID]],
+    ) -> None:
+        self._bus = bus
+        self._season_id = season_id
+        self._team_records = team_records
+        self._team_rankings = team_rankings
+        self._game_rankings = game_rankings
+
+    @property
+    def season_id(self) -> SeasonID:
+        return self._season_id
+
+    @property
+    def team_records(self) -> Sequence[TeamRecord]:
+        return self._team_records
+
+    @property
+    def team_rankings(self) -> Sequence[Ranking[TeamID]]:
+        return self._team_rankings
+
+    @property
+    def game_rankings(self) -> Sequence[Ranking[GameID]]:
+        return self._game_rankings
+
+
+class SeasonRankingsFactory:
+    def __init__(self, bus: EventBus) -> None:
+        self._bus = bus
+
+    def create(
+        self,
+        season_id: SeasonID,
+        team_ids: IdTable,
+        game_ids: IdTable,
+        team_records: Sequence[TeamRecord],
+        team_rankings: Sequence[Ranking[TeamID]],
+        game_rankings: Sequence[Ranking[GameID]],
+    ) -> SeasonRankings:
+        season_rankings = SeasonRankings(
+            self._bus,
+            season_id,
+            team_records,
+            team_rankings,
+            game_rankings,
+        )
+        packed_team_records = [
+            _packed_record(team_ids, record) for record in team_records
+        ]
+        packed_team_rankings = [
+            _packed_ranking(team_ids, ranking) for ranking in team_rankings
+        ]
+        packed_game_rankings = [
+            _packed_ranking(game_ids, ranking) for ranking in game_rankings
+        ]
+        self._bus.publish(
+            SeasonRankingsCalculatedEvent(
+                event_id=str(uuid4()),
+                season_id=str(season_rankings.season_id),
+                team_ids=ids_to_bytes(team_ids),
+                game_ids=ids_to_bytes(game_ids),
+                team_records=packed_team_records,
+                team_rankings=packed_team_rankings,
+                game_rankings=packed_game_rankings,
+            ),
+        )
+
+        return season_rankings
+
+
+class SeasonRankingsBuilder:
+    # Records and rankings created through this builder do not publish an
+    # event each. They are collected so that a SeasonRankingsFactory can
+    # publish all of them together.
+    def __init__(self, bus: EventBus) -> None:
+        self.team_records: list[TeamRecord] = []
+        self.team_rankings: list[Ranking[TeamID]] = []
+        self.game_rankings: list[Ranking[GameID]] = []
+
+        self._team_record = _TeamRecordCollector(bus, self.team_records)
+        self._team_ranking = _TeamRankingCollector(bus, self.team_rankings)
+        self._game_ranking = _GameRankingCollector(bus, self.game_rankings)
+
+    @property
+    def team_record(self) -> TeamRecordFactory:
+        return self._team_record
+
+    @property
+    def team_ranking(self) -> TeamRankingFactory:
+        return self._team_ranking
+
+    @property
+    def game_ranking(self) -> GameRankingFactory:
+        return self._game_ranking
+
+
+class _TeamRecordCollector(TeamRecordFactory):
+    def __init__(self, bus: EventBus, records: list[TeamRecord]) -> None:
+        super().__init__(bus)
+        self._records = records
+
+    def create(
+        self,
+        season_id: SeasonID,
+        week: Optional[int],
+        ids: IdTable,
+        values: list[TeamRecordValue],
+    ) -> TeamRecord:
+        id_ = TeamRecordID(uuid4())
+        record = TeamRecord(self._bus, id_, season_id, week, ids, values)
+        self._records.append(record)
+        return record
+
+
+class _TeamRankingCollector(TeamRankingFactory):
+    def __init__(self, bus: EventBus, rankings: list[Ranking[TeamID]]) -> None:
+        super().__init__(bus)
+        self._rankings = rankings
+
+    def create(
+        self,
+        name: str,
+        season_id: SeasonID,
+        week: Optional[int],
+        ids: IdTable,
+        values: RankingValues[TeamID],
+    ) -> Ranking[TeamID]:
+        id_ = RankingID(uuid4())
+        ranking = Ranking(self._bus, id_, name, season_id, week, ids, values)
+        self._rankings.append(ranking)
+        return ranking
+
+
+class _GameRankingCollector(GameRankingFactory):
+    def __init__(self, bus: EventBus, rankings: list[Ranking[GameID]]) -> None:
+        super().__init__(bus)
+        self._rankings = rankings
+
+    def create(
+        self,
+        name: str,
+        season_id: SeasonID,
+        week: Optional[int],
+        ids: IdTable,
+        values: RankingValues[GameID],
+    ) -> Ranking[GameID]:
+        id_ = RankingID(uuid4())
+        ranking = Ranking(self._bus, id_, name, season_id, week, ids, values)
+        self._rankings.append(ranking)
+        return ranking
+
+
+def _packed_record(ids: IdTable, record: TeamRecord) -> PackedTeamRecord:
+    teams: list[int] = [value.team_id for value in record.values]
+    if record.ids is not ids:
+        teams = [ids.intern(record.ids[team]) for team in teams]
+
+    return PackedTeamRecord(
+        record_id=str(record.id_),
+        week=record.week,
+        teams=teams,
+        wins=[value.wins for value in record.values],
+        losses=[value.losses for value in record.values],
+    )
+
+
+def _packed_ranking(ids: IdTable, ranking: Ranking[T]) -> PackedRanking:
+    values = ranking.values
+    value_ids = values.ids.tolist()
+    if ranking.ids is not ids:
+        value_ids = [ids.intern(ranking.ids[id_]) for id_ in value_ids]
+
+    return PackedRanking(
+        ranking_id=str(ranking.id_),
+        name=ranking.name,
+        week=ranking.week,
+        ids=value_ids,
+        orders=values.orders.tolist(),
+        ranks=values.ranks.tolist(),
+        values=values.values.tolist(),
+    )
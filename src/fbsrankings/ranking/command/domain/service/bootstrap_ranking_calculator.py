@@ -0,0 +1,60 @@
+import numpy
+from numpy.typing import NDArray
+
+from fbsrankings.ranking.command.domain.model.core import SeasonID
+from fbsrankings.ranking.command.domain.model.core import TeamID
+from fbsrankings.ranking.command.domain.model.ranking import Ranking
+from fbsrankings.ranking.command.domain.model.ranking import SeasonData
+from fbsrankings.ranking.command.domain.model.ranking import TeamRankingCalculator
+from fbsrankings.ranking.command.domain.model.ranking import TeamRankingFactory
+
+
+class BootstrapRankingCalculator:
+    # Share of the bootstrapped values of a team that falls between its lower
+    # and upper rankings.
+    confidence: float = 0.9
+
+    def __init__(self, factory: TeamRankingFactory) -> None:
+        self._factory = factory
+
+    def calculate_for_season(
+        self,
+        season_data: SeasonData,
+        name: str,
+        values: NDArray[numpy.float64],
+    ) -> list[Ranking[TeamID]]:
+        tail = (1.0 - self.confidence) / 2.0
+        lower, upper = numpy.quantile(values, [tail, 1.0 - tail], axis=1)
+
+        rankings = []
+        for bound, bound_values in (("Lower", lower), ("Upper", upper)):
+            bound_name = f"{name} - Bootstrap - {bound}"
+            for week, x in zip(season_data.calculated_weeks, bound_values):
+                ranking_values = TeamRankingCalculator.to_values(
+                    season_data,
+                    season_data.ranked_teams,
+                    x,
+                )
+
+                rankings.append(
+                    self._factory.create(
+                        bound_name,
+                        SeasonID(season_data.season_id),
+                        int(week),
+                        season_data.team_ids,
+                        ranking_values,
+                    ),
+                )
+
+            if season_data.is_complete and len(season_data.calculated_weeks) > 0:
+                rankings.append(
+                    self._factory.create(
+                        bound_name,
+                        SeasonID(season_data.season_id),
+                        None,
+                        season_data.team_ids,
+                        ranking_values,
+                    ),
+                )
+
+        return rankings
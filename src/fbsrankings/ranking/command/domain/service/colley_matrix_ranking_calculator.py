@@ -1,123 +1,170 @@
-from uuid import UUID
+from typing import Callable
 
 import numpy
+from numpy.typing import NDArray
 
-from fbsrankings.messages.enums import GameStatus
-from fbsrankings.messages.enums import Subdivision
-from fbsrankings.messages.query import GameBySeasonResult
 from fbsrankings.ranking.command.domain.model.core import SeasonID
 from fbsrankings.ranking.command.domain.model.core import TeamID
 from fbsrankings.ranking.command.domain.model.ranking import Ranking
 from fbsrankings.ranking.command.domain.model.ranking import SeasonData
 from fbsrankings.ranking.command.domain.model.ranking import TeamRankingCalculator
 from fbsrankings.ranking.command.domain.model.ranking import TeamRankingFactory
-
-
-class TeamData:
-    def __init__(self, index: int) -> None:
-        self.index = index
-        self.game_total = 0
-        self.win_total = 0
-        self.loss_total = 0
-
-    def add_win(self) -> None:
-        self.game_total += 1
-        self.win_total += 1
-
-    def add_loss(self) -> None:
-        self.game_total += 1
-        self.loss_total += 1
+from fbsrankings.ranking.command.domain.service.scenario_solver import ScenarioSystem
+from fbsrankings.ranking.command.domain.service.weekly_solver import DirectWeeklySolver
+from fbsrankings.ranking.command.domain.service.weekly_solver import WeeklySolver
+from fbsrankings.ranking.command.domain.service.weekly_solver import WeeklySystem
 
 
 class ColleyMatrixRankingCalculator:
     name: str = "Colley Matrix"
+    bootstrap_entries: int = 2**24
 
-    def __init__(self, factory: TeamRankingFactory) -> None:
+    def __init__(
+        self,
+        factory: TeamRankingFactory,
+        solver_factory: Callable[[], WeeklySolver] = DirectWeeklySolver,
+    ) -> None:
         self._factory = factory
+        self._solver_factory = solver_factory
 
     def calculate_for_season(self, season_data: SeasonData) -> list[Ranking[TeamID]]:
-        team_data: dict[str, TeamData] = {}
-        for affiliation in season_data.affiliation_map.values():
-            if affiliation.subdivision == Subdivision.SUBDIVISION_FBS:
-                team_data[affiliation.team_id] = TeamData(len(team_data))
-
-        season_is_complete = True
-        games_by_week: dict[int, list[GameBySeasonResult]] = {}
-        for game in season_data.game_map.values():
-            winning_data = None
-            losing_data = None
-
-            if game.home_team_score is not None and game.away_team_score is not None:
-                if game.home_team_score > game.away_team_score:
-                    winning_data = team_data.get(game.home_team_id)
-                    losing_data = team_data.get(game.away_team_id)
-                elif game.away_team_score > game.home_team_score:
-                    winning_data = team_data.get(game.away_team_id)
-                    losing_data = team_data.get(game.home_team_id)
-
-            if winning_data is not None and losing_data is not None:
-                week_games = games_by_week.setdefault(game.week, [])
-                week_games.append(game)
-
-            elif game.status == GameStatus.GAME_STATUS_SCHEDULED:
-                season_is_complete = False
-
-        n = len(team_data)
-        a = numpy.zeros((n, n))
-        b = numpy.zeros(n)
+        system = self._system(season_data, season_data.start_week_index)
+        x_by_week = self._solver_factory().solve_weeks(system)
 
         rankings = []
-        for week in sorted(games_by_week.keys()):
-            for game in games_by_week[week]:
-                winning_data = None
-                losing_data = None
-
-                if (
-                    game.home_team_score is not None
-                    and game.away_team_score is not None
-                ):
-                    if game.home_team_score > game.away_team_score:
-                        winning_data = team_data.get(game.home_team_id)
-                        losing_data = team_data.get(game.away_team_id)
-                    elif game.away_team_score > game.home_team_score:
-                        winning_data = team_data.get(game.away_team_id)
-                        losing_data = team_data.get(game.home_team_id)
-
-                if winning_data is not None and losing_data is not None:
-                    winning_data.add_win()
-                    losing_data.add_loss()
-
-                    a[winning_data.index, losing_data.index] -= 1.0
-                    a[losing_data.index, winning_data.index] -= 1.0
-
-            for data in team_data.values():
-                a[data.index, data.index] = 2.0 + data.game_total
-                b[data.index] = 1 + (data.win_total - data.loss_total) / 2.0
-
-            x = numpy.linalg.solve(a, b)
-
-            result = {
-                TeamID(UUID(id_)): x[data.index] for id_, data in team_data.items()
-            }
-            ranking_values = TeamRankingCalculator.to_values(season_data, result)
+        for week, x in zip(season_data.calculated_weeks, x_by_week):
+            ranking_values = TeamRankingCalculator.to_values(
+                season_data,
+                season_data.ranked_teams,
+                x,
+            )
 
             rankings.append(
                 self._factory.create(
                     ColleyMatrixRankingCalculator.name,
                     SeasonID(season_data.season_id),
-                    week,
+                    int(week),
+                    season_data.team_ids,
                     ranking_values,
                 ),
             )
 
-        if season_is_complete:
+        if season_data.is_complete and rankings:
             rankings.append(
                 self._factory.create(
                     ColleyMatrixRankingCalculator.name,
                     SeasonID(season_data.season_id),
                     None,
+                    season_data.team_ids,
                     ranking_values,
                 ),
             )
 
         return rankings
+
+    @staticmethod
+    def scenario_system(season_data: SeasonData) -> ScenarioSystem:
+        return ScenarioSystem(
+            ColleyMatrixRankingCalculator._system(
+                season_data,
+                len(season_data.ranked_weeks) - 1,
+            ),
+            ColleyMatrixRankingCalculator._win_weight,
+        )
+
+    @staticmethod
+    def bootstrap(season_data: SeasonData, samples: int) -> NDArray[numpy.float64]:
+        # The games played through each week are resampled with replacement.
+        # Each sample counts its games a different number of times, so each
+        # one has its own matrix, and the samples of a week are solved as a
+        # stack. The stacks are split so that none of them holds more than
+        # bootstrap_entries entries, since a season of every division has
+        # hundreds of teams.
+        n = len(season_data.ranked_teams)
+        games = season_data.ranked_games
+        winners = season_data.ranked_team_index[season_data.game_winning_team[games]]
+        losers = season_data.ranked_team_index[season_data.game_losing_team[games]]
+        outcome = numpy.zeros((len(games), n))
+        outcome[numpy.arange(len(games)), winners] = 0.5
+        outcome[numpy.arange(len(games)), losers] = -0.5
+        week_ends = numpy.searchsorted(
+            season_data.ranked_week_index,
+            numpy.arange(season_data.start_week_index, len(season_data.ranked_weeks)),
+            side="right",
+        )
+
+        chunk = max(1, ColleyMatrixRankingCalculator.bootstrap_entries // (n * n))
+        diagonal = numpy.arange(n)
+        values = numpy.empty((len(week_ends), samples, n))
+        for index, (week, end) in enumerate(
+            zip(season_data.calculated_weeks, week_ends),
+        ):
+            generator = numpy.random.default_rng(int(week))
+            counts = generator.multinomial(
+                end,
+                numpy.full(end, 1.0 / end),
+                size=samples,
+            ).astype(numpy.float64)
+
+            for start in range(0, samples, chunk):
+                chunk_counts = counts[start : start + chunk]
+                size = len(chunk_counts)
+                offsets = numpy.arange(size)[:, None] * (n * n)
+                entries = numpy.concatenate(
+                    (
+                        offsets + winners[:end] * (n + 1),
+                        offsets + losers[:end] * (n + 1),
+                        offsets + winners[:end] * n + losers[:end],
+                        offsets + losers[:end] * n + winners[:end],
+                    ),
+                    axis=1,
+                )
+                a = numpy.bincount(
+                    entries.ravel(),
+                    weights=numpy.concatenate(
+                        (chunk_counts, chunk_counts, -chunk_counts, -chunk_counts),
+                        axis=1,
+                    ).ravel(),
+                    minlength=size * n * n,
+                ).reshape((size, n, n))
+                a[:, diagonal, diagonal] += 2
+                b = 1.0 + chunk_counts @ outcome[:end]
+
+                values[index, start : start + size] = numpy.linalg.solve(
+                    a,
+                    b[:, :, None],
+                )[:, :, 0]
+
+        return values
+
+    @staticmethod
+    def _system(season_data: SeasonData, start: int) -> WeeklySystem:
+        n = len(season_data.ranked_teams)
+        week_count = len(season_data.ranked_weeks)
+        week_index = season_data.ranked_week_index
+        games = season_data.ranked_games
+        winners = season_data.ranked_team_index[season_data.game_winning_team[games]]
+        losers = season_data.ranked_team_index[season_data.game_losing_team[games]]
+
+        win_total = numpy.zeros((week_count, n))
+        numpy.add.at(win_total, (week_index, winners), 1.0)
+        numpy.cumsum(win_total, axis=0, out=win_total)
+
+        loss_total = numpy.zeros((week_count, n))
+        numpy.add.at(loss_total, (week_index, losers), 1.0)
+        numpy.cumsum(loss_total, axis=0, out=loss_total)
+
+        return WeeklySystem(
+            week_index=numpy.concatenate((week_index, week_index)),
+            rows=numpy.concatenate((winners, losers)),
+            columns=numpy.concatenate((losers, winners)),
+            values=numpy.full(2 * len(games), -1.0),
+            diagonal=2.0 + win_total + loss_total,
+            b=1 + (win_total - loss_total) / 2.0,
+            symmetric=True,
+            start=start,
+        )
+
+    @staticmethod
+    def _win_weight(margin: NDArray[numpy.int32]) -> NDArray[numpy.float64]:
+        return numpy.sign(margin) / 2.0
@@ -0,0 +1,168 @@
+import math
+from collections.abc import Iterable
+from typing import Optional
+
+import numpy
+from numpy.typing import NDArray
+
+from fbsrankings.ranking.command.domain.model.core import SeasonID
+from fbsrankings.ranking.command.domain.model.core import TeamID
+from fbsrankings.ranking.command.domain.model.ranking import Ranking
+from fbsrankings.ranking.command.domain.model.ranking import SeasonData
+from fbsrankings.ranking.command.domain.model.ranking import TeamRankingCalculator
+from fbsrankings.ranking.command.domain.model.ranking import TeamRankingFactory
+
+
+class EloRatings:
+    initial: float = 1500.0
+    k: float = 20.0
+    home_advantage: float = 55.0
+
+    # The running ratings of a season after the games through a week, where
+    # week 0 is before any games. Teams that have not played yet have the
+    # initial rating. Applying a game only changes the ratings of its two
+    # teams, so a copy of the ratings can be kept as a checkpoint and the
+    # games of later weeks applied to it.
+    def __init__(
+        self,
+        week: int = 0,
+        ratings: Optional[dict[str, float]] = None,
+    ) -> None:
+        self.week = week
+        self.ratings = ratings if ratings is not None else {}
+
+    def rating(self, team_id: str) -> float:
+        return self.ratings.get(team_id, self.initial)
+
+    def values(self, team_ids: Iterable[str]) -> NDArray[numpy.float64]:
+        return numpy.fromiter(
+            (self.rating(team_id) for team_id in team_ids),
+            dtype=numpy.float64,
+        )
+
+    def apply(self, home_team_id: str, away_team_id: str, margin: int) -> None:
+        home_rating = self.rating(home_team_id)
+        away_rating = self.rating(away_team_id)
+
+        # The change is scaled up for larger margins, but less so when the
+        # winner was already expected to win, so that a strong team does not
+        # keep gaining from running up the score. A tie counts as half a win
+        # for each team and is scaled like a one point game with no winner.
+        difference = home_rating + self.home_advantage - away_rating
+        expected = 1.0 / (1.0 + 10.0 ** (-difference / 400.0))
+        if margin == 0:
+            score = 0.5
+            multiplier = math.log(2.0) * 2.2
+        else:
+            score = 1.0 if margin > 0 else 0.0
+            winner_difference = difference if margin > 0 else -difference
+            multiplier = (
+                math.log(abs(margin) + 1.0) * 2.2 / (winner_difference * 0.001 + 2.2)
+            )
+        change = self.k * multiplier * (score - expected)
+
+        self.ratings[home_team_id] = home_rating + change
+        self.ratings[away_team_id] = away_rating - change
+
+    def copy(self, week: int) -> "EloRatings":
+        return EloRatings(week, dict(self.ratings))
+
+
+class EloRankingCalculator:
+    name: str = "Elo"
+
+    def __init__(self, factory: TeamRankingFactory) -> None:
+        self._factory = factory
+
+    def calculate_for_season(
+        self,
+        season_data: SeasonData,
+        checkpoint: Optional[EloRatings] = None,
+    ) -> list[Ranking[TeamID]]:
+        return self.calculate_for_ratings(
+            season_data,
+            self.ratings_for_season(season_data, checkpoint),
+        )
+
+    def calculate_for_ratings(
+        self,
+        season_data: SeasonData,
+        ratings: Iterable[EloRatings],
+    ) -> list[Ranking[TeamID]]:
+        ratings_by_week = {weekly.week: weekly for weekly in ratings}
+        team_ids = [
+            season_data.team_ids[team] for team in season_data.ranked_teams.tolist()
+        ]
+
+        rankings = []
+        for week in season_data.calculated_weeks.tolist():
+            ranking_values = TeamRankingCalculator.to_values(
+                season_data,
+                season_data.ranked_teams,
+                ratings_by_week[week].values(team_ids),
+            )
+
+            rankings.append(
+                self._factory.create(
+                    EloRankingCalculator.name,
+                    SeasonID(season_data.season_id),
+                    week,
+                    season_data.team_ids,
+                    ranking_values,
+                ),
+            )
+
+        if season_data.is_complete and rankings:
+            rankings.append(
+                self._factory.create(
+                    EloRankingCalculator.name,
+                    SeasonID(season_data.season_id),
+                    None,
+                    season_data.team_ids,
+                    ranking_values,
+                ),
+            )
+
+        return rankings
+
+    @staticmethod
+    def ratings_for_season(
+        season_data: SeasonData,
+        checkpoint: Optional[EloRatings] = None,
+    ) -> list[EloRatings]:
+        # Returns the ratings after each ranked week that follows the
+        # checkpoint, applying the games of each week in the order they were
+        # played. The games include ties, and a week of only ties is not
+        # ranked, so its games are applied with those of the next ranked week.
+        games = season_data.played_games
+        games = games[
+            numpy.lexsort(
+                (season_data.game_sort_order[games], season_data.game_week[games]),
+            )
+        ]
+        game_weeks = season_data.game_week[games]
+        home_teams = season_data.game_home_team[games].tolist()
+        away_teams = season_data.game_away_team[games].tolist()
+        margins = (
+            season_data.game_home_score[games] - season_data.game_away_score[games]
+        ).tolist()
+
+        ratings = checkpoint.copy(checkpoint.week) if checkpoint else EloRatings()
+        weeks = season_data.ranked_weeks[season_data.ranked_weeks > ratings.week]
+
+        weekly = []
+        ends = numpy.searchsorted(game_weeks, weeks, side="right").tolist()
+        starts = [
+            int(numpy.searchsorted(game_weeks, ratings.week, side="right")),
+            *ends[:-1],
+        ]
+        for week, start, end in zip(weeks.tolist(), starts, ends):
+            for game in range(start, end):
+                ratings.apply(
+                    season_data.team_ids[home_teams[game]],
+                    season_data.team_ids[away_teams[game]],
+                    margins[game],
+                )
+            weekly.append(ratings.copy(week))
+
+        return weekly
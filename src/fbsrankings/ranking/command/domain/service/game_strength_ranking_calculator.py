@@ -1,4 +1,4 @@
-from uuid import UUID
+import numpy
 
 from fbsrankings.messages.enums import GameStatus
 from fbsrankings.ranking.command.domain.model.core import GameID
@@ -19,32 +19,32 @@ class GameStrengthRankingCalculator:
         season_data: SeasonData,
         performance_ranking: Ranking[TeamID],
     ) -> Ranking[GameID]:
-        game_data: dict[UUID, float] = {}
-
-        performance_map = {r.id_: r for r in performance_ranking.values}
-
-        for game in season_data.game_map.values():
-            if game.status != GameStatus.GAME_STATUS_CANCELED:
-                home_performance = performance_map.get(TeamID(UUID(game.home_team_id)))
-                away_performance = performance_map.get(TeamID(UUID(game.away_team_id)))
-
-                if home_performance is not None and away_performance is not None:
-                    if home_performance.value > away_performance.value:
-                        game_value = (
-                            99 * away_performance.value + home_performance.value
-                        ) / 100.0
-                    else:
-                        game_value = (
-                            99 * home_performance.value + away_performance.value
-                        ) / 100.0
-                    game_data[UUID(game.game_id)] = game_value
+        performance = season_data.team_values(performance_ranking)
+        home_performance = performance[season_data.game_home_team]
+        away_performance = performance[season_data.game_away_team]
+        games = numpy.flatnonzero(
+            (season_data.game_status != GameStatus.GAME_STATUS_CANCELED)
+            & ~numpy.isnan(home_performance)
+            & ~numpy.isnan(away_performance),
+        )
 
-        result = {GameID(id_): data for id_, data in game_data.items()}
-        ranking_values = GameRankingCalculator.to_values(season_data, result)
+        home_value = home_performance[games]
+        away_value = away_performance[games]
+        game_value = (
+            99 * numpy.minimum(home_value, away_value)
+            + numpy.maximum(home_value, away_value)
+        ) / 100.0
+
+        ranking_values = GameRankingCalculator.to_values(
+            season_data,
+            games,
+            game_value,
+        )
 
         return self._factory.create(
             performance_ranking.name + " - Game Strength",
             SeasonID(season_data.season_id),
             performance_ranking.week,
+            season_data.game_ids,
             ranking_values,
         )
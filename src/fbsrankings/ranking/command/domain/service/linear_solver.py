@@ -0,0 +1,120 @@
+from abc import ABCMeta
+from abc import abstractmethod
+from typing import cast
+from typing import Optional
+from typing import Union
+
+import numpy
+import scipy.linalg
+import scipy.sparse
+import scipy.sparse.linalg
+from numpy.typing import NDArray
+
+
+Matrix = Union[NDArray[numpy.float64], scipy.sparse.csr_matrix]
+
+
+class LinearSolver(metaclass=ABCMeta):
+    @abstractmethod
+    def solve(
+        self,
+        a: Matrix,
+        b: NDArray[numpy.float64],
+        x0: Optional[NDArray[numpy.float64]] = None,
+    ) -> NDArray[numpy.float64]:
+        raise NotImplementedError
+
+
+class LUSolver(LinearSolver):
+    def solve(
+        self,
+        a: Matrix,
+        b: NDArray[numpy.float64],
+        x0: Optional[NDArray[numpy.float64]] = None,
+    ) -> NDArray[numpy.float64]:
+        if not isinstance(a, numpy.ndarray):
+            x: NDArray[numpy.float64] = scipy.sparse.linalg.splu(a.tocsc()).solve(b)
+            return x
+        return cast(NDArray[numpy.float64], numpy.linalg.solve(a, b))
+
+
+class CholeskySolver(LinearSolver):
+    def solve(
+        self,
+        a: Matrix,
+        b: NDArray[numpy.float64],
+        x0: Optional[NDArray[numpy.float64]] = None,
+    ) -> NDArray[numpy.float64]:
+        if not isinstance(a, numpy.ndarray):
+            a = a.toarray()
+        factor = scipy.linalg.cho_factor(a, check_finite=False)
+        x: NDArray[numpy.float64] = scipy.linalg.cho_solve(
+            factor,
+            b,
+            check_finite=False,
+        )
+        return x
+
+
+class ConjugateGradientSolver(LinearSolver):
+    tolerance: float = 1e-12
+
+    def solve(
+        self,
+        a: Matrix,
+        b: NDArray[numpy.float64],
+        x0: Optional[NDArray[numpy.float64]] = None,
+    ) -> NDArray[numpy.float64]:
+        x, info = scipy.sparse.linalg.cg(
+            a,
+            b,
+            x0=x0,
+            rtol=self.tolerance,
+            atol=0.0,
+            M=scipy.sparse.diags(1.0 / a.diagonal()),
+            maxiter=10 * len(b),
+        )
+        if info != 0:
+            return LUSolver().solve(a, b)
+        return cast(NDArray[numpy.float64], x)
+
+
+class GMRESSolver(LinearSolver):
+    tolerance: float = 1e-12
+
+    def solve(
+        self,
+        a: Matrix,
+        b: NDArray[numpy.float64],
+        x0: Optional[NDArray[numpy.float64]] = None,
+    ) -> NDArray[numpy.float64]:
+        x, info = scipy.sparse.linalg.gmres(
+            a,
+            b,
+            x0=x0,
+            rtol=self.tolerance,
+            atol=0.0,
+            M=scipy.sparse.diags(1.0 / a.diagonal()),
+            restart=min(len(b), 50),
+            maxiter=10 * len(b),
+        )
+        if info != 0:
+            return LUSolver().solve(a, b)
+        return cast(NDArray[numpy.float64], x)
+
+
+def select_linear_solver(
+    solver_type: Optional[type[LinearSolver]],
+    symmetric: bool,
+    sparse: bool,
+) -> LinearSolver:
+    # A dense system is always factored with LU by default, so the rankings
+    # stay the same as they were before the other backends were added. A
+    # large sparse system that is symmetric is solved iteratively instead.
+    if solver_type is None:
+        solver_type = ConjugateGradientSolver if sparse and symmetric else LUSolver
+
+    elif not symmetric and solver_type in (CholeskySolver, ConjugateGradientSolver):
+        solver_type = LUSolver if solver_type is CholeskySolver else GMRESSolver
+
+    return solver_type()
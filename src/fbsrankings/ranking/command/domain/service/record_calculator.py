@@ -1,8 +1,5 @@
-from uuid import UUID
+import numpy
 
-from fbsrankings.messages.enums import GameStatus
-from fbsrankings.messages.enums import Subdivision
-from fbsrankings.messages.query import GameBySeasonResult
 from fbsrankings.ranking.command.domain.model.core import SeasonID
 from fbsrankings.ranking.command.domain.model.core import TeamID
 from fbsrankings.ranking.command.domain.model.ranking import SeasonData
@@ -11,82 +8,59 @@ from fbsrankings.ranking.command.domain.model.record import TeamRecordFactory
 from fbsrankings.ranking.command.domain.model.record import TeamRecordValue
 
 
-class TeamData:
-    def __init__(self) -> None:
-        self.wins = 0
-        self.losses = 0
-
-
 class TeamRecordCalculator:
     def __init__(self, factory: TeamRecordFactory) -> None:
         self._factory = factory
 
     def calculate_for_season(self, season_data: SeasonData) -> list[TeamRecord]:
-        team_data: dict[str, TeamData] = {}
-        for affiliation in season_data.affiliation_map.values():
-            if affiliation.subdivision == Subdivision.SUBDIVISION_FBS:
-                team_data[affiliation.team_id] = TeamData()
-
-        season_is_complete = True
-        games_by_week: dict[int, list[GameBySeasonResult]] = {}
-        for game in season_data.game_map.values():
-            winning_data = None
-            losing_data = None
-
-            if game.home_team_score is not None and game.away_team_score is not None:
-                if game.home_team_score > game.away_team_score:
-                    winning_data = team_data.get(game.home_team_id)
-                    losing_data = team_data.get(game.away_team_id)
-                elif game.away_team_score > game.home_team_score:
-                    winning_data = team_data.get(game.away_team_id)
-                    losing_data = team_data.get(game.home_team_id)
+        n = len(season_data.ranked_teams)
+        week_count = len(season_data.ranked_weeks)
+        week_index = season_data.ranked_week_index
+        games = season_data.ranked_games
+        winners = season_data.ranked_team_index[season_data.game_winning_team[games]]
+        losers = season_data.ranked_team_index[season_data.game_losing_team[games]]
 
-            if winning_data is not None and losing_data is not None:
-                week_games = games_by_week.setdefault(game.week, [])
-                week_games.append(game)
+        wins = numpy.zeros((week_count, n), dtype=numpy.int64)
+        numpy.add.at(wins, (week_index, winners), 1)
+        numpy.cumsum(wins, axis=0, out=wins)
 
-            elif game.status == GameStatus.GAME_STATUS_SCHEDULED:
-                season_is_complete = False
+        losses = numpy.zeros((week_count, n), dtype=numpy.int64)
+        numpy.add.at(losses, (week_index, losers), 1)
+        numpy.cumsum(losses, axis=0, out=losses)
 
         records = []
-        for week in sorted(games_by_week.keys()):
-            for game in games_by_week[week]:
-                winning_data = None
-                losing_data = None
-
-                if (
-                    game.home_team_score is not None
-                    and game.away_team_score is not None
-                ):
-                    if game.home_team_score > game.away_team_score:
-                        winning_data = team_data.get(game.home_team_id)
-                        losing_data = team_data.get(game.away_team_id)
-                    elif game.away_team_score > game.home_team_score:
-                        winning_data = team_data.get(game.away_team_id)
-                        losing_data = team_data.get(game.home_team_id)
-
-                if winning_data is not None and losing_data is not None:
-                    winning_data.wins += 1
-                    losing_data.losses += 1
-
+        for index, week in enumerate(
+            season_data.calculated_weeks,
+            season_data.start_week_index,
+        ):
             record_values = [
-                TeamRecordValue(TeamID(UUID(id_)), data.wins, data.losses)
-                for id_, data in team_data.items()
+                TeamRecordValue(
+                    TeamID(team),
+                    int(team_wins),
+                    int(team_losses),
+                )
+                for team, team_wins, team_losses in zip(
+                    season_data.ranked_teams.tolist(),
+                    wins[index],
+                    losses[index],
+                )
             ]
 
             records.append(
                 self._factory.create(
                     SeasonID(season_data.season_id),
-                    week,
+                    int(week),
+                    season_data.team_ids,
                     record_values,
                 ),
             )
 
-        if season_is_complete:
+        if season_data.is_complete and records:
             records.append(
                 self._factory.create(
                     SeasonID(season_data.season_id),
                     None,
+                    season_data.team_ids,
                     record_values,
                 ),
             )
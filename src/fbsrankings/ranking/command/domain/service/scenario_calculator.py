@@ -0,0 +1,127 @@
+from collections.abc import Iterable
+
+import numpy
+from numpy.typing import NDArray
+
+from fbsrankings.messages.enums import GameStatus
+from fbsrankings.ranking.command.domain.model.core import TeamID
+from fbsrankings.ranking.command.domain.model.ranking import RankingValues
+from fbsrankings.ranking.command.domain.model.ranking import SeasonData
+from fbsrankings.ranking.command.domain.service.colley_matrix_ranking_calculator import (
+    ColleyMatrixRankingCalculator,
+)
+from fbsrankings.ranking.command.domain.service.scenario_solver import ScenarioSystem
+from fbsrankings.ranking.command.domain.service.srs_ranking_calculator import (
+    SRSRankingCalculator,
+)
+
+
+class ScenarioRanking:
+    def __init__(
+        self,
+        name: str,
+        values: NDArray[numpy.float64],
+        ranks: NDArray[numpy.intp],
+        value_deltas: NDArray[numpy.float64],
+        rank_deltas: NDArray[numpy.intp],
+    ) -> None:
+        self.name = name
+        self.values = values
+        self.ranks = ranks
+        self.value_deltas = value_deltas
+        self.rank_deltas = rank_deltas
+
+
+class ScenarioCalculator:
+    # Applies hypothetical results of scheduled games to the rankings of the
+    # last ranked week of a season. The values of each team are given in the
+    # order of season_data.ranked_teams, along with their change from the
+    # rankings without the hypothetical results.
+    def __init__(self, season_data: SeasonData) -> None:
+        if len(season_data.ranked_weeks) == 0:
+            raise ValueError(
+                f"No completed weeks were found for {season_data.season_id}",
+            )
+
+        self._season_data = season_data
+        self._sort_order = season_data.team_sort_order[season_data.ranked_teams]
+        self._systems: dict[str, ScenarioSystem] = {
+            SRSRankingCalculator.name: SRSRankingCalculator.scenario_system(
+                season_data,
+            ),
+            ColleyMatrixRankingCalculator.name: (
+                ColleyMatrixRankingCalculator.scenario_system(season_data)
+            ),
+        }
+        self._base_ranks = {
+            name: self._ranks(system.x) for name, system in self._systems.items()
+        }
+
+    @property
+    def week(self) -> int:
+        return int(self._season_data.ranked_weeks[-1])
+
+    def system(self, name: str) -> ScenarioSystem:
+        return self._systems[name]
+
+    def calculate(
+        self,
+        results: Iterable[tuple[str, int, int]],
+    ) -> list[ScenarioRanking]:
+        home, away, margin = self._games(results)
+
+        rankings = []
+        for name, system in self._systems.items():
+            values = system.solve(home, away, margin)
+            ranks = self._ranks(values)
+            rankings.append(
+                ScenarioRanking(
+                    name,
+                    values,
+                    ranks,
+                    values - system.x,
+                    self._base_ranks[name] - ranks,
+                ),
+            )
+        return rankings
+
+    def _games(
+        self,
+        results: Iterable[tuple[str, int, int]],
+    ) -> tuple[NDArray[numpy.intp], NDArray[numpy.intp], NDArray[numpy.int32]]:
+        season_data = self._season_data
+
+        home = []
+        away = []
+        margin = []
+        for game_id, home_team_score, away_team_score in results:
+            if game_id not in season_data.game_ids:
+                raise ValueError(f"Game not found for {game_id}")
+            game = season_data.game_ids.index(game_id)
+            if season_data.game_status[game] != GameStatus.GAME_STATUS_SCHEDULED:
+                raise ValueError(f"Game {game_id} is not scheduled")
+
+            # Like a completed game, a tie or a game against an unranked team
+            # does not change the rankings.
+            home_team = season_data.ranked_team_index[season_data.game_home_team[game]]
+            away_team = season_data.ranked_team_index[season_data.game_away_team[game]]
+            if home_team >= 0 and away_team >= 0 and home_team_score != away_team_score:
+                home.append(home_team)
+                away.append(away_team)
+                margin.append(home_team_score - away_team_score)
+
+        return (
+            numpy.array(home, dtype=numpy.intp),
+            numpy.array(away, dtype=numpy.intp),
+            numpy.array(margin, dtype=numpy.int32),
+        )
+
+    def _ranks(self, values: NDArray[numpy.float64]) -> NDArray[numpy.intp]:
+        ranking_values = RankingValues[TeamID].from_scores(
+            numpy.arange(len(values)),
+            values,
+            self._sort_order,
+        )
+        ranks = numpy.empty(len(values), dtype=numpy.intp)
+        ranks[ranking_values.ids] = ranking_values.ranks
+        return ranks
@@ -0,0 +1,115 @@
+from typing import Callable
+
+import numpy
+import scipy.linalg
+from numpy.typing import NDArray
+
+from fbsrankings.ranking.command.domain.service.weekly_solver import WeeklySystem
+
+
+class ScenarioSystem:
+    # The system of the last week is inverted once. A game between two teams
+    # adds e * e^T to it, where e is +1 for the home team and -1 for the away
+    # team, and adds e * weight(margin) to b, so the games of a scenario are
+    # applied to the inverse as a Woodbury update of their rank. The margins
+    # can have a second axis to solve many outcomes of the same games at once.
+    def __init__(
+        self,
+        system: WeeklySystem,
+        weight: Callable[[NDArray[numpy.int32]], NDArray[numpy.float64]],
+    ) -> None:
+        self._a = system.dense()[-1]
+        self._b = system.b[-1]
+        self._components = (
+            system.components[-1] if system.components is not None else None
+        )
+        self.weight = weight
+
+        lu = scipy.linalg.lu_factor(self._a, check_finite=False)
+        self._inverse: NDArray[numpy.float64] = scipy.linalg.lu_solve(
+            lu,
+            numpy.eye(len(self._b)),
+            check_finite=False,
+        )
+        self.x: NDArray[numpy.float64] = self._inverse @ self._b
+
+    def solve(
+        self,
+        home: NDArray[numpy.intp],
+        away: NDArray[numpy.intp],
+        margin: NDArray[numpy.int32],
+    ) -> NDArray[numpy.float64]:
+        weight = self.weight(margin)
+        x = _column(self.x, weight)
+        if len(home) == 0:
+            return x + numpy.zeros(weight.shape[1:])
+
+        components = self._components
+        if components is not None and numpy.any(
+            components[home] != components[away],
+        ):
+            return self._solve_joined(components, home, away, weight)
+
+        z = self._inverse[:, home] - self._inverse[:, away]
+        y = x + z @ weight
+        capacitance = numpy.eye(len(home)) + z[home, :] - z[away, :]
+        return y - z @ numpy.linalg.solve(capacitance, y[home] - y[away])
+
+    def _solve_joined(
+        self,
+        components: NDArray[numpy.intp],
+        home: NDArray[numpy.intp],
+        away: NDArray[numpy.intp],
+        weight: NDArray[numpy.float64],
+    ) -> NDArray[numpy.float64]:
+        # A game between two groups of teams that have not played each other
+        # joins their sum-to-zero constraints, which is not a low-rank change,
+        # so the system is solved directly instead.
+        a = self._a - _same(components) + _same(_join(components, home, away))
+        b = _column(self._b, weight) + numpy.zeros(weight.shape[1:])
+        numpy.add.at(a, (home, home), 1.0)
+        numpy.add.at(a, (away, away), 1.0)
+        numpy.add.at(a, (home, away), -1.0)
+        numpy.add.at(a, (away, home), -1.0)
+        numpy.add.at(b, home, weight)
+        numpy.subtract.at(b, away, weight)
+
+        x: NDArray[numpy.float64] = scipy.linalg.solve(a, b, check_finite=False)
+        return x
+
+
+def _column(
+    vector: NDArray[numpy.float64],
+    weight: NDArray[numpy.float64],
+) -> NDArray[numpy.float64]:
+    return vector.reshape(vector.shape + (1,) * (weight.ndim - 1))
+
+
+def _join(
+    components: NDArray[numpy.intp],
+    home: NDArray[numpy.intp],
+    away: NDArray[numpy.intp],
+) -> NDArray[numpy.intp]:
+    roots = numpy.arange(len(components), dtype=numpy.intp)
+    for first, second in zip(components[home].tolist(), components[away].tolist()):
+        first_root = _find(roots, first)
+        second_root = _find(roots, second)
+        if first_root != second_root:
+            roots[max(first_root, second_root)] = min(first_root, second_root)
+    return numpy.array(
+        [_find(roots, component) for component in components.tolist()],
+        dtype=numpy.intp,
+    )
+
+
+def _find(roots: NDArray[numpy.intp], index: int) -> int:
+    while roots[index] != index:
+        index = int(roots[index])
+    return index
+
+
+def _same(components: NDArray[numpy.intp]) -> NDArray[numpy.float64]:
+    same: NDArray[numpy.float64] = (components[:, None] == components[None, :]).astype(
+        numpy.float64
+    )
+    return same
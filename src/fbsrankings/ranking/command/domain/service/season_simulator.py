@@ -0,0 +1,146 @@
+from typing import Optional
+
+import numpy
+from numpy.typing import NDArray
+
+from fbsrankings.messages.enums import GameStatus
+from fbsrankings.ranking.command.domain.model.ranking import SeasonData
+from fbsrankings.ranking.command.domain.service.scenario_solver import ScenarioSystem
+
+
+class SeasonSimulation:
+    def __init__(
+        self,
+        count: int,
+        margin_deviation: float,
+        wins: NDArray[numpy.int64],
+        losses: NDArray[numpy.int64],
+        remaining_games: NDArray[numpy.int64],
+        ratings: NDArray[numpy.float64],
+        projected_ratings: NDArray[numpy.float64],
+        expected_wins: NDArray[numpy.float64],
+        win_probabilities: NDArray[numpy.float64],
+        rank_probabilities: NDArray[numpy.float64],
+    ) -> None:
+        self.count = count
+        self.margin_deviation = margin_deviation
+        self.wins = wins
+        self.losses = losses
+        self.remaining_games = remaining_games
+        self.ratings = ratings
+        self.projected_ratings = projected_ratings
+        self.expected_wins = expected_wins
+        self.win_probabilities = win_probabilities
+        self.rank_probabilities = rank_probabilities
+
+
+class SeasonSimulator:
+    # Simulates the remaining ranked games of a season from the ratings of its
+    # last ranked week. The home margin of each game is drawn from a normal
+    # distribution around the rating difference, with the spread that the
+    # completed games show around their ratings. All of the simulations are
+    # drawn as one array and their final ratings are solved together, so the
+    # values of each team are given in the order of season_data.ranked_teams,
+    # with wins and ranks as the second axis of the probabilities.
+    minimum_deviation: float = 1.0
+
+    def __init__(self, season_data: SeasonData, system: ScenarioSystem) -> None:
+        self._season_data = season_data
+        self._system = system
+
+        n = len(season_data.ranked_teams)
+        games = season_data.ranked_games
+        home = season_data.ranked_team_index[season_data.game_home_team[games]]
+        away = season_data.ranked_team_index[season_data.game_away_team[games]]
+        winners = season_data.ranked_team_index[season_data.game_winning_team[games]]
+        losers = season_data.ranked_team_index[season_data.game_losing_team[games]]
+
+        self._wins = numpy.bincount(winners, minlength=n)
+        self._losses = numpy.bincount(losers, minlength=n)
+
+        residual = system.weight(
+            season_data.game_home_score[games] - season_data.game_away_score[games],
+        ) - (system.x[home] - system.x[away])
+        self._deviation = max(
+            float(numpy.std(residual)) if len(residual) > 0 else 0.0,
+            self.minimum_deviation,
+        )
+
+        scheduled = numpy.flatnonzero(
+            (season_data.game_status == GameStatus.GAME_STATUS_SCHEDULED)
+            & (season_data.ranked_team_index[season_data.game_home_team] >= 0)
+            & (season_data.ranked_team_index[season_data.game_away_team] >= 0),
+        )
+        self._home = season_data.ranked_team_index[
+            season_data.game_home_team[scheduled]
+        ]
+        self._away = season_data.ranked_team_index[
+            season_data.game_away_team[scheduled]
+        ]
+
+        self._home_games = numpy.zeros((n, len(scheduled)))
+        self._home_games[self._home, numpy.arange(len(scheduled))] = 1.0
+        self._away_games = numpy.zeros((n, len(scheduled)))
+        self._away_games[self._away, numpy.arange(len(scheduled))] = 1.0
+
+        # Ties in the final ratings are broken the same way as in a ranking.
+        self._team_order = numpy.argsort(
+            season_data.team_sort_order[season_data.ranked_teams],
+        )
+
+    def simulate(self, count: int, seed: Optional[int] = None) -> SeasonSimulation:
+        if count <= 0:
+            raise ValueError(f"Simulation count must be positive: {count}")
+
+        n = len(self._wins)
+        x = self._system.x
+        generator = numpy.random.default_rng(seed)
+
+        expected = x[self._home] - x[self._away]
+        draws = generator.normal(
+            expected[:, None],
+            self._deviation,
+            (len(expected), count),
+        )
+        margin = numpy.rint(draws).astype(numpy.int32)
+        margin[margin == 0] = numpy.where(draws[margin == 0] < 0, -1, 1)
+        home_win = (margin > 0).astype(numpy.float64)
+
+        wins = self._wins[:, None] + (
+            self._home_games @ home_win + self._away_games @ (1.0 - home_win)
+        ).astype(numpy.int64)
+        win_count = int(wins.max()) + 1
+        win_probabilities = numpy.bincount(
+            (numpy.arange(n)[:, None] * win_count + wins).ravel(),
+            minlength=n * win_count,
+        ).reshape(n, win_count) / float(count)
+
+        ratings = self._system.solve(self._home, self._away, margin)
+        order = self._team_order[
+            numpy.argsort(-ratings[self._team_order], axis=0, kind="stable")
+        ]
+        ranks = numpy.empty((n, count), dtype=numpy.intp)
+        numpy.put_along_axis(
+            ranks,
+            order,
+            numpy.broadcast_to(numpy.arange(n)[:, None], (n, count)),
+            axis=0,
+        )
+        rank_probabilities = numpy.bincount(
+            (numpy.arange(n)[:, None] * n + ranks).ravel(),
+            minlength=n * n,
+        ).reshape(n, n) / float(count)
+
+        return SeasonSimulation(
+            count,
+            self._deviation,
+            self._wins,
+            self._losses,
+            self._home_games.sum(axis=1).astype(numpy.int64)
+            + self._away_games.sum(axis=1).astype(numpy.int64),
+            x,
+            ratings.mean(axis=1),
+            wins.mean(axis=1),
+            win_probabilities,
+            rank_probabilities,
+        )
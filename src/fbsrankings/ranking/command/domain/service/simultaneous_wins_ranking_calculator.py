@@ -1,122 +1,83 @@
-from uuid import UUID
+from typing import Callable
 
 import numpy
 
-from fbsrankings.messages.enums import GameStatus
-from fbsrankings.messages.enums import Subdivision
-from fbsrankings.messages.query import GameBySeasonResult
 from fbsrankings.ranking.command.domain.model.core import SeasonID
 from fbsrankings.ranking.command.domain.model.core import TeamID
 from fbsrankings.ranking.command.domain.model.ranking import Ranking
 from fbsrankings.ranking.command.domain.model.ranking import SeasonData
 from fbsrankings.ranking.command.domain.model.ranking import TeamRankingCalculator
 from fbsrankings.ranking.command.domain.model.ranking import TeamRankingFactory
-
-
-class TeamData:
-    def __init__(self, index: int) -> None:
-        self.index = index
-        self.game_total = 0
-        self.win_total = 0
-
-    def add_win(self) -> None:
-        self.game_total += 1
-        self.win_total += 1
-
-    def add_loss(self) -> None:
-        self.game_total += 1
-
-    @property
-    def win_percentage(self) -> float:
-        return float(self.win_total) / self.game_total if self.game_total > 0 else 0.0
+from fbsrankings.ranking.command.domain.service.weekly_solver import DirectWeeklySolver
+from fbsrankings.ranking.command.domain.service.weekly_solver import WeeklySolver
+from fbsrankings.ranking.command.domain.service.weekly_solver import WeeklySystem
 
 
 class SimultaneousWinsRankingCalculator:
     name: str = "Simultaneous Wins"
 
-    def __init__(self, factory: TeamRankingFactory) -> None:
+    def __init__(
+        self,
+        factory: TeamRankingFactory,
+        solver_factory: Callable[[], WeeklySolver] = DirectWeeklySolver,
+    ) -> None:
         self._factory = factory
+        self._solver_factory = solver_factory
 
     def calculate_for_season(self, season_data: SeasonData) -> list[Ranking[TeamID]]:
-        team_data: dict[str, TeamData] = {}
-        for affiliation in season_data.affiliation_map.values():
-            if affiliation.subdivision == Subdivision.SUBDIVISION_FBS:
-                team_data[affiliation.team_id] = TeamData(len(team_data))
-
-        season_is_complete = True
-        games_by_week: dict[int, list[GameBySeasonResult]] = {}
-        for game in season_data.game_map.values():
-            winning_data = None
-            losing_data = None
-
-            if game.home_team_score is not None and game.away_team_score is not None:
-                if game.home_team_score > game.away_team_score:
-                    winning_data = team_data.get(game.home_team_id)
-                    losing_data = team_data.get(game.away_team_id)
-                elif game.away_team_score > game.home_team_score:
-                    winning_data = team_data.get(game.away_team_id)
-                    losing_data = team_data.get(game.home_team_id)
-
-            if winning_data is not None and losing_data is not None:
-                week_games = games_by_week.setdefault(game.week, [])
-                week_games.append(game)
-
-            elif game.status == GameStatus.GAME_STATUS_SCHEDULED:
-                season_is_complete = False
-
-        n = len(team_data)
-        a = numpy.zeros((n, n))
-        b = numpy.zeros(n)
+        n = len(season_data.ranked_teams)
+        week_count = len(season_data.ranked_weeks)
+        week_index = season_data.ranked_week_index
+        games = season_data.ranked_games
+        winners = season_data.ranked_team_index[season_data.game_winning_team[games]]
+        losers = season_data.ranked_team_index[season_data.game_losing_team[games]]
+
+        win_total = numpy.zeros((week_count, n))
+        numpy.add.at(win_total, (week_index, winners), 1.0)
+        numpy.cumsum(win_total, axis=0, out=win_total)
+
+        game_total = numpy.zeros((week_count, n))
+        numpy.add.at(game_total, (week_index, winners), 1.0)
+        numpy.add.at(game_total, (week_index, losers), 1.0)
+        numpy.cumsum(game_total, axis=0, out=game_total)
+
+        system = WeeklySystem(
+            week_index=week_index,
+            rows=winners,
+            columns=losers,
+            values=numpy.full(len(games), -1.0),
+            diagonal=numpy.maximum(game_total, 1.0),
+            b=win_total,
+            symmetric=False,
+            start=season_data.start_week_index,
+        )
+        x_by_week = self._solver_factory().solve_weeks(system)
 
         rankings = []
-        for week in sorted(games_by_week.keys()):
-            for game in games_by_week[week]:
-                winning_data = None
-                losing_data = None
-
-                if (
-                    game.home_team_score is not None
-                    and game.away_team_score is not None
-                ):
-                    if game.home_team_score > game.away_team_score:
-                        winning_data = team_data.get(game.home_team_id)
-                        losing_data = team_data.get(game.away_team_id)
-                    elif game.away_team_score > game.home_team_score:
-                        winning_data = team_data.get(game.away_team_id)
-                        losing_data = team_data.get(game.home_team_id)
-
-                if winning_data is not None and losing_data is not None:
-                    winning_data.add_win()
-                    losing_data.add_loss()
-
-                    a[winning_data.index, losing_data.index] -= 1.0
-
-            for data in team_data.values():
-                a[data.index, data.index] = max(data.game_total, 1.0)
-                b[data.index] = data.win_total
-
-            x = numpy.linalg.solve(a, b)
-
-            result = {
-                TeamID(UUID(id_)): x[data.index] for id_, data in team_data.items()
-            }
-            ranking_values = TeamRankingCalculator.to_values(season_data, result)
+        for week, x in zip(season_data.calculated_weeks, x_by_week):
+            ranking_values = TeamRankingCalculator.to_values(
+                season_data,
+                season_data.ranked_teams,
+                x,
+            )
 
             rankings.append(
                 self._factory.create(
                     SimultaneousWinsRankingCalculator.name,
                     SeasonID(season_data.season_id),
-                    week,
+                    int(week),
+                    season_data.team_ids,
                     ranking_values,
                 ),
             )
 
-        if season_is_complete:
+        if season_data.is_complete and rankings:
             rankings.append(
                 self._factory.create(
                     SimultaneousWinsRankingCalculator.name,
                     SeasonID(season_data.season_id),
                     None,
+                    season_data.team_ids,
                     ranking_values,
                 ),
             )
@@ -1,113 +1,60 @@
-from uuid import UUID
+from typing import Callable
 
 import numpy
+from numpy.typing import NDArray
 
-from fbsrankings.messages.enums import GameStatus
-from fbsrankings.messages.enums import Subdivision
-from fbsrankings.messages.query import GameBySeasonResult
 from fbsrankings.ranking.command.domain.model.core import SeasonID
 from fbsrankings.ranking.command.domain.model.core import TeamID
 from fbsrankings.ranking.command.domain.model.ranking import Ranking
 from fbsrankings.ranking.command.domain.model.ranking import SeasonData
 from fbsrankings.ranking.command.domain.model.ranking import TeamRankingCalculator
 from fbsrankings.ranking.command.domain.model.ranking import TeamRankingFactory
-
-
-class TeamData:
-    def __init__(self, index: int) -> None:
-        self.index = index
-        self.game_total = 0
-        self.point_margin = 0
-
-    def add_game(self, point_margin: int) -> None:
-        self.game_total += 1
-        self.point_margin += point_margin
+from fbsrankings.ranking.command.domain.service.scenario_solver import ScenarioSystem
+from fbsrankings.ranking.command.domain.service.weekly_solver import DirectWeeklySolver
+from fbsrankings.ranking.command.domain.service.weekly_solver import WeeklySolver
+from fbsrankings.ranking.command.domain.service.weekly_solver import WeeklySystem
 
 
 class SRSRankingCalculator:
     name: str = "SRS"
 
-    def __init__(self, factory: TeamRankingFactory) -> None:
+    def __init__(
+        self,
+        factory: TeamRankingFactory,
+        solver_factory: Callable[[], WeeklySolver] = DirectWeeklySolver,
+    ) -> None:
         self._factory = factory
+        self._solver_factory = solver_factory
 
     def calculate_for_season(self, season_data: SeasonData) -> list[Ranking[TeamID]]:
-        team_data: dict[str, TeamData] = {}
-        for affiliation in season_data.affiliation_map.values():
-            if affiliation.subdivision == Subdivision.SUBDIVISION_FBS:
-                team_data[affiliation.team_id] = TeamData(len(team_data))
-
-        season_is_complete = True
-        games_by_week: dict[int, list[GameBySeasonResult]] = {}
-        for game in season_data.game_map.values():
-            winning_data = None
-            losing_data = None
-
-            if game.home_team_score is not None and game.away_team_score is not None:
-                if game.home_team_score > game.away_team_score:
-                    winning_data = team_data.get(game.home_team_id)
-                    losing_data = team_data.get(game.away_team_id)
-                elif game.away_team_score > game.home_team_score:
-                    winning_data = team_data.get(game.away_team_id)
-                    losing_data = team_data.get(game.home_team_id)
-
-            if winning_data is not None and losing_data is not None:
-                week_games = games_by_week.setdefault(game.week, [])
-                week_games.append(game)
-
-            elif game.status == GameStatus.GAME_STATUS_SCHEDULED:
-                season_is_complete = False
-
-        n = len(team_data)
-        a = numpy.zeros((n + 1, n))
-        b = numpy.zeros(n + 1)
+        system = self._system(season_data, season_data.start_week_index)
+        x_by_week = self._solver_factory().solve_weeks(system)
 
         rankings = []
-        for week in sorted(games_by_week.keys()):
-            for game in games_by_week[week]:
-                if (
-                    game.home_team_score is not None
-                    and game.away_team_score is not None
-                ):
-                    home_data = team_data[game.home_team_id]
-                    away_data = team_data[game.away_team_id]
-
-                    home_margin = self._adjust_margin(
-                        game.home_team_score - game.away_team_score,
-                    )
-                    home_data.add_game(home_margin)
-                    away_data.add_game(-home_margin)
-
-                    a[home_data.index, away_data.index] -= 1.0
-                    a[away_data.index, home_data.index] -= 1.0
-
-            for data in team_data.values():
-                a[data.index, data.index] = data.game_total
-                b[data.index] = data.point_margin
-                a[n, data.index] = 1.0
-            b[n] = 0.0
-
-            x = numpy.linalg.lstsq(a, b, rcond=-1)[0]
-
-            result = {
-                TeamID(UUID(id_)): x[data.index] for id_, data in team_data.items()
-            }
-            ranking_values = TeamRankingCalculator.to_values(season_data, result)
+        for week, x in zip(season_data.calculated_weeks, x_by_week):
+            ranking_values = TeamRankingCalculator.to_values(
+                season_data,
+                season_data.ranked_teams,
+                x,
+            )
 
             rankings.append(
                 self._factory.create(
                     SRSRankingCalculator.name,
                     SeasonID(season_data.season_id),
-                    week,
+                    int(week),
+                    season_data.team_ids,
                     ranking_values,
                 ),
             )
 
-        if season_is_complete:
+        if season_data.is_complete and rankings:
             rankings.append(
                 self._factory.create(
                     SRSRankingCalculator.name,
                     SeasonID(season_data.season_id),
                     None,
+                    season_data.team_ids,
                     ranking_values,
                 ),
             )
@@ -115,13 +62,137 @@ class SRSRankingCalculator:
         return rankings
 
     @staticmethod
-    def _adjust_margin(margin: int) -> int:
-        if margin > 24:
-            return 24
-        if margin < -24:
-            return -24
-        if 0 < margin < 7:
-            return 7
-        if 0 > margin > -7:
-            return -7
-        return margin
+    def scenario_system(season_data: SeasonData) -> ScenarioSystem:
+        return ScenarioSystem(
+            SRSRankingCalculator._system(
+                season_data,
+                len(season_data.ranked_weeks) - 1,
+            ),
+            SRSRankingCalculator._adjust_margin_weight,
+        )
+
+    @staticmethod
+    def bootstrap(season_data: SeasonData, samples: int) -> NDArray[numpy.float64]:
+        # The residuals of the games played through each week are resampled
+        # around their fitted margins. The matrix of a week does not depend on
+        # the margins, so the samples of every week are solved in one batch.
+        system = SRSRankingCalculator._system(
+            season_data,
+            season_data.start_week_index,
+        )
+        a = system.dense()
+        x = numpy.linalg.solve(a, system.b[:, :, None])[:, :, 0]
+
+        n = len(season_data.ranked_teams)
+        games = season_data.ranked_games
+        home = season_data.ranked_team_index[season_data.game_home_team[games]]
+        away = season_data.ranked_team_index[season_data.game_away_team[games]]
+        home_margin = SRSRankingCalculator._adjust_margin_weight(
+            season_data.game_home_score[games] - season_data.game_away_score[games],
+        )
+        incidence = numpy.zeros((n, len(games)))
+        incidence[home, numpy.arange(len(games))] = 1.0
+        incidence[away, numpy.arange(len(games))] = -1.0
+        week_ends = numpy.searchsorted(
+            season_data.ranked_week_index,
+            numpy.arange(season_data.start_week_index, len(season_data.ranked_weeks)),
+            side="right",
+        )
+
+        b = numpy.empty((len(week_ends), n, samples))
+        for index, (week, end) in enumerate(
+            zip(season_data.calculated_weeks, week_ends),
+        ):
+            generator = numpy.random.default_rng(int(week))
+            fitted = x[index, home[:end]] - x[index, away[:end]]
+            residual = home_margin[:end] - fitted
+            margins = fitted + residual[generator.integers(0, end, (samples, end))]
+            b[index] = incidence[:, :end] @ margins.T
+
+        values: NDArray[numpy.float64] = numpy.linalg.solve(a, b).transpose(0, 2, 1)
+        return values
+
+    @staticmethod
+    def _system(season_data: SeasonData, start: int) -> WeeklySystem:
+        n = len(season_data.ranked_teams)
+        week_count = len(season_data.ranked_weeks)
+        week_index = season_data.ranked_week_index
+        games = season_data.ranked_games
+        home = season_data.ranked_team_index[season_data.game_home_team[games]]
+        away = season_data.ranked_team_index[season_data.game_away_team[games]]
+        home_margin = SRSRankingCalculator._adjust_margin(
+            season_data.game_home_score[games] - season_data.game_away_score[games],
+        )
+
+        game_total = numpy.zeros((week_count, n))
+        numpy.add.at(game_total, (week_index, home), 1.0)
+        numpy.add.at(game_total, (week_index, away), 1.0)
+        numpy.cumsum(game_total, axis=0, out=game_total)
+
+        point_margin = numpy.zeros((week_count, n))
+        numpy.add.at(point_margin, (week_index, home), home_margin)
+        numpy.subtract.at(point_margin, (week_index, away), home_margin)
+        numpy.cumsum(point_margin, axis=0, out=point_margin)
+
+        return WeeklySystem(
+            week_index=numpy.concatenate((week_index, week_index)),
+            rows=numpy.concatenate((home, away)),
+            columns=numpy.concatenate((away, home)),
+            values=numpy.full(2 * len(games), -1.0),
+            diagonal=game_total,
+            b=point_margin,
+            symmetric=True,
+            components=SRSRankingCalculator._components(
+                n, home, away, week_index, week_count
+            ),
+            start=start,
+        )
+
+    @staticmethod
+    def _components(
+        n: int,
+        home: NDArray[numpy.intp],
+        away: NDArray[numpy.intp],
+        week_index: NDArray[numpy.intp],
+        week_count: int,
+    ) -> NDArray[numpy.intp]:
+        component = numpy.arange(n, dtype=numpy.intp)
+        components = numpy.empty((week_count, n), dtype=numpy.intp)
+
+        game = 0
+        for week in range(week_count):
+            while game < len(week_index) and week_index[game] == week:
+                SRSRankingCalculator._join(component, home[game], away[game])
+                game += 1
+            for team in range(n):
+                SRSRankingCalculator._find(component, team)
+            components[week] = component
+
+        return components
+
+    @staticmethod
+    def _find(component: NDArray[numpy.intp], index: int) -> int:
+        root = index
+        while component[root] != root:
+            root = component[root]
+        while component[index] != root:
+            component[index], index = root, component[index]
+        return root
+
+    @staticmethod
+    def _join(component: NDArray[numpy.intp], first: int, second: int) -> None:
+        first_root = SRSRankingCalculator._find(component, first)
+        second_root = SRSRankingCalculator._find(component, second)
+        if first_root != second_root:
+            component[max(first_root, second_root)] = min(first_root, second_root)
+
+    @staticmethod
+    def _adjust_margin(margin: NDArray[numpy.int32]) -> NDArray[numpy.int32]:
+        adjusted = numpy.clip(margin, -24, 24)
+        adjusted[(adjusted > 0) & (adjusted < 7)] = 7
+        adjusted[(adjusted < 0) & (adjusted > -7)] = -7
+        return adjusted
+
+    @staticmethod
+    def _adjust_margin_weight(margin: NDArray[numpy.int32]) -> NDArray[numpy.float64]:
+        return SRSRankingCalculator._adjust_margin(margin).astype(numpy.float64)
@@ -1,4 +1,4 @@
-from uuid import UUID
+import numpy
 
 from fbsrankings.messages.enums import GameStatus
 from fbsrankings.ranking.command.domain.model.core import SeasonID
@@ -9,20 +9,6 @@ from fbsrankings.ranking.command.domain.model.ranking import TeamRankingCalculat
 from fbsrankings.ranking.command.domain.model.ranking import TeamRankingFactory
 
 
-class TeamData:
-    def __init__(self) -> None:
-        self.game_total = 0
-        self.opponent_sum = 0.0
-
-    def add_opponent(self, opponent_value: float) -> None:
-        self.game_total += 1
-        self.opponent_sum += opponent_value
-
-    @property
-    def strength_of_schedule(self) -> float:
-        return self.opponent_sum / self.game_total if self.game_total > 0 else 0.0
-
-
 class StrengthOfScheduleRankingCalculator:
     def __init__(self, factory: TeamRankingFactory) -> None:
         self._factory = factory
@@ -32,37 +18,42 @@ class StrengthOfScheduleRankingCalculator:
         season_data: SeasonData,
         performance_ranking: Ranking[TeamID],
     ) -> Ranking[TeamID]:
-        team_data: dict[str, TeamData] = {}
-
-        performance_map = {r.id_: r for r in performance_ranking.values}
-
-        for game in season_data.game_map.values():
-            if game.status != GameStatus.GAME_STATUS_CANCELED:
-                home_performance = performance_map.get(TeamID(UUID(game.home_team_id)))
-                away_performance = performance_map.get(TeamID(UUID(game.away_team_id)))
+        performance = season_data.team_values(performance_ranking)
+        home_performance = performance[season_data.game_home_team]
+        away_performance = performance[season_data.game_away_team]
+        games = numpy.flatnonzero(
+            (season_data.game_status != GameStatus.GAME_STATUS_CANCELED)
+            & ~numpy.isnan(home_performance)
+            & ~numpy.isnan(away_performance),
+        )
 
-                if home_performance is not None and away_performance is not None:
-                    home_data = team_data.get(game.home_team_id)
-                    if home_data is None:
-                        home_data = TeamData()
-                        team_data[game.home_team_id] = home_data
-                    home_data.add_opponent(away_performance.value)
+        team_count = len(season_data.team_ids)
+        teams = numpy.column_stack(
+            (season_data.game_home_team[games], season_data.game_away_team[games]),
+        ).ravel()
+        opponent_values = numpy.column_stack(
+            (away_performance[games], home_performance[games]),
+        ).ravel()
+        opponent_sum = numpy.bincount(
+            teams,
+            weights=opponent_values,
+            minlength=team_count,
+        )
+        game_total = numpy.bincount(teams, minlength=team_count)
 
-                    away_data = team_data.get(game.away_team_id)
-                    if away_data is None:
-                        away_data = TeamData()
-                        team_data[game.away_team_id] = away_data
-                    away_data.add_opponent(home_performance.value)
+        played = numpy.flatnonzero(game_total > 0)
+        strength_of_schedule = opponent_sum[played] / game_total[played]
 
-        result = {
-            TeamID(UUID(id_)): data.strength_of_schedule
-            for id_, data in team_data.items()
-        }
-        ranking_values = TeamRankingCalculator.to_values(season_data, result)
+        ranking_values = TeamRankingCalculator.to_values(
+            season_data,
+            played,
+            strength_of_schedule,
+        )
 
         return self._factory.create(
             performance_ranking.name + " - Strength of Schedule - Total",
             SeasonID(season_data.season_id),
             performance_ranking.week,
+            season_data.team_ids,
             ranking_values,
         )
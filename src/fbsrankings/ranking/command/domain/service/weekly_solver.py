@@ -0,0 +1,272 @@
+import sys
+from abc import ABCMeta
+from abc import abstractmethod
+from typing import cast
+from typing import Optional
+
+import numpy
+import scipy.linalg
+import scipy.sparse
+from numpy.typing import NDArray
+
+from fbsrankings.ranking.command.domain.service.linear_solver import LinearSolver
+from fbsrankings.ranking.command.domain.service.linear_solver import (
+    select_linear_solver,
+)
+
+
+class WeeklySystem:
+    def __init__(
+        self,
+        week_index: NDArray[numpy.intp],
+        rows: NDArray[numpy.intp],
+        columns: NDArray[numpy.intp],
+        values: NDArray[numpy.float64],
+        diagonal: NDArray[numpy.float64],
+        b: NDArray[numpy.float64],
+        symmetric: bool,
+        components: Optional[NDArray[numpy.intp]] = None,
+        start: int = 0,
+    ) -> None:
+        # Weeks before the start are folded into the first week that is solved.
+        week_index = numpy.maximum(week_index - start, 0)
+        order = numpy.argsort(week_index, kind="stable")
+        self.week_index = week_index[order]
+        self.rows = rows[order]
+        self.columns = columns[order]
+        self.values = values[order]
+        self.diagonal = diagonal[start:]
+        self.b = b[start:]
+        self.symmetric = symmetric
+        self.components = components[start:] if components is not None else None
+
+        self.week_count, self.n = self.b.shape
+        self._week_ends = numpy.searchsorted(
+            self.week_index,
+            numpy.arange(self.week_count),
+            side="right",
+        )
+
+    @property
+    def density(self) -> float:
+        entries = numpy.unique(self.rows * self.n + self.columns)
+        return float((len(entries) + self.n) / max(self.n * self.n, 1))
+
+    def dense(self) -> NDArray[numpy.float64]:
+        a = numpy.zeros((self.week_count, self.n, self.n))
+        numpy.add.at(a, (self.week_index, self.rows, self.columns), self.values)
+        numpy.cumsum(a, axis=0, out=a)
+
+        diagonal = numpy.arange(self.n)
+        a[:, diagonal, diagonal] += self.diagonal
+
+        # The solution is only defined up to a constant for each connected
+        # group of teams, so each group is constrained to sum to zero.
+        if self.components is not None:
+            a += self.components[:, :, None] == self.components[:, None, :]
+
+        return a
+
+    def sparse(self, week: int) -> scipy.sparse.csr_matrix:
+        end = self._week_ends[week]
+        a = scipy.sparse.coo_matrix(
+            (self.values[:end], (self.rows[:end], self.columns[:end])),
+            shape=(self.n, self.n),
+        ).tocsr()
+        return a + scipy.sparse.diags(self.diagonal[week], format="csr")
+
+
+class WeeklySolver(metaclass=ABCMeta):
+    @abstractmethod
+    def solve_weeks(self, system: WeeklySystem) -> NDArray[numpy.float64]:
+        raise NotImplementedError
+
+
+class DirectWeeklySolver(WeeklySolver):
+    def __init__(
+        self,
+        linear_solver_type: Optional[type[LinearSolver]] = None,
+    ) -> None:
+        self._linear_solver_type = linear_solver_type
+
+    def solve_weeks(self, system: WeeklySystem) -> NDArray[numpy.float64]:
+        solver = select_linear_solver(
+            self._linear_solver_type,
+            system.symmetric,
+            sparse=False,
+        )
+
+        a = system.dense()
+        x = numpy.empty_like(system.b)
+        previous = None
+        for week in range(system.week_count):
+            previous = solver.solve(a[week], system.b[week], previous)
+            x[week] = previous
+        return x
+
+
+class BatchedWeeklySolver(WeeklySolver):
+    def solve_weeks(self, system: WeeklySystem) -> NDArray[numpy.float64]:
+        return cast(
+            NDArray[numpy.float64],
+            numpy.linalg.solve(system.dense(), system.b[..., None])[..., 0],
+        )
+
+
+class IncrementalWeeklySolver(WeeklySolver):
+    # The system is factored once and later weeks are solved against that
+    # factorization with a Woodbury update over the rows that changed since.
+    # Once too many rows have changed for the update to pay off, the current
+    # system is factored instead.
+    max_update_fraction: float = 0.1
+
+    def __init__(self) -> None:
+        self._a: Optional[NDArray[numpy.float64]] = None
+        self._lu: Optional[tuple[NDArray[numpy.float64], NDArray[numpy.int32]]] = None
+        self._inverse_columns: dict[int, NDArray[numpy.float64]] = {}
+
+    def solve_weeks(self, system: WeeklySystem) -> NDArray[numpy.float64]:
+        a = system.dense()
+        x = numpy.empty_like(system.b)
+        for week in range(system.week_count):
+            x[week] = self.solve(a[week], system.b[week])
+        return x
+
+    def solve(
+        self,
+        a: NDArray[numpy.float64],
+        b: NDArray[numpy.float64],
+    ) -> NDArray[numpy.float64]:
+        if self._a is not None and self._lu is not None and self._a.shape == a.shape:
+            rows = numpy.flatnonzero(numpy.any(a != self._a, axis=1))
+            if len(rows) == 0:
+                return self._lu_solve(self._lu, b)
+
+            if len(rows) <= self.max_update_fraction * len(b):
+                x = self._update(self._lu, a[rows, :] - self._a[rows, :], rows, b)
+                if self._is_solution(a, b, x):
+                    return x
+
+        self._a = a.copy()
+        self._lu = scipy.linalg.lu_factor(a, check_finite=False)
+        self._inverse_columns.clear()
+        return self._lu_solve(self._lu, b)
+
+    def _update(
+        self,
+        lu: tuple[NDArray[numpy.float64], NDArray[numpy.int32]],
+        v: NDArray[numpy.float64],
+        rows: NDArray[numpy.intp],
+        b: NDArray[numpy.float64],
+    ) -> NDArray[numpy.float64]:
+        new_rows = [row for row in rows if row not in self._inverse_columns]
+        if new_rows:
+            u = numpy.zeros((len(b), len(new_rows)))
+            u[new_rows, numpy.arange(len(new_rows))] = 1.0
+            columns = self._lu_solve(lu, u)
+            for index, row in enumerate(new_rows):
+                self._inverse_columns[row] = columns[:, index]
+
+        z = numpy.column_stack([self._inverse_columns[row] for row in rows])
+        y = self._lu_solve(lu, b)
+        capacitance = numpy.eye(len(rows)) + v @ z
+        return y - z @ numpy.linalg.solve(capacitance, v @ y)
+
+    @staticmethod
+    def _lu_solve(
+        lu: tuple[NDArray[numpy.float64], NDArray[numpy.int32]],
+        b: NDArray[numpy.float64],
+    ) -> NDArray[numpy.float64]:
+        x: NDArray[numpy.float64] = scipy.linalg.lu_solve(lu, b, check_finite=False)
+        return x
+
+    @staticmethod
+    def _is_solution(
+        a: NDArray[numpy.float64],
+        b: NDArray[numpy.float64],
+        x: NDArray[numpy.float64],
+    ) -> bool:
+        residual = numpy.linalg.norm(b - a @ x, numpy.inf)
+        scale = numpy.linalg.norm(a, numpy.inf) * numpy.linalg.norm(
+            x,
+            numpy.inf,
+        ) + numpy.linalg.norm(b, numpy.inf)
+        return bool(residual <= len(b) * sys.float_info.epsilon * scale)
+
+
+class SparseWeeklySolver(WeeklySolver):
+    # Each week is assembled as a sparse matrix and solved with a backend
+    # that works on it, warm-started from the previous week. Instead of the
+    # dense sum-to-zero constraint, one team of each connected group is
+    # pinned to zero and the group is re-centered afterwards.
+    def __init__(
+        self,
+        linear_solver_type: Optional[type[LinearSolver]] = None,
+    ) -> None:
+        self._linear_solver_type = linear_solver_type
+
+    def solve_weeks(self, system: WeeklySystem) -> NDArray[numpy.float64]:
+        solver = select_linear_solver(
+            self._linear_solver_type,
+            system.symmetric,
+            sparse=True,
+        )
+
+        x = numpy.zeros_like(system.b)
+        previous = numpy.zeros(system.n)
+        for week in range(system.week_count):
+            a = system.sparse(week)
+            b = system.b[week]
+
+            if system.components is not None:
+                components = system.components[week]
+                a, b = self._pin(a, b, components)
+                previous = self._center(
+                    solver.solve(a, b, previous),
+                    components,
+                )
+            else:
+                previous = solver.solve(a, b, previous)
+
+            x[week] = previous
+
+        return x
+
+    @staticmethod
+    def _pin(
+        a: scipy.sparse.csr_matrix,
+        b: NDArray[numpy.float64],
+        components: NDArray[numpy.intp],
+    ) -> tuple[scipy.sparse.csr_matrix, NDArray[numpy.float64]]:
+        free = (components != numpy.arange(len(components))).astype(float)
+        keep = scipy.sparse.diags(free, format="csr")
+        a = keep @ a @ keep + scipy.sparse.diags(1.0 - free, format="csr")
+        return a, b * free
+
+    @staticmethod
+    def _center(
+        x: NDArray[numpy.float64],
+        components: NDArray[numpy.intp],
+    ) -> NDArray[numpy.float64]:
+        total = numpy.bincount(components, weights=x, minlength=len(x))
+        count = numpy.bincount(components, minlength=len(x))
+        return x - total[components] / count[components]
+
+
+class AutoWeeklySolver(WeeklySolver):
+    sparse_minimum_size: int = 256
+    sparse_maximum_density: float = 0.05
+
+    def __init__(
+        self,
+        linear_solver_type: Optional[type[LinearSolver]] = None,
+    ) -> None:
+        self._linear_solver_type = linear_solver_type
+
+    def solve_weeks(self, system: WeeklySystem) -> NDArray[numpy.float64]:
+        if (
+            system.n >= self.sparse_minimum_size
+            and system.density <= self.sparse_maximum_density
+        ):
+            return SparseWeeklySolver(self._linear_solver_type).solve_weeks(system)
+        return DirectWeeklySolver(self._linear_solver_type).solve_weeks(system)
@@ -6,6 +6,9 @@ from communication.bus import EventBus
 from fbsrankings.ranking.command.infrastructure.event_handler import (
     EventHandler as BaseEventHandler,
 )
+from fbsrankings.ranking.command.infrastructure.memory.fingerprint import (
+    RankingFingerprintEventHandler,
+)
 from fbsrankings.ranking.command.infrastructure.memory.ranking import (
     GameRankingEventHandler,
 )
@@ -15,6 +18,12 @@ from fbsrankings.ranking.command.infrastructure.memory.ranking import (
 from fbsrankings.ranking.command.infrastructure.memory.record import (
     TeamRecordEventHandler,
 )
+from fbsrankings.ranking.command.infrastructure.memory.season_ranking import (
+    SeasonRankingsEventHandler,
+)
+from fbsrankings.ranking.command.infrastructure.shared.fingerprint import (
+    RankingFingerprintEventManager,
+)
 from fbsrankings.ranking.command.infrastructure.shared.ranking import (
     GameRankingEventManager,
 )
@@ -24,6 +33,9 @@ from fbsrankings.ranking.command.infrastructure.shared.ranking import (
 from fbsrankings.ranking.command.infrastructure.shared.record import (
     TeamRecordEventManager,
 )
+from fbsrankings.ranking.command.infrastructure.shared.season_ranking import (
+    SeasonRankingsEventManager,
+)
 from fbsrankings.storage.memory import Storage
 
 
@@ -41,16 +53,28 @@ class EventHandler(BaseEventHandler):
             GameRankingEventHandler(storage.game_ranking),
             bus,
         )
+        self._season_rankings = SeasonRankingsEventManager(
+            SeasonRankingsEventHandler(storage),
+            bus,
+        )
+        self._ranking_fingerprint = RankingFingerprintEventManager(
+            RankingFingerprintEventHandler(storage.ranking_fingerprint),
+            bus,
+        )
 
     def close(self) -> None:
         self._team_record.close()
         self._team_ranking.close()
         self._game_ranking.close()
+        self._season_rankings.close()
+        self._ranking_fingerprint.close()
 
     def __enter__(self) -> "EventHandler":
         self._team_record.__enter__()
         self._team_ranking.__enter__()
         self._game_ranking.__enter__()
+        self._season_rankings.__enter__()
+        self._ranking_fingerprint.__enter__()
         return self
 
     def __exit__(
@@ -60,6 +84,8 @@ class EventHandler(BaseEventHandler):
         traceback: Optional[TracebackType],
     ) -> Literal[False]:
         self.close()
+        self._ranking_fingerprint.__exit__(type_, value, traceback)
+        self._season_rankings.__exit__(type_, value, traceback)
         self._game_ranking.__exit__(type_, value, traceback)
         self._team_ranking.__exit__(type_, value, traceback)
         self._team_record.__exit__(type_, value, traceback)
@@ -0,0 +1,40 @@
+from typing import Optional
+from uuid import UUID
+
+from communication.bus import EventBus
+from fbsrankings.messages.event import RankingFingerprintCalculatedEvent
+from fbsrankings.ranking.command.domain.model.core import SeasonID
+from fbsrankings.ranking.command.domain.model.fingerprint import RankingFingerprint
+from fbsrankings.ranking.command.domain.model.fingerprint import (
+    RankingFingerprintRepository as BaseRepository,
+)
+from fbsrankings.ranking.command.infrastructure.shared.fingerprint import (
+    RankingFingerprintEventHandler as BaseEventHandler,
+)
+from fbsrankings.storage.memory import RankingFingerprintDto
+from fbsrankings.storage.memory import RankingFingerprintStorage
+
+
+class RankingFingerprintRepository(BaseRepository):
+    def __init__(self, storage: RankingFingerprintStorage, bus: EventBus) -> None:
+        self._storage = storage
+        self._bus = bus
+
+    def find(self, season_id: SeasonID) -> Optional[RankingFingerprint]:
+        dto = self._storage.find(str(season_id))
+        return self._to_fingerprint(dto) if dto is not None else None
+
+    def _to_fingerprint(self, dto: RankingFingerprintDto) -> RankingFingerprint:
+        return RankingFingerprint(
+            self._bus,
+            SeasonID(UUID(dto.season_id)),
+            dto.fingerprint,
+        )
+
+
+class RankingFingerprintEventHandler(BaseEventHandler):
+    def __init__(self, storage: RankingFingerprintStorage) -> None:
+        self._storage = storage
+
+    def handle_calculated(self, event: RankingFingerprintCalculatedEvent) -> None:
+        self._storage.add(RankingFingerprintDto(event.season_id, event.fingerprint))
@@ -1,3 +1,5 @@
+from collections.abc import Iterable
+from collections.abc import Iterator
 from collections.abc import Sequence
 from typing import Callable
 from typing import Generic
@@ -7,9 +9,11 @@ from uuid import UUID
 
 from communication.bus import EventBus
 from fbsrankings.messages.event import GameRankingCalculatedEvent
+from fbsrankings.messages.event import PackedRanking
 from fbsrankings.messages.event import RankingValue as EventValue
 from fbsrankings.messages.event import TeamRankingCalculatedEvent
 from fbsrankings.ranking.command.domain.model.core import GameID
+from fbsrankings.ranking.command.domain.model.core import IdTable
 from fbsrankings.ranking.command.domain.model.core import SeasonID
 from fbsrankings.ranking.command.domain.model.core import TeamID
 from fbsrankings.ranking.command.domain.model.ranking import (
@@ -18,6 +22,7 @@ from fbsrankings.ranking.command.domain.model.ranking import (
 from fbsrankings.ranking.command.domain.model.ranking import Ranking
 from fbsrankings.ranking.command.domain.model.ranking import RankingID
 from fbsrankings.ranking.command.domain.model.ranking import RankingValue
+from fbsrankings.ranking.command.domain.model.ranking import RankingValues
 from fbsrankings.ranking.command.domain.model.ranking import (
     TeamRankingRepository as BaseTeamRankingRepository,
 )
@@ -32,7 +37,7 @@ from fbsrankings.storage.memory import RankingStorage
 from fbsrankings.storage.memory import RankingValueDto
 
 
-T = TypeVar("T", bound=UUID)
+T = TypeVar("T", bound=int)
 
 
 class RankingRepository(Generic[T]):
@@ -40,7 +45,7 @@ class RankingRepository(Generic[T]):
         self,
         storage: RankingStorage,
         bus: EventBus,
-        to_value: Callable[[RankingValueDto], RankingValue[T]],
+        to_value: Callable[[IdTable, RankingValueDto], RankingValue[T]],
     ) -> None:
         self._bus = bus
         self._storage = storage
@@ -60,13 +65,17 @@ class RankingRepository(Generic[T]):
         return self._to_ranking(dto) if dto is not None else None
 
     def _to_ranking(self, dto: RankingDto) -> Ranking[T]:
+        ids = IdTable()
         return Ranking[T](
             self._bus,
             RankingID(UUID(dto.id_)),
             dto.name,
             SeasonID(UUID(dto.season_id)),
             dto.week,
-            [self._to_value(value) for value in dto.values],
+            ids,
+            RankingValues.from_values(
+                self._to_value(ids, value) for value in dto.values
+            ),
         )
 
 
@@ -80,7 +89,7 @@ class RankingEventHandler:
         name: str,
         season_id: str,
         week: Optional[int],
-        values: Sequence[EventValue],
+        values: Iterable[tuple[str, int, int, float]],
     ) -> None:
         self._storage.add(
             RankingDto(
@@ -89,17 +98,31 @@ class RankingEventHandler:
                 season_id,
                 week,
                 [
-                    RankingValueDto(
-                        value.id,
-                        value.order,
-                        value.rank,
-                        value.value,
-                    )
-                    for value in values
+                    RankingValueDto(id_, order, rank, value)
+                    for id_, order, rank, value in values
                 ],
             ),
         )
 
+    def handle_packed(
+        self,
+        season_id: str,
+        ids: Sequence[str],
+        ranking: PackedRanking,
+    ) -> None:
+        self.handle_calculated(
+            ranking.ranking_id,
+            ranking.name,
+            season_id,
+            ranking.week if ranking.HasField("week") else None,
+            zip(
+                [ids[id_] for id_ in ranking.ids],
+                ranking.orders,
+                ranking.ranks,
+                ranking.values,
+            ),
+        )
+
 
 class TeamRankingRepository(BaseTeamRankingRepository):
     def __init__(self, storage: RankingStorage, bus: EventBus) -> None:
@@ -117,9 +140,9 @@ class TeamRankingRepository(BaseTeamRankingRepository):
         return self._repository.find(name, season_id, week)
 
     @staticmethod
-    def _to_value(dto: RankingValueDto) -> RankingValue[TeamID]:
+    def _to_value(ids: IdTable, dto: RankingValueDto) -> RankingValue[TeamID]:
         return RankingValue[TeamID](
-            TeamID(UUID(dto.id_)),
+            TeamID(ids.intern(dto.id_)),
             dto.order,
             dto.rank,
             dto.value,
@@ -139,9 +162,17 @@ class TeamRankingEventHandler(BaseTeamRankingEventHandler):
             event.name,
             event.season_id,
             event.week if event.HasField("week") else None,
-            event.values,
+            _values(event.values),
         )
 
+    def handle_packed(
+        self,
+        season_id: str,
+        ids: Sequence[str],
+        ranking: PackedRanking,
+    ) -> None:
+        self._event_handler.handle_packed(season_id, ids, ranking)
+
 
 class GameRankingRepository(BaseGameRankingRepository):
     def __init__(self, storage: RankingStorage, bus: EventBus) -> None:
@@ -159,9 +190,9 @@ class GameRankingRepository(BaseGameRankingRepository):
         return self._repository.find(name, season_id, week)
 
     @staticmethod
-    def _to_value(dto: RankingValueDto) -> RankingValue[GameID]:
+    def _to_value(ids: IdTable, dto: RankingValueDto) -> RankingValue[GameID]:
         return RankingValue[GameID](
-            GameID(UUID(dto.id_)),
+            GameID(ids.intern(dto.id_)),
             dto.order,
             dto.rank,
             dto.value,
@@ -181,5 +212,18 @@ class GameRankingEventHandler(BaseGameRankingEventHandler):
             event.name,
             event.season_id,
             event.week if event.HasField("week") else None,
-            event.values,
+            _values(event.values),
         )
+
+    def handle_packed(
+        self,
+        season_id: str,
+        ids: Sequence[str],
+        ranking: PackedRanking,
+    ) -> None:
+        self._event_handler.handle_packed(season_id, ids, ranking)
+
+
+def _values(values: Iterable[EventValue]) -> Iterator[tuple[str, int, int, float]]:
+    for value in values:
+        yield value.id, value.order, value.rank, value.value
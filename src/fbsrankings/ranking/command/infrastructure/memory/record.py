@@ -1,8 +1,11 @@
+from collections.abc import Sequence
 from typing import Optional
 from uuid import UUID
 
 from communication.bus import EventBus
+from fbsrankings.messages.event import PackedTeamRecord
 from fbsrankings.messages.event import TeamRecordCalculatedEvent
+from fbsrankings.ranking.command.domain.model.core import IdTable
 from fbsrankings.ranking.command.domain.model.core import SeasonID
 from fbsrankings.ranking.command.domain.model.core import TeamID
 from fbsrankings.ranking.command.domain.model.record import TeamRecord
@@ -33,17 +36,19 @@ class TeamRecordRepository(BaseRepository):
         return self._to_record(dto) if dto is not None else None
 
     def _to_record(self, dto: TeamRecordDto) -> TeamRecord:
+        ids = IdTable()
         return TeamRecord(
             self._bus,
             TeamRecordID(UUID(dto.id_)),
             SeasonID(UUID(dto.season_id)),
             dto.week,
-            [self._to_value(value) for value in dto.values],
+            ids,
+            [self._to_value(ids, value) for value in dto.values],
         )
 
     @staticmethod
-    def _to_value(dto: TeamRecordValueDto) -> TeamRecordValue:
-        return TeamRecordValue(TeamID(UUID(dto.team_id)), dto.wins, dto.losses)
+    def _to_value(ids: IdTable, dto: TeamRecordValueDto) -> TeamRecordValue:
+        return TeamRecordValue(TeamID(ids.intern(dto.team_id)), dto.wins, dto.losses)
 
 
 class TeamRecordEventHandler(BaseEventHandler):
@@ -62,3 +67,25 @@ class TeamRecordEventHandler(BaseEventHandler):
                 ],
             ),
         )
+
+    def handle_packed(
+        self,
+        season_id: str,
+        team_ids: Sequence[str],
+        record: PackedTeamRecord,
+    ) -> None:
+        self._storage.add(
+            TeamRecordDto(
+                record.record_id,
+                season_id,
+                record.week if record.HasField("week") else None,
+                [
+                    TeamRecordValueDto(team_ids[team], wins, losses)
+                    for team, wins, losses in zip(
+                        record.teams,
+                        record.wins,
+                        record.losses,
+                    )
+                ],
+            ),
+        )
@@ -2,6 +2,9 @@ from communication.bus import EventBus
 from fbsrankings.ranking.command.domain.model.repository import (
     Repository as BaseRepository,
 )
+from fbsrankings.ranking.command.infrastructure.memory.fingerprint import (
+    RankingFingerprintRepository,
+)
 from fbsrankings.ranking.command.infrastructure.memory.ranking import (
     GameRankingRepository,
 )
@@ -21,6 +24,10 @@ class Repository(BaseRepository):
         self._team_record = TeamRecordRepository(storage.team_record, self._bus)
         self._team_ranking = TeamRankingRepository(storage.team_ranking, self._bus)
         self._game_ranking = GameRankingRepository(storage.game_ranking, self._bus)
+        self._ranking_fingerprint = RankingFingerprintRepository(
+            storage.ranking_fingerprint,
+            self._bus,
+        )
 
     @property
     def team_record(self) -> TeamRecordRepository:
@@ -33,3 +40,7 @@ class Repository(BaseRepository):
     @property
     def game_ranking(self) -> GameRankingRepository:
         return self._game_ranking
+
+    @property
+    def ranking_fingerprint(self) -> RankingFingerprintRepository:
+        return self._ranking_fingerprint
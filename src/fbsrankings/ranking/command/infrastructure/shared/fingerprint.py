@@ -0,0 +1,44 @@
+from abc import ABCMeta
+from abc import abstractmethod
+from types import TracebackType
+from typing import ContextManager
+from typing import Literal
+from typing import Optional
+
+from communication.bus import EventBus
+from fbsrankings.messages.event import RankingFingerprintCalculatedEvent
+
+
+class RankingFingerprintEventHandler(metaclass=ABCMeta):
+    @abstractmethod
+    def handle_calculated(self, event: RankingFingerprintCalculatedEvent) -> None:
+        raise NotImplementedError
+
+
+class RankingFingerprintEventManager(ContextManager["RankingFingerprintEventManager"]):
+    def __init__(self, handler: RankingFingerprintEventHandler, bus: EventBus) -> None:
+        self._handler = handler
+        self._bus = bus
+
+        self._bus.register_handler(
+            RankingFingerprintCalculatedEvent,
+            self._handler.handle_calculated,
+        )
+
+    def close(self) -> None:
+        self._bus.unregister_handler(
+            RankingFingerprintCalculatedEvent,
+            self._handler.handle_calculated,
+        )
+
+    def __enter__(self) -> "RankingFingerprintEventManager":
+        return self
+
+    def __exit__(
+        self,
+        type_: Optional[type[BaseException]],
+        value: Optional[BaseException],
+        traceback: Optional[TracebackType],
+    ) -> Literal[False]:
+        self.close()
+        return False
@@ -0,0 +1,44 @@
+from abc import ABCMeta
+from abc import abstractmethod
+from types import TracebackType
+from typing import ContextManager
+from typing import Literal
+from typing import Optional
+
+from communication.bus import EventBus
+from fbsrankings.messages.event import SeasonRankingsCalculatedEvent
+
+
+class SeasonRankingsEventHandler(metaclass=ABCMeta):
+    @abstractmethod
+    def handle_calculated(self, event: SeasonRankingsCalculatedEvent) -> None:
+        raise NotImplementedError
+
+
+class SeasonRankingsEventManager(ContextManager["SeasonRankingsEventManager"]):
+    def __init__(self, handler: SeasonRankingsEventHandler, bus: EventBus) -> None:
+        self._handler = handler
+        self._bus = bus
+
+        self._bus.register_handler(
+            SeasonRankingsCalculatedEvent,
+            self._handler.handle_calculated,
+        )
+
+    def close(self) -> None:
+        self._bus.unregister_handler(
+            SeasonRankingsCalculatedEvent,
+            self._handler.handle_calculated,
+        )
+
+    def __enter__(self) -> "SeasonRankingsEventManager":
+        return self
+
+    def __exit__(
+        self,
+        type_: Optional[type[BaseException]],
+        value: Optional[BaseException],
+        traceback: Optional[TracebackType],
+    ) -> Literal[False]:
+        self.close()
+        return False
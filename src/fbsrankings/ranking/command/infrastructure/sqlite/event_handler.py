@@ -7,6 +7,9 @@ from communication.bus import EventBus
 from fbsrankings.ranking.command.infrastructure.event_handler import (
     EventHandler as BaseEventHandler,
 )
+from fbsrankings.ranking.command.infrastructure.shared.fingerprint import (
+    RankingFingerprintEventManager,
+)
 from fbsrankings.ranking.command.infrastructure.shared.ranking import (
     GameRankingEventManager,
 )
@@ -16,6 +19,12 @@ from fbsrankings.ranking.command.infrastructure.shared.ranking import (
 from fbsrankings.ranking.command.infrastructure.shared.record import (
     TeamRecordEventManager,
 )
+from fbsrankings.ranking.command.infrastructure.shared.season_ranking import (
+    SeasonRankingsEventManager,
+)
+from fbsrankings.ranking.command.infrastructure.sqlite.fingerprint import (
+    RankingFingerprintEventHandler,
+)
 from fbsrankings.ranking.command.infrastructure.sqlite.ranking import (
     GameRankingEventHandler,
 )
@@ -25,6 +34,9 @@ from fbsrankings.ranking.command.infrastructure.sqlite.ranking import (
 from fbsrankings.ranking.command.infrastructure.sqlite.record import (
     TeamRecordEventHandler,
 )
+from fbsrankings.ranking.command.infrastructure.sqlite.season_ranking import (
+    SeasonRankingsEventHandler,
+)
 from fbsrankings.storage.sqlite import Storage
 
 
@@ -45,11 +57,21 @@ class EventHandler(BaseEventHandler):
             GameRankingEventHandler(self._cursor),
             bus,
         )
+        self._season_rankings = SeasonRankingsEventManager(
+            SeasonRankingsEventHandler(self._cursor),
+            bus,
+        )
+        self._ranking_fingerprint = RankingFingerprintEventManager(
+            RankingFingerprintEventHandler(self._cursor),
+            bus,
+        )
 
     def close(self) -> None:
         self._team_record.close()
         self._team_ranking.close()
         self._game_ranking.close()
+        self._season_rankings.close()
+        self._ranking_fingerprint.close()
 
         try:
             self._cursor.execute("commit")
@@ -61,6 +83,8 @@ class EventHandler(BaseEventHandler):
         self._team_record.__enter__()
         self._team_ranking.__enter__()
         self._game_ranking.__enter__()
+        self._season_rankings.__enter__()
+        self._ranking_fingerprint.__enter__()
         return self
 
     def __exit__(
@@ -70,6 +94,8 @@ class EventHandler(BaseEventHandler):
         traceback: Optional[TracebackType],
     ) -> Literal[False]:
         self.close()
+        self._ranking_fingerprint.__exit__(type_, value, traceback)
+        self._season_rankings.__exit__(type_, value, traceback)
         self._game_ranking.__exit__(type_, value, traceback)
         self._team_ranking.__exit__(type_, value, traceback)
         self._team_record.__exit__(type_, value, traceback)
@@ -0,0 +1,50 @@
+import sqlite3
+from typing import Optional
+from uuid import UUID
+
+from communication.bus import EventBus
+from fbsrankings.messages.event import RankingFingerprintCalculatedEvent
+from fbsrankings.ranking.command.domain.model.core import SeasonID
+from fbsrankings.ranking.command.domain.model.fingerprint import RankingFingerprint
+from fbsrankings.ranking.command.domain.model.fingerprint import (
+    RankingFingerprintRepository as BaseRepository,
+)
+from fbsrankings.ranking.command.infrastructure.shared.fingerprint import (
+    RankingFingerprintEventHandler as BaseEventHandler,
+)
+from fbsrankings.storage.sqlite import RankingFingerprintTable
+
+
+class RankingFingerprintRepository(BaseRepository):
+    def __init__(self, connection: sqlite3.Connection, bus: EventBus) -> None:
+        self._connection = connection
+        self._table = RankingFingerprintTable().table
+        self._bus = bus
+
+    def find(self, season_id: SeasonID) -> Optional[RankingFingerprint]:
+        cursor = self._connection.cursor()
+        cursor.execute(
+            f"SELECT SeasonID, Fingerprint FROM {self._table} WHERE SeasonID = ?;",
+            [str(season_id)],
+        )
+        row = cursor.fetchone()
+        cursor.close()
+
+        return self._to_fingerprint(row) if row is not None else None
+
+    def _to_fingerprint(self, row: tuple[str, str]) -> RankingFingerprint:
+        return RankingFingerprint(self._bus, SeasonID(UUID(row[0])), row[1])
+
+
+class RankingFingerprintEventHandler(BaseEventHandler):
+    def __init__(self, cursor: sqlite3.Cursor) -> None:
+        self._cursor = cursor
+        self._table = RankingFingerprintTable().table
+
+    def handle_calculated(self, event: RankingFingerprintCalculatedEvent) -> None:
+        self._cursor.execute(
+            f"INSERT OR REPLACE INTO {self._table} "
+            "(SeasonID, Fingerprint) "
+            "VALUES (?,?);",
+            [event.season_id, event.fingerprint],
+        )
@@ -1,4 +1,6 @@
 import sqlite3
+from collections.abc import Iterable
+from collections.abc import Iterator
 from collections.abc import Sequence
 from typing import Callable
 from typing import Generic
@@ -9,9 +11,11 @@ from uuid import UUID
 
 from communication.bus import EventBus
 from fbsrankings.messages.event import GameRankingCalculatedEvent
+from fbsrankings.messages.event import PackedRanking
 from fbsrankings.messages.event import RankingValue as EventValue
 from fbsrankings.messages.event import TeamRankingCalculatedEvent
 from fbsrankings.ranking.command.domain.model.core import GameID
+from fbsrankings.ranking.command.domain.model.core import IdTable
 from fbsrankings.ranking.command.domain.model.core import SeasonID
 from fbsrankings.ranking.command.domain.model.core import TeamID
 from fbsrankings.ranking.command.domain.model.ranking import (
@@ -20,6 +24,7 @@ from fbsrankings.ranking.command.domain.model.ranking import (
 from fbsrankings.ranking.command.domain.model.ranking import Ranking
 from fbsrankings.ranking.command.domain.model.ranking import RankingID
 from fbsrankings.ranking.command.domain.model.ranking import RankingValue
+from fbsrankings.ranking.command.domain.model.ranking import RankingValues
 from fbsrankings.ranking.command.domain.model.ranking import (
     TeamRankingRepository as BaseTeamRankingRepository,
 )
@@ -35,7 +40,7 @@ from fbsrankings.storage.sqlite import RankingType
 from fbsrankings.storage.sqlite import TeamRankingValueTable
 
 
-T = TypeVar("T", bound=UUID)
+T = TypeVar("T", bound=int)
 
 
 SqliteParam = Union[None, int, float, str, bytes]
@@ -49,7 +54,10 @@ class RankingRepository(Generic[T]):
         value_table: str,
         value_columns: list[str],
         type_: RankingType,
-        to_value: Callable[[tuple[str, str, int, int, float]], RankingValue[T]],
+        to_value: Callable[
+            [IdTable, tuple[str, str, int, int, float]],
+            RankingValue[T],
+        ],
     ) -> None:
         self._bus = bus
         self._connection = connection
@@ -114,7 +122,8 @@ class RankingRepository(Generic[T]):
         rows = cursor.fetchall()
         cursor.close()
 
-        values = [self._to_value(row) for row in rows if row is not None]
+        ids = IdTable()
+        values = [self._to_value(ids, row) for row in rows if row is not None]
 
         return Ranking[T](
             self._bus,
@@ -122,7 +131,8 @@ class RankingRepository(Generic[T]):
             row[1],
             SeasonID(UUID(row[3])),
             row[4],
-            values,
+            ids,
+            RankingValues.from_values(values),
         )
 
 
@@ -146,7 +156,7 @@ class RankingEventHandler:
         name: str,
         season_id: str,
         week: Optional[int],
-        values: Sequence[EventValue],
+        values: Iterable[tuple[str, int, int, float]],
     ) -> None:
         query = (
             "SELECT UUID "
@@ -190,17 +200,32 @@ class RankingEventHandler:
             "(" + ", ".join(self._value_columns) + ") "
             "VALUES (?,?,?,?,?)"
         )
-        for value in values:
-            self._cursor.execute(
-                insert_sql,
-                [
-                    ranking_id,
-                    value.id,
-                    value.order,
-                    value.rank,
-                    value.value,
-                ],
-            )
+        self._cursor.executemany(
+            insert_sql,
+            (
+                (ranking_id, id_, order, rank, value)
+                for id_, order, rank, value in values
+            ),
+        )
+
+    def handle_packed(
+        self,
+        season_id: str,
+        ids: Sequence[str],
+        ranking: PackedRanking,
+    ) -> None:
+        self.handle_calculated(
+            ranking.ranking_id,
+            ranking.name,
+            season_id,
+            ranking.week if ranking.HasField("week") else None,
+            zip(
+                [ids[id_] for id_ in ranking.ids],
+                ranking.orders,
+                ranking.ranks,
+                ranking.values,
+            ),
+        )
 
 
 class TeamRankingRepository(BaseTeamRankingRepository):
@@ -234,8 +259,11 @@ class TeamRankingRepository(BaseTeamRankingRepository):
         return self._repository.find(name, season_id, week)
 
     @staticmethod
-    def _to_value(row: tuple[str, str, int, int, float]) -> RankingValue[TeamID]:
-        return RankingValue[TeamID](TeamID(UUID(row[1])), row[2], row[3], row[4])
+    def _to_value(
+        ids: IdTable,
+        row: tuple[str, str, int, int, float],
+    ) -> RankingValue[TeamID]:
+        return RankingValue[TeamID](TeamID(ids.intern(row[1])), row[2], row[3], row[4])
 
 
 class TeamRankingEventHandler(BaseTeamRankingEventHandler):
@@ -261,9 +289,17 @@ class TeamRankingEventHandler(BaseTeamRankingEventHandler):
             event.name,
             event.season_id,
             event.week if event.HasField("week") else None,
-            event.values,
+            _values(event.values),
         )
 
+    def handle_packed(
+        self,
+        season_id: str,
+        ids: Sequence[str],
+        ranking: PackedRanking,
+    ) -> None:
+        self._event_handler.handle_packed(season_id, ids, ranking)
+
 
 class GameRankingRepository(BaseGameRankingRepository):
     def __init__(self, connection: sqlite3.Connection, bus: EventBus) -> None:
@@ -296,8 +332,11 @@ class GameRankingRepository(BaseGameRankingRepository):
         return self._repository.find(name, season_id, week)
 
     @staticmethod
-    def _to_value(row: tuple[str, str, int, int, float]) -> RankingValue[GameID]:
-        return RankingValue[GameID](GameID(UUID(row[1])), row[2], row[3], row[4])
+    def _to_value(
+        ids: IdTable,
+        row: tuple[str, str, int, int, float],
+    ) -> RankingValue[GameID]:
+        return RankingValue[GameID](GameID(ids.intern(row[1])), row[2], row[3], row[4])
 
 
 class GameRankingEventHandler(BaseGameRankingEventHandler):
@@ -323,5 +362,18 @@ class GameRankingEventHandler(BaseGameRankingEventHandler):
             event.name,
             event.season_id,
             event.week if event.HasField("week") else None,
-            event.values,
+            _values(event.values),
         )
+
+    def handle_packed(
+        self,
+        season_id: str,
+        ids: Sequence[str],
+        ranking: PackedRanking,
+    ) -> None:
+        self._event_handler.handle_packed(season_id, ids, ranking)
+
+
+def _values(values: Iterable[EventValue]) -> Iterator[tuple[str, int, int, float]]:
+    for value in values:
+        yield value.id, value.order, value.rank, value.value
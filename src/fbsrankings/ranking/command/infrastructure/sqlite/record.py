@@ -1,10 +1,14 @@
 import sqlite3
+from collections.abc import Iterable
+from collections.abc import Sequence
 from typing import Optional
 from typing import Union
 from uuid import UUID
 
 from communication.bus import EventBus
+from fbsrankings.messages.event import PackedTeamRecord
 from fbsrankings.messages.event import TeamRecordCalculatedEvent
+from fbsrankings.ranking.command.domain.model.core import IdTable
 from fbsrankings.ranking.command.domain.model.core import SeasonID
 from fbsrankings.ranking.command.domain.model.core import TeamID
 from fbsrankings.ranking.command.domain.model.record import TeamRecord
@@ -76,19 +80,21 @@ class TeamRecordRepository(BaseRepository):
         rows = cursor.fetchall()
         cursor.close()
 
-        values = [self._to_value(row) for row in rows if row is not None]
+        ids = IdTable()
+        values = [self._to_value(ids, row) for row in rows if row is not None]
 
         return TeamRecord(
             self._bus,
             TeamRecordID(UUID(row[0])),
             SeasonID(UUID(row[1])),
             row[2],
+            ids,
             values,
         )
 
     @staticmethod
-    def _to_value(row: tuple[str, str, int, int]) -> TeamRecordValue:
-        return TeamRecordValue(TeamID(UUID(row[1])), row[2], row[3])
+    def _to_value(ids: IdTable, row: tuple[str, str, int, int]) -> TeamRecordValue:
+        return TeamRecordValue(TeamID(ids.intern(row[1])), row[2], row[3])
 
 
 class TeamRecordEventHandler(BaseEventHandler):
@@ -98,12 +104,43 @@ class TeamRecordEventHandler(BaseEventHandler):
         self._value_table = TeamRecordValueTable().table
 
     def handle_calculated(self, event: TeamRecordCalculatedEvent) -> None:
+        self._add(
+            event.record_id,
+            event.season_id,
+            event.week if event.HasField("week") else None,
+            ((value.team_id, value.wins, value.losses) for value in event.values),
+        )
+
+    def handle_packed(
+        self,
+        season_id: str,
+        team_ids: Sequence[str],
+        record: PackedTeamRecord,
+    ) -> None:
+        self._add(
+            record.record_id,
+            season_id,
+            record.week if record.HasField("week") else None,
+            zip(
+                [team_ids[team] for team in record.teams],
+                record.wins,
+                record.losses,
+            ),
+        )
+
+    def _add(
+        self,
+        record_id: str,
+        season_id: str,
+        week: Optional[int],
+        values: Iterable[tuple[str, int, int]],
+    ) -> None:
         query = f"SELECT UUID FROM {self._record_table} WHERE SeasonID = ?"
-        params: list[SqliteParam] = [event.season_id]
+        params: list[SqliteParam] = [season_id]
 
-        if event.HasField("week"):
+        if week is not None:
             query += " AND Week = ?;"
-            params.append(event.week)
+            params.append(week)
         else:
             query += " AND Week IS NULL;"
 
@@ -123,19 +160,14 @@ class TeamRecordEventHandler(BaseEventHandler):
             f"INSERT INTO {self._record_table} "
             "(UUID, SeasonID, Week) "
             "VALUES (?,?,?);",
-            [
-                event.record_id,
-                event.season_id,
-                event.week if event.HasField("week") else None,
-            ],
+            [record_id, season_id, week],
         )
         insert_sql = (
             f"INSERT INTO {self._value_table} "
             "(TeamRecordID, TeamID, Wins, Losses) "
             "VALUES (?,?,?,?);"
         )
-        for value in event.values:
-            self._cursor.execute(
-                insert_sql,
-                [event.record_id, value.team_id, value.wins, value.losses],
-            )
+        self._cursor.executemany(
+            insert_sql,
+            ((record_id, team_id, wins, losses) for team_id, wins, losses in values),
+        )
@@ -2,6 +2,9 @@ from communication.bus import EventBus
 from fbsrankings.ranking.command.domain.model.repository import (
     Repository as BaseRepository,
 )
+from fbsrankings.ranking.command.infrastructure.sqlite.fingerprint import (
+    RankingFingerprintRepository,
+)
 from fbsrankings.ranking.command.infrastructure.sqlite.ranking import (
     GameRankingRepository,
 )
@@ -19,6 +22,10 @@ class Repository(BaseRepository):
         self._team_record = TeamRecordRepository(storage.connection, bus)
         self._team_ranking = TeamRankingRepository(storage.connection, bus)
         self._game_ranking = GameRankingRepository(storage.connection, bus)
+        self._ranking_fingerprint = RankingFingerprintRepository(
+            storage.connection,
+            bus,
+        )
 
     @property
     def team_record(self) -> TeamRecordRepository:
@@ -31,3 +38,7 @@ class Repository(BaseRepository):
     @property
     def game_ranking(self) -> GameRankingRepository:
         return self._game_ranking
+
+    @property
+    def ranking_fingerprint(self) -> RankingFingerprintRepository:
+        return self._ranking_fingerprint
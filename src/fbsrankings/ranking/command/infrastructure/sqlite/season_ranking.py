@@ -0,0 +1,33 @@
+import sqlite3
+
+from fbsrankings.messages.convert import bytes_to_ids
+from fbsrankings.messages.event import SeasonRankingsCalculatedEvent
+from fbsrankings.ranking.command.infrastructure.shared.season_ranking import (
+    SeasonRankingsEventHandler as BaseEventHandler,
+)
+from fbsrankings.ranking.command.infrastructure.sqlite.ranking import (
+    GameRankingEventHandler,
+)
+from fbsrankings.ranking.command.infrastructure.sqlite.ranking import (
+    TeamRankingEventHandler,
+)
+from fbsrankings.ranking.command.infrastructure.sqlite.record import (
+    TeamRecordEventHandler,
+)
+
+
+class SeasonRankingsEventHandler(BaseEventHandler):
+    def __init__(self, cursor: sqlite3.Cursor) -> None:
+        self._team_record = TeamRecordEventHandler(cursor)
+        self._team_ranking = TeamRankingEventHandler(cursor)
+        self._game_ranking = GameRankingEventHandler(cursor)
+
+    def handle_calculated(self, event: SeasonRankingsCalculatedEvent) -> None:
+        team_ids = bytes_to_ids(event.team_ids)
+        game_ids = bytes_to_ids(event.game_ids)
+        for record in event.team_records:
+            self._team_record.handle_packed(event.season_id, team_ids, record)
+        for ranking in event.team_rankings:
+            self._team_ranking.handle_packed(event.season_id, team_ids, ranking)
+        for ranking in event.game_rankings:
+            self._game_ranking.handle_packed(event.season_id, game_ids, ranking)
@@ -0,0 +1,61 @@
+from typing import Optional
+from uuid import uuid4
+
+from communication.bus import EventBus
+from communication.messages import Event
+from fbsrankings.messages.event import RankingFingerprintCalculatedEvent
+from fbsrankings.ranking.command.domain.model.core import SeasonID
+from fbsrankings.ranking.command.domain.model.fingerprint import RankingFingerprint
+from fbsrankings.ranking.command.domain.model.fingerprint import (
+    RankingFingerprintRepository as BaseRepository,
+)
+from fbsrankings.ranking.command.infrastructure.memory.fingerprint import (
+    RankingFingerprintRepository as MemoryRepository,
+)
+from fbsrankings.ranking.command.infrastructure.shared.fingerprint import (
+    RankingFingerprintEventHandler as BaseEventHandler,
+)
+
+
+class RankingFingerprintRepository(BaseRepository):
+    def __init__(
+        self,
+        repository: BaseRepository,
+        cache: MemoryRepository,
+        cache_bus: EventBus,
+    ) -> None:
+        self._repository = repository
+        self._cache = cache
+        self._cache_bus = cache_bus
+
+    def find(self, season_id: SeasonID) -> Optional[RankingFingerprint]:
+        fingerprint = self._cache.find(season_id)
+        if fingerprint is None:
+            fingerprint = self._repository.find(season_id)
+            if fingerprint is not None:
+                self._cache_bus.publish(_created_event(fingerprint))
+        return fingerprint
+
+
+def _created_event(
+    fingerprint: RankingFingerprint,
+) -> RankingFingerprintCalculatedEvent:
+    return RankingFingerprintCalculatedEvent(
+        event_id=str(uuid4()),
+        season_id=str(fingerprint.season_id),
+        fingerprint=fingerprint.value,
+    )
+
+
+class RankingFingerprintEventHandler(BaseEventHandler):
+    def __init__(
+        self,
+        events: list[Event],
+        cache_bus: EventBus,
+    ) -> None:
+        self._events = events
+        self._cache_bus = cache_bus
+
+    def handle_calculated(self, event: RankingFingerprintCalculatedEvent) -> None:
+        self._events.append(event)
+        self._cache_bus.publish(event)
@@ -73,7 +73,7 @@ def _team_created_event(ranking: Ranking[TeamID]) -> TeamRankingCalculatedEvent:
         week=ranking.week,
         values=[
             EventValue(
-                id=str(value.id_),
+                id=ranking.ids[value.id_],
                 order=value.order,
                 rank=value.rank,
                 value=value.value,
@@ -139,7 +139,7 @@ def _game_created_event(ranking: Ranking[GameID]) -> GameRankingCalculatedEvent:
         week=ranking.week,
         values=[
             EventValue(
-                id=str(value.id_),
+                id=ranking.ids[value.id_],
                 order=value.order,
                 rank=value.rank,
                 value=value.value,
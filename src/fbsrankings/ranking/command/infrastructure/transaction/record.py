@@ -55,7 +55,7 @@ def _created_event(record: TeamRecord) -> TeamRecordCalculatedEvent:
         week=record.week,
         values=[
             EventValue(
-                team_id=str(value.team_id),
+                team_id=record.ids[value.team_id],
                 wins=value.wins,
                 losses=value.losses,
                 games=value.games,
@@ -1,4 +1,7 @@
 from communication.bus import EventBus
+from fbsrankings.ranking.command.domain.model.fingerprint import (
+    RankingFingerprintRepository,
+)
 from fbsrankings.ranking.command.domain.model.ranking import GameRankingRepository
 from fbsrankings.ranking.command.domain.model.ranking import TeamRankingRepository
 from fbsrankings.ranking.command.domain.model.record import TeamRecordRepository
@@ -8,6 +11,9 @@ from fbsrankings.ranking.command.domain.model.repository import (
 from fbsrankings.ranking.command.infrastructure.memory.repository import (
     Repository as MemoryRepository,
 )
+from fbsrankings.ranking.command.infrastructure.transaction.fingerprint import (
+    RankingFingerprintRepository as TransactionRankingFingerprintRepository,
+)
 from fbsrankings.ranking.command.infrastructure.transaction.ranking import (
     GameRankingRepository as TransactionGameRankingRepository,
 )
@@ -41,6 +47,11 @@ class Repository(BaseRepository):
             cache.game_ranking,
             storage_bus,
         )
+        self._ranking_fingerprint = TransactionRankingFingerprintRepository(
+            repository.ranking_fingerprint,
+            cache.ranking_fingerprint,
+            storage_bus,
+        )
 
     @property
     def team_record(self) -> TeamRecordRepository:
@@ -53,3 +64,7 @@ class Repository(BaseRepository):
     @property
     def game_ranking(self) -> GameRankingRepository:
         return self._game_ranking
+
+    @property
+    def ranking_fingerprint(self) -> RankingFingerprintRepository:
+        return self._ranking_fingerprint
@@ -0,0 +1,20 @@
+from communication.bus import EventBus
+from communication.messages import Event
+from fbsrankings.messages.event import SeasonRankingsCalculatedEvent
+from fbsrankings.ranking.command.infrastructure.shared.season_ranking import (
+    SeasonRankingsEventHandler as BaseEventHandler,
+)
+
+
+class SeasonRankingsEventHandler(BaseEventHandler):
+    def __init__(
+        self,
+        events: list[Event],
+        cache_bus: EventBus,
+    ) -> None:
+        self._events = events
+        self._cache_bus = cache_bus
+
+    def handle_calculated(self, event: SeasonRankingsCalculatedEvent) -> None:
+        self._events.append(event)
+        self._cache_bus.publish(event)
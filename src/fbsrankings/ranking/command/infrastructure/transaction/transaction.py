@@ -5,6 +5,7 @@ from typing import Optional
 
 from communication.bus import EventBus
 from communication.bus import MemoryEventBus
+from communication.messages import Event
 from fbsrankings.ranking.command.domain.model.factory import Factory
 from fbsrankings.ranking.command.domain.model.repository import Repository
 from fbsrankings.ranking.command.infrastructure.data_source import DataSource
@@ -52,6 +53,9 @@ class Transaction(ContextManager["Transaction"]):
     def repository(self) -> Repository:
         return self._repository
 
+    def publish(self, event: Event) -> None:
+        self._inner_bus.publish(event)
+
     def commit(self) -> None:
         storage_bus = MemoryEventBus()
         with self._data_source.event_handler(storage_bus) as event_handler:
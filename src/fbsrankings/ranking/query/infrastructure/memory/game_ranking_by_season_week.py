@@ -1,8 +1,8 @@
-from fbsrankings.messages.convert import date_to_timestamp
+from fbsrankings.messages.packed import GameRankingRow
+from fbsrankings.messages.packed import pack_game_ranking_values
 from fbsrankings.messages.query import GameRankingBySeasonWeekQuery
 from fbsrankings.messages.query import GameRankingBySeasonWeekResult
 from fbsrankings.messages.query import GameRankingBySeasonWeekValue
-from fbsrankings.messages.query import GameRankingValueBySeasonWeekResult
 from fbsrankings.storage.memory import Storage
 
 
@@ -22,7 +22,7 @@ class GameRankingBySeasonWeekQueryHandler:
         if ranking is not None:
             season = self._storage.season.get(ranking.season_id)
             if season is not None:
-                values = []
+                values: list[GameRankingRow] = []
                 for value in ranking.values:
                     game = self._storage.game.get(value.id_)
 
@@ -32,24 +32,22 @@ class GameRankingBySeasonWeekQueryHandler:
 
                         if home_team is not None and away_team is not None:
                             values.append(
-                                GameRankingValueBySeasonWeekResult(
-                                    game_id=str(game.id_),
-                                    season_id=str(game.season_id),
-                                    year=season.year,
-                                    week=game.week,
-                                    date=date_to_timestamp(game.date),
-                                    season_section=game.season_section,
-                                    home_team_id=str(game.home_team_id),
-                                    home_team_name=home_team.name,
-                                    away_team_id=str(game.away_team_id),
-                                    away_team_name=away_team.name,
-                                    home_team_score=game.home_team_score,
-                                    away_team_score=game.away_team_score,
-                                    status=game.status,
-                                    notes=game.notes,
-                                    order=value.order,
-                                    rank=value.rank,
-                                    value=value.value,
+                                (
+                                    str(game.id_),
+                                    game.week,
+                                    game.date,
+                                    game.season_section,
+                                    str(game.home_team_id),
+                                    home_team.name,
+                                    str(game.away_team_id),
+                                    away_team.name,
+                                    game.home_team_score,
+                                    game.away_team_score,
+                                    game.status,
+                                    game.notes,
+                                    value.order,
+                                    value.rank,
+                                    value.value,
                                 ),
                             )
 
@@ -61,7 +59,7 @@ class GameRankingBySeasonWeekQueryHandler:
                         season_id=str(ranking.season_id),
                         year=season.year,
                         week=ranking.week,
-                        values=values,
+                        packed_values=pack_game_ranking_values(values),
                     ),
                 )
 
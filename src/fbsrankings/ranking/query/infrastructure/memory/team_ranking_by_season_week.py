@@ -1,7 +1,8 @@
+from fbsrankings.messages.packed import pack_team_ranking_values
+from fbsrankings.messages.packed import TeamRankingRow
 from fbsrankings.messages.query import TeamRankingBySeasonWeekQuery
 from fbsrankings.messages.query import TeamRankingBySeasonWeekResult
 from fbsrankings.messages.query import TeamRankingBySeasonWeekValue
-from fbsrankings.messages.query import TeamRankingValueBySeasonWeekResult
 from fbsrankings.storage.memory import Storage
 
 
@@ -21,18 +22,12 @@ class TeamRankingBySeasonWeekQueryHandler:
         if ranking is not None:
             season = self._storage.season.get(ranking.season_id)
 
-            values = []
+            values: list[TeamRankingRow] = []
             for value in ranking.values:
                 team = self._storage.team.get(value.id_)
                 if team is not None:
                     values.append(
-                        TeamRankingValueBySeasonWeekResult(
-                            team_id=value.id_,
-                            name=team.name,
-                            order=value.order,
-                            rank=value.rank,
-                            value=value.value,
-                        ),
+                        (value.id_, team.name, value.order, value.rank, value.value),
                     )
 
             if season is not None:
@@ -44,7 +39,7 @@ class TeamRankingBySeasonWeekQueryHandler:
                         season_id=str(ranking.season_id),
                         year=season.year,
                         week=ranking.week,
-                        values=values,
+                        packed_values=pack_team_ranking_values(values),
                     ),
                 )
 
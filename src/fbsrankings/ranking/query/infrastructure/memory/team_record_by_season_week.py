@@ -1,7 +1,8 @@
+from fbsrankings.messages.packed import pack_team_record_values
+from fbsrankings.messages.packed import TeamRecordRow
 from fbsrankings.messages.query import TeamRecordBySeasonWeekQuery
 from fbsrankings.messages.query import TeamRecordBySeasonWeekResult
 from fbsrankings.messages.query import TeamRecordBySeasonWeekValue
-from fbsrankings.messages.query import TeamRecordValueBySeasonWeekResult
 from fbsrankings.storage.memory import Storage
 
 
@@ -20,18 +21,11 @@ class TeamRecordBySeasonWeekQueryHandler:
         if record is not None:
             season = self._storage.season.get(record.season_id)
 
-            values = []
+            values: list[TeamRecordRow] = []
             for value in record.values:
                 team = self._storage.team.get(value.team_id)
                 if team is not None:
-                    values.append(
-                        TeamRecordValueBySeasonWeekResult(
-                            team_id=value.team_id,
-                            name=team.name,
-                            wins=value.wins,
-                            losses=value.losses,
-                        ),
-                    )
+                    values.append((value.team_id, team.name, value.wins, value.losses))
 
             if season is not None:
                 return TeamRecordBySeasonWeekResult(
@@ -41,7 +35,7 @@ class TeamRecordBySeasonWeekQueryHandler:
                         season_id=str(record.season_id),
                         year=season.year,
                         week=record.week,
-                        values=values,
+                        packed_values=pack_team_record_values(values),
                     ),
                 )
 
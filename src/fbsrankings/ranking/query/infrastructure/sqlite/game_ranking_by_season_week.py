@@ -2,11 +2,11 @@ import sqlite3
 from datetime import datetime
 from typing import Union
 
-from fbsrankings.messages.convert import datetime_to_timestamp
+from fbsrankings.messages.packed import GameRankingRow
+from fbsrankings.messages.packed import pack_game_ranking_values
 from fbsrankings.messages.query import GameRankingBySeasonWeekQuery
 from fbsrankings.messages.query import GameRankingBySeasonWeekResult
 from fbsrankings.messages.query import GameRankingBySeasonWeekValue
-from fbsrankings.messages.query import GameRankingValueBySeasonWeekResult
 from fbsrankings.storage.sqlite import GameRankingValueTable
 from fbsrankings.storage.sqlite import GameTable
 from fbsrankings.storage.sqlite import RankingTable
@@ -62,13 +62,11 @@ class GameRankingBySeasonWeekQueryHandler:
         cursor.execute(sql_query, params)
         row = cursor.fetchone()
 
-        values = []
+        values: list[GameRankingRow] = []
         if row is not None:
             cursor.execute(
                 "SELECT "
                 f"{self._value_table}.GameID, "
-                f"{self._game_table}.SeasonID, "
-                f"{self._season_table}.Year, "
                 f"{self._game_table}.Week, "
                 f"{self._game_table}.Date, "
                 f"{self._game_table}.SeasonSection, "
@@ -86,8 +84,6 @@ class GameRankingBySeasonWeekQueryHandler:
                 f"FROM {self._value_table} "
                 f"JOIN {self._game_table} "
                 f"ON {self._game_table}.UUID = {self._value_table}.GameID "
-                f"JOIN {self._season_table} "
-                f"ON {self._season_table}.UUID = {self._game_table}.SeasonID "
                 f"JOIN {self._team_table} home_team "
                 f"ON home_team.UUID = {self._game_table}.HomeTeamID "
                 f"JOIN {self._team_table} away_team "
@@ -96,24 +92,22 @@ class GameRankingBySeasonWeekQueryHandler:
                 [row[0]],
             )
             values = [
-                GameRankingValueBySeasonWeekResult(
-                    game_id=value[0],
-                    season_id=value[1],
-                    year=value[2],
-                    week=value[3],
-                    date=datetime_to_timestamp(datetime.strptime(value[4], "%Y-%m-%d")),
-                    season_section=value[5],
-                    home_team_id=value[6],
-                    home_team_name=value[7],
-                    away_team_id=value[8],
-                    away_team_name=value[9],
-                    home_team_score=value[10],
-                    away_team_score=value[11],
-                    status=value[12],
-                    notes=value[13],
-                    order=value[14],
-                    rank=value[15],
-                    value=value[16],
+                (
+                    value[0],
+                    value[1],
+                    datetime.strptime(value[2], "%Y-%m-%d"),
+                    value[3],
+                    value[4],
+                    value[5],
+                    value[6],
+                    value[7],
+                    value[8],
+                    value[9],
+                    value[10],
+                    value[11],
+                    value[12],
+                    value[13],
+                    value[14],
                 )
                 for value in cursor.fetchall()
             ]
@@ -129,7 +123,7 @@ class GameRankingBySeasonWeekQueryHandler:
                     season_id=row[2],
                     year=row[3],
                     week=row[4],
-                    values=values,
+                    packed_values=pack_game_ranking_values(values),
                 ),
             )
 
@@ -1,10 +1,11 @@
 import sqlite3
 from typing import Union
 
+from fbsrankings.messages.packed import pack_team_ranking_values
+from fbsrankings.messages.packed import TeamRankingRow
 from fbsrankings.messages.query import TeamRankingBySeasonWeekQuery
 from fbsrankings.messages.query import TeamRankingBySeasonWeekResult
 from fbsrankings.messages.query import TeamRankingBySeasonWeekValue
-from fbsrankings.messages.query import TeamRankingValueBySeasonWeekResult
 from fbsrankings.storage.sqlite import RankingTable
 from fbsrankings.storage.sqlite import RankingType
 from fbsrankings.storage.sqlite import SeasonTable
@@ -58,7 +59,7 @@ class TeamRankingBySeasonWeekQueryHandler:
         cursor.execute(sql_query, params)
         row = cursor.fetchone()
 
-        values = []
+        values: list[TeamRankingRow] = []
         if row is not None:
             cursor.execute(
                 "SELECT "
@@ -73,16 +74,7 @@ class TeamRankingBySeasonWeekQueryHandler:
                 f"WHERE {self._value_table}.RankingID = ?;",
                 [row[0]],
             )
-            values = [
-                TeamRankingValueBySeasonWeekResult(
-                    team_id=value[0],
-                    name=value[1],
-                    order=value[2],
-                    rank=value[3],
-                    value=value[4],
-                )
-                for value in cursor.fetchall()
-            ]
+            values = cursor.fetchall()
 
         cursor.close()
 
@@ -95,7 +87,7 @@ class TeamRankingBySeasonWeekQueryHandler:
                     season_id=row[2],
                     year=row[3],
                     week=row[4],
-                    values=values,
+                    packed_values=pack_team_ranking_values(values),
                 ),
             )
 
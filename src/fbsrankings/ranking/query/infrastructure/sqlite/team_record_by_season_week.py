@@ -1,10 +1,11 @@
 import sqlite3
 from typing import Union
 
+from fbsrankings.messages.packed import pack_team_record_values
+from fbsrankings.messages.packed import TeamRecordRow
 from fbsrankings.messages.query import TeamRecordBySeasonWeekQuery
 from fbsrankings.messages.query import TeamRecordBySeasonWeekResult
 from fbsrankings.messages.query import TeamRecordBySeasonWeekValue
-from fbsrankings.messages.query import TeamRecordValueBySeasonWeekResult
 from fbsrankings.storage.sqlite import SeasonTable
 from fbsrankings.storage.sqlite import TeamRecordTable
 from fbsrankings.storage.sqlite import TeamRecordValueTable
@@ -52,7 +53,7 @@ class TeamRecordBySeasonWeekQueryHandler:
         cursor.execute(sql_query, params)
         row = cursor.fetchone()
 
-        values = []
+        values: list[TeamRecordRow] = []
         if row is not None:
             cursor.execute(
                 "SELECT "
@@ -66,15 +67,7 @@ class TeamRecordBySeasonWeekQueryHandler:
                 f"WHERE {self._value_table}.TeamRecordID = ?;",
                 [row[0]],
             )
-            values = [
-                TeamRecordValueBySeasonWeekResult(
-                    team_id=value[0],
-                    name=value[1],
-                    wins=value[2],
-                    losses=value[3],
-                )
-                for value in cursor.fetchall()
-            ]
+            values = cursor.fetchall()
 
         cursor.close()
 
@@ -86,7 +79,7 @@ class TeamRecordBySeasonWeekQueryHandler:
                     season_id=row[1],
                     year=row[2],
                     week=row[3],
-                    values=values,
+                    packed_values=pack_team_record_values(values),
                 ),
             )
 
@@ -1,14 +1,19 @@
+from collections.abc import Iterable
 from datetime import datetime
+from typing import Any
+from typing import Optional
 
 from tinydb import Query
+from tinydb.table import Document
 
 from communication.bus import EventBus
-from fbsrankings.messages.convert import datetime_to_timestamp
+from fbsrankings.messages.convert import bytes_to_ids
 from fbsrankings.messages.event import GameRankingCalculatedEvent
+from fbsrankings.messages.event import SeasonRankingsCalculatedEvent
+from fbsrankings.messages.packed import pack_game_ranking_values
 from fbsrankings.messages.query import GameRankingBySeasonWeekQuery
 from fbsrankings.messages.query import GameRankingBySeasonWeekResult
 from fbsrankings.messages.query import GameRankingBySeasonWeekValue
-from fbsrankings.messages.query import GameRankingValueBySeasonWeekResult
 from fbsrankings.storage.tinydb import Storage
 
 
@@ -18,75 +23,129 @@ class GameRankingBySeasonWeekQueryProjection:
         self._event_bus = event_bus
 
         self._event_bus.register_handler(GameRankingCalculatedEvent, self.project)
+        self._event_bus.register_handler(
+            SeasonRankingsCalculatedEvent,
+            self.project_season,
+        )
 
     def close(self) -> None:
         self._event_bus.unregister_handler(GameRankingCalculatedEvent, self.project)
+        self._event_bus.unregister_handler(
+            SeasonRankingsCalculatedEvent,
+            self.project_season,
+        )
 
     def project(self, event: GameRankingCalculatedEvent) -> None:
+        self._project(
+            event.season_id,
+            [
+                (
+                    event.ranking_id,
+                    event.name,
+                    event.week if event.HasField("week") else None,
+                    [
+                        (value.id, value.order, value.rank, value.value)
+                        for value in event.values
+                    ],
+                ),
+            ],
+        )
+
+    def project_season(self, event: SeasonRankingsCalculatedEvent) -> None:
+        game_ids = bytes_to_ids(event.game_ids)
+        self._project(
+            event.season_id,
+            [
+                (
+                    ranking.ranking_id,
+                    ranking.name,
+                    ranking.week if ranking.HasField("week") else None,
+                    zip(
+                        [game_ids[id_] for id_ in ranking.ids],
+                        ranking.orders,
+                        ranking.ranks,
+                        ranking.values,
+                    ),
+                )
+                for ranking in event.game_rankings
+            ],
+        )
+
+    def _project(
+        self,
+        season_id: str,
+        rankings: Iterable[
+            tuple[str, str, Optional[int], Iterable[tuple[str, int, int, float]]]
+        ],
+    ) -> None:
         table = self._storage.connection.table("game_ranking_by_season_week")
 
-        existing_season = self._storage.cache_season_by_id.get(event.season_id)
+        existing_season = self._storage.cache_season_by_id.get(season_id)
         if existing_season is None:
             raise RuntimeError(
                 "Query database is out of sync with master database. "
-                f"Season {event.season_id} was not found",
+                f"Season {season_id} was not found",
             )
 
-        values = []
-        for value in event.values:
-            existing_game = self._storage.cache_game_by_id.get(value.id)
-            if existing_game is None:
-                raise RuntimeError(
-                    "Query database is out of sync with master database. "
-                    f"Game {value.id} was not found for game ranking {event.ranking_id}",
+        existing_rankings: dict[tuple[str, Optional[int]], Document] = {}
+        for document in table.search(Query().season_id == season_id):
+            existing_rankings.setdefault((document["name"], document["week"]), document)
+
+        stale: list[int] = []
+        documents: list[dict[str, Any]] = []
+        for ranking_id, name, week, ranking_values in rankings:
+            existing = existing_rankings.get((name, week))
+            if existing is not None:
+                if existing["id_"] == ranking_id:
+                    continue
+                # A recalculated game ranking replaces the one stored before it.
+                stale.append(existing.doc_id)
+
+            values = []
+            for id_, order, rank, value in ranking_values:
+                existing_game = self._storage.cache_game_by_id.get(id_)
+                if existing_game is None:
+                    raise RuntimeError(
+                        "Query database is out of sync with master database. "
+                        f"Game {id_} was not found for game ranking {ranking_id}",
+                    )
+                values.append(
+                    {
+                        "id_": id_,
+                        "season_id": existing_game["season_id"],
+                        "year": existing_season["year"],
+                        "week": existing_game["week"],
+                        "date": existing_game["date"],
+                        "season_section": existing_game["season_section"],
+                        "home_team_id": existing_game["home_team_id"],
+                        "home_team_name": existing_game["home_team_name"],
+                        "away_team_id": existing_game["away_team_id"],
+                        "away_team_name": existing_game["away_team_name"],
+                        "home_team_score": existing_game["home_team_score"],
+                        "away_team_score": existing_game["away_team_score"],
+                        "status": existing_game["status"],
+                        "notes": existing_game["notes"],
+                        "order": order,
+                        "rank": rank,
+                        "value": value,
+                    },
                 )
-            values.append(
-                {
-                    "id_": value.id,
-                    "season_id": existing_game["season_id"],
-                    "year": existing_season["year"],
-                    "week": existing_game["week"],
-                    "date": existing_game["date"],
-                    "season_section": existing_game["season_section"],
-                    "home_team_id": existing_game["home_team_id"],
-                    "home_team_name": existing_game["home_team_name"],
-                    "away_team_id": existing_game["away_team_id"],
-                    "away_team_name": existing_game["away_team_name"],
-                    "home_team_score": existing_game["home_team_score"],
-                    "away_team_score": existing_game["away_team_score"],
-                    "status": existing_game["status"],
-                    "notes": existing_game["notes"],
-                    "order": value.order,
-                    "rank": value.rank,
-                    "value": value.value,
-                },
-            )
 
-        existing = table.get(
-            (Query().name == event.name)
-            & (Query().season_id == event.season_id)
-            & (Query().week == (event.week if event.HasField("week") else None)),
-        )
-        if isinstance(existing, list):
-            existing = existing[0]
-        if existing is None:
-            table.insert(
+            documents.append(
                 {
-                    "id_": event.ranking_id,
-                    "name": event.name,
-                    "season_id": event.season_id,
+                    "id_": ranking_id,
+                    "name": name,
+                    "season_id": season_id,
                     "year": existing_season["year"],
-                    "week": event.week if event.HasField("week") else None,
+                    "week": week,
                     "values": values,
                 },
             )
 
-        elif existing["id_"] != event.ranking_id:
-            raise RuntimeError(
-                "Query database is out of sync with master database. "
-                f"ID for game ranking does not match: "
-                f"{existing['id_']} vs. {event.ranking_id}",
-            )
+        if stale:
+            table.remove(doc_ids=stale)
+        if documents:
+            table.insert_multiple(documents)
 
 
 class GameRankingBySeasonWeekQueryHandler:
@@ -116,30 +175,26 @@ class GameRankingBySeasonWeekQueryHandler:
                     season_id=item["season_id"],
                     year=item["year"],
                     week=item["week"],
-                    values=[
-                        GameRankingValueBySeasonWeekResult(
-                            game_id=value["id_"],
-                            season_id=value["season_id"],
-                            year=value["year"],
-                            week=value["week"],
-                            date=datetime_to_timestamp(
-                                datetime.strptime(value["date"], "%Y-%m-%d"),
-                            ),
-                            season_section=value["season_section"],
-                            home_team_id=value["home_team_id"],
-                            home_team_name=value["home_team_name"],
-                            away_team_id=value["away_team_id"],
-                            away_team_name=value["away_team_name"],
-                            home_team_score=value["home_team_score"],
-                            away_team_score=value["away_team_score"],
-                            status=value["status"],
-                            notes=value["notes"],
-                            order=value["order"],
-                            rank=value["rank"],
-                            value=value["value"],
+                    packed_values=pack_game_ranking_values(
+                        (
+                            value["id_"],
+                            value["week"],
+                            datetime.strptime(value["date"], "%Y-%m-%d"),
+                            value["season_section"],
+                            value["home_team_id"],
+                            value["home_team_name"],
+                            value["away_team_id"],
+                            value["away_team_name"],
+                            value["home_team_score"],
+                            value["away_team_score"],
+                            value["status"],
+                            value["notes"],
+                            value["order"],
+                            value["rank"],
+                            value["value"],
                         )
                         for value in item["values"]
-                    ],
+                    ),
                 ),
             )
 
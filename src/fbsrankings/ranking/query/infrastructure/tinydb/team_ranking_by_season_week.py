@@ -1,11 +1,18 @@
+from collections.abc import Iterable
+from typing import Any
+from typing import Optional
+
 from tinydb import Query
+from tinydb.table import Document
 
 from communication.bus import EventBus
+from fbsrankings.messages.convert import bytes_to_ids
+from fbsrankings.messages.event import SeasonRankingsCalculatedEvent
 from fbsrankings.messages.event import TeamRankingCalculatedEvent
+from fbsrankings.messages.packed import pack_team_ranking_values
 from fbsrankings.messages.query import TeamRankingBySeasonWeekQuery
 from fbsrankings.messages.query import TeamRankingBySeasonWeekResult
 from fbsrankings.messages.query import TeamRankingBySeasonWeekValue
-from fbsrankings.messages.query import TeamRankingValueBySeasonWeekResult
 from fbsrankings.storage.tinydb import Storage
 
 
@@ -15,63 +22,117 @@ class TeamRankingBySeasonWeekQueryProjection:
         self._event_bus = event_bus
 
         self._event_bus.register_handler(TeamRankingCalculatedEvent, self.project)
+        self._event_bus.register_handler(
+            SeasonRankingsCalculatedEvent,
+            self.project_season,
+        )
 
     def close(self) -> None:
         self._event_bus.unregister_handler(TeamRankingCalculatedEvent, self.project)
+        self._event_bus.unregister_handler(
+            SeasonRankingsCalculatedEvent,
+            self.project_season,
+        )
 
     def project(self, event: TeamRankingCalculatedEvent) -> None:
+        self._project(
+            event.season_id,
+            [
+                (
+                    event.ranking_id,
+                    event.name,
+                    event.week if event.HasField("week") else None,
+                    [
+                        (value.id, value.order, value.rank, value.value)
+                        for value in event.values
+                    ],
+                ),
+            ],
+        )
+
+    def project_season(self, event: SeasonRankingsCalculatedEvent) -> None:
+        team_ids = bytes_to_ids(event.team_ids)
+        self._project(
+            event.season_id,
+            [
+                (
+                    ranking.ranking_id,
+                    ranking.name,
+                    ranking.week if ranking.HasField("week") else None,
+                    zip(
+                        [team_ids[id_] for id_ in ranking.ids],
+                        ranking.orders,
+                        ranking.ranks,
+                        ranking.values,
+                    ),
+                )
+                for ranking in event.team_rankings
+            ],
+        )
+
+    def _project(
+        self,
+        season_id: str,
+        rankings: Iterable[
+            tuple[str, str, Optional[int], Iterable[tuple[str, int, int, float]]]
+        ],
+    ) -> None:
         table = self._storage.connection.table("team_ranking_by_season_week")
 
-        existing_season = self._storage.cache_season_by_id.get(event.season_id)
+        existing_season = self._storage.cache_season_by_id.get(season_id)
         if existing_season is None:
             raise RuntimeError(
                 "Query database is out of sync with master database. "
-                f"Season {event.season_id} was not found",
+                f"Season {season_id} was not found",
             )
 
-        values = []
-        for value in event.values:
-            existing_team = self._storage.cache_team_by_id.get(value.id)
-            if existing_team is None:
-                raise RuntimeError(
-                    "Query database is out of sync with master database. "
-                    f"Team {value.id} was not found for team ranking {event.ranking_id}",
+        existing_rankings: dict[tuple[str, Optional[int]], Document] = {}
+        for document in table.search(Query().season_id == season_id):
+            existing_rankings.setdefault((document["name"], document["week"]), document)
+
+        stale: list[int] = []
+        documents: list[dict[str, Any]] = []
+        for ranking_id, name, week, ranking_values in rankings:
+            existing = existing_rankings.get((name, week))
+            if existing is not None:
+                if existing["id_"] == ranking_id:
+                    continue
+                # A recalculated team ranking replaces the one stored before it.
+                stale.append(existing.doc_id)
+
+            values = []
+            for id_, order, rank, value in ranking_values:
+                existing_team = self._storage.cache_team_by_id.get(id_)
+                if existing_team is None:
+                    raise RuntimeError(
+                        "Query database is out of sync with master database. "
+                        f"Team {id_} was not found for team ranking {ranking_id}",
+                    )
+                values.append(
+                    {
+                        "id_": id_,
+                        "name": existing_team["name"],
+                        "order": order,
+                        "rank": rank,
+                        "value": value,
+                    },
                 )
-            values.append(
-                {
-                    "id_": value.id,
-                    "name": existing_team["name"],
-                    "order": value.order,
-                    "rank": value.rank,
-                    "value": value.value,
-                },
-            )
 
-        existing = table.get(
-            (Query().name == event.name)
-            & (Query().season_id == event.season_id)
-            & (Query().week == (event.week if event.HasField("week") else None)),
-        )
-        if isinstance(existing, list):
-            existing = existing[0]
-        if existing is None:
-            table.insert(
+            documents.append(
                 {
-                    "id_": event.ranking_id,
-                    "name": event.name,
-                    "season_id": event.season_id,
+                    "id_": ranking_id,
+                    "name": name,
+                    "season_id": season_id,
                     "year": existing_season["year"],
-                    "week": event.week if event.HasField("week") else None,
+                    "week": week,
                     "values": values,
                 },
             )
 
-        elif existing["id_"] != event.ranking_id:
-            raise RuntimeError(
-                "Query database is out of sync with master database. "
-                f"ID for team ranking does not match: "
-                f"{existing['id_']} vs. {event.ranking_id}",
-            )
+        if stale:
+            table.remove(doc_ids=stale)
+        if documents:
+            table.insert_multiple(documents)
 
 
 class TeamRankingBySeasonWeekQueryHandler:
@@ -101,16 +162,16 @@ class TeamRankingBySeasonWeekQueryHandler:
                     season_id=item["season_id"],
                     year=item["year"],
                     week=item["week"],
-                    values=[
-                        TeamRankingValueBySeasonWeekResult(
-                            team_id=value["id_"],
-                            name=value["name"],
-                            order=value["order"],
-                            rank=value["rank"],
-                            value=value["value"],
+                    packed_values=pack_team_ranking_values(
+                        (
+                            value["id_"],
+                            value["name"],
+                            value["order"],
+                            value["rank"],
+                            value["value"],
                         )
                         for value in item["values"]
-                    ],
+                    ),
                 ),
             )
 
@@ -1,11 +1,18 @@
+from collections.abc import Iterable
+from typing import Any
+from typing import Optional
+
 from tinydb import Query
+from tinydb.table import Document
 
 from communication.bus import EventBus
+from fbsrankings.messages.convert import bytes_to_ids
+from fbsrankings.messages.event import SeasonRankingsCalculatedEvent
 from fbsrankings.messages.event import TeamRecordCalculatedEvent
+from fbsrankings.messages.packed import pack_team_record_values
 from fbsrankings.messages.query import TeamRecordBySeasonWeekQuery
 from fbsrankings.messages.query import TeamRecordBySeasonWeekResult
 from fbsrankings.messages.query import TeamRecordBySeasonWeekValue
-from fbsrankings.messages.query import TeamRecordValueBySeasonWeekResult
 from fbsrankings.storage.tinydb import Storage
 
 
@@ -15,60 +22,110 @@ class TeamRecordBySeasonWeekQueryProjection:
         self._event_bus = event_bus
 
         self._event_bus.register_handler(TeamRecordCalculatedEvent, self.project)
+        self._event_bus.register_handler(
+            SeasonRankingsCalculatedEvent,
+            self.project_season,
+        )
 
     def close(self) -> None:
         self._event_bus.unregister_handler(TeamRecordCalculatedEvent, self.project)
+        self._event_bus.unregister_handler(
+            SeasonRankingsCalculatedEvent,
+            self.project_season,
+        )
 
     def project(self, event: TeamRecordCalculatedEvent) -> None:
+        self._project(
+            event.season_id,
+            [
+                (
+                    event.record_id,
+                    event.week if event.HasField("week") else None,
+                    [
+                        (value.team_id, value.wins, value.losses)
+                        for value in event.values
+                    ],
+                ),
+            ],
+        )
+
+    def project_season(self, event: SeasonRankingsCalculatedEvent) -> None:
+        team_ids = bytes_to_ids(event.team_ids)
+        self._project(
+            event.season_id,
+            [
+                (
+                    record.record_id,
+                    record.week if record.HasField("week") else None,
+                    zip(
+                        [team_ids[team] for team in record.teams],
+                        record.wins,
+                        record.losses,
+                    ),
+                )
+                for record in event.team_records
+            ],
+        )
+
+    def _project(
+        self,
+        season_id: str,
+        records: Iterable[tuple[str, Optional[int], Iterable[tuple[str, int, int]]]],
+    ) -> None:
         table = self._storage.connection.table("team_record_by_season_week")
 
-        existing_season = self._storage.cache_season_by_id.get(event.season_id)
+        existing_season = self._storage.cache_season_by_id.get(season_id)
         if existing_season is None:
             raise RuntimeError(
                 "Query database is out of sync with master database. "
-                f"Season {event.season_id} was not found",
+                f"Season {season_id} was not found",
             )
 
-        values = []
-        for value in event.values:
-            existing_team = self._storage.cache_team_by_id.get(value.team_id)
-            if existing_team is None:
-                raise RuntimeError(
-                    "Query database is out of sync with master database. "
-                    f"Team {value.team_id} was not found for team record {event.record_id}",
+        existing_records: dict[Optional[int], Document] = {}
+        for document in table.search(Query().season_id == season_id):
+            existing_records.setdefault(document["week"], document)
+
+        stale: list[int] = []
+        documents: list[dict[str, Any]] = []
+        for record_id, week, record_values in records:
+            existing = existing_records.get(week)
+            if existing is not None:
+                if existing["id_"] == record_id:
+                    continue
+                # A recalculated team record replaces the one stored before it.
+                stale.append(existing.doc_id)
+
+            values = []
+            for team_id, wins, losses in record_values:
+                existing_team = self._storage.cache_team_by_id.get(team_id)
+                if existing_team is None:
+                    raise RuntimeError(
+                        "Query database is out of sync with master database. "
+                        f"Team {team_id} was not found for team record {record_id}",
+                    )
+                values.append(
+                    {
+                        "id_": team_id,
+                        "name": existing_team["name"],
+                        "wins": wins,
+                        "losses": losses,
+                    },
                 )
-            values.append(
-                {
-                    "id_": value.team_id,
-                    "name": existing_team["name"],
-                    "wins": value.wins,
-                    "losses": value.losses,
-                },
-            )
 
-        existing = table.get(
-            (Query().season_id == event.season_id)
-            & (Query().week == (event.week if event.HasField("week") else None)),
-        )
-        if isinstance(existing, list):
-            existing = existing[0]
-        if existing is None:
-            table.insert(
+            documents.append(
                 {
-                    "id_": event.record_id,
-                    "season_id": event.season_id,
+                    "id_": record_id,
+                    "season_id": season_id,
                     "year": existing_season["year"],
-                    "week": event.week if event.HasField("week") else None,
+                    "week": week,
                     "values": values,
                 },
             )
 
-        elif existing["id_"] != event.record_id:
-            raise RuntimeError(
-                "Query database is out of sync with master database. "
-                f"ID for team record does not match: "
-                f"{existing['id_']} vs. {event.record_id}",
-            )
+        if stale:
+            table.remove(doc_ids=stale)
+        if documents:
+            table.insert_multiple(documents)
 
 
 class TeamRecordBySeasonWeekQueryHandler:
@@ -96,15 +153,10 @@ class TeamRecordBySeasonWeekQueryHandler:
                     season_id=item["season_id"],
                     year=item["year"],
                     week=item["week"],
-                    values=[
-                        TeamRecordValueBySeasonWeekResult(
-                            team_id=value["id_"],
-                            name=value["name"],
-                            wins=value["wins"],
-                            losses=value["losses"],
-                        )
+                    packed_values=pack_team_record_values(
+                        (value["id_"], value["name"], value["wins"], value["losses"])
                         for value in item["values"]
-                    ],
+                    ),
                 ),
             )
 
@@ -2,6 +2,8 @@
 
 from .affiliation import AffiliationDto
 from .affiliation import AffiliationStorage
+from .fingerprint import RankingFingerprintDto
+from .fingerprint import RankingFingerprintStorage
 from .game import GameDto
 from .game import GameStorage
 from .ranking import RankingDto
@@ -23,6 +25,8 @@ __all__ = [
     "GameDto",
     "GameStorage",
     "RankingDto",
+    "RankingFingerprintDto",
+    "RankingFingerprintStorage",
     "RankingStorage",
     "RankingValueDto",
     "SeasonDto",
@@ -0,0 +1,22 @@
+from dataclasses import dataclass
+from typing import Optional
+
+
+@dataclass(frozen=True)
+class RankingFingerprintDto:
+    season_id: str
+    fingerprint: str
+
+
+class RankingFingerprintStorage:
+    def __init__(self) -> None:
+        self._by_season: dict[str, RankingFingerprintDto] = {}
+
+    def add(self, fingerprint: RankingFingerprintDto) -> None:
+        self._by_season[fingerprint.season_id] = fingerprint
+
+    def find(self, season_id: str) -> Optional[RankingFingerprintDto]:
+        return self._by_season.get(season_id)
+
+    def drop(self) -> None:
+        self._by_season = {}
@@ -4,6 +4,7 @@ from typing import Literal
 from typing import Optional
 
 from fbsrankings.storage.memory.affiliation import AffiliationStorage
+from fbsrankings.storage.memory.fingerprint import RankingFingerprintStorage
 from fbsrankings.storage.memory.game import GameStorage
 from fbsrankings.storage.memory.ranking import RankingStorage
 from fbsrankings.storage.memory.record import TeamRecordStorage
@@ -21,6 +22,7 @@ class Storage(ContextManager["Storage"]):
         self.team_record = TeamRecordStorage()
         self.team_ranking = RankingStorage()
         self.game_ranking = RankingStorage()
+        self.ranking_fingerprint = RankingFingerprintStorage()
 
     def drop(self) -> None:
         self.season.drop()
@@ -31,6 +33,7 @@ class Storage(ContextManager["Storage"]):
         self.team_record.drop()
         self.team_ranking.drop()
         self.game_ranking.drop()
+        self.ranking_fingerprint.drop()
 
     def close(self) -> None:
         pass
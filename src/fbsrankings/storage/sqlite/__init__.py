@@ -1,6 +1,7 @@
 """Sqlite storage classes for the fbsrankings package"""
 
 from .affiliation import AffiliationTable
+from .fingerprint import RankingFingerprintTable
 from .game import GameTable
 from .ranking import GameRankingValueTable
 from .ranking import RankingTable
@@ -17,6 +18,7 @@ __all__ = [
     "AffiliationTable",
     "GameRankingValueTable",
     "GameTable",
+    "RankingFingerprintTable",
     "RankingTable",
     "RankingType",
     "SeasonTable",
@@ -0,0 +1,24 @@
+import sqlite3
+
+
+class RankingFingerprintTable:
+    def __init__(self) -> None:
+        self.table = "rankingfingerprint"
+
+    def create(self, cursor: sqlite3.Cursor) -> None:
+        cursor.execute(
+            f"CREATE TABLE IF NOT EXISTS {self.table} "
+            "(SeasonID TEXT NOT NULL UNIQUE REFERENCES season(UUID), "
+            "Fingerprint TEXT NOT NULL);",
+        )
+
+    def dump(self, connection: sqlite3.Connection) -> None:
+        print("Ranking Fingerprints:")
+        cursor = connection.cursor()
+        cursor.execute(f"SELECT ROWID,* FROM {self.table};")
+        for row in cursor.fetchall():
+            print("(" + ", ".join(str(item) for item in row) + ")")
+        cursor.close()
+
+    def drop(self, cursor: sqlite3.Cursor) -> None:
+        cursor.execute(f"DROP TABLE IF EXISTS {self.table};")
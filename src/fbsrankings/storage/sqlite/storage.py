@@ -8,6 +8,7 @@ from typing import Optional
 from fbsrankings.config import SqliteFile
 from fbsrankings.storage.sqlite.affiliation import AffiliationTable
 from fbsrankings.storage.sqlite.affiliation import SubdivisionTable
+from fbsrankings.storage.sqlite.fingerprint import RankingFingerprintTable
 from fbsrankings.storage.sqlite.game import GameStatusTable
 from fbsrankings.storage.sqlite.game import GameTable
 from fbsrankings.storage.sqlite.game import SeasonSectionTable
@@ -48,6 +49,7 @@ class Storage(ContextManager["Storage"]):
 
             TeamRecordTable().create(cursor)
             RankingTable().create(cursor)
+            RankingFingerprintTable().create(cursor)
 
             cursor.execute("commit")
         except Exception:
@@ -60,6 +62,7 @@ class Storage(ContextManager["Storage"]):
         cursor = self.connection.cursor()
         cursor.execute("begin")
         try:
+            RankingFingerprintTable().drop(cursor)
             RankingTable().drop(cursor)
             TeamRecordTable().drop(cursor)
             GameTable().drop(cursor)
@@ -83,6 +86,7 @@ class Storage(ContextManager["Storage"]):
             GameTable().create(cursor)
             TeamRecordTable().create(cursor)
             RankingTable().create(cursor)
+            RankingFingerprintTable().create(cursor)
 
             cursor.execute("commit")
         except Exception:
@@ -1,9 +1,23 @@
+import gzip
+import hashlib
+from collections.abc import Iterator
+from configparser import ConfigParser
+from functools import partial
+from http.server import SimpleHTTPRequestHandler
+from http.server import ThreadingHTTPServer
 from pathlib import Path
+from threading import Thread
 from typing import Any
+from typing import cast
+from typing import Optional
+
+import pytest
 
 from fbsrankings.cli.main import main
+from fbsrankings.core.command.infrastructure.sports_reference import SportsReference
 
 from .copy_files import _copy_files
+from .local_seasons import _set_archive_config
 
 
 def test_main_import(
@@ -38,3 +52,393 @@ def test_main_import(
     assert "Dropping existing data:" in captured_err
     assert "Importing season data:" in captured_err
     assert "Calculating rankings:" in captured_err
+
+
+class SportsReferenceServer(ThreadingHTTPServer):
+    def __init__(self, *args: Any, **kwargs: Any) -> None:
+        super().__init__(*args, **kwargs)
+        self.requests: list[tuple[str, Optional[str], int, int]] = []
+        self.unavailable: dict[str, int] = {}
+
+
+@pytest.fixture(name="sports_reference_server")
+def sports_reference_server_fixture(
+    data_path: Path,
+) -> Iterator[SportsReferenceServer]:
+    # Pages are sent compressed when the client asks for it, over connections
+    # that are kept open between requests, with an ETag of their content.
+    # Each request is logged on the server with its path, its If-None-Match
+    # header, the status of its response and the port of its connection. A
+    # path can be made unavailable for a number of requests.
+    class QuietRequestHandler(SimpleHTTPRequestHandler):
+        protocol_version = "HTTP/1.1"
+
+        def do_GET(self) -> None:  # noqa: N802
+            server = cast(SportsReferenceServer, self.server)
+            if server.unavailable.get(self.path, 0) > 0:
+                server.unavailable[self.path] -= 1
+                self._log_request(503)
+                self.send_response(503)
+                self.send_header("Content-Length", "0")
+                self.end_headers()
+                return
+
+            path = Path(self.translate_path(self.path))
+            if not path.is_file():
+                self._log_request(404)
+                super().do_GET()
+                return
+
+            content = path.read_bytes()
+            etag = f'"{hashlib.sha256(content).hexdigest()[:16]}"'
+            if self.headers.get("If-None-Match") == etag:
+                self._log_request(304)
+                self.send_response(304)
+                self.send_header("ETag", etag)
+                self.end_headers()
+                return
+
+            gzipped = "gzip" in self.headers.get("Accept-Encoding", "")
+            body = gzip.compress(content) if gzipped else content
+            self._log_request(200)
+            self.send_response(200)
+            self.send_header("Content-Type", self.guess_type(str(path)))
+            if gzipped:
+                self.send_header("Content-Encoding", "gzip")
+            self.send_header("Content-Length", str(len(body)))
+            self.send_header("ETag", etag)
+            self.end_headers()
+            self.wfile.write(body)
+
+        def log_message(self, *_: Any) -> None:
+            pass
+
+        def _log_request(self, status: int) -> None:
+            server = cast(SportsReferenceServer, self.server)
+            server.requests.append(
+                (
+                    self.path,
+                    self.headers.get("If-None-Match"),
+                    status,
+                    self.client_address[1],
+                ),
+            )
+
+    server = SportsReferenceServer(
+        ("127.0.0.1", 0),
+        partial(QuietRequestHandler, directory=str(data_path / "sports_reference")),
+    )
+    thread = Thread(target=server.serve_forever, daemon=True)
+    thread.start()
+    try:
+        yield server
+    finally:
+        server.shutdown()
+        server.server_close()
+        thread.join()
+
+
+def test_main_import_local(
+    capsys: Any,
+    output_path: Path,
+    test_path: Path,
+    command_config: Path,
+    test_seasons: list[str],
+    sports_reference_server: SportsReferenceServer,
+) -> None:
+    files = _copy_files(
+        output_path,
+        test_path,
+        ["main_import_2012_2013_local.txt"],
+    )
+    with files[0].open(mode="r", encoding="utf-8") as expected_file:
+        expected_out = expected_file.read()
+
+    _set_fetch_config(command_config, _server_url(sports_reference_server))
+
+    exit_result = main(
+        [
+            "import",
+            *test_seasons,
+            "--drop",
+            f"--config={command_config}",
+            "--trace",
+        ],
+    )
+    assert exit_result == 0
+
+    captured_out, captured_err = capsys.readouterr()
+    assert captured_out == expected_out
+    assert "Importing season data:" in captured_err
+    assert "Calculating rankings:" in captured_err
+
+
+def test_main_import_cached(
+    capsys: Any,
+    output_path: Path,
+    test_path: Path,
+    command_config: Path,
+    test_seasons: list[str],
+    sports_reference_server: SportsReferenceServer,
+) -> None:
+    files = _copy_files(
+        output_path,
+        test_path,
+        ["main_import_2012_2013_local.txt"],
+    )
+    with files[0].open(mode="r", encoding="utf-8") as expected_file:
+        expected_out = expected_file.read()
+
+    cache_path = test_path / "cache"
+    _set_fetch_config(
+        command_config,
+        _server_url(sports_reference_server),
+        cache_path,
+    )
+    exit_result = main(
+        ["import", *test_seasons, "--drop", f"--config={command_config}"],
+    )
+    assert exit_result == 0
+    capsys.readouterr()
+
+    # The test seasons are over, so their cached pages are used without
+    # requesting them again.
+    sports_reference_server.shutdown()
+    sports_reference_server.server_close()
+    exit_result = main(
+        [
+            "import",
+            *test_seasons,
+            "--drop",
+            f"--config={command_config}",
+            "--trace",
+        ],
+    )
+    assert exit_result == 0
+
+    captured_out, captured_err = capsys.readouterr()
+    assert captured_out == expected_out
+    assert "Importing season data:" in captured_err
+
+
+def test_main_import_revalidated(
+    capsys: Any,
+    monkeypatch: Any,
+    output_path: Path,
+    test_path: Path,
+    command_config: Path,
+    test_seasons: list[str],
+    sports_reference_server: SportsReferenceServer,
+) -> None:
+    files = _copy_files(
+        output_path,
+        test_path,
+        ["main_import_2012_2013_local.txt"],
+    )
+    with files[0].open(mode="r", encoding="utf-8") as expected_file:
+        expected_out = expected_file.read()
+
+    cache_path = test_path / "cache"
+    _set_fetch_config(
+        command_config,
+        _server_url(sports_reference_server),
+        cache_path,
+    )
+    exit_result = main(
+        ["import", *test_seasons, "--drop", f"--config={command_config}"],
+    )
+    assert exit_result == 0
+    capsys.readouterr()
+    assert all(request[1] is None for request in sports_reference_server.requests)
+
+    # The pages of a season that is not over yet may still change, so their
+    # cached copies are revalidated with their ETags, and used as they are
+    # when the server answers that they have not changed.
+    monkeypatch.setattr(SportsReference, "_is_final", staticmethod(lambda _: False))
+    sports_reference_server.requests.clear()
+    exit_result = main(
+        [
+            "import",
+            *test_seasons,
+            "--drop",
+            f"--config={command_config}",
+            "--trace",
+        ],
+    )
+    assert exit_result == 0
+
+    captured_out, captured_err = capsys.readouterr()
+    assert captured_out == expected_out
+    assert "Importing season data:" in captured_err
+    assert len(sports_reference_server.requests) == 2 * len(test_seasons)
+    for _, etag, status, _ in sports_reference_server.requests:
+        assert etag is not None
+        assert status == 304
+
+
+def test_main_import_retried(
+    capsys: Any,
+    output_path: Path,
+    test_path: Path,
+    command_config: Path,
+    test_seasons: list[str],
+    sports_reference_server: SportsReferenceServer,
+) -> None:
+    files = _copy_files(
+        output_path,
+        test_path,
+        ["main_import_2012_2013_local.txt"],
+    )
+    with files[0].open(mode="r", encoding="utf-8") as expected_file:
+        expected_out = expected_file.read()
+
+    # The server is busy for the first requests of a page, which are retried
+    # after backing off.
+    sports_reference_server.unavailable["/2013-schedule.html"] = 2
+    _set_fetch_config(
+        command_config,
+        _server_url(sports_reference_server),
+        backoff="0.01",
+    )
+    exit_result = main(
+        [
+            "import",
+            *test_seasons,
+            "--drop",
+            f"--config={command_config}",
+            "--trace",
+        ],
+    )
+    assert exit_result == 0
+
+    captured_out, captured_err = capsys.readouterr()
+    assert captured_out == expected_out
+    assert "Importing season data:" in captured_err
+    assert [
+        status
+        for path, _, status, _ in sports_reference_server.requests
+        if path == "/2013-schedule.html"
+    ] == [503, 503, 200]
+
+
+def test_main_import_retries_exhausted(
+    capsys: Any,
+    command_config: Path,
+    sports_reference_server: SportsReferenceServer,
+) -> None:
+    sports_reference_server.unavailable["/2013-schedule.html"] = 3
+    _set_fetch_config(
+        command_config,
+        _server_url(sports_reference_server),
+        retries="2",
+        backoff="0.01",
+    )
+    exit_result = main(["import", "2013", "--drop", f"--config={command_config}"])
+    assert exit_result == 1
+
+    _, captured_err = capsys.readouterr()
+    assert "503" in captured_err
+    assert [
+        status
+        for path, _, status, _ in sports_reference_server.requests
+        if path == "/2013-schedule.html"
+    ] == [503, 503, 503]
+
+
+def test_main_import_reuses_connection(
+    capsys: Any,
+    output_path: Path,
+    test_path: Path,
+    command_config: Path,
+    test_seasons: list[str],
+    sports_reference_server: SportsReferenceServer,
+) -> None:
+    files = _copy_files(
+        output_path,
+        test_path,
+        ["main_import_2012_2013_local.txt"],
+    )
+    with files[0].open(mode="r", encoding="utf-8") as expected_file:
+        expected_out = expected_file.read()
+
+    # With a single worker the pages are requested one after another, so
+    # they are all sent over the same connection.
+    _set_fetch_config(
+        command_config,
+        _server_url(sports_reference_server),
+        workers="1",
+    )
+    exit_result = main(
+        [
+            "import",
+            *test_seasons,
+            "--drop",
+            f"--config={command_config}",
+            "--trace",
+        ],
+    )
+    assert exit_result == 0
+
+    captured_out, captured_err = capsys.readouterr()
+    assert captured_out == expected_out
+    assert "Importing season data:" in captured_err
+    assert len(sports_reference_server.requests) == 2 * len(test_seasons)
+    assert len({port for _, _, _, port in sports_reference_server.requests}) == 1
+
+
+def test_main_import_archive(
+    capsys: Any,
+    output_path: Path,
+    data_path: Path,
+    test_path: Path,
+    command_config: Path,
+    test_seasons: list[str],
+) -> None:
+    files = _copy_files(
+        output_path,
+        test_path,
+        ["main_import_2012_2013_local.txt"],
+    )
+    with files[0].open(mode="r", encoding="utf-8") as expected_file:
+        expected_out = expected_file.read()
+
+    _set_archive_config(command_config, data_path, test_path)
+
+    exit_result = main(
+        [
+            "import",
+            *test_seasons,
+            "--drop",
+            f"--config={command_config}",
+            "--trace",
+        ],
+    )
+    assert exit_result == 0
+
+    captured_out, captured_err = capsys.readouterr()
+    assert captured_out == expected_out
+    assert "Importing season data:" in captured_err
+
+
+def _server_url(server: SportsReferenceServer) -> str:
+    return f"http://127.0.0.1:{server.server_address[1]}"
+
+
+def _set_fetch_config(
+    config_path: Path,
+    url: str,
+    cache_path: Optional[Path] = None,
+    **options: str,
+) -> None:
+    parser = ConfigParser()
+    parser.read(config_path)
+    if not parser.has_section("fbsrankings.fetch"):
+        parser.add_section("fbsrankings.fetch")
+    parser.set("fbsrankings.fetch", "url", url)
+    parser.set("fbsrankings.fetch", "delay", "0")
+    if cache_path is not None:
+        parser.set("fbsrankings.fetch", "cache", str(cache_path))
+    for name, value in options.items():
+        parser.set("fbsrankings.fetch", name, value)
+    with config_path.open(mode="w", encoding="utf-8") as config_file:
+        parser.write(config_file)
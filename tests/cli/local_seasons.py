@@ -0,0 +1,31 @@
+import tarfile
+from collections.abc import Sequence
+from configparser import ConfigParser
+from pathlib import Path
+
+from fbsrankings.cli.main import main
+
+
+def _set_archive_config(config_path: Path, data_path: Path, test_path: Path) -> None:
+    archive_path = test_path / "sports_reference.tar"
+    with tarfile.open(archive_path, mode="w") as archive:
+        archive.add(data_path / "sports_reference", arcname="sports_reference")
+
+    parser = ConfigParser()
+    parser.read(config_path)
+    if not parser.has_section("fbsrankings.fetch"):
+        parser.add_section("fbsrankings.fetch")
+    parser.set("fbsrankings.fetch", "archive", str(archive_path))
+    with config_path.open(mode="w", encoding="utf-8") as config_file:
+        parser.write(config_file)
+
+
+def _import_local_seasons(
+    config_path: Path,
+    data_path: Path,
+    test_path: Path,
+    seasons: Sequence[str],
+) -> None:
+    _set_archive_config(config_path, data_path, test_path)
+    exit_result = main(["import", *seasons, "--drop", f"--config={config_path}"])
+    assert exit_result == 0
@@ -0,0 +1,72 @@
+from pathlib import Path
+from typing import Any
+
+from fbsrankings.cli.main import main
+
+from .copy_files import _copy_files
+from .local_seasons import _import_local_seasons
+
+
+def test_main_record_year_empty(
+    capsys: Any,
+    output_path: Path,
+    data_path: Path,
+    test_path: Path,
+    command_config: Path,
+) -> None:
+    _copy_files(data_path, test_path, ["empty_data.db", "empty_data.json"])
+    files = _copy_files(output_path, test_path, ["main_record_2012_empty.txt"])
+    with files[0].open(mode="r", encoding="utf-8") as expected_file:
+        expected_err = expected_file.read()
+
+    exit_result = main(
+        [
+            "record",
+            "2012",
+            "Alabama",
+            "21",
+            "Auburn",
+            "14",
+            f"--config={command_config}",
+        ],
+    )
+    assert exit_result == 1
+
+    captured_out, captured_err = capsys.readouterr()
+    assert captured_out == ""
+    assert captured_err == expected_err
+
+
+def test_main_record_local(
+    capsys: Any,
+    output_path: Path,
+    data_path: Path,
+    test_path: Path,
+    query_config: Path,
+) -> None:
+    files = _copy_files(output_path, test_path, ["main_record_2013_local.txt"])
+    with files[0].open(mode="r", encoding="utf-8") as expected_file:
+        expected_out = expected_file.read()
+
+    _import_local_seasons(query_config, data_path, test_path, ["2013"])
+    capsys.readouterr()
+
+    exit_result = main(
+        [
+            "record",
+            "2013",
+            "Oregon",
+            "14",
+            "Alabama",
+            "21",
+            f"--config={query_config}",
+        ],
+    )
+    assert exit_result == 0
+
+    exit_result = main(["latest", "--top=all", f"--config={query_config}"])
+    assert exit_result == 0
+
+    captured_out, captured_err = capsys.readouterr()
+    assert captured_out == expected_out
+    assert captured_err == ""
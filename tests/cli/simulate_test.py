@@ -0,0 +1,98 @@
+from pathlib import Path
+from typing import Any
+from uuid import uuid4
+
+import numpy
+
+from fbsrankings.cli.environment import Environment
+from fbsrankings.cli.main import main
+from fbsrankings.messages.query import SeasonByYearQuery
+from fbsrankings.messages.query import SeasonByYearResult
+from fbsrankings.messages.query import SeasonSimulationQuery
+from fbsrankings.messages.query import SeasonSimulationResult
+
+from .copy_files import _copy_files
+from .local_seasons import _import_local_seasons
+
+
+def test_main_simulate_empty(
+    capsys: Any,
+    output_path: Path,
+    data_path: Path,
+    test_path: Path,
+    command_config: Path,
+) -> None:
+    _copy_files(data_path, test_path, ["empty_data.db", "empty_data.json"])
+    files = _copy_files(output_path, test_path, ["main_simulate_empty.txt"])
+    with files[0].open(mode="r", encoding="utf-8") as expected_file:
+        expected_err = expected_file.read()
+
+    exit_result = main(["simulate", f"--config={command_config}"])
+    assert exit_result == 1
+
+    captured_out, captured_err = capsys.readouterr()
+    assert captured_out == ""
+    assert captured_err == expected_err
+
+
+def test_main_simulate_year_empty(
+    capsys: Any,
+    output_path: Path,
+    data_path: Path,
+    test_path: Path,
+    command_config: Path,
+) -> None:
+    _copy_files(data_path, test_path, ["empty_data.db", "empty_data.json"])
+    files = _copy_files(output_path, test_path, ["main_simulate_2012_empty.txt"])
+    with files[0].open(mode="r", encoding="utf-8") as expected_file:
+        expected_err = expected_file.read()
+
+    exit_result = main(["simulate", "2012", f"--config={command_config}"])
+    assert exit_result == 1
+
+    captured_out, captured_err = capsys.readouterr()
+    assert captured_out == ""
+    assert captured_err == expected_err
+
+
+def test_simulate_local(
+    data_path: Path,
+    test_path: Path,
+    query_config: Path,
+) -> None:
+    _import_local_seasons(query_config, data_path, test_path, ["2013"])
+
+    with Environment(str(query_config)) as env:
+        season = env.query_bus.query(
+            SeasonByYearQuery(query_id=str(uuid4()), year=2013),
+            SeasonByYearResult,
+        ).season
+        results = [
+            env.query_bus.query(
+                SeasonSimulationQuery(
+                    query_id=str(uuid4()),
+                    season_id=season.season_id,
+                    count=1000,
+                    seed=2013,
+                ),
+                SeasonSimulationResult,
+            )
+            for _ in range(2)
+        ]
+
+    simulation = results[0]
+    assert simulation.count == 1000
+    assert simulation.teams == results[1].teams
+    assert any(team.remaining_games > 0 for team in simulation.teams)
+
+    for team in simulation.teams:
+        win_probabilities = numpy.array(team.win_probabilities)
+        rank_probabilities = numpy.array(team.rank_probabilities)
+        numpy.testing.assert_allclose(win_probabilities.sum(), 1.0)
+        numpy.testing.assert_allclose(rank_probabilities.sum(), 1.0)
+        assert len(rank_probabilities) == len(simulation.teams)
+
+        wins = numpy.flatnonzero(win_probabilities)
+        assert wins.min() >= team.wins
+        assert wins.max() <= team.wins + team.remaining_games
+        assert team.wins <= team.expected_wins <= team.wins + team.remaining_games
@@ -0,0 +1,60 @@
+import numpy
+import pytest
+
+from fbsrankings.core.command.infrastructure.sports_reference import _html_iter
+
+
+PAGE = """<!DOCTYPE html>
+<html><head><title>2013 Schedule</title></head><body>
+<!-- <table id="schedule"><tr><td>Commented</td></tr></table> -->
+<table id="schedule_summary">
+<tr><th>Games</th><td>8</td></tr>
+</table>
+<div class="table_container">
+<table class="sortable stats_table" id="schedule" data-cols-to-freeze=",4">
+<thead><tr><th>Rk</th><th>Wk</th><th>Winner/Tie</th><th>Pts</th></tr></thead>
+<tbody>
+<tr><th>1</th><td>1</td><td><a href="/cfb/schools/auburn/2013.html">Auburn</a></td><td>27</td></tr>
+<tr class="thead"><td colspan="4"></td></tr>
+<tr><th>2</th><td>1</td><td>Texas A&amp;M <!-- ranked --> (7)</td><td>52</td></tr>
+</tbody>
+</table>
+</div>
+<table id="schedule_notes"><tr><td>Unrelated</td></tr></table>
+</body></html>
+"""
+
+ROWS = [
+    ["Rk", "Wk", "Winner/Tie", "Pts"],
+    ["1", "1", "Auburn", "27"],
+    [""],
+    ["2", "1", "(7)", "52"],
+]
+
+
+def test_html_iter_reads_table_rows() -> None:
+    assert list(_html_iter([PAGE], "schedule")) == ROWS
+    assert list(_html_iter([PAGE], "schedule_notes")) == [["Unrelated"]]
+
+
+@pytest.mark.parametrize("size", range(1, 8))
+def test_html_iter_chunks_match_whole_page(size: int) -> None:
+    chunks = [PAGE[start : start + size] for start in range(0, len(PAGE), size)]
+    assert list(_html_iter(chunks, "schedule")) == ROWS
+
+
+def test_html_iter_uneven_chunks_match_whole_page() -> None:
+    generator = numpy.random.default_rng(2013)
+    for _ in range(20):
+        ends = numpy.cumsum(generator.integers(1, 8, len(PAGE))).tolist()
+        starts = [0, *ends]
+        chunks = [PAGE[start:end] for start, end in zip(starts, ends) if start < end]
+        assert "".join(chunks) == PAGE
+        assert list(_html_iter(chunks, "schedule")) == ROWS
+
+
+@pytest.mark.parametrize("size", [1, 7, len(PAGE)])
+def test_html_iter_missing_table_raises(size: int) -> None:
+    chunks = [PAGE[start : start + size] for start in range(0, len(PAGE), size)]
+    with pytest.raises(ValueError, match="Table was not found: standings"):
+        list(_html_iter(chunks, "standings"))
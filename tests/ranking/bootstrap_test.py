@@ -0,0 +1,22 @@
+from typing import Any
+
+import numpy
+
+from fbsrankings.ranking.command.domain.service.colley_matrix_ranking_calculator import (
+    ColleyMatrixRankingCalculator,
+)
+
+from .season_data import build_season_data
+
+
+def test_colley_bootstrap_chunks_match_single_stack(monkeypatch: Any) -> None:
+    season_data = build_season_data(all_divisions=True)
+    n = len(season_data.ranked_teams)
+    expected = ColleyMatrixRankingCalculator.bootstrap(season_data, 37)
+
+    # Five samples fit in each stack, so the last one only has two.
+    monkeypatch.setattr(ColleyMatrixRankingCalculator, "bootstrap_entries", n * n * 5)
+    actual = ColleyMatrixRankingCalculator.bootstrap(season_data, 37)
+
+    assert actual.shape == (len(season_data.calculated_weeks), 37, n)
+    numpy.testing.assert_allclose(actual, expected, rtol=1e-9, atol=1e-12)
@@ -0,0 +1,15 @@
+import pytest
+
+from fbsrankings.ranking.command.domain.model.ranking import SeasonData
+
+from .season_data import build_season_data
+
+
+@pytest.fixture(name="season_data")
+def season_data_fixture() -> SeasonData:
+    return build_season_data()
+
+
+@pytest.fixture(name="scheduled_season_data")
+def scheduled_season_data_fixture() -> SeasonData:
+    return build_season_data(bowl_weeks=0, scheduled_weeks=2)
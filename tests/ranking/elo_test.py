@@ -0,0 +1,145 @@
+import math
+
+import numpy
+import pytest
+
+from fbsrankings.messages.enums import GameStatus
+from fbsrankings.messages.query import GameBySeasonResult
+from fbsrankings.ranking.command.domain.model.ranking import SeasonData
+from fbsrankings.ranking.command.domain.service.elo_ranking_calculator import (
+    EloRankingCalculator,
+)
+from fbsrankings.ranking.command.domain.service.elo_ranking_calculator import EloRatings
+
+
+def test_elo_win_moves_ratings_by_scaled_change() -> None:
+    ratings = EloRatings(ratings={"home": 1600.0})
+    ratings.apply("home", "away", -14)
+
+    # The home team was expected to win by 155 points of rating, so losing
+    # by 14 costs it more than a plain upset would.
+    expected = 1.0 / (1.0 + 10.0 ** (-155.0 / 400.0))
+    multiplier = math.log(15.0) * 2.2 / (-155.0 * 0.001 + 2.2)
+    change = EloRatings.k * multiplier * (0.0 - expected)
+    assert ratings.rating("home") == pytest.approx(1600.0 + change)
+    assert ratings.rating("away") == pytest.approx(EloRatings.initial - change)
+    assert ratings.rating("home") + ratings.rating("away") == pytest.approx(3100.0)
+
+
+def test_elo_tie_counts_as_half_a_win() -> None:
+    ratings = EloRatings()
+    ratings.apply("home", "away", 0)
+
+    # The home team was favored by its home advantage, so a tie lowers its
+    # rating, by the same amount as the away team gains.
+    expected = 1.0 / (1.0 + 10.0 ** (-EloRatings.home_advantage / 400.0))
+    change = EloRatings.k * math.log(2.0) * 2.2 * (0.5 - expected)
+    assert change < 0.0
+    assert ratings.rating("home") == pytest.approx(EloRatings.initial + change)
+    assert ratings.rating("away") == pytest.approx(EloRatings.initial - change)
+
+
+def test_elo_season_ties_move_ratings(season_data: SeasonData) -> None:
+    ties = [
+        game
+        for game in season_data.game_map.values()
+        if game.status == GameStatus.GAME_STATUS_COMPLETED
+        and game.home_team_score == game.away_team_score
+    ]
+    assert len(ties) == 1
+    tie = ties[0]
+
+    # Without its tie the season has the same ranked weeks, but the tied
+    # teams have different ratings from the week of the tie on.
+    untied_data = SeasonData(
+        season_data.season_id,
+        season_data.affiliation_map.values(),
+        [game for game in season_data.game_map.values() if game is not tie],
+    )
+    ratings = EloRankingCalculator.ratings_for_season(season_data)
+    untied = EloRankingCalculator.ratings_for_season(untied_data)
+    assert [weekly.week for weekly in ratings] == [weekly.week for weekly in untied]
+
+    week = [weekly.week for weekly in ratings].index(tie.week)
+    assert ratings[week - 1].ratings == untied[week - 1].ratings
+    for team_id in (tie.home_team_id, tie.away_team_id):
+        assert ratings[week].rating(team_id) != pytest.approx(
+            untied[week].rating(team_id),
+        )
+    assert _replay(season_data) == pytest.approx(ratings[-1].ratings)
+
+
+def test_elo_week_of_ties_is_applied_with_next_ranked_week(
+    season_data: SeasonData,
+) -> None:
+    # The second to last week only has a single bowl game, so once it is a
+    # tie the week is not ranked, but the tie still counts towards the
+    # ratings of the last week.
+    week = int(season_data.ranked_weeks[-2])
+    games = []
+    for game in season_data.game_map.values():
+        copied = GameBySeasonResult()
+        copied.CopyFrom(game)
+        if copied.week == week:
+            copied.away_team_score = copied.home_team_score
+        games.append(copied)
+    tied_data = SeasonData(
+        season_data.season_id,
+        season_data.affiliation_map.values(),
+        games,
+    )
+    assert week not in tied_data.ranked_weeks.tolist()
+
+    ratings = EloRankingCalculator.ratings_for_season(tied_data)
+    assert ratings[-1].week == season_data.ranked_weeks[-1]
+    assert _replay(tied_data) == pytest.approx(ratings[-1].ratings)
+
+
+def test_elo_resumed_from_checkpoint_matches_full_replay(
+    season_data: SeasonData,
+) -> None:
+    full = EloRankingCalculator.ratings_for_season(season_data)
+    assert [ratings.week for ratings in full] == season_data.ranked_weeks.tolist()
+
+    team_ids = list(season_data.team_ids)
+    for index, checkpoint in enumerate(full[:-1]):
+        resumed = EloRankingCalculator.ratings_for_season(season_data, checkpoint)
+
+        assert [ratings.week for ratings in resumed] == [
+            ratings.week for ratings in full[index + 1 :]
+        ]
+        for expected, actual in zip(full[index + 1 :], resumed):
+            numpy.testing.assert_allclose(
+                actual.values(team_ids),
+                expected.values(team_ids),
+                rtol=1e-12,
+            )
+
+    # The checkpoint itself is not changed by resuming from it.
+    numpy.testing.assert_allclose(
+        full[0].values(team_ids),
+        EloRankingCalculator.ratings_for_season(season_data)[0].values(team_ids),
+    )
+
+
+def _replay(season_data: SeasonData) -> dict[str, float]:
+    # Applies the completed games between ranked teams one at a time, in the
+    # order they were played.
+    ratings = EloRatings()
+    for game in sorted(
+        season_data.game_map.values(),
+        key=lambda game: (game.week, game.date.seconds),
+    ):
+        home_team = season_data.team_ids.index(game.home_team_id)
+        away_team = season_data.team_ids.index(game.away_team_id)
+        if (
+            game.status == GameStatus.GAME_STATUS_COMPLETED
+            and season_data.ranked_team_index[home_team] >= 0
+            and season_data.ranked_team_index[away_team] >= 0
+        ):
+            ratings.apply(
+                game.home_team_id,
+                game.away_team_id,
+                game.home_team_score - game.away_team_score,
+            )
+    return ratings.ratings
@@ -0,0 +1,83 @@
+from functools import partial
+from typing import Optional
+from typing import Union
+
+import numpy
+import pytest
+
+from communication.bus import MemoryEventBus
+from fbsrankings.ranking.command.domain.model.core import TeamID
+from fbsrankings.ranking.command.domain.model.ranking import Ranking
+from fbsrankings.ranking.command.domain.model.ranking import SeasonData
+from fbsrankings.ranking.command.domain.model.ranking import TeamRankingFactory
+from fbsrankings.ranking.command.domain.service.colley_matrix_ranking_calculator import (
+    ColleyMatrixRankingCalculator,
+)
+from fbsrankings.ranking.command.domain.service.linear_solver import CholeskySolver
+from fbsrankings.ranking.command.domain.service.linear_solver import (
+    ConjugateGradientSolver,
+)
+from fbsrankings.ranking.command.domain.service.linear_solver import GMRESSolver
+from fbsrankings.ranking.command.domain.service.linear_solver import LinearSolver
+from fbsrankings.ranking.command.domain.service.linear_solver import LUSolver
+from fbsrankings.ranking.command.domain.service.srs_ranking_calculator import (
+    SRSRankingCalculator,
+)
+from fbsrankings.ranking.command.domain.service.weekly_solver import DirectWeeklySolver
+from fbsrankings.ranking.command.domain.service.weekly_solver import SparseWeeklySolver
+
+from .season_data import build_season_data
+
+
+CalculatorType = Union[type[SRSRankingCalculator], type[ColleyMatrixRankingCalculator]]
+EngineType = Union[type[DirectWeeklySolver], type[SparseWeeklySolver]]
+
+
+@pytest.mark.parametrize(
+    "calculator_type",
+    [SRSRankingCalculator, ColleyMatrixRankingCalculator],
+)
+@pytest.mark.parametrize("engine_type", [DirectWeeklySolver, SparseWeeklySolver])
+@pytest.mark.parametrize(
+    "linear_solver_type",
+    [None, LUSolver, CholeskySolver, ConjugateGradientSolver, GMRESSolver],
+)
+@pytest.mark.parametrize("all_divisions", [False, True])
+def test_linear_solvers_give_same_ranks(
+    calculator_type: CalculatorType,
+    engine_type: EngineType,
+    linear_solver_type: Optional[type[LinearSolver]],
+    all_divisions: bool,
+) -> None:
+    season_data = build_season_data(all_divisions=all_divisions)
+    expected = _rankings(calculator_type, season_data, DirectWeeklySolver, LUSolver)
+    actual = _rankings(calculator_type, season_data, engine_type, linear_solver_type)
+
+    assert len(actual) == len(expected)
+    for actual_ranking, expected_ranking in zip(actual, expected):
+        assert actual_ranking.week == expected_ranking.week
+        assert actual_ranking.values.ids.tolist() == (
+            expected_ranking.values.ids.tolist()
+        )
+        assert actual_ranking.values.ranks.tolist() == (
+            expected_ranking.values.ranks.tolist()
+        )
+        numpy.testing.assert_allclose(
+            actual_ranking.values.values,
+            expected_ranking.values.values,
+            rtol=1e-9,
+            atol=1e-9,
+        )
+
+
+def _rankings(
+    calculator_type: CalculatorType,
+    season_data: SeasonData,
+    engine_type: EngineType,
+    linear_solver_type: Optional[type[LinearSolver]],
+) -> list[Ranking[TeamID]]:
+    calculator = calculator_type(
+        TeamRankingFactory(MemoryEventBus()),
+        partial(engine_type, linear_solver_type),
+    )
+    return calculator.calculate_for_season(season_data)
@@ -0,0 +1,24 @@
+import numpy
+
+from fbsrankings.ranking.command.domain.model.ranking import RankingValues
+
+
+def test_from_scores_ranks_near_ties_together() -> None:
+    scores = numpy.array([0.375, 0.5, 0.375 + 1e-15, 0.375 - 2e-16, 0.625, 0.5])
+    sort_order = numpy.array([5, 4, 3, 2, 1, 0])
+
+    values = RankingValues[int].from_scores(numpy.arange(6), scores, sort_order)
+
+    assert values.ids.tolist() == [4, 5, 1, 3, 2, 0]
+    assert values.orders.tolist() == [1, 2, 3, 4, 5, 6]
+    assert values.ranks.tolist() == [1, 2, 2, 4, 4, 4]
+
+
+def test_from_scores_keeps_distinct_scores_apart() -> None:
+    scores = numpy.array([10.0, 10.0 + 1e-6, 9.0])
+    sort_order = numpy.array([0, 1, 2])
+
+    values = RankingValues[int].from_scores(numpy.arange(3), scores, sort_order)
+
+    assert values.ids.tolist() == [1, 0, 2]
+    assert values.ranks.tolist() == [1, 2, 3]
@@ -0,0 +1,129 @@
+from typing import Any
+from typing import Union
+
+import numpy
+import pytest
+from numpy.typing import NDArray
+
+from communication.bus import MemoryEventBus
+from fbsrankings.messages.enums import GameStatus
+from fbsrankings.messages.query import GameBySeasonResult
+from fbsrankings.ranking.command.domain.model.ranking import SeasonData
+from fbsrankings.ranking.command.domain.model.ranking import TeamRankingFactory
+from fbsrankings.ranking.command.domain.service.colley_matrix_ranking_calculator import (
+    ColleyMatrixRankingCalculator,
+)
+from fbsrankings.ranking.command.domain.service.scenario_calculator import (
+    ScenarioCalculator,
+)
+from fbsrankings.ranking.command.domain.service.scenario_solver import ScenarioSystem
+from fbsrankings.ranking.command.domain.service.srs_ranking_calculator import (
+    SRSRankingCalculator,
+)
+from fbsrankings.ranking.command.domain.service.weekly_solver import DirectWeeklySolver
+
+from .season_data import build_season_data
+from .season_data import CONFERENCE_WEEKS
+
+
+CalculatorType = Union[type[SRSRankingCalculator], type[ColleyMatrixRankingCalculator]]
+
+
+@pytest.mark.parametrize(
+    "calculator_type",
+    [SRSRankingCalculator, ColleyMatrixRankingCalculator],
+)
+def test_scenario_matches_recalculation(
+    monkeypatch: Any,
+    scheduled_season_data: SeasonData,
+    calculator_type: CalculatorType,
+) -> None:
+    # The teams have all been joined by the games of the last ranked week, so
+    # the scheduled games are applied as an update of its inverse.
+    joined = _count_joined(monkeypatch)
+    _assert_scenario_matches_recalculation(scheduled_season_data, calculator_type)
+    assert not joined
+
+
+def test_scenario_joining_groups_matches_recalculation(monkeypatch: Any) -> None:
+    # The conferences have only played each other by the last ranked week, so
+    # the scheduled games join their groups and the system is solved again.
+    season_data = build_season_data(
+        weeks=CONFERENCE_WEEKS + 1,
+        bowl_weeks=0,
+        scheduled_weeks=1,
+    )
+    joined = _count_joined(monkeypatch)
+    _assert_scenario_matches_recalculation(season_data, SRSRankingCalculator)
+    assert joined
+
+
+def _assert_scenario_matches_recalculation(
+    season_data: SeasonData,
+    calculator_type: CalculatorType,
+) -> None:
+    results = {
+        game.game_id: (28 + index % 3, 14 if index % 2 == 0 else 35)
+        for index, game in enumerate(
+            game
+            for game in season_data.game_map.values()
+            if game.status == GameStatus.GAME_STATUS_SCHEDULED
+        )
+    }
+    assert results
+
+    scenario = next(
+        ranking
+        for ranking in ScenarioCalculator(season_data).calculate(
+            (game_id, home_score, away_score)
+            for game_id, (home_score, away_score) in results.items()
+        )
+        if ranking.name == calculator_type.name
+    )
+
+    games = []
+    for game in season_data.game_map.values():
+        recorded = GameBySeasonResult()
+        recorded.CopyFrom(game)
+        if game.game_id in results:
+            recorded.home_team_score, recorded.away_team_score = results[game.game_id]
+            recorded.status = GameStatus.GAME_STATUS_COMPLETED
+        games.append(recorded)
+    recorded_data = SeasonData(
+        season_data.season_id,
+        season_data.affiliation_map.values(),
+        games,
+    )
+    expected = _last_team_values(calculator_type, recorded_data)
+
+    assert numpy.any(numpy.abs(scenario.value_deltas) > 1e-6)
+    numpy.testing.assert_allclose(
+        scenario.values,
+        expected[season_data.ranked_teams],
+        rtol=1e-9,
+        atol=1e-12,
+    )
+
+
+def _count_joined(monkeypatch: Any) -> list[int]:
+    joined = []
+    solve_joined = ScenarioSystem.__dict__["_solve_joined"]
+
+    def counting_solve_joined(*args: Any, **kwargs: Any) -> Any:
+        joined.append(len(args[2]))
+        return solve_joined(*args, **kwargs)
+
+    monkeypatch.setattr(ScenarioSystem, "_solve_joined", counting_solve_joined)
+    return joined
+
+
+def _last_team_values(
+    calculator_type: CalculatorType,
+    season_data: SeasonData,
+) -> NDArray[numpy.float64]:
+    calculator = calculator_type(
+        TeamRankingFactory(MemoryEventBus()),
+        DirectWeeklySolver,
+    )
+    rankings = calculator.calculate_for_season(season_data)
+    return season_data.team_values(rankings[-1])
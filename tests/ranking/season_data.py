@@ -0,0 +1,127 @@
+import uuid
+from typing import Any
+
+import numpy
+from google.protobuf.timestamp_pb2 import Timestamp
+
+from fbsrankings.messages.enums import GameStatus
+from fbsrankings.messages.enums import SeasonSection
+from fbsrankings.messages.enums import Subdivision
+from fbsrankings.messages.query import AffiliationBySeasonResult
+from fbsrankings.messages.query import GameBySeasonResult
+from fbsrankings.ranking.command.domain.model.ranking import SeasonData
+
+
+CONFERENCE_COUNT = 3
+CONFERENCE_SIZE = 8
+CONFERENCE_WEEKS = 3
+
+
+def build_season_data(
+    weeks: int = 12,
+    bowl_weeks: int = 3,
+    scheduled_weeks: int = 0,
+    seed: int = 2012,
+    **options: Any,
+) -> SeasonData:
+    # A season of FBS teams in conferences that only play each other for the
+    # first few weeks, so the teams are split into groups that have not
+    # played each other until the later weeks, plus two FCS teams and a tie.
+    # Each week of bowl games after the regular season has a single game, so
+    # only a couple of rows of the systems change from one week to the next.
+    generator = numpy.random.default_rng(seed)
+    season_id = uuid.UUID(int=seed)
+    team_count = CONFERENCE_COUNT * CONFERENCE_SIZE
+    team_ids = [
+        str(uuid.UUID(int=seed * 1000 + team)) for team in range(team_count + 2)
+    ]
+
+    affiliations = [
+        AffiliationBySeasonResult(
+            affiliation_id=str(uuid.UUID(int=seed * 2000 + team)),
+            season_id=str(season_id),
+            year=seed,
+            team_id=team_id,
+            team_name=f"Team {team:02d}",
+            subdivision=(
+                Subdivision.SUBDIVISION_FBS
+                if team < team_count
+                else Subdivision.SUBDIVISION_FCS
+            ),
+        )
+        for team, team_id in enumerate(team_ids)
+    ]
+
+    strength = generator.normal(0.0, 10.0, team_count + 2)
+    strength[team_count:] -= 20.0
+
+    games: list[GameBySeasonResult] = []
+    for week in range(1, weeks + bowl_weeks + 1):
+        if week > weeks:
+            home, away = generator.choice(team_count, 2, replace=False).tolist()
+            pairs = [(home, away)]
+        elif week <= CONFERENCE_WEEKS:
+            pairs = [
+                pair
+                for conference in range(CONFERENCE_COUNT)
+                for pair in _pairs(
+                    generator,
+                    conference * CONFERENCE_SIZE
+                    + generator.permutation(CONFERENCE_SIZE),
+                )
+            ]
+        else:
+            pairs = _pairs(generator, generator.permutation(team_count))
+        if week == 1:
+            pairs.append((0, team_count))
+            pairs.append((team_count + 1, CONFERENCE_SIZE))
+
+        scheduled = week > weeks + bowl_weeks - scheduled_weeks
+        for index, (home, away) in enumerate(pairs):
+            margin = strength[home] - strength[away] + generator.normal(3.0, 14.0)
+            home_score = int(max(0.0, 24.0 + margin / 2.0))
+            away_score = int(max(0.0, 24.0 - margin / 2.0))
+            if week == 2 and index == 0:
+                away_score = home_score
+            games.append(
+                GameBySeasonResult(
+                    game_id=str(uuid.UUID(int=seed * 3000 + len(games))),
+                    season_id=str(season_id),
+                    year=seed,
+                    week=week,
+                    date=Timestamp(seconds=week * 604800 + len(games) * 3600),
+                    season_section=(
+                        SeasonSection.SEASON_SECTION_POSTSEASON
+                        if week > weeks
+                        else SeasonSection.SEASON_SECTION_REGULAR_SEASON
+                    ),
+                    home_team_id=team_ids[home],
+                    home_team_name=f"Team {home:02d}",
+                    away_team_id=team_ids[away],
+                    away_team_name=f"Team {away:02d}",
+                    home_team_score=None if scheduled else home_score,
+                    away_team_score=None if scheduled else away_score,
+                    status=(
+                        GameStatus.GAME_STATUS_SCHEDULED
+                        if scheduled
+                        else GameStatus.GAME_STATUS_COMPLETED
+                    ),
+                ),
+            )
+
+    return SeasonData(season_id, affiliations, games, **options)
+
+
+def _pairs(
+    generator: numpy.random.Generator,
+    teams: Any,
+) -> list[tuple[int, int]]:
+    teams = [int(team) for team in teams]
+    return [
+        (
+            (teams[index], teams[index + 1])
+            if generator.random() < 0.5
+            else (teams[index + 1], teams[index])
+        )
+        for index in range(0, len(teams) - 1, 2)
+    ]
@@ -0,0 +1,281 @@
+from collections.abc import Iterable
+from pathlib import Path
+from typing import Any
+from typing import Optional
+from uuid import uuid4
+
+import pytest
+
+from communication.bus import MemoryEventBus
+from communication.bus import MemoryQueryBus
+from communication.bus import QueryBus
+from communication.messages import Event
+from fbsrankings.config import Config
+from fbsrankings.config import RankingConfig
+from fbsrankings.config import StorageType
+from fbsrankings.context import Context
+from fbsrankings.core.command.infrastructure.data_source import (
+    DataSource as CoreDataSource,
+)
+from fbsrankings.core.query import Service as CoreQueryService
+from fbsrankings.messages.convert import bytes_to_ids
+from fbsrankings.messages.enums import GameStatus
+from fbsrankings.messages.event import AffiliationCreatedEvent
+from fbsrankings.messages.event import GameCompletedEvent
+from fbsrankings.messages.event import GameCreatedEvent
+from fbsrankings.messages.event import GameRankingCalculatedEvent
+from fbsrankings.messages.event import RankingValue
+from fbsrankings.messages.event import SeasonCreatedEvent
+from fbsrankings.messages.event import SeasonRankingsCalculatedEvent
+from fbsrankings.messages.event import TeamCreatedEvent
+from fbsrankings.messages.event import TeamRankingCalculatedEvent
+from fbsrankings.messages.event import TeamRecordCalculatedEvent
+from fbsrankings.messages.event import TeamRecordValue
+from fbsrankings.messages.packed import game_ranking_values
+from fbsrankings.messages.packed import team_ranking_values
+from fbsrankings.messages.packed import team_record_values
+from fbsrankings.messages.query import GameRankingBySeasonWeekQuery
+from fbsrankings.messages.query import GameRankingBySeasonWeekResult
+from fbsrankings.messages.query import TeamRankingBySeasonWeekQuery
+from fbsrankings.messages.query import TeamRankingBySeasonWeekResult
+from fbsrankings.messages.query import TeamRecordBySeasonWeekQuery
+from fbsrankings.messages.query import TeamRecordBySeasonWeekResult
+from fbsrankings.ranking.command.application.season_ranking_calculator import (
+    SeasonRankingCalculator,
+)
+from fbsrankings.ranking.command.domain.model.ranking import SeasonData
+from fbsrankings.ranking.command.infrastructure.data_source import (
+    DataSource as RankingDataSource,
+)
+from fbsrankings.ranking.query import Service as RankingQueryService
+
+
+@pytest.mark.parametrize(
+    "storage",
+    [StorageType.MEMORY_SHARED, StorageType.SQLITE_SHARED, StorageType.SQLITE_TINYDB],
+)
+def test_season_event_matches_ranking_events(
+    tmp_path: Path,
+    season_data: SeasonData,
+    storage: StorageType,
+) -> None:
+    # The records and rankings of a season's single event read back the same
+    # as when each of them was published as its own event.
+    season_id = str(season_data.season_id)
+    events, _ = SeasonRankingCalculator(RankingConfig()).calculate_for_season(
+        season_id,
+        season_data.affiliation_map.values(),
+        season_data.game_map.values(),
+    )
+    assert len(events) == 1
+    event = events[0]
+    assert isinstance(event, SeasonRankingsCalculatedEvent)
+
+    keys = _keys(event)
+    expected = _project(
+        tmp_path / "ranking",
+        storage,
+        season_data,
+        _split(event),
+        keys,
+    )
+    actual = _project(tmp_path / "season", storage, season_data, [event], keys)
+
+    assert all(actual[key] for key in keys)
+    assert actual == expected
+
+
+def _project(
+    path: Path,
+    storage: StorageType,
+    season_data: SeasonData,
+    events: list[Event],
+    keys: Iterable[tuple[str, str, Optional[int]]],
+) -> dict[tuple[str, str, Optional[int]], list[Any]]:
+    path.mkdir()
+    config = Config.from_dict(
+        {
+            "storage": storage.value,
+            "sqlite": {"file": str(path / "fbsrankings.db")},
+            "tinydb": {"file": str(path / "fbsrankings.json")},
+        },
+    )
+
+    query_bus = MemoryQueryBus()
+    event_bus = MemoryEventBus()
+    with Context(config) as context, CoreQueryService(
+        context,
+        query_bus,
+        event_bus,
+    ), RankingQueryService(context, query_bus, event_bus):
+        with CoreDataSource(context).event_handler(event_bus):
+            for season_event in _season_events(season_data):
+                event_bus.publish(season_event)
+        with RankingDataSource(context).event_handler(event_bus):
+            for event in events:
+                event_bus.publish(event)
+
+        return {
+            key: _query(query_bus, str(season_data.season_id), *key) for key in keys
+        }
+
+
+def _season_events(season_data: SeasonData) -> Iterable[Event]:
+    season_id = str(season_data.season_id)
+    affiliations = list(season_data.affiliation_map.values())
+    yield SeasonCreatedEvent(
+        event_id=str(uuid4()),
+        season_id=season_id,
+        year=affiliations[0].year,
+    )
+    for affiliation in affiliations:
+        yield TeamCreatedEvent(
+            event_id=str(uuid4()),
+            team_id=affiliation.team_id,
+            name=affiliation.team_name,
+        )
+        yield AffiliationCreatedEvent(
+            event_id=str(uuid4()),
+            affiliation_id=affiliation.affiliation_id,
+            season_id=season_id,
+            team_id=affiliation.team_id,
+            subdivision=affiliation.subdivision,
+        )
+    for game in season_data.game_map.values():
+        yield GameCreatedEvent(
+            event_id=str(uuid4()),
+            game_id=game.game_id,
+            season_id=season_id,
+            week=game.week,
+            date=game.date,
+            season_section=game.season_section,
+            home_team_id=game.home_team_id,
+            away_team_id=game.away_team_id,
+            notes=game.notes,
+        )
+        if game.status == GameStatus.GAME_STATUS_COMPLETED:
+            yield GameCompletedEvent(
+                event_id=str(uuid4()),
+                game_id=game.game_id,
+                season_id=season_id,
+                week=game.week,
+                date=game.date,
+                season_section=game.season_section,
+                home_team_id=game.home_team_id,
+                away_team_id=game.away_team_id,
+                home_team_score=game.home_team_score,
+                away_team_score=game.away_team_score,
+                notes=game.notes,
+            )
+
+
+def _split(event: SeasonRankingsCalculatedEvent) -> list[Event]:
+    # The record and ranking events that were published for each record and
+    # ranking before they were combined into a single event.
+    team_ids = bytes_to_ids(event.team_ids)
+    game_ids = bytes_to_ids(event.game_ids)
+
+    events: list[Event] = []
+    for record in event.team_records:
+        events.append(
+            TeamRecordCalculatedEvent(
+                event_id=str(uuid4()),
+                record_id=record.record_id,
+                season_id=event.season_id,
+                week=_week(record),
+                values=[
+                    TeamRecordValue(
+                        team_id=team_ids[team],
+                        wins=wins,
+                        losses=losses,
+                        games=wins + losses,
+                        win_percentage=wins / (wins + losses) if wins > 0 else 0.0,
+                    )
+                    for team, wins, losses in zip(
+                        record.teams,
+                        record.wins,
+                        record.losses,
+                    )
+                ],
+            ),
+        )
+    for event_type, rankings, ids in (
+        (TeamRankingCalculatedEvent, event.team_rankings, team_ids),
+        (GameRankingCalculatedEvent, event.game_rankings, game_ids),
+    ):
+        for ranking in rankings:
+            events.append(
+                event_type(
+                    event_id=str(uuid4()),
+                    ranking_id=ranking.ranking_id,
+                    name=ranking.name,
+                    season_id=event.season_id,
+                    week=_week(ranking),
+                    values=[
+                        RankingValue(id=ids[id_], order=order, rank=rank, value=value)
+                        for id_, order, rank, value in zip(
+                            ranking.ids,
+                            ranking.orders,
+                            ranking.ranks,
+                            ranking.values,
+                        )
+                    ],
+                ),
+            )
+    return events
+
+
+def _keys(
+    event: SeasonRankingsCalculatedEvent,
+) -> list[tuple[str, str, Optional[int]]]:
+    return [
+        *(("record", "", _week(record)) for record in event.team_records),
+        *(("team", ranking.name, _week(ranking)) for ranking in event.team_rankings),
+        *(("game", ranking.name, _week(ranking)) for ranking in event.game_rankings),
+    ]
+
+
+def _query(
+    query_bus: QueryBus,
+    season_id: str,
+    kind: str,
+    name: str,
+    week: Optional[int],
+) -> list[Any]:
+    if kind == "record":
+        record = query_bus.query(
+            TeamRecordBySeasonWeekQuery(
+                query_id=str(uuid4()),
+                season_id=season_id,
+                week=week,
+            ),
+            TeamRecordBySeasonWeekResult,
+        ).record
+        return sorted(team_record_values(record), key=lambda value: value.team_id)
+
+    if kind == "team":
+        team_ranking = query_bus.query(
+            TeamRankingBySeasonWeekQuery(
+                query_id=str(uuid4()),
+                name=name,
+                season_id=season_id,
+                week=week,
+            ),
+            TeamRankingBySeasonWeekResult,
+        ).ranking
+        return sorted(team_ranking_values(team_ranking), key=lambda value: value.order)
+
+    game_ranking = query_bus.query(
+        GameRankingBySeasonWeekQuery(
+            query_id=str(uuid4()),
+            name=name,
+            season_id=season_id,
+            week=week,
+        ),
+        GameRankingBySeasonWeekResult,
+    ).ranking
+    return sorted(game_ranking_values(game_ranking), key=lambda value: value.order)
+
+
+def _week(message: Any) -> Optional[int]:
+    return message.week if message.HasField("week") else None
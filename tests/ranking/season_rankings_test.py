@@ -0,0 +1,168 @@
+from typing import Any
+
+import pytest
+
+from fbsrankings.config import ChannelType
+from fbsrankings.config import Config
+from fbsrankings.config import RankingConfig
+from fbsrankings.config import RankingDivisionType
+from fbsrankings.config import SerializationType
+from fbsrankings.config import StorageType
+from fbsrankings.context import Context
+from fbsrankings.ranking.command.application.season_ranking_calculator import (
+    SeasonRankingCalculator,
+)
+from fbsrankings.ranking.command.domain.model.ranking import SeasonData
+from fbsrankings.ranking.command.infrastructure.transaction.transaction import (
+    Transaction,
+)
+
+from .season_data import build_season_data
+from .season_source import event_values
+from .season_source import SeasonSource
+from .season_source import with_score
+
+
+START_WEEK = 10
+
+
+def test_matching_fingerprint_skips_season(season_data: SeasonData) -> None:
+    source = SeasonSource(season_data)
+    config = RankingConfig()
+    with _context() as context:
+        assert source.calculate_for_seasons(context, config)
+        assert not source.calculate_for_seasons(context, config)
+        assert not source.calculate_for_season(
+            context,
+            config,
+            str(season_data.season_id),
+        )
+
+
+def test_settings_change_recalculates_every_week(season_data: SeasonData) -> None:
+    # The stored rankings were calculated with other settings, so the start
+    # week is ignored and the whole season is calculated again.
+    source = SeasonSource(season_data)
+    season_id = str(season_data.season_id)
+    config = RankingConfig(division=RankingDivisionType.ALL)
+    with _context() as context:
+        expected = event_values(source.calculate_for_seasons(context, config))
+
+    with _context() as context:
+        source.calculate_for_seasons(context, RankingConfig())
+        actual = event_values(
+            source.calculate_for_seasons(context, config, {season_id: 10}),
+        )
+        assert actual == expected
+        assert not source.calculate_for_season(context, config, season_id, 10)
+
+    with _context() as context:
+        source.calculate_for_season(context, RankingConfig(), season_id)
+        actual = event_values(
+            source.calculate_for_season(context, config, season_id, 10),
+        )
+        assert actual == expected
+
+
+def test_start_week_matches_full_recalculation(season_data: SeasonData) -> None:
+    # Changing the result of a game in the start week leaves the earlier weeks
+    # as they were, so only the start week and the later ones are published.
+    source = SeasonSource(season_data)
+    season_id = str(season_data.season_id)
+    config = RankingConfig()
+    with _context() as context:
+        before = event_values(source.calculate_for_seasons(context, config))
+
+        game = next(game for game in source.games[season_id] if game.week == START_WEEK)
+        source.games[season_id] = with_score(
+            source.games[season_id],
+            game.game_id,
+            game.away_team_score + 7,
+            game.home_team_score,
+        )
+        actual = event_values(
+            source.calculate_for_seasons(context, config, {season_id: START_WEEK}),
+        )
+
+    with _context() as context:
+        expected = event_values(source.calculate_for_seasons(context, config))
+
+    assert actual
+    assert all(week is None or week >= START_WEEK for _, _, week in actual)
+    assert actual == {key: expected[key] for key in actual}
+    assert all(
+        before[key] == value for key, value in expected.items() if key not in actual
+    )
+    assert actual != {key: before[key] for key in actual}
+
+
+def test_elo_checkpoints_are_kept_after_commit(
+    monkeypatch: Any,
+    season_data: SeasonData,
+) -> None:
+    source = SeasonSource(season_data)
+    season_id = str(season_data.season_id)
+    config = RankingConfig()
+    fingerprint = SeasonRankingCalculator(config).fingerprint(
+        source.affiliations[season_id],
+        source.games[season_id],
+    )
+
+    def fail(_: Transaction) -> None:
+        raise ValueError("Commit failed")
+
+    with _context() as context, monkeypatch.context() as patch:
+        patch.setattr(Transaction, "commit", fail)
+        with pytest.raises(ValueError):
+            source.calculate_for_seasons(context, config)
+    assert not source.elo_checkpoints.get(season_id, fingerprint)
+
+    with _context() as context:
+        source.calculate_for_seasons(context, config)
+    assert source.elo_checkpoints.get(season_id, fingerprint)
+    assert not source.elo_checkpoints.get(season_id, None)
+
+
+def test_process_pool_matches_serial_calculation() -> None:
+    source = SeasonSource(build_season_data(), build_season_data(seed=2013))
+    with _context() as context:
+        expected = source.calculate_for_seasons(context, RankingConfig())
+    with _context() as context:
+        actual = source.calculate_for_seasons(context, RankingConfig(workers=2))
+
+    assert len(expected) == 2
+    assert [event.season_id for event in actual] == [
+        event.season_id for event in expected
+    ]
+    assert [event_values([event]) for event in actual] == [
+        event_values([event]) for event in expected
+    ]
+
+
+def test_threads_match_sequential_calculation(season_data: SeasonData) -> None:
+    source = SeasonSource(season_data)
+    season_id = str(season_data.season_id)
+    with _context() as context:
+        expected = source.calculate_for_season(context, RankingConfig(), season_id)
+    with _context() as context:
+        actual = source.calculate_for_season(
+            context,
+            RankingConfig(threads=4),
+            season_id,
+        )
+
+    assert len(expected) == 1
+    assert [(ranking.name, ranking.week) for ranking in actual[0].team_rankings] == [
+        (ranking.name, ranking.week) for ranking in expected[0].team_rankings
+    ]
+    assert event_values(actual) == event_values(expected)
+
+
+def _context() -> Context:
+    return Context(
+        Config(
+            channel=ChannelType.NONE,
+            serialization=SerializationType.NONE,
+            storage=StorageType.MEMORY_SHARED,
+        ),
+    )
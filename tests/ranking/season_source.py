@@ -0,0 +1,194 @@
+from collections.abc import Iterable
+from collections.abc import Mapping
+from typing import Optional
+from uuid import uuid4
+
+from communication.bus import MemoryEventBus
+from communication.bus import MemoryQueryBus
+from fbsrankings.config import RankingConfig
+from fbsrankings.context import Context
+from fbsrankings.messages.command import CalculateRankingsForSeasonCommand
+from fbsrankings.messages.command import CalculateRankingsForSeasonsCommand
+from fbsrankings.messages.convert import bytes_to_ids
+from fbsrankings.messages.event import PackedRanking
+from fbsrankings.messages.event import SeasonRankingsCalculatedEvent
+from fbsrankings.messages.query import AffiliationBySeasonResult
+from fbsrankings.messages.query import AffiliationsBySeasonQuery
+from fbsrankings.messages.query import AffiliationsBySeasonResult
+from fbsrankings.messages.query import GameBySeasonResult
+from fbsrankings.messages.query import GamesBySeasonQuery
+from fbsrankings.messages.query import GamesBySeasonResult
+from fbsrankings.messages.query import SeasonByIDQuery
+from fbsrankings.messages.query import SeasonByIDResult
+from fbsrankings.messages.query import SeasonByIDValue
+from fbsrankings.ranking.command.application.calculate_rankings_for_season import (
+    CalculateRankingsForSeasonCommandHandler,
+)
+from fbsrankings.ranking.command.application.calculate_rankings_for_seasons import (
+    CalculateRankingsForSeasonsCommandHandler,
+)
+from fbsrankings.ranking.command.application.elo_checkpoint_cache import (
+    EloCheckpointCache,
+)
+from fbsrankings.ranking.command.application.season_cache import SeasonCache
+from fbsrankings.ranking.command.domain.model.ranking import SeasonData
+from fbsrankings.ranking.command.infrastructure.data_source import DataSource
+
+
+RankingKey = tuple[str, str, Optional[int]]
+RankingValues = tuple[tuple[str, ...], tuple[int, ...], tuple[float, ...]]
+
+
+class SeasonSource:
+    # Answers the season queries of the ranking command handlers from the
+    # affiliations and games of seasons built for the tests. The games of a
+    # season can be replaced to change its results.
+    def __init__(self, *seasons: SeasonData) -> None:
+        self.affiliations: dict[str, list[AffiliationBySeasonResult]] = {}
+        self.games: dict[str, list[GameBySeasonResult]] = {}
+        for season_data in seasons:
+            season_id = str(season_data.season_id)
+            self.affiliations[season_id] = list(season_data.affiliation_map.values())
+            self.games[season_id] = list(season_data.game_map.values())
+
+        self.elo_checkpoints = EloCheckpointCache()
+        self.query_bus = MemoryQueryBus()
+        self.query_bus.register_handler(SeasonByIDQuery, self._season)
+        self.query_bus.register_handler(AffiliationsBySeasonQuery, self._affiliations)
+        self.query_bus.register_handler(GamesBySeasonQuery, self._games)
+
+    def calculate_for_seasons(
+        self,
+        context: Context,
+        config: RankingConfig,
+        start_weeks: Optional[Mapping[str, int]] = None,
+    ) -> list[SeasonRankingsCalculatedEvent]:
+        event_bus = MemoryEventBus()
+        events: list[SeasonRankingsCalculatedEvent] = []
+        event_bus.register_handler(SeasonRankingsCalculatedEvent, events.append)
+
+        handler = CalculateRankingsForSeasonsCommandHandler(
+            config,
+            DataSource(context),
+            self.elo_checkpoints,
+            self.query_bus,
+            event_bus,
+        )
+        handler(
+            CalculateRankingsForSeasonsCommand(
+                command_id=str(uuid4()),
+                season_ids=list(self.games),
+                start_weeks=start_weeks or {},
+            ),
+        )
+        return events
+
+    def calculate_for_season(
+        self,
+        context: Context,
+        config: RankingConfig,
+        season_id: str,
+        start_week: Optional[int] = None,
+    ) -> list[SeasonRankingsCalculatedEvent]:
+        event_bus = MemoryEventBus()
+        events: list[SeasonRankingsCalculatedEvent] = []
+        event_bus.register_handler(SeasonRankingsCalculatedEvent, events.append)
+
+        cache = SeasonCache(self.query_bus, event_bus)
+        try:
+            handler = CalculateRankingsForSeasonCommandHandler(
+                config,
+                DataSource(context),
+                cache,
+                self.elo_checkpoints,
+                self.query_bus,
+                event_bus,
+            )
+            handler(
+                CalculateRankingsForSeasonCommand(
+                    command_id=str(uuid4()),
+                    season_id=season_id,
+                    start_week=start_week,
+                ),
+            )
+        finally:
+            cache.close()
+        return events
+
+    def _season(self, query: SeasonByIDQuery) -> SeasonByIDResult:
+        games = self.games.get(query.season_id)
+        if games is None:
+            return SeasonByIDResult(query_id=query.query_id)
+        return SeasonByIDResult(
+            query_id=query.query_id,
+            season=SeasonByIDValue(season_id=query.season_id, year=games[0].year),
+        )
+
+    def _affiliations(
+        self,
+        query: AffiliationsBySeasonQuery,
+    ) -> AffiliationsBySeasonResult:
+        return AffiliationsBySeasonResult(
+            query_id=query.query_id,
+            affiliations=self.affiliations[query.season_id],
+        )
+
+    def _games(self, query: GamesBySeasonQuery) -> GamesBySeasonResult:
+        return GamesBySeasonResult(
+            query_id=query.query_id,
+            games=self.games[query.season_id],
+        )
+
+
+def with_score(
+    games: Iterable[GameBySeasonResult],
+    game_id: str,
+    home_team_score: int,
+    away_team_score: int,
+) -> list[GameBySeasonResult]:
+    changed = []
+    for game in games:
+        copied = GameBySeasonResult()
+        copied.CopyFrom(game)
+        if copied.game_id == game_id:
+            copied.home_team_score = home_team_score
+            copied.away_team_score = away_team_score
+        changed.append(copied)
+    return changed
+
+
+def event_values(
+    events: Iterable[SeasonRankingsCalculatedEvent],
+) -> dict[RankingKey, RankingValues]:
+    # The records and rankings of the events by their kind, name and week,
+    # with their ids resolved, since the ids of the records and rankings
+    # themselves are new for each calculation.
+    values: dict[RankingKey, RankingValues] = {}
+    for event in events:
+        team_ids = bytes_to_ids(event.team_ids)
+        game_ids = bytes_to_ids(event.game_ids)
+        for record in event.team_records:
+            values[("record", "", _week(record.week, record.HasField("week")))] = (
+                tuple(team_ids[team] for team in record.teams),
+                tuple(record.wins),
+                tuple(float(losses) for losses in record.losses),
+            )
+        for kind, rankings, ids in (
+            ("team", event.team_rankings, team_ids),
+            ("game", event.game_rankings, game_ids),
+        ):
+            for ranking in rankings:
+                values[(kind, ranking.name, _ranking_week(ranking))] = (
+                    tuple(ids[id_] for id_ in ranking.ids),
+                    tuple(ranking.ranks),
+                    tuple(ranking.values),
+                )
+    return values
+
+
+def _ranking_week(ranking: PackedRanking) -> Optional[int]:
+    return _week(ranking.week, ranking.HasField("week"))
+
+
+def _week(week: int, has_week: bool) -> Optional[int]:
+    return week if has_week else None
@@ -0,0 +1,147 @@
+import uuid
+
+import numpy
+import pytest
+from google.protobuf.timestamp_pb2 import Timestamp
+
+from communication.bus import MemoryEventBus
+from fbsrankings.messages.enums import GameStatus
+from fbsrankings.messages.enums import SeasonSection
+from fbsrankings.messages.enums import Subdivision
+from fbsrankings.messages.query import AffiliationBySeasonResult
+from fbsrankings.messages.query import GameBySeasonResult
+from fbsrankings.ranking.command.domain.model.core import SeasonID
+from fbsrankings.ranking.command.domain.model.core import TeamID
+from fbsrankings.ranking.command.domain.model.ranking import GameRankingFactory
+from fbsrankings.ranking.command.domain.model.ranking import Ranking
+from fbsrankings.ranking.command.domain.model.ranking import SeasonData
+from fbsrankings.ranking.command.domain.model.ranking import TeamRankingCalculator
+from fbsrankings.ranking.command.domain.model.ranking import TeamRankingFactory
+from fbsrankings.ranking.command.domain.service.game_strength_ranking_calculator import (
+    GameStrengthRankingCalculator,
+)
+from fbsrankings.ranking.command.domain.service.strength_of_schedule_ranking_calculator import (
+    StrengthOfScheduleRankingCalculator,
+)
+
+
+PERFORMANCE = {"A": 6.0, "B": 3.0, "C": 1.0, "D": -2.0}
+
+GAMES = [
+    ("A", "B", GameStatus.GAME_STATUS_COMPLETED),
+    ("C", "D", GameStatus.GAME_STATUS_COMPLETED),
+    ("A", "C", GameStatus.GAME_STATUS_COMPLETED),
+    ("B", "D", GameStatus.GAME_STATUS_SCHEDULED),
+    ("B", "C", GameStatus.GAME_STATUS_COMPLETED),
+    ("A", "D", GameStatus.GAME_STATUS_CANCELED),
+    ("A", "E", GameStatus.GAME_STATUS_COMPLETED),
+]
+
+
+def test_strength_of_schedule_averages_opponents() -> None:
+    # Scheduled games count, but canceled games and games against the FCS
+    # team, which has no performance value, do not.
+    season_data = _season_data()
+    ranking = StrengthOfScheduleRankingCalculator(
+        TeamRankingFactory(MemoryEventBus()),
+    ).calculate_for_ranking(season_data, _performance(season_data))
+
+    values = season_data.team_values(ranking)
+    assert ranking.name == "Performance - Strength of Schedule - Total"
+    assert {
+        name: values[season_data.team_ids.index(_team_id(name))] for name in PERFORMANCE
+    } == pytest.approx({"A": 2.0, "B": 5.0 / 3.0, "C": 7.0 / 3.0, "D": 2.0})
+    assert numpy.isnan(values[season_data.team_ids.index(_team_id("E"))])
+
+
+def test_game_strength_weights_weaker_team() -> None:
+    season_data = _season_data()
+    ranking = GameStrengthRankingCalculator(
+        GameRankingFactory(MemoryEventBus()),
+    ).calculate_for_ranking(season_data, _performance(season_data))
+
+    assert ranking.name == "Performance - Game Strength"
+    assert {
+        ranking.ids[id_]: value
+        for id_, value in zip(
+            ranking.values.ids.tolist(),
+            ranking.values.values.tolist(),
+        )
+    } == pytest.approx(
+        {
+            _game_id(0): 3.03,
+            _game_id(1): -1.97,
+            _game_id(2): 1.05,
+            _game_id(3): -1.95,
+            _game_id(4): 1.02,
+        },
+    )
+    assert ranking.values.ranks.tolist() == [1, 2, 3, 4, 5]
+
+
+def _season_data() -> SeasonData:
+    season_id = uuid.UUID(int=1)
+    affiliations = [
+        AffiliationBySeasonResult(
+            affiliation_id=str(uuid.UUID(int=100 + index)),
+            season_id=str(season_id),
+            year=2012,
+            team_id=_team_id(name),
+            team_name=name,
+            subdivision=(
+                Subdivision.SUBDIVISION_FBS
+                if name in PERFORMANCE
+                else Subdivision.SUBDIVISION_FCS
+            ),
+        )
+        for index, name in enumerate("ABCDE")
+    ]
+    games = [
+        GameBySeasonResult(
+            game_id=_game_id(index),
+            season_id=str(season_id),
+            year=2012,
+            week=1,
+            date=Timestamp(seconds=index * 3600),
+            season_section=SeasonSection.SEASON_SECTION_REGULAR_SEASON,
+            home_team_id=_team_id(home),
+            home_team_name=home,
+            away_team_id=_team_id(away),
+            away_team_name=away,
+            home_team_score=(
+                28 if status == GameStatus.GAME_STATUS_COMPLETED else None
+            ),
+            away_team_score=(
+                14 if status == GameStatus.GAME_STATUS_COMPLETED else None
+            ),
+            status=status,
+        )
+        for index, (home, away, status) in enumerate(GAMES)
+    ]
+    return SeasonData(season_id, affiliations, games)
+
+
+def _performance(season_data: SeasonData) -> Ranking[TeamID]:
+    teams = numpy.array(
+        [season_data.team_ids.index(_team_id(name)) for name in PERFORMANCE],
+        dtype=numpy.intp,
+    )
+    return TeamRankingFactory(MemoryEventBus()).create(
+        "Performance",
+        SeasonID(season_data.season_id),
+        None,
+        season_data.team_ids,
+        TeamRankingCalculator.to_values(
+            season_data,
+            teams,
+            numpy.array(list(PERFORMANCE.values())),
+        ),
+    )
+
+
+def _team_id(name: str) -> str:
+    return str(uuid.UUID(int=10 + "ABCDE".index(name)))
+
+
+def _game_id(index: int) -> str:
+    return str(uuid.UUID(int=1000 + index))
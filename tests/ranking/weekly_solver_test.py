@@ -0,0 +1,109 @@
+from typing import Any
+from typing import Callable
+from typing import Union
+
+import numpy
+import pytest
+import scipy.linalg
+from numpy.typing import NDArray
+
+from communication.bus import MemoryEventBus
+from fbsrankings.ranking.command.domain.model.ranking import SeasonData
+from fbsrankings.ranking.command.domain.model.ranking import TeamRankingFactory
+from fbsrankings.ranking.command.domain.service.colley_matrix_ranking_calculator import (
+    ColleyMatrixRankingCalculator,
+)
+from fbsrankings.ranking.command.domain.service.srs_ranking_calculator import (
+    SRSRankingCalculator,
+)
+from fbsrankings.ranking.command.domain.service.weekly_solver import BatchedWeeklySolver
+from fbsrankings.ranking.command.domain.service.weekly_solver import DirectWeeklySolver
+from fbsrankings.ranking.command.domain.service.weekly_solver import (
+    IncrementalWeeklySolver,
+)
+from fbsrankings.ranking.command.domain.service.weekly_solver import SparseWeeklySolver
+from fbsrankings.ranking.command.domain.service.weekly_solver import WeeklySolver
+
+from .season_data import build_season_data
+from .season_data import CONFERENCE_COUNT
+from .season_data import CONFERENCE_SIZE
+
+
+CalculatorType = Union[type[SRSRankingCalculator], type[ColleyMatrixRankingCalculator]]
+
+
+@pytest.mark.parametrize(
+    "calculator_type",
+    [SRSRankingCalculator, ColleyMatrixRankingCalculator],
+)
+@pytest.mark.parametrize(
+    "solver_factory",
+    [BatchedWeeklySolver, SparseWeeklySolver],
+)
+@pytest.mark.parametrize("all_divisions", [False, True])
+def test_solver_matches_direct(
+    calculator_type: CalculatorType,
+    solver_factory: Callable[[], WeeklySolver],
+    all_divisions: bool,
+) -> None:
+    season_data = build_season_data(all_divisions=all_divisions)
+    expected = _team_values(calculator_type, season_data, DirectWeeklySolver)
+    actual = _team_values(calculator_type, season_data, solver_factory)
+
+    numpy.testing.assert_allclose(actual, expected, rtol=1e-9, atol=1e-12)
+
+
+def test_sparse_solver_centers_disconnected_groups(season_data: SeasonData) -> None:
+    # The conferences only play each other in the first weeks, so until then
+    # the SRS values of each conference are only defined up to a constant,
+    # which is chosen so that they sum to zero.
+    values = _team_values(SRSRankingCalculator, season_data, SparseWeeklySolver)
+    conferences = values[0, : CONFERENCE_COUNT * CONFERENCE_SIZE].reshape(
+        (CONFERENCE_COUNT, CONFERENCE_SIZE),
+    )
+    totals = conferences.sum(axis=1)
+    numpy.testing.assert_allclose(totals, 0.0, atol=1e-9)
+
+
+@pytest.mark.parametrize(
+    "calculator_type",
+    [SRSRankingCalculator, ColleyMatrixRankingCalculator],
+)
+def test_incremental_solver_matches_direct(
+    monkeypatch: Any,
+    season_data: SeasonData,
+    calculator_type: CalculatorType,
+) -> None:
+    expected = _team_values(calculator_type, season_data, DirectWeeklySolver)
+
+    factorizations = []
+    lu_factor = scipy.linalg.lu_factor
+
+    def counting_lu_factor(*args: Any, **kwargs: Any) -> Any:
+        factorizations.append(args[0].shape)
+        return lu_factor(*args, **kwargs)
+
+    monkeypatch.setattr(scipy.linalg, "lu_factor", counting_lu_factor)
+    actual = _team_values(calculator_type, season_data, IncrementalWeeklySolver)
+
+    # The bowl weeks only change a couple of rows, so at least one of them
+    # is solved with the update instead of a new factorization.
+    assert len(factorizations) < len(season_data.ranked_weeks)
+    numpy.testing.assert_allclose(actual, expected, rtol=1e-9, atol=1e-12)
+
+
+def _team_values(
+    calculator_type: CalculatorType,
+    season_data: SeasonData,
+    solver_factory: Callable[[], WeeklySolver],
+) -> NDArray[numpy.float64]:
+    calculator = calculator_type(
+        TeamRankingFactory(MemoryEventBus()),
+        solver_factory,
+    )
+    return numpy.array(
+        [
+            season_data.team_values(ranking)
+            for ranking in calculator.calculate_for_season(season_data)
+        ],
+    )
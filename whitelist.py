@@ -2,3 +2,5 @@ command_id  # unused variable (src\communication\messages\domain\command.py:8)
 _.handle_starttag  # unused method (src\fbsrankings\core\command\infrastructure\sports_reference.py:318)
 _.handle_endtag  # unused method (src\fbsrankings\core\command\infrastructure\sports_reference.py:330)
 _.handle_data  # unused method (src\fbsrankings\core\command\infrastructure\sports_reference.py:338)
+_.handle_comment  # unused method (src\fbsrankings\core\command\infrastructure\sports_reference.py:389)
+_.game_section  # unused attribute (src\fbsrankings\ranking\command\domain\model\ranking.py:82)